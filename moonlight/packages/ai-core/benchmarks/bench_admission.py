@@ -0,0 +1,134 @@
+"""
+Admission Control Benchmark
+
+시끄러운 클라이언트 하나 + 일반 사용자 N명이 용량이 고정된 가짜 업스트림을 공유 (in-process 시뮬레이션)
+- none     : 수락 제어 없음 (모든 요청이 업스트림 대기열로)
+- admission: 사용자별 / 전체 토큰 버킷 + 우선순위 대기열 (AdmissionController)
+측정: 일반 사용자 지연 p50/p95, 업스트림 호출 수, 거절(429) 수, admit() 한 번의 비용 (µs)
+
+실행: python -m benchmarks.bench_admission [--seconds 5] [--users 20] [--noisy-rps 200]
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from src.admission import AdmissionController, AdmissionRejected, BucketSpec, InMemoryBucketStore
+
+
+class Upstream:
+    """동시 처리 capacity 개, 호출당 service_ms (초과분은 줄 서서 대기)"""
+
+    def __init__(self, capacity: int, service_ms: float):
+        self._slots = asyncio.Semaphore(capacity)
+        self.service = service_ms / 1000
+        self.calls = 0
+
+    async def call(self) -> None:
+        async with self._slots:
+            self.calls += 1
+            await asyncio.sleep(self.service)
+
+
+def _percentile(values: list[float], p: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * p / 100), len(ordered) - 1)]
+
+
+async def _scenario(mode: str, args: argparse.Namespace) -> dict:
+    upstream = Upstream(args.capacity, args.service_ms)
+    controller = None
+    if mode == "admission":
+        controller = AdmissionController(
+            InMemoryBucketStore(),
+            user_requests=BucketSpec(rate=args.user_rps, capacity=args.user_rps * 5),
+            global_requests=BucketSpec(rate=args.capacity / (args.service_ms / 1000), capacity=args.capacity),
+            queue_size=args.capacity * 4,
+            queue_timeout=2.0,
+        )
+
+    latencies: dict[str, list[float]] = {"normal": [], "noisy": []}
+    rejected = {"normal": 0, "noisy": 0}
+    tasks: set[asyncio.Task] = set()
+
+    async def request(kind: str, user: str) -> None:
+        started = time.perf_counter()
+        try:
+            if controller is not None:
+                await controller.admit(user)
+            await upstream.call()
+        except AdmissionRejected:
+            rejected[kind] += 1
+            return
+        latencies[kind].append((time.perf_counter() - started) * 1000)
+
+    async def open_loop(kind: str, user: str, rps: float, rng: random.Random) -> None:
+        """포아송 도착 (응답을 기다리지 않고 계속 보냄)"""
+        deadline = time.perf_counter() + args.seconds
+        while time.perf_counter() < deadline:
+            await asyncio.sleep(rng.expovariate(rps))
+            task = asyncio.create_task(request(kind, user))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+    rng = random.Random(7)
+    await asyncio.gather(
+        open_loop("noisy", "noisy", args.noisy_rps, random.Random(rng.random())),
+        *(open_loop("normal", f"user{i}", args.user_rps, random.Random(rng.random())) for i in range(args.users)),
+    )
+    await asyncio.gather(*tasks)
+    if controller is not None:
+        await controller.close()
+
+    normal = latencies["normal"]
+    return {
+        "mode": mode,
+        "p50": _percentile(normal, 50),
+        "p95": _percentile(normal, 95),
+        "normal_ok": len(normal),
+        "normal_429": rejected["normal"],
+        "noisy_ok": len(latencies["noisy"]),
+        "noisy_429": rejected["noisy"],
+        "upstream": upstream.calls,
+    }
+
+
+async def _admit_cost(iterations: int) -> float:
+    """거절 없는 admit() 한 번 (사용자 + 전체 버킷 + 토큰 예산), µs"""
+    controller = AdmissionController(
+        InMemoryBucketStore(),
+        user_requests=BucketSpec(rate=1e9, capacity=1e9),
+        global_requests=BucketSpec(rate=1e9, capacity=1e9),
+        user_tokens=BucketSpec.per_minute(10**9),
+    )
+    started = time.perf_counter()
+    for i in range(iterations):
+        await controller.admit(f"user{i % 1000}")
+    elapsed = time.perf_counter() - started
+    await controller.close()
+    return elapsed / iterations * 1e6
+
+
+async def main(args: argparse.Namespace) -> None:
+    print(f"seconds={args.seconds} users={args.users}×{args.user_rps}rps noisy={args.noisy_rps}rps "
+          f"upstream capacity={args.capacity} service={args.service_ms}ms")
+    print(f"{'mode':>10} {'p50 ms':>8} {'p95 ms':>8} {'일반 ok':>8} {'일반 429':>9} {'noisy ok':>9} {'noisy 429':>10} {'upstream':>9}")
+    for mode in ("none", "admission"):
+        r = await _scenario(mode, args)
+        print(f"{r['mode']:>10} {r['p50']:>8.0f} {r['p95']:>8.0f} {r['normal_ok']:>8} {r['normal_429']:>9} "
+              f"{r['noisy_ok']:>9} {r['noisy_429']:>10} {r['upstream']:>9}")
+    print(f"\nadmit() 비용: {await _admit_cost(50_000):.2f} µs")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--user-rps", type=float, default=1.0)
+    parser.add_argument("--noisy-rps", type=float, default=200.0)
+    parser.add_argument("--capacity", type=int, default=16, help="업스트림 동시 처리 수")
+    parser.add_argument("--service-ms", type=float, default=200.0)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,64 @@
+"""
+Constitution Check Benchmark
+
+응답 한 건당 사후 검사 비용 (µs)
+- compiled: 컴파일된 negative 문구 매처 (정규식 alternation, 응답 한 번 순회)
+- naive: 매 응답마다 YAML 원칙을 돌며 `phrase in response` 검사
+- triggers: 사용자 메시지 트리거 매칭 (principle_4 등)
+
+실행: python -m benchmarks.bench_constitution [--iterations 20000]
+"""
+
+import argparse
+import time
+
+from src.constitution.loader import ConstitutionLoader, get_constitution
+
+RESPONSES = {
+    "short": "힘드셨죠. 여기 있어요.",
+    "medium": "주인님, 오늘 하루 정말 길었네요. 천천히 생각해보세요. 하고 싶으실 때 하세요. " * 3,
+    "long": "그럴 수 있어요. 이해해요. 함께 있을게요. 요즘 이런 주제에 관심이 많으신 것 같아요. " * 20 + "힘내세요",
+}
+
+
+def _naive_check(principles: list[dict], response: str) -> list[tuple[str, str]]:
+    found = []
+    for principle in principles:
+        for phrase in principle.get("examples", {}).get("negative", []):
+            if phrase.rstrip("?") in response:
+                found.append((principle["id"], phrase))
+    return found
+
+
+def _per_call_us(fn, arg, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn(arg)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main(iterations: int) -> None:
+    loader: ConstitutionLoader = get_constitution()
+    compiled = loader.current
+    principles = [
+        {"id": p.id, "examples": {"negative": list(p.negative)}}
+        for p in compiled.principles
+    ]
+
+    print(f"constitution v{compiled.version} ({len(compiled.principles)} principles)")
+    print(f"{'response':>8} {'chars':>6} {'compiled µs':>12} {'naive µs':>10}")
+    for name, response in RESPONSES.items():
+        compiled_us = _per_call_us(compiled.check, response, iterations)
+        naive_us = _per_call_us(lambda r: _naive_check(principles, r), response, iterations)
+        print(f"{name:>8} {len(response):>6} {compiled_us:>12.2f} {naive_us:>10.2f}")
+
+    message = "오늘 회사에서 너무 지쳤어"
+    print(f"\ntriggers   : {_per_call_us(compiled.triggered, message, iterations):.2f} µs/message")
+    print(f"focus_for  : {_per_call_us(compiled.focus_for, '오늘 날씨 어때?', iterations):.2f} µs/message (트리거 없음)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+    main(args.iterations)
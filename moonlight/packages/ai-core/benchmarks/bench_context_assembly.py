@@ -0,0 +1,101 @@
+"""
+Context Assembly Benchmark
+
+세션 하나를 N턴 진행하며 턴마다 프롬프트를 구성하는 비용 비교
+- naive: 매 턴 전체 메시지를 다시 토큰화하고 최신부터 잘라냄
+- assembler: 세그먼트 토큰 수 재사용 + 중요도 기반 제거 (ContextAssembler)
+
+토큰 카운터는 실제 토크나이저 비용을 흉내내도록 바이트 단위로 순회합니다.
+--tiktoken 옵션이 있으면 tiktoken(cl100k_base)을 사용합니다.
+
+실행: python -m benchmarks.bench_context_assembly [--turns 200] [--budget 3000]
+"""
+
+import argparse
+import time
+
+from src.memory.context import ContextAssembler
+from src.memory.retrieval import RetrievedMemory
+from src.memory.session import SessionBuffer, Turn
+
+SYSTEM_PROMPT = "당신은 '달빛 비서'입니다. 판단하지 않고, 기대하지 않고, 존재로서 지지합니다.\n" * 8
+
+
+def _slow_counter(text: str) -> int:
+    """토크나이저 흉내 (문자 단위 순회, 입력 길이에 비례하는 비용)"""
+    count = 0
+    for ch in text:
+        count += 1 if ord(ch) > 127 else 0.25
+    return max(1, int(count))
+
+
+def _counter(use_tiktoken: bool):
+    if not use_tiktoken:
+        return _slow_counter
+    import tiktoken
+
+    encoding = tiktoken.get_encoding("cl100k_base")
+    return lambda text: len(encoding.encode(text))
+
+
+def _naive(counter, system: str, history: list[Turn], memories, message: str, budget: int) -> list[dict]:
+    messages = [{"role": t.role, "content": t.content} for t in history]
+    memory_text = "\n".join(f"- {m.user_message} / {m.assistant_message}" for m in memories)
+    fixed = counter(system) + counter(message) + counter(memory_text)
+
+    kept: list[dict] = []
+    used = fixed
+    for msg in reversed(messages):
+        tokens = counter(msg["content"])
+        if used + tokens > budget:
+            break
+        used += tokens
+        kept.append(msg)
+    return [
+        {"role": "system", "content": system},
+        *reversed(kept),
+        {"role": "system", "content": memory_text},
+        {"role": "user", "content": message},
+    ]
+
+
+def main(turns: int, budget: int, use_tiktoken: bool) -> None:
+    counter = _counter(use_tiktoken)
+    assembler = ContextAssembler(max_prompt_tokens=budget, counter=counter)
+    buffer = SessionBuffer(max_turns=100)
+    memories = [
+        RetrievedMemory(i, 0.8 - i * 0.05, f"예전에 나눈 이야기 {i} " * 6, f"그때 대답 {i} " * 6)
+        for i in range(5)
+    ]
+
+    naive_s = assembled_s = 0.0
+    naive_tokens = 0
+    for i in range(turns):
+        message = f"오늘 있었던 일을 조금 더 이야기해볼게 {i}. " * 4
+
+        start = time.perf_counter()
+        _naive(counter, SYSTEM_PROMPT, list(buffer.turns), memories, message, budget)
+        naive_s += time.perf_counter() - start
+        naive_tokens += sum(counter(t.content) for t in buffer.turns) + counter(SYSTEM_PROMPT)
+
+        start = time.perf_counter()
+        assembler.assemble("bench", SYSTEM_PROMPT, message, list(buffer.turns), memories)
+        assembled_s += time.perf_counter() - start
+
+        buffer.extend([Turn.create("user", message), Turn.create("assistant", "네 주인님, 듣고 있어요. " * 10)])
+
+    stats = assembler.stats.as_dict()
+    print(f"turns={turns} budget={budget} counter={'tiktoken' if use_tiktoken else 'synthetic'}")
+    print(f"naive     : {naive_s / turns * 1e6:8.1f} µs/turn (재토큰화 {naive_tokens} tokens)")
+    print(f"assembler : {assembled_s / turns * 1e6:8.1f} µs/turn (p95 ≤ {assembler.assembly_time.percentile(0.95)} µs)")
+    print(f"tokens counted={stats['tokens_counted']} reused={stats['tokens_reused']} "
+          f"trimmed={stats['tokens_trimmed']} evicted segments={stats['segments_evicted']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--turns", type=int, default=200)
+    parser.add_argument("--budget", type=int, default=3000)
+    parser.add_argument("--tiktoken", action="store_true", help="tiktoken 토크나이저 사용")
+    args = parser.parse_args()
+    main(args.turns, args.budget, args.tiktoken)
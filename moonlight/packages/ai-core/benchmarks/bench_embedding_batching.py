@@ -0,0 +1,77 @@
+"""
+Embedding Micro-batching Benchmark
+
+동시 요청 N개를 한 건씩 인코딩할 때와 EmbeddingService 배치로 처리할 때 비교
+
+기본은 "고정 비용 + 항목당 비용" 을 흉내내는 합성 모델을 사용합니다.
+--real 옵션은 실제 sentence-transformers 모델(all-MiniLM-L6-v2)을 사용합니다.
+
+실행: python -m benchmarks.bench_embedding_batching [--real] [--requests 512]
+"""
+
+import argparse
+import asyncio
+import time
+
+import numpy as np
+
+from src.memory.embedding import EmbeddingModel
+from src.memory.embedding_service import EmbeddingService
+
+
+class SyntheticModel(EmbeddingModel):
+    """배치 호출당 고정 4ms + 항목당 0.2ms (CPU 모델의 대략적 특성)"""
+
+    def __init__(self):
+        super().__init__("synthetic")
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        # sleep 대신 CPU 점유 (GIL 보유 → 스레드를 늘려도 병렬화되지 않음)
+        end = time.perf_counter() + 0.004 + 0.0002 * len(texts)
+        while time.perf_counter() < end:
+            pass
+        vectors = np.random.rand(len(texts), 384).astype(np.float32)
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+async def _unbatched(model: EmbeddingModel, texts: list[str]) -> float:
+    start = time.perf_counter()
+    await asyncio.gather(*(model.embed(text) for text in texts))
+    return time.perf_counter() - start
+
+
+async def _batched(service: EmbeddingService, texts: list[str]) -> float:
+    start = time.perf_counter()
+    await asyncio.gather(*(service.embed(text) for text in texts))
+    return time.perf_counter() - start
+
+
+async def main(real: bool, requests: int) -> None:
+    model = EmbeddingModel() if real else SyntheticModel()
+    texts = [f"오늘 하루는 어땠는지 이야기해줘 {i}" for i in range(requests)]
+
+    model.encode(texts[:1])  # 워밍업 (모델 로딩)
+
+    unbatched = await _unbatched(model, texts)
+    print(f"unbatched : {requests / unbatched:8.1f} req/s ({unbatched * 1000:.0f} ms)")
+
+    for batch_size in (8, 32, 64):
+        service = EmbeddingService(model, max_batch_size=batch_size, max_wait_ms=10.0)
+        await service.start()
+        elapsed = await _batched(service, texts)
+        await service.stop()
+
+        stats = service.stats()
+        print(
+            f"batch={batch_size:<3}: {requests / elapsed:8.1f} req/s ({elapsed * 1000:.0f} ms) "
+            f"batch p50={stats['batch_size']['p50']} "
+            f"queue p95={stats['queue_latency_ms']['p95']}ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--real", action="store_true", help="실제 sentence-transformers 모델 사용")
+    parser.add_argument("--requests", type=int, default=512)
+    args = parser.parse_args()
+    asyncio.run(main(args.real, args.requests))
@@ -0,0 +1,80 @@
+"""
+Keyword Matcher Benchmark
+
+키워드 수를 10 → 10,000 으로 늘리며 메시지당 매칭 비용 비교:
+- naive: 기존 중첩 루프 (`keyword in message`)
+- automaton: KeywordMatcher (Aho–Corasick 단일 순회)
+
+실행: python -m benchmarks.bench_keyword_matcher
+"""
+
+import random
+import string
+import time
+
+from src.agents.keyword_matcher import KeywordMatcher
+
+MESSAGES = [
+    "내일 오후 3시에 팀 회의 일정 추가해줘",
+    "오늘 날씨 어때?",
+    "moonlight 저장소 github 이슈 보여줘",
+    "그냥 좀 지쳤어, 오늘 하루가 길었네",
+]
+KEYWORDS_PER_TOOL = 5
+ROUNDS = 2000
+
+
+def _random_keyword(rng: random.Random) -> str:
+    return "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 10)))
+
+
+def _build_tools(keyword_count: int, rng: random.Random) -> dict[str, list[str]]:
+    tools: dict[str, list[str]] = {
+        "create_event": ["일정 추가", "일정 만들"],
+        "get_calendar": ["일정", "캘린더"],
+        "github_issues": ["github", "이슈"],
+    }
+    remaining = keyword_count - sum(len(v) for v in tools.values())
+    for i in range(max(remaining, 0) // KEYWORDS_PER_TOOL):
+        tools[f"tool_{i}"] = [_random_keyword(rng) for _ in range(KEYWORDS_PER_TOOL)]
+    return tools
+
+
+def _naive(tools: dict[str, list[str]], message: str):
+    message_lower = message.lower()
+    for tool_name, keywords in tools.items():
+        for keyword in keywords:
+            if keyword in message_lower:
+                return tool_name
+    return None
+
+
+def _time_per_message(fn) -> float:
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for message in MESSAGES:
+            fn(message)
+    return (time.perf_counter() - start) / (ROUNDS * len(MESSAGES)) * 1e6
+
+
+def main() -> None:
+    rng = random.Random(42)
+
+    print(f"{'keywords':>9} | {'build ms':>9} | {'naive us':>9} | {'automaton us':>12}")
+    print("-" * 49)
+
+    for count in (10, 100, 1_000, 10_000):
+        tools = _build_tools(count, rng)
+
+        start = time.perf_counter()
+        matcher = KeywordMatcher(tools)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        naive_us = _time_per_message(lambda m: _naive(tools, m))
+        automaton_us = _time_per_message(matcher.best_match)
+
+        print(f"{len(matcher):>9} | {build_ms:>9.2f} | {naive_us:>9.2f} | {automaton_us:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Pending Confirmation Benchmark
+
+고위험 작업 확인 대기 N건의 비용
+- blocking: 확인마다 코루틴이 Future를 기다림 (asyncio.wait_for + 항목별 타이머)
+- store   : InMemoryPendingStore (압축 문자열 + 타이밍 휠)
+측정: 항목당 메모리 (tracemalloc), 등록 / 재개(pop) µs, 만료 정리 µs/항목
+
+실행: python -m benchmarks.bench_pending [--pending 10000]
+"""
+
+import argparse
+import asyncio
+import gc
+import time
+import tracemalloc
+
+from src.memory.pending import InMemoryPendingStore
+
+CALLS = [("send_email", {"to": "kim@example.com", "subject": "회의록", "body": "회의록 공유드립니다."}, "send_email:3f2a")]
+PROMPT = "주인님, 이메일을 전송하시겠어요?"
+
+
+async def _blocking(n: int, ttl: float) -> tuple[float, float]:
+    """→ (바이트/항목, 등록 µs/항목)"""
+    loop = asyncio.get_running_loop()
+    futures: dict[str, asyncio.Future] = {}
+
+    async def wait_for_reply(key: str, calls: list, prompt: str) -> None:
+        future = futures[key] = loop.create_future()
+        try:
+            await asyncio.wait_for(future, ttl)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            futures.pop(key, None)
+
+    async def spawn() -> list[asyncio.Task]:
+        tasks = [
+            asyncio.create_task(wait_for_reply(f"user{i}:s", [(t, dict(p), k) for t, p, k in CALLS], PROMPT))
+            for i in range(n)
+        ]
+        await asyncio.sleep(0)  # 각 코루틴이 wait_for 까지 진행
+        return tasks
+
+    async def cancel(tasks: list[asyncio.Task]) -> None:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    started = time.perf_counter()
+    tasks = await spawn()
+    create_us = (time.perf_counter() - started) / n * 1e6
+    await cancel(tasks)
+
+    gc.collect()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    tasks = await spawn()
+    used = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    await cancel(tasks)
+    return used / n, create_us
+
+
+async def _store(n: int, ttl: float) -> dict:
+    async def fill(store: InMemoryPendingStore) -> None:
+        for i in range(n):
+            await store.put(f"user{i}:s", store.create([(t, dict(p), k) for t, p, k in CALLS], PROMPT))
+
+    gc.collect()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    measured = InMemoryPendingStore(ttl_seconds=ttl, tick=1.0)
+    await fill(measured)
+    used = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    del measured
+
+    store = InMemoryPendingStore(ttl_seconds=ttl, tick=1.0)
+    started = time.perf_counter()
+    await fill(store)
+    create_us = (time.perf_counter() - started) / n * 1e6
+
+    started = time.perf_counter()
+    for i in range(0, n, 2):
+        await store.pop(f"user{i}:s")
+    resume_us = (time.perf_counter() - started) / (n // 2) * 1e6
+
+    started = time.perf_counter()
+    removed = store.sweep(time.time() + ttl + 2)
+    sweep_us = (time.perf_counter() - started) / max(removed, 1) * 1e6
+
+    return {
+        "bytes": used / n,
+        "create_us": create_us,
+        "resume_us": resume_us,
+        "sweep_us": sweep_us,
+        "removed": removed,
+    }
+
+
+async def main(pending: int, ttl: float) -> None:
+    blocking_bytes, blocking_create = await _blocking(pending, ttl)
+    store = await _store(pending, ttl)
+
+    print(f"pending={pending} ttl={ttl:g}s")
+    print(f"{'':>9} {'바이트/건':>10} {'등록 µs':>9} {'재개 µs':>9} {'만료 µs':>9}")
+    print(f"{'blocking':>9} {blocking_bytes:>10.0f} {blocking_create:>9.2f} {'-':>9} {'-':>9}")
+    print(f"{'store':>9} {store['bytes']:>10.0f} {store['create_us']:>9.2f} "
+          f"{store['resume_us']:>9.2f} {store['sweep_us']:>9.2f}  (만료 {store['removed']}건)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pending", type=int, default=10_000)
+    parser.add_argument("--ttl", type=float, default=300.0)
+    args = parser.parse_args()
+    asyncio.run(main(args.pending, args.ttl))
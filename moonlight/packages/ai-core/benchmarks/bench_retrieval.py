@@ -0,0 +1,128 @@
+"""
+Retrieval Benchmark
+
+정확 검색(float32 brute force) 대비 recall@k / 지연시간 / 메모리
+- 로컬 인덱스: float32, float16, int8 양자화, memory-map 로딩
+- --dsn/--user: pgvector IVFFlat 의 probes 별 recall@k (해당 사용자의 실제 데이터)
+
+합성 데이터는 384차원 군집 벡터(대화 주제가 몰려 있는 상황)를 사용합니다.
+
+실행: python -m benchmarks.bench_retrieval [--sizes 1000 10000 100000] [--k 10]
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from src.memory.retrieval import LocalVectorIndex, PgVectorRetriever
+
+DIM = 384
+
+
+def _normalize(x: np.ndarray) -> np.ndarray:
+    return (x / np.linalg.norm(x, axis=-1, keepdims=True)).astype(np.float32)
+
+
+def _corpus(n: int, rng: np.random.Generator, clusters: int = 50) -> np.ndarray:
+    centers = rng.standard_normal((clusters, DIM))
+    labels = rng.integers(0, clusters, n)
+    return _normalize(centers[labels] + 0.6 * rng.standard_normal((n, DIM)))
+
+
+def _queries(corpus: np.ndarray, count: int, rng: np.random.Generator) -> np.ndarray:
+    picks = corpus[rng.integers(0, len(corpus), count)]
+    return _normalize(picks + 0.3 * rng.standard_normal(picks.shape))
+
+
+def _exact_top_k(corpus: np.ndarray, query: np.ndarray, k: int) -> set[int]:
+    scores = corpus @ query
+    return set(np.argpartition(-scores, k - 1)[:k].tolist())
+
+
+def _percentile_ms(samples: list[float], q: float) -> float:
+    return float(np.percentile(samples, q)) * 1000
+
+
+def bench_local(sizes: list[int], k: int, queries: int) -> None:
+    rng = np.random.default_rng(7)
+    print(f"{'N':>8} {'dtype':>8} {'recall@' + str(k):>10} {'p50 ms':>8} {'p95 ms':>8} {'MB':>8}")
+
+    for n in sizes:
+        corpus = _corpus(n, rng)
+        qs = _queries(corpus, queries, rng)
+        truth = [_exact_top_k(corpus, q, k) for q in qs]
+
+        for dtype in ("float32", "float16", "int8"):
+            index = LocalVectorIndex(DIM, dtype, capacity=n)
+            index.add(list(range(n)), corpus)
+
+            latencies, hits = [], 0
+            for q, expected in zip(qs, truth):
+                start = time.perf_counter()
+                positions, _ = index.search(q, k)
+                latencies.append(time.perf_counter() - start)
+                hits += len(expected & set(positions.tolist()))
+
+            print(
+                f"{n:>8} {dtype:>8} {hits / (k * len(qs)):>10.4f} "
+                f"{_percentile_ms(latencies, 50):>8.3f} {_percentile_ms(latencies, 95):>8.3f} "
+                f"{index.nbytes / 1e6:>8.1f}"
+            )
+
+    # memory-map 로딩 (디스크 → 첫 검색)
+    n = sizes[-1]
+    index = LocalVectorIndex(DIM, "int8", capacity=n)
+    index.add(list(range(n)), _corpus(n, rng))
+    with tempfile.TemporaryDirectory() as tmp:
+        index.save(Path(tmp))
+        start = time.perf_counter()
+        loaded = LocalVectorIndex.load(Path(tmp))
+        loaded.search(_queries(_corpus(10, rng), 1, rng)[0], k)
+        elapsed = (time.perf_counter() - start) * 1000
+    print(f"\nmmap load + first search (N={n}, int8): {elapsed:.1f} ms")
+
+
+async def bench_pgvector(dsn: str, user_id: str, k: int, queries: int) -> None:
+    retriever = PgVectorRetriever(dsn)
+    ids, corpus, _ = await retriever.fetch_all(user_id)
+    if not ids:
+        print(f"{user_id}: 임베딩이 있는 대화가 없습니다")
+        return
+
+    rng = np.random.default_rng(7)
+    qs = _queries(corpus, queries, rng)
+    truth = [{ids[i] for i in _exact_top_k(corpus, q, min(k, len(ids)))} for q in qs]
+
+    print(f"\npgvector (user={user_id}, N={len(ids)})")
+    print(f"{'probes':>8} {'recall@' + str(k):>10} {'p50 ms':>8} {'p95 ms':>8}")
+    for probes in (1, 5, 10, 25, 100):
+        latencies, hits = [], 0
+        for q, expected in zip(qs, truth):
+            start = time.perf_counter()
+            results = await retriever.search(user_id, q, k, probes=probes)
+            latencies.append(time.perf_counter() - start)
+            hits += len(expected & {r.conversation_id for r in results})
+
+        print(
+            f"{probes:>8} {hits / sum(len(t) for t in truth):>10.4f} "
+            f"{_percentile_ms(latencies, 50):>8.3f} {_percentile_ms(latencies, 95):>8.3f}"
+        )
+    await retriever.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--dsn", help="pgvector 비교용 PostgreSQL DSN")
+    parser.add_argument("--user", default="dev_user", help="pgvector 비교 대상 사용자")
+    args = parser.parse_args()
+
+    bench_local(args.sizes, args.k, args.queries)
+    if args.dsn:
+        asyncio.run(bench_pgvector(args.dsn, args.user, args.k, args.queries))
@@ -0,0 +1,131 @@
+"""
+Slot Filling Benchmark
+
+명확화 질문 답변 턴의 LLM 왕복 수 / 지연시간 (스크립트 모델, httpx MockTransport + 지연)
+- reparse: 답변을 새 요청으로 처리 (native tool calling 한 번, 모델이 이전 파라미터까지 복원하는 최선의 경우)
+- slots  : 부분 파라미터를 세션에 두고 누락 필드만 추출 (정규식 / 자유 텍스트, 남은 필드만 LLM)
+
+실행: python -m benchmarks.bench_slot_filling [--rounds 20] [--llm-ms 300]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+import httpx
+
+from src.agents.orchestrator import AgentOrchestrator
+from src.llm.provider import LLMProvider
+from src.memory.pending import InMemoryPendingStore
+from src.memory.session import InMemorySessionStore, SessionMemory
+
+# (첫 요청, Tool, 첫 요청에서 추출된 파라미터, 명확화 답변, 답변으로 채워질 파라미터)
+DIALOGS = [
+    ("회의록 메일 보내줘", "send_email", {"subject": "회의록", "body": "회의록 공유드립니다."},
+     "kim@example.com", {"to": "kim@example.com"}),
+    ("로그인 버그 이슈 올려줘", "github_issues", {"title": "로그인 버그"},
+     "moonlight-app/moonlight 저장소요", {"repo": "moonlight-app/moonlight"}),
+    ("이거 좀 알아봐줘", "google_search", {},
+     "오늘 서울 날씨", {"query": "오늘 서울 날씨"}),
+    ("내일 3시로 하나 잡아줘", "create_event", {"start_time": "내일 15:00"},
+     "팀 회의", {"title": "팀 회의"}),
+    ("메일 하나 써줘", "send_email", {"to": "kim@example.com"},
+     "제목은 주간 보고, 내용은 이번 주 진행 상황 공유", {"subject": "주간 보고", "body": "이번 주 진행 상황 공유"}),
+]
+FIRST = {first: (tool, args) for first, tool, args, _, _ in DIALOGS}
+ANSWER = {answer: (tool, {**args, **filled}) for _, tool, args, answer, filled in DIALOGS}
+FILLED = {answer: filled for _, _, _, answer, filled in DIALOGS}
+
+
+class ScriptedModel:
+    """요청마다 llm_ms 만큼 지연 후 스크립트대로 답하는 가짜 OpenRouter"""
+
+    def __init__(self, llm_ms: float):
+        self.delay = llm_ms / 1000
+        self.requests = 0
+
+    def respond(self, payload: dict) -> dict:
+        last = payload["messages"][-1]["content"]
+
+        if "필드의 값을 추출하세요" in last:  # Slot Filler LLM fallback
+            answer = last.split("답변: ", 1)[1].split("\n", 1)[0]
+            return {"content": json.dumps(FILLED.get(answer, {}), ensure_ascii=False)}
+
+        found = FIRST.get(last) or ANSWER.get(last)
+        if found is None or not payload.get("tools"):
+            return {"content": "주인님, 듣고 있어요."}
+        tool, args = found
+        return {"content": None, "tool_calls": [{
+            "id": "call_1",
+            "type": "function",
+            "function": {"name": tool, "arguments": json.dumps(args, ensure_ascii=False)},
+        }]}
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        await asyncio.sleep(self.delay)
+        message = self.respond(json.loads(request.content))
+        return httpx.Response(200, json={"choices": [{"message": message}]})
+
+
+async def _run(mode: str, rounds: int, llm_ms: float) -> dict:
+    model = ScriptedModel(llm_ms)
+    client = httpx.AsyncClient(transport=httpx.MockTransport(model.handler), base_url="http://mock/api/v1")
+    llm = LLMProvider(client=client)
+    llm.cache = None
+
+    orchestrator = AgentOrchestrator(
+        llm=llm,
+        writer=None,
+        sessions=SessionMemory(InMemorySessionStore()),
+        pending=InMemoryPendingStore(),
+    )
+    orchestrator.intent_parser.cache = None
+    orchestrator.tool_calling = "native"
+    if mode == "reparse":
+        orchestrator.slot_filler = None
+
+    trips = completed = turns = 0
+    elapsed = 0.0
+    try:
+        for i in range(rounds):
+            for n, (first, tool, _, answer, _) in enumerate(DIALOGS):
+                session = f"s{i}-{n}"
+                await orchestrator.process("bench", first, session_id=session)
+
+                before = model.requests
+                started = time.perf_counter()
+                result = await orchestrator.process("bench", answer, session_id=session)
+                elapsed += time.perf_counter() - started
+                trips += model.requests - before
+                completed += result.tool_used == tool or result.awaiting_confirmation
+                turns += 1
+    finally:
+        await client.aclose()
+
+    return {
+        "mode": mode,
+        "round_trips": trips / turns,
+        "completed": completed / turns,
+        "ms": elapsed / turns * 1000,
+        "stats": orchestrator.slot_filler.stats.as_dict() if orchestrator.slot_filler else None,
+    }
+
+
+async def main(rounds: int, llm_ms: float) -> None:
+    print(f"rounds={rounds} llm_ms={llm_ms:g} (대화 {len(DIALOGS)}종, 명확화 답변 턴만 측정)")
+    print(f"{'mode':>8} {'LLM 왕복/턴':>12} {'이어서 진행':>10} {'ms/턴':>8}")
+    for mode in ("reparse", "slots"):
+        r = await _run(mode, rounds, llm_ms)
+        print(f"{r['mode']:>8} {r['round_trips']:>12.2f} {r['completed']:>10.0%} {r['ms']:>8.1f}")
+        if r["stats"]:
+            print(f"{'':>8} {r['stats']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--llm-ms", type=float, default=300.0, help="LLM 호출당 지연 (ms)")
+    args = parser.parse_args()
+    asyncio.run(main(args.rounds, args.llm_ms))
@@ -0,0 +1,83 @@
+"""
+Tool Result Cache Benchmark
+
+세션 안에서 같은 읽기 전용 Tool 호출이 반복되는 워크로드 (Zipf 분포 질의)
+- 캐시 없음 vs ToolResultCache: 평균 지연시간, 적중률, 메모리
+- 캐시 조회 오버헤드 (µs, 정규 JSON + SHA-256 키)
+
+실행: python -m benchmarks.bench_tool_cache [--calls 2000] [--queries 200] [--tool-ms 50]
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from src.tools.cache import ToolResultCache, tool_cache_key
+from src.tools.executor import ToolExecutor
+from src.tools.registry import ToolRegistry, ToolSpec
+
+HERE = __name__
+TOOL_DELAY = 0.05
+
+
+async def fake_search(query: str, limit: int = 10) -> dict:
+    await asyncio.sleep(TOOL_DELAY)
+    return {"query": query, "results": [f"{query} 결과 {i}" for i in range(limit)]}
+
+
+def _workload(calls: int, queries: int, users: int, seed: int = 7) -> list[tuple[str, dict]]:
+    rng = random.Random(seed)
+    weights = [1 / (rank + 1) for rank in range(queries)]  # Zipf(s=1)
+    picks = rng.choices(range(queries), weights=weights, k=calls)
+    return [(f"user{rng.randrange(users)}", {"query": f"질문 {q}", "limit": 10}) for q in picks]
+
+
+async def _run(executor: ToolExecutor, workload: list, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def call(scope: str, params: dict) -> None:
+        async with semaphore:
+            await executor.execute("search", params, scope=scope)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(call(scope, params) for scope, params in workload))
+    return time.perf_counter() - started
+
+
+async def main(calls: int, queries: int, users: int, concurrency: int) -> None:
+    registry = ToolRegistry([
+        ToolSpec("search", "검색", handler=f"{HERE}:fake_search", cache_ttl=300.0, max_concurrency=concurrency),
+    ])
+    workload = _workload(calls, queries, users)
+
+    plain = ToolExecutor(registry)
+    plain_s = await _run(plain, workload, concurrency)
+
+    cache = ToolResultCache(max_entries=queries * users)
+    cached = ToolExecutor(registry, cache=cache)
+    cached_s = await _run(cached, workload, concurrency)
+
+    start = time.perf_counter()
+    for scope, params in workload:
+        tool_cache_key("search", params, scope)
+    key_us = (time.perf_counter() - start) / len(workload) * 1e6
+
+    stats = cache.stats.as_dict()
+    print(f"calls={calls} queries={queries} users={users} tool={TOOL_DELAY * 1000:.0f}ms concurrency={concurrency}")
+    print(f"no cache : {plain_s:6.2f}s  executions={plain.stats.calls}  latency={plain.latency.as_dict()}")
+    print(f"cache    : {cached_s:6.2f}s  executions={cached.stats.calls}  hit_rate={stats['hit_rate']:.1%}")
+    print(f"memory   : {stats['entries']} entries / {stats['bytes'] / 1024:.1f} KiB, evictions={stats['evictions']}")
+    print(f"key      : {key_us:.2f} µs/call (정규 JSON + SHA-256)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--users", type=int, default=4)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--tool-ms", type=float, default=50.0)
+    args = parser.parse_args()
+    TOOL_DELAY = args.tool_ms / 1000
+    asyncio.run(main(args.calls, args.queries, args.users, args.concurrency))
@@ -0,0 +1,180 @@
+"""
+Tool Calling Round Trips Benchmark
+
+턴당 LLM 왕복 횟수 / Tool 선택 정확도 비교 (스크립트 모델, httpx MockTransport)
+- legacy-strict: Intent Parser 프롬프트 JSON + json.loads (코드 펜스면 조용히 "Tool 없음" → 일반 응답 재호출)
+- legacy       : 같은 경로 + 관대한 JSON 추출 (extract_json)
+- json         : 한 번의 호출에서 JSON Tool 호출을 텍스트로 출력 (native 미지원 모델용)
+- native       : 한 번의 호출로 직접 답변 또는 tool_calls
+
+스크립트 모델은 --fence-rate 비율로 JSON을 ```json 펜스로 감싸 답합니다.
+
+실행: python -m benchmarks.bench_tool_calling [--turns 210] [--fence-rate 0.5] [--stream]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+import httpx
+
+import src.agents.intent_parser as intent_parser_module
+from src.agents.orchestrator import AgentOrchestrator
+from src.llm.provider import LLMProvider
+from src.memory.session import InMemorySessionStore, SessionMemory
+
+# (메시지, 기대 Tool, 모델이 추출할 파라미터)
+SCRIPT = [
+    ("요즘 잠이 잘 안 와", None, None),
+    ("오늘 하루 너무 길었어", None, None),
+    ("그냥 얘기 좀 들어줄래?", None, None),
+    ("내일 오후 3시에 팀 회의 잡아줘", "create_event", {"title": "팀 회의", "start_time": "내일 15:00"}),
+    ("moonlight 레포에 로그인 버그 이슈 올려줘", "github_issues", {"repo": "moonlight", "title": "로그인 버그"}),
+    ("오늘 서울 날씨 검색해줘", "google_search", {"query": "오늘 서울 날씨"}),
+    ("김대리한테 회의록 보내줘 kim@example.com", "send_email",
+     {"to": "kim@example.com", "subject": "회의록", "body": "회의록 공유드립니다."}),
+]
+EXPECTED = {message: tool for message, tool, _ in SCRIPT}
+ARGS = {message: args for message, _, args in SCRIPT}
+
+
+class ScriptedModel:
+    """payload 형태에 따라 답하는 가짜 OpenRouter"""
+
+    def __init__(self, fence_rate: float, seed: int = 3):
+        self.fence_rate = fence_rate
+        self.rng = random.Random(seed)
+        self.requests = 0
+
+    def _json_text(self, value: dict) -> str:
+        text = json.dumps(value, ensure_ascii=False)
+        if self.rng.random() < self.fence_rate:
+            return f"```json\n{text}\n```"
+        return text
+
+    def respond(self, payload: dict) -> dict:
+        """→ OpenAI 형식 message"""
+        messages = payload["messages"]
+        last = messages[-1]["content"]
+
+        if "다음 JSON 형식으로만 답하세요" in last:  # legacy Intent Parser
+            user = last.split("사용자 메시지: ", 1)[1].split("\n", 1)[0]
+            tool = EXPECTED.get(user)
+            return {"content": self._json_text({
+                "tool_needed": tool is not None,
+                "tool_name": tool,
+                "parameters": ARGS.get(user) or {},
+                "confidence": 0.9,
+            })}
+
+        tool = EXPECTED.get(last)
+        if payload.get("tools") and tool:  # native
+            return {"content": None, "tool_calls": [{
+                "id": "call_1",
+                "type": "function",
+                "function": {"name": tool, "arguments": json.dumps(ARGS[last], ensure_ascii=False)},
+            }]}
+        if tool and any("JSON만 출력하세요" in m["content"] for m in messages if m["role"] == "system"):
+            return {"content": self._json_text({"tool": tool, "parameters": ARGS[last]})}
+        return {"content": "주인님, 듣고 있어요. 천천히 말씀해주세요."}
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        payload = json.loads(request.content)
+        message = self.respond(payload)
+
+        if not payload.get("stream"):
+            return httpx.Response(200, json={"choices": [{"message": message}]})
+
+        events = []
+        if message.get("content"):
+            text = message["content"]
+            for i in range(0, len(text), 8):
+                events.append({"choices": [{"delta": {"content": text[i:i + 8]}}]})
+        for index, call in enumerate(message.get("tool_calls") or ()):
+            arguments = call["function"]["arguments"]
+            events.append({"choices": [{"delta": {"tool_calls": [
+                {"index": index, "id": call["id"], "function": {"name": call["function"]["name"], "arguments": ""}}
+            ]}}]})
+            for i in range(0, len(arguments), 16):
+                events.append({"choices": [{"delta": {"tool_calls": [
+                    {"index": index, "function": {"arguments": arguments[i:i + 16]}}
+                ]}}]})
+        body = "".join(f"data: {json.dumps(e, ensure_ascii=False)}\n\n" for e in events) + "data: [DONE]\n\n"
+        return httpx.Response(200, text=body, headers={"content-type": "text/event-stream"})
+
+
+def _strict_extract(text):
+    """변경 전 동작 (json.loads 실패 → None)"""
+    try:
+        return json.loads(text)
+    except (json.JSONDecodeError, TypeError):
+        return None
+
+
+async def _run_mode(mode: str, turns: int, fence_rate: float, stream: bool) -> dict:
+    model = ScriptedModel(fence_rate)
+    client = httpx.AsyncClient(transport=httpx.MockTransport(model.handler), base_url="http://mock/api/v1")
+    llm = LLMProvider(client=client)
+    llm.cache = None  # 왕복 수만 측정
+
+    orchestrator = AgentOrchestrator(
+        llm=llm,
+        writer=None,
+        sessions=SessionMemory(InMemorySessionStore()),
+    )
+    orchestrator.intent_parser.cache = None
+    orchestrator.tool_calling = "legacy" if mode.startswith("legacy") else mode
+
+    original = intent_parser_module.extract_json
+    if mode == "legacy-strict":
+        intent_parser_module.extract_json = _strict_extract
+
+    correct = 0
+    chat_trips = chat_turns = 0
+    started = time.perf_counter()
+    try:
+        for i in range(turns):
+            message, expected, _ = SCRIPT[i % len(SCRIPT)]
+            before = model.requests
+            if stream:
+                async for event in orchestrator.process_stream("bench", message, session_id=f"s{i}"):
+                    if event.type == "done":
+                        tool_used = event.tool_used
+            else:
+                tool_used = (await orchestrator.process("bench", message, session_id=f"s{i}")).tool_used
+            correct += tool_used == expected
+            if expected is None:
+                chat_trips += model.requests - before
+                chat_turns += 1
+    finally:
+        intent_parser_module.extract_json = original
+        await client.aclose()
+
+    return {
+        "mode": mode,
+        "round_trips_per_turn": model.requests / turns,
+        "chat_round_trips": chat_trips / max(chat_turns, 1),
+        "tool_accuracy": correct / turns,
+        "elapsed_ms_per_turn": (time.perf_counter() - started) / turns * 1000,
+    }
+
+
+async def main(turns: int, fence_rate: float, stream: bool) -> None:
+    print(f"turns={turns} fence_rate={fence_rate} stream={stream} (메시지 {len(SCRIPT)}종 순환)")
+    print(f"{'mode':>14} {'LLM 왕복/턴':>12} {'(일반 대화)':>12} {'Tool 정확도':>12} {'ms/턴':>8}")
+    for mode in ("legacy-strict", "legacy", "json", "native"):
+        r = await _run_mode(mode, turns, fence_rate, stream)
+        print(f"{r['mode']:>14} {r['round_trips_per_turn']:>12.2f} {r['chat_round_trips']:>12.2f} "
+              f"{r['tool_accuracy']:>12.1%} {r['elapsed_ms_per_turn']:>8.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--turns", type=int, default=210)
+    parser.add_argument("--fence-rate", type=float, default=0.5, help="JSON을 코드 펜스로 감싸는 비율")
+    parser.add_argument("--stream", action="store_true", help="process_stream 경로 측정")
+    args = parser.parse_args()
+    asyncio.run(main(args.turns, args.fence_rate, args.stream))
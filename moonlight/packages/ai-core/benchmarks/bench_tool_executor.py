@@ -0,0 +1,128 @@
+"""
+Tool Executor Load Test
+
+가짜 Tool로 실행 엔진 동작 확인
+- 벌크헤드: 느린 GitHub 호출이 몰릴 때 검색 지연시간 (Tool별 벌크헤드 vs 공유 동시성 제한)
+- 병렬 실행: 한 응답의 독립 Tool 호출 N개 (순차 vs execute_many)
+- 제한 시간: 멈춘 Tool이 timeout 안에 실패로 반환되는지
+- 풀: blocking I/O (스레드), CPU 작업 (프로세스)
+
+실행: python -m benchmarks.bench_tool_executor [--github 100] [--search 200] [--github-ms 300]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import time
+
+from src.metrics.histogram import Histogram
+from src.tools.executor import ToolCall, ToolExecutor
+from src.tools.registry import ToolRegistry, ToolSpec
+
+HERE = __name__
+GITHUB_DELAY = 0.3
+
+
+async def fake_search(query: str) -> dict:
+    await asyncio.sleep(0.01)
+    return {"query": query, "results": 3}
+
+
+async def fake_github(repo: str) -> dict:
+    await asyncio.sleep(GITHUB_DELAY)
+    return {"repo": repo, "issues": 12}
+
+
+def fake_blocking(delay: float) -> str:
+    time.sleep(delay)
+    return "ok"
+
+
+def fake_cpu(rounds: int) -> str:
+    digest = b"moonlight"
+    for _ in range(rounds):
+        digest = hashlib.sha256(digest).digest()
+    return digest.hex()[:8]
+
+
+async def fake_hang() -> None:
+    await asyncio.sleep(3600)
+
+
+def _registry() -> ToolRegistry:
+    return ToolRegistry([
+        ToolSpec("search", "검색", handler=f"{HERE}:fake_search", timeout=2.0, max_concurrency=64),
+        ToolSpec("github", "GitHub", handler=f"{HERE}:fake_github", timeout=30.0, max_concurrency=4),
+        ToolSpec("blocking", "blocking I/O", handler=f"{HERE}:fake_blocking"),
+        ToolSpec("cpu", "CPU 작업", handler=f"{HERE}:fake_cpu", blocking="process", timeout=30.0),
+        ToolSpec("hang", "멈춘 Tool", handler=f"{HERE}:fake_hang", timeout=0.2),
+    ])
+
+
+async def _flood(executor: ToolExecutor, github: int, search: int, shared: asyncio.Semaphore = None) -> Histogram:
+    """GitHub 호출을 먼저 몰아넣고 검색 지연시간 측정"""
+    search_latency = Histogram("search_ms")
+
+    async def call(name: str, params: dict) -> None:
+        started = time.perf_counter()
+        if shared is None:
+            await executor.execute(name, params)
+        else:
+            async with shared:
+                await executor.execute(name, params)
+        if name == "search":
+            search_latency.observe((time.perf_counter() - started) * 1000)
+
+    tasks = [call("github", {"repo": f"moonlight/{i}"}) for i in range(github)]
+    tasks += [call("search", {"query": f"날씨 {i}"}) for i in range(search)]
+    await asyncio.gather(*tasks)
+    return search_latency
+
+
+async def main(github: int, search: int) -> None:
+    registry = _registry()
+
+    # 1. 벌크헤드
+    executor = ToolExecutor(registry, default_concurrency=8)
+    isolated = await _flood(executor, github, search)
+    shared = await _flood(ToolExecutor(registry), github, search, asyncio.Semaphore(8))
+    print(f"[bulkhead] github={github} ({GITHUB_DELAY * 1000:.0f}ms, 동시 4) + search={search}")
+    print(f"  Tool별 벌크헤드 : search {isolated.as_dict()}")
+    print(f"  공유 제한(8)    : search {shared.as_dict()}")
+
+    # 2. 병렬 실행
+    calls = [ToolCall("blocking", {"delay": 0.1}) for _ in range(5)]
+    started = time.perf_counter()
+    for call in calls:
+        await executor.execute(call.tool_name, call.parameters)
+    sequential_ms = (time.perf_counter() - started) * 1000
+    started = time.perf_counter()
+    results = await executor.execute_many(calls)
+    parallel_ms = (time.perf_counter() - started) * 1000
+    print(f"[execute_many] 5 x 100ms blocking: 순차 {sequential_ms:.0f}ms / 병렬 {parallel_ms:.0f}ms "
+          f"(성공 {sum(r.success for r in results)}/5)")
+
+    # 3. 제한 시간
+    hang = await executor.execute("hang")
+    print(f"[timeout] hang: success={hang.success} timed_out={hang.timed_out} "
+          f"{hang.execution_time_ms}ms error={hang.error!r}")
+
+    # 4. CPU 작업 (프로세스 풀)
+    started = time.perf_counter()
+    cpu = await executor.execute_many([ToolCall("cpu", {"rounds": 200_000}) for _ in range(4)])
+    print(f"[process pool] 4 x sha256(200k): {(time.perf_counter() - started) * 1000:.0f}ms "
+          f"(성공 {sum(r.success for r in cpu)}/4)")
+
+    print(f"stats: {executor.stats.as_dict()}")
+    print(f"latency: {executor.latency.as_dict()}")
+    executor.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--github", type=int, default=100)
+    parser.add_argument("--search", type=int, default=200)
+    parser.add_argument("--github-ms", type=float, default=300.0)
+    args = parser.parse_args()
+    GITHUB_DELAY = args.github_ms / 1000
+    asyncio.run(main(args.github, args.search))
@@ -0,0 +1,124 @@
+"""
+Tool Registry Benchmark
+
+Tool N개 (매니페스트 *.yaml) 기준 시작 비용과 스키마 캐시 효과
+- eager: 디스커버리 시 모든 파라미터 모듈을 바로 import
+- lazy : 메타데이터만 읽고 첫 사용 시 import (ToolRegistry)
+
+각 Tool 모듈은 실제 SDK import 비용을 흉내내도록 import 시 --import-ms 만큼 대기합니다.
+
+실행: python -m benchmarks.bench_tool_registry [--tools 200] [--import-ms 2] [--budget-ms 200]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+from src.tools.builtin import BUILTIN_TOOLS
+from src.tools.registry import ToolRegistry
+
+MODULE_TEMPLATE = '''
+import time
+from typing import Optional
+
+from pydantic import BaseModel
+
+time.sleep({delay})
+
+
+class Params(BaseModel):
+    query: str
+    limit: int = 10
+    note: Optional[str] = None
+'''
+
+
+def _write_plugins(root: Path, tools: int, import_ms: float, per_manifest: int = 20) -> Path:
+    """임시 Tool 모듈 + 매니페스트 생성"""
+    package = root / "bench_plugins"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    manifests = root / "manifests"
+    manifests.mkdir()
+
+    specs = []
+    for i in range(tools):
+        (package / f"tool_{i}.py").write_text(MODULE_TEMPLATE.format(delay=import_ms / 1000))
+        specs.append({
+            "name": f"plugin_tool_{i}",
+            "description": f"플러그인 Tool {i}",
+            "category": "plugin",
+            "keywords": [f"플러그인{i}"],
+            "params": f"bench_plugins.tool_{i}:Params",
+        })
+
+    for start in range(0, tools, per_manifest):
+        chunk = specs[start:start + per_manifest]
+        with open(manifests / f"plugins_{start:04d}.yaml", "w", encoding="utf-8") as f:
+            yaml.safe_dump({"tools": chunk}, f, allow_unicode=True)
+    return manifests
+
+
+def _purge_plugins() -> None:
+    for name in [m for m in sys.modules if m.startswith("bench_plugins")]:
+        del sys.modules[name]
+
+
+def main(tools: int, import_ms: float, budget_ms: float) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        manifests = _write_plugins(root, tools, import_ms)
+        sys.path.insert(0, str(root))
+
+        # lazy: 메타데이터만
+        start = time.perf_counter()
+        lazy = ToolRegistry(BUILTIN_TOOLS)
+        lazy.discover(group=None, manifest_dir=str(manifests))
+        lazy_ms = (time.perf_counter() - start) * 1000
+
+        # 첫 사용 (Tool 하나)
+        start = time.perf_counter()
+        lazy.param_model("plugin_tool_0")
+        first_use_ms = (time.perf_counter() - start) * 1000
+
+        # eager: 시작 시 모든 모듈 import
+        _purge_plugins()
+        start = time.perf_counter()
+        eager = ToolRegistry(BUILTIN_TOOLS)
+        eager.discover(group=None, manifest_dir=str(manifests))
+        for spec in eager:
+            eager.param_model(spec.name)
+        eager_ms = (time.perf_counter() - start) * 1000
+
+        # function calling 스키마: 첫 생성 vs 캐시
+        start = time.perf_counter()
+        schemas = eager.function_schemas()
+        cold_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        for _ in range(100):
+            eager.function_schemas()
+        warm_us = (time.perf_counter() - start) / 100 * 1e6
+
+        sys.path.remove(str(root))
+        _purge_plugins()
+
+    total = len(lazy)
+    print(f"tools={total} (builtin {len(BUILTIN_TOOLS)} + plugin {tools}) import={import_ms}ms/module")
+    print(f"lazy  discovery : {lazy_ms:8.1f} ms  {'OK' if lazy_ms <= budget_ms else 'OVER'} (budget {budget_ms}ms)")
+    print(f"eager discovery : {eager_ms:8.1f} ms  {'OK' if eager_ms <= budget_ms else 'OVER'}")
+    print(f"first use       : {first_use_ms:8.1f} ms  (모듈 1개 import)")
+    print(f"function schemas: cold {cold_ms:.1f} ms / cached {warm_us:.2f} µs ({len(schemas)} tools)")
+    print(f"stats: {lazy.stats.as_dict()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tools", type=int, default=200)
+    parser.add_argument("--import-ms", type=float, default=2.0, help="Tool 모듈 import 지연 (SDK 흉내)")
+    parser.add_argument("--budget-ms", type=float, default=200.0, help="시작 시 디스커버리 예산")
+    args = parser.parse_args()
+    main(args.tools, args.import_ms, args.budget_ms)
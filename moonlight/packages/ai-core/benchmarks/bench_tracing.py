@@ -0,0 +1,131 @@
+"""
+Tracing Overhead Benchmark
+
+span 하나의 비용 (µs) 과 턴 단위 오버헤드
+- disabled    : 추적 비활성화 (no-op 컨텍스트 매니저)
+- span        : Trace 없이 span (히스토그램만 기록)
+- trace+span  : 요청 Trace 안에서 span (Server-Timing / 최근 Trace 보관 포함)
+- nested      : 부모 span 안의 자식 span (2단계)
+- detached    : start_span()/end() (스트리밍 제너레이터용)
+- 턴 단위     : 스크립트 모델로 orchestrator.process 를 추적 켬/끔 비교 (ms/턴)
+
+실행: python -m benchmarks.bench_tracing [--spans 200000] [--turns 2000] [--rounds 3]
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from benchmarks.bench_tool_calling import SCRIPT, ScriptedModel
+from src.agents.orchestrator import AgentOrchestrator
+from src.llm.provider import LLMProvider
+from src.memory.session import InMemorySessionStore, SessionMemory
+from src.metrics.tracing import Tracer, tracer
+
+
+def _per_span_us(run, n: int) -> float:
+    started = time.perf_counter_ns()
+    run(n)
+    return (time.perf_counter_ns() - started) / n / 1000
+
+
+def _bench_spans(n: int) -> dict[str, float]:
+    t = Tracer(keep_traces=10)
+
+    def baseline(n):
+        for _ in range(n):
+            pass
+
+    def disabled(n):
+        t.enabled = False
+        for _ in range(n):
+            with t.span("stage", tool="search"):
+                pass
+        t.enabled = True
+
+    def plain(n):
+        for _ in range(n):
+            with t.span("stage", tool="search"):
+                pass
+
+    def traced(n):
+        # 요청당 span 8개 정도를 흉내 (Trace 하나에 span이 무한히 쌓이지 않도록)
+        for _ in range(n // 8):
+            with t.start_trace():
+                for _ in range(8):
+                    with t.span("stage", tool="search"):
+                        pass
+
+    def nested(n):
+        for _ in range(n // 2):
+            with t.span("parent"):
+                with t.span("child"):
+                    pass
+
+    def detached(n):
+        for _ in range(n):
+            t.end(t.start_span("stream", model="m"))
+
+    base = _per_span_us(baseline, n)
+    return {
+        name: _per_span_us(run, n) - base
+        for name, run in (
+            ("disabled", disabled),
+            ("span", plain),
+            ("trace+span", traced),
+            ("nested", nested),
+            ("detached", detached),
+        )
+    }
+
+
+async def _bench_turns(turns: int, enabled: bool) -> tuple[float, float]:
+    """→ (ms/턴, 턴당 span 수)"""
+    model = ScriptedModel(fence_rate=0.0)
+    client = httpx.AsyncClient(transport=httpx.MockTransport(model.handler), base_url="http://mock/api/v1")
+    llm = LLMProvider(client=client)
+    llm.cache = None
+    orchestrator = AgentOrchestrator(llm=llm, writer=None, sessions=SessionMemory(InMemorySessionStore()))
+    orchestrator.intent_parser.cache = None
+
+    tracer.enabled = enabled
+    spans = 0
+    started = time.perf_counter()
+    try:
+        for i in range(turns):
+            message = SCRIPT[i % len(SCRIPT)][0]
+            with tracer.start_trace() as trace:
+                await orchestrator.process("bench", message, session_id=f"s{i % 50}")
+            spans += len(trace.spans)
+    finally:
+        tracer.enabled = True
+        await client.aclose()
+    return (time.perf_counter() - started) / turns * 1000, spans / turns
+
+
+async def main(spans: int, turns: int, rounds: int) -> None:
+    print(f"span 비용 (µs/span, 빈 루프 제외, n={spans})")
+    for name, us in _bench_spans(spans).items():
+        print(f"  {name:>12}: {us:6.2f}")
+
+    print(f"\n턴 단위 (native, 스크립트 모델, turns={turns}, 번갈아 {rounds}회 중 최솟값)")
+    await _bench_turns(min(turns, 100), True)  # 워밍업
+    off: list[float] = []
+    on: list[float] = []
+    for _ in range(rounds):
+        off.append((await _bench_turns(turns, False))[0])
+        ms, spans_per_turn = await _bench_turns(turns, True)
+        on.append(ms)
+    print(f"  추적 끔 : {min(off):.3f} ms/턴")
+    print(f"  추적 켬 : {min(on):.3f} ms/턴  ({(min(on) - min(off)) * 1000:+.1f} µs/턴, 턴당 span {spans_per_turn:.1f}개)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--spans", type=int, default=200_000)
+    parser.add_argument("--turns", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.spans, args.turns, args.rounds))
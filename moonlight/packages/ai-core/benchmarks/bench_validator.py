@@ -0,0 +1,111 @@
+"""
+Parameter Validation Benchmark
+
+Tool별 초당 검증 수 (valid / 누락 / 형식 오류)
+- legacy  : model(**parameters) → ValidationError.errors() 순회 → 호출마다 필드 이름 dict 생성
+- compiled: 필수 필드 집합 차 → pydantic-core 검증기, 명확화 질문은 미리 생성
+- batch   : Tool 호출 3개를 asyncio.gather(validate) vs validate_many
+
+실행: python -m benchmarks.bench_validator [--iterations 50000]
+"""
+
+import argparse
+import asyncio
+import time
+
+from pydantic import ValidationError
+
+from src.agents.validator import ParameterValidatorAgent, ValidationResult
+from src.tools.registry import get_tool_registry
+
+CASES = {
+    "send_email": {
+        "valid": {"to": "kim@example.com", "subject": "회의록", "body": "공유드립니다."},
+        "missing": {"subject": "회의록"},
+        "invalid": {"to": "kim", "subject": "회의록", "body": "공유드립니다."},
+    },
+    "google_search": {
+        "valid": {"query": "오늘 서울 날씨"},
+        "missing": {},
+        "invalid": {"query": ["오늘", "날씨"]},
+    },
+    "create_event": {
+        "valid": {"title": "팀 회의", "start_time": "내일 15:00"},
+        "missing": {"start_time": "내일 15:00"},
+        "invalid": {"title": 3.5},
+    },
+    "github_issues": {
+        "valid": {"repo": "moonlight", "title": "로그인 버그"},
+        "missing": {"repo": "moonlight"},
+        "invalid": {"repo": {"name": "moonlight"}, "title": "로그인 버그"},
+    },
+}
+
+
+def _legacy_validate(registry, tool_name: str, parameters: dict) -> ValidationResult:
+    """변경 전 ParameterValidatorAgent.validate (await 제외)"""
+    model = registry.param_model(tool_name)
+    try:
+        return ValidationResult(is_valid=True, tool_name=tool_name, parameters=model(**parameters).model_dump())
+    except ValidationError as e:
+        missing = [err["loc"][0] for err in e.errors() if err["type"] == "missing"]
+        if not missing:
+            return ValidationResult(is_valid=False, clarification_message="주인님, 입력 형식이 올바르지 않은 것 같아요.")
+        field_names = {
+            "to": "받는 사람 이메일",
+            "subject": "제목",
+            "body": "내용",
+            "query": "검색어",
+            "title": "제목",
+            "start_time": "시작 시간",
+            "end_time": "종료 시간",
+            "repo": "저장소 이름",
+        }
+        labels = [field_names.get(f, f) for f in missing]
+        return ValidationResult(is_valid=False, clarification_message=f"주인님, {', '.join(labels)}을(를) 알려주시겠어요?")
+
+
+def _rate(fn, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return iterations / (time.perf_counter() - started)
+
+
+async def _batch(agent: ParameterValidatorAgent, iterations: int) -> tuple[float, float]:
+    calls = [(tool, cases["valid"]) for tool, cases in list(CASES.items())[:3]]
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await asyncio.gather(*(agent.validate(tool, params, {}) for tool, params in calls))
+    gathered = iterations / (time.perf_counter() - started)
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        agent.validate_many(calls)
+    batched = iterations / (time.perf_counter() - started)
+    return gathered, batched
+
+
+def main(iterations: int) -> None:
+    registry = get_tool_registry()
+    registry.compile_validators()
+    agent = ParameterValidatorAgent(llm=None, registry=registry)
+
+    print(f"iterations={iterations} (천 건/초)")
+    print(f"{'tool':>14} {'case':>8} {'legacy':>9} {'compiled':>9} {'배율':>6}")
+    for tool, cases in CASES.items():
+        for case, params in cases.items():
+            legacy = _rate(lambda: _legacy_validate(registry, tool, params), iterations)
+            compiled = _rate(lambda: agent.check(tool, params), iterations)
+            print(f"{tool:>14} {case:>8} {legacy / 1000:>9.0f} {compiled / 1000:>9.0f} {compiled / legacy:>5.1f}x")
+
+    gathered, batched = asyncio.run(_batch(agent, iterations // 10))
+    print(f"\n호출 3개 일괄 검증 (천 배치/초): gather(validate) {gathered / 1000:.1f}  validate_many {batched / 1000:.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=50_000)
+    args = parser.parse_args()
+    main(args.iterations)
@@ -0,0 +1,100 @@
+"""
+Worker Scaling Benchmark
+
+Mock OpenRouter 하나 앞에 AI Core(python -m src.server)를 워커 수별로 띄우고 같은 부하를 보냄
+- 처리량 (턴/s), 워커 1개 대비 배율, 지연시간 p50/p95
+- 업스트림 지연을 짧게 두어 AI Core 자체 CPU(요청 파싱, 컨텍스트 구성, 직렬화)가 병목이 되도록 함
+- 공유 상태는 기본 memory (워커별), --env SHARED_BACKEND=redis 로 Redis 공유 비용 포함 측정
+
+배율은 CPU 코어 수를 넘지 못합니다 (코어 1개 환경에서는 워커를 늘려도 그대로).
+
+실행: python -m benchmarks.bench_workers [--workers 1,2,4] [--modes rest,ws] [--concurrency 64] [--turns 1000]
+"""
+
+import argparse
+import asyncio
+import os
+
+from .loadtest import LoadDriver, _free_port, _print_result, _spawn, _wait_ready, run_scenario
+
+
+def _stop(process) -> None:
+    process.terminate()
+    try:
+        process.wait(timeout=60)
+    except Exception:
+        process.kill()
+
+
+async def _measure(workers: int, mock_url: str, args: argparse.Namespace) -> list[dict]:
+    env = {
+        "OPENROUTER_BASE_URL": f"{mock_url}/api/v1",
+        "OPENROUTER_API_KEY": "mock",
+        "DEBUG": "false",
+        "ADMISSION_ENABLED": "false",
+        # 같은 메시지가 반복되므로 캐시를 끄고 매 턴 전체 경로를 태움
+        "LLM_CACHE_BACKEND": "none",
+        "INTENT_CACHE_ENABLED": "false",
+    }
+    env.update(dict(item.split("=", 1) for item in args.env))
+    port = _free_port()
+    process = _spawn(["-m", "src.server", "--port", str(port), "--workers", str(workers), "--log-level", "warning"], env)
+    try:
+        app_url = f"http://127.0.0.1:{port}"
+        _wait_ready(f"{app_url}/api/health", process, timeout=60)
+        driver = LoadDriver(app_url, timeout=args.timeout)
+        # 워커마다 첫 요청 비용이 들어가지 않도록 충분히 예열
+        await driver.run("rest", max(workers * 4, 8), args.warmup)
+
+        results = []
+        for mode in args.modes.split(","):
+            result = await run_scenario(driver, mode, args.concurrency, args.turns, mock_url)
+            result["workers"] = workers
+            results.append(result)
+        return results
+    finally:
+        _stop(process)
+
+
+async def main(args: argparse.Namespace) -> None:
+    port = _free_port()
+    mock = _spawn([
+        "-m", "benchmarks.mock_openrouter", "--port", str(port),
+        "--latency-ms", str(args.latency_ms), "--jitter-ms", "0", "--token-delay-ms", "0",
+    ])
+    mock_url = f"http://127.0.0.1:{port}"
+    try:
+        _wait_ready(f"{mock_url}/stats", mock)
+        print(f"CPU {os.cpu_count()}개, latency={args.latency_ms:g}ms concurrency={args.concurrency} turns={args.turns}")
+
+        baseline: dict[str, float] = {}
+        rows = []
+        for workers in (int(w) for w in args.workers.split(",")):
+            print(f"\n워커 {workers}개")
+            for r in await _measure(workers, mock_url, args):
+                _print_result(r)
+                baseline.setdefault(r["mode"], r["throughput_rps"])
+                rows.append(r)
+    finally:
+        _stop(mock)
+
+    print(f"\n{'mode':>6} {'workers':>8} {'턴/s':>8} {'배율':>6} {'p50 ms':>8} {'p95 ms':>8}")
+    for r in rows:
+        base = baseline[r["mode"]]
+        scale = r["throughput_rps"] / base if base else 0.0
+        lat = r["latency_ms"]
+        print(f"{r['mode']:>6} {r['workers']:>8} {r['throughput_rps']:>8.1f} {scale:>5.2f}x "
+              f"{lat.get('p50', 0):>8.1f} {lat.get('p95', 0):>8.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", default="1,2,4", help="쉼표 구분 워커 수")
+    parser.add_argument("--modes", default="rest,ws", help="쉼표 구분 (rest, stream, ws)")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--turns", type=int, default=1000)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Mock 업스트림 지연")
+    parser.add_argument("--env", action="append", default=[], help="서버 환경변수 KEY=VALUE (반복 가능)")
+    asyncio.run(main(parser.parse_args()))
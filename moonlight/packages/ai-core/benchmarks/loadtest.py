@@ -0,0 +1,440 @@
+"""
+Load Test
+
+로컬 Mock OpenRouter 앞에 AI Core(python -m src.server)를 띄우고 REST / SSE / WebSocket 대화를 동시성별로 부하
+- 처리량 (턴/s), 지연시간 p50/p95/p99, 첫 delta까지 시간 (stream / ws)
+- 턴당 업스트림 호출 수 (Mock /stats 차이), 업스트림 오류 수
+- REST는 Server-Timing 헤더의 단계별 평균 (ms)
+- 결과를 JSON으로 저장 → 커밋 간 회귀 비교 (--compare)
+
+실행:
+    python -m benchmarks.loadtest --modes rest,stream,ws --concurrency 1,8,32 --turns 200 --out results/HEAD.json
+    python -m benchmarks.loadtest --latency-ms 300 --distribution lognormal --error-rate 0.05 --tool-call-rate 0.2
+    python -m benchmarks.loadtest --app-url http://localhost:8000   # 이미 떠 있는 서버 (업스트림 통계 없음)
+    python -m benchmarks.loadtest --compare results/main.json results/HEAD.json
+
+서버 설정은 환경변수로 전달합니다 (--env TOOL_CALLING_MODE=legacy).
+수락 제어는 기본으로 끄고 띄웁니다 (용량 측정). 한도/대기열 동작은 --env ADMISSION_ENABLED=true 로 확인하고,
+429 응답 수는 rejected 로 따로 집계합니다.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+import httpx
+
+from .mock_openrouter import DISTRIBUTIONS
+
+ROOT = Path(__file__).resolve().parent.parent  # packages/ai-core
+MODES = ("rest", "stream", "ws")
+
+# (메시지, 경로) 일반 대화 위주 + 키워드 fast path Tool 호출
+MESSAGES = [
+    "요즘 잠이 잘 안 와",
+    "오늘 하루 너무 길었어",
+    "그냥 얘기 좀 들어줄래?",
+    "오늘 서울 날씨 검색해줘",
+    "주말에 뭐 하면 좋을까",
+]
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _spawn(args: list[str], env: Optional[dict] = None) -> subprocess.Popen:
+    return subprocess.Popen(
+        [sys.executable, *args],
+        cwd=ROOT,
+        env={**os.environ, **(env or {})},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def _wait_ready(url: str, process: Optional[subprocess.Popen] = None, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            raise RuntimeError(f"프로세스가 종료되었습니다 (code={process.returncode}): {url}")
+        try:
+            if httpx.get(url, timeout=1.0).status_code < 500:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.1)
+    raise TimeoutError(f"서버 준비 시간 초과: {url}")
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def percentile(values: list[float], q: float) -> float:
+    """최근접 순위 백분위수 (정렬된 입력)"""
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, max(0, int(round(q / 100 * len(values) + 0.5)) - 1))
+    return values[index]
+
+
+def summarize(values: list[float]) -> dict:
+    ordered = sorted(values)
+    if not ordered:
+        return {"count": 0}
+    return {
+        "count": len(ordered),
+        "mean": sum(ordered) / len(ordered),
+        "p50": percentile(ordered, 50),
+        "p95": percentile(ordered, 95),
+        "p99": percentile(ordered, 99),
+        "max": ordered[-1],
+    }
+
+
+def parse_server_timing(header: Optional[str]) -> dict[str, float]:
+    """"intent;dur=12.3, llm;dur=410.2" → {"intent": 12.3, "llm": 410.2}"""
+    timings: dict[str, float] = {}
+    for metric in (header or "").split(","):
+        name, _, params = metric.strip().partition(";")
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "dur" and name:
+                timings[name] = timings.get(name, 0.0) + float(value)
+    return timings
+
+
+class Sample:
+    """턴 하나의 측정값"""
+
+    __slots__ = ("latency_ms", "ttft_ms", "ok", "timings", "rejected")
+
+    def __init__(
+        self,
+        latency_ms: float,
+        ttft_ms: Optional[float],
+        ok: bool,
+        timings: Optional[dict] = None,
+        rejected: bool = False,
+    ):
+        self.latency_ms = latency_ms
+        self.ttft_ms = ttft_ms
+        self.ok = ok
+        self.timings = timings
+        self.rejected = rejected  # 429 (수락 제어)
+
+
+class LoadDriver:
+    """가상 사용자 N명이 각자 순서대로 턴을 보내는 닫힌 루프 부하"""
+
+    def __init__(self, app_url: str, timeout: float = 60.0):
+        self.app_url = app_url.rstrip("/")
+        self.ws_url = "ws" + self.app_url[len("http"):] + "/api/chat/ws"
+        self.timeout = timeout
+
+    async def run(self, mode: str, concurrency: int, turns: int) -> tuple[list[Sample], float]:
+        """→ (샘플, 경과 시간 s)"""
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        async with httpx.AsyncClient(base_url=self.app_url, timeout=self.timeout, limits=limits) as client:
+            counter = iter(range(turns))
+            samples: list[Sample] = []
+
+            async def user(index: int) -> None:
+                if mode == "ws":
+                    await self._ws_user(index, counter, samples)
+                    return
+                for turn in counter:
+                    payload = self._payload(index, turn)
+                    if mode == "rest":
+                        samples.append(await self._rest(client, payload))
+                    else:
+                        samples.append(await self._stream(client, payload))
+
+            started = time.perf_counter()
+            await asyncio.gather(*(user(i) for i in range(concurrency)))
+            return samples, time.perf_counter() - started
+
+    @staticmethod
+    def _payload(user: int, turn: int) -> dict:
+        return {
+            "user_id": f"load{user}",
+            "session_id": f"load{user}",
+            "message": MESSAGES[turn % len(MESSAGES)],
+        }
+
+    async def _rest(self, client: httpx.AsyncClient, payload: dict) -> Sample:
+        started = time.perf_counter()
+        status = None
+        try:
+            response = await client.post("/api/chat", json=payload)
+            status = response.status_code
+            ok = status == 200
+            timings = parse_server_timing(response.headers.get("server-timing"))
+        except httpx.HTTPError:
+            ok, timings = False, None
+        return Sample((time.perf_counter() - started) * 1000, None, ok, timings, rejected=status == 429)
+
+    async def _stream(self, client: httpx.AsyncClient, payload: dict) -> Sample:
+        started = time.perf_counter()
+        ttft = None
+        ok = False
+        status = None
+        try:
+            async with client.stream("POST", "/api/chat/stream", json=payload) as response:
+                status = response.status_code
+                async for line in response.aiter_lines():
+                    if ttft is None and line.startswith("event: delta"):
+                        ttft = (time.perf_counter() - started) * 1000
+                    elif line.startswith("event: done"):
+                        ok = response.status_code == 200
+        except httpx.HTTPError:
+            ok = False
+        return Sample((time.perf_counter() - started) * 1000, ttft, ok, rejected=status == 429)
+
+    async def _ws_user(self, index: int, counter, samples: list[Sample]) -> None:
+        import websockets
+
+        async with websockets.connect(self.ws_url, open_timeout=self.timeout, max_size=None) as ws:
+            for turn in counter:
+                started = time.perf_counter()
+                ttft = None
+                ok = rejected = False
+                try:
+                    await ws.send(json.dumps(self._payload(index, turn), ensure_ascii=False))
+                    while True:
+                        event = json.loads(await asyncio.wait_for(ws.recv(), self.timeout))
+                        if event.get("type") == "delta" and ttft is None:
+                            ttft = (time.perf_counter() - started) * 1000
+                        elif event.get("type") == "done":
+                            ok = True
+                            break
+                        elif event.get("type") == "error":
+                            rejected = event.get("status") == 429
+                            break
+                except (asyncio.TimeoutError, websockets.WebSocketException):
+                    samples.append(Sample((time.perf_counter() - started) * 1000, ttft, False))
+                    return
+                samples.append(Sample((time.perf_counter() - started) * 1000, ttft, ok, rejected=rejected))
+
+
+async def _mock_stats(client: httpx.AsyncClient, mock_url: Optional[str]) -> Optional[dict]:
+    if mock_url is None:
+        return None
+    try:
+        return (await client.get(f"{mock_url}/stats")).json()
+    except httpx.HTTPError:
+        return None
+
+
+async def run_scenario(
+    driver: LoadDriver,
+    mode: str,
+    concurrency: int,
+    turns: int,
+    mock_url: Optional[str],
+) -> dict:
+    async with httpx.AsyncClient(timeout=5.0) as control:
+        before = await _mock_stats(control, mock_url)
+        samples, elapsed = await driver.run(mode, concurrency, turns)
+        after = await _mock_stats(control, mock_url)
+
+    ok = [s for s in samples if s.ok]
+    result = {
+        "mode": mode,
+        "concurrency": concurrency,
+        "turns": len(samples),
+        "errors": len(samples) - len(ok),
+        "rejected": sum(s.rejected for s in samples),
+        "duration_s": elapsed,
+        "throughput_rps": len(ok) / elapsed if elapsed else 0.0,
+        "latency_ms": summarize([s.latency_ms for s in ok]),
+    }
+    ttft = [s.ttft_ms for s in ok if s.ttft_ms is not None]
+    if ttft:
+        result["ttft_ms"] = summarize(ttft)
+
+    timed = [s.timings for s in ok if s.timings]
+    if timed:
+        stages: dict[str, float] = {}
+        for timings in timed:
+            for name, ms in timings.items():
+                stages[name] = stages.get(name, 0.0) + ms
+        result["server_timing_ms"] = {name: total / len(timed) for name, total in stages.items()}
+
+    if before is not None and after is not None and samples:
+        result["upstream_calls_per_turn"] = (after["requests"] - before["requests"]) / len(samples)
+        result["upstream_errors"] = after["errors"] - before["errors"]
+    return result
+
+
+def _print_result(r: dict) -> None:
+    lat = r["latency_ms"]
+    line = (
+        f"{r['mode']:>6} c={r['concurrency']:<4} {r['throughput_rps']:8.1f} 턴/s  "
+        f"p50={lat.get('p50', 0):8.1f}  p95={lat.get('p95', 0):8.1f}  p99={lat.get('p99', 0):8.1f} ms"
+    )
+    if "ttft_ms" in r:
+        line += f"  ttft p50={r['ttft_ms']['p50']:7.1f}"
+    if "upstream_calls_per_turn" in r:
+        line += f"  upstream/턴={r['upstream_calls_per_turn']:.2f}"
+    if r["errors"]:
+        line += f"  errors={r['errors']}"
+    if r.get("rejected"):
+        line += f" (429={r['rejected']})"
+    print(line)
+
+
+def compare(baseline_path: str, candidate_path: str) -> None:
+    """두 결과 파일의 (mode, concurrency)별 변화율"""
+    baseline = json.loads(Path(baseline_path).read_text(encoding="utf-8"))
+    candidate = json.loads(Path(candidate_path).read_text(encoding="utf-8"))
+    base = {(r["mode"], r["concurrency"]): r for r in baseline["results"]}
+
+    def delta(new: float, old: float) -> str:
+        return f"{(new - old) / old:+7.1%}" if old else "    n/a"
+
+    print(f"baseline  {baseline['meta'].get('commit')}  →  candidate  {candidate['meta'].get('commit')}")
+    print(f"{'mode':>6} {'c':>4} {'턴/s':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'upstream/턴':>12}")
+    for r in candidate["results"]:
+        old = base.get((r["mode"], r["concurrency"]))
+        if old is None:
+            continue
+        lat, old_lat = r["latency_ms"], old["latency_ms"]
+        upstream = ""
+        if "upstream_calls_per_turn" in r and "upstream_calls_per_turn" in old:
+            upstream = f"{old['upstream_calls_per_turn']:.2f}→{r['upstream_calls_per_turn']:.2f}"
+        print(
+            f"{r['mode']:>6} {r['concurrency']:>4} {delta(r['throughput_rps'], old['throughput_rps']):>8} "
+            f"{delta(lat.get('p50', 0), old_lat.get('p50', 0)):>8} "
+            f"{delta(lat.get('p95', 0), old_lat.get('p95', 0)):>8} "
+            f"{delta(lat.get('p99', 0), old_lat.get('p99', 0)):>8} {upstream:>12}"
+        )
+
+
+def _mock_args(args: argparse.Namespace, port: int) -> list[str]:
+    return [
+        "-m", "benchmarks.mock_openrouter",
+        "--port", str(port),
+        "--latency-ms", str(args.latency_ms),
+        "--jitter-ms", str(args.jitter_ms),
+        "--distribution", args.distribution,
+        "--sigma", str(args.sigma),
+        "--tail-rate", str(args.tail_rate),
+        "--tail-ms", str(args.tail_ms),
+        "--error-rate", str(args.error_rate),
+        "--tool-call-rate", str(args.tool_call_rate),
+        "--token-delay-ms", str(args.token_delay_ms),
+        "--seed", str(args.seed),
+    ]
+
+
+async def main(args: argparse.Namespace) -> None:
+    processes: list[subprocess.Popen] = []
+    mock_url = args.mock_url
+    app_url = args.app_url
+    try:
+        if app_url is None:
+            if mock_url is None:
+                port = _free_port()
+                processes.append(_spawn(_mock_args(args, port)))
+                mock_url = f"http://127.0.0.1:{port}"
+                _wait_ready(f"{mock_url}/stats", processes[-1])
+
+            env = {
+                "OPENROUTER_BASE_URL": f"{mock_url}/api/v1",
+                "OPENROUTER_API_KEY": "mock",
+                "DEBUG": "false",
+                "ADMISSION_ENABLED": "false",
+            }
+            env.update(dict(item.split("=", 1) for item in args.env))
+            port = _free_port()
+            processes.append(_spawn(
+                ["-m", "src.server", "--port", str(port), "--workers", str(args.workers),
+                 "--log-level", "warning"],
+                env,
+            ))
+            app_url = f"http://127.0.0.1:{port}"
+            _wait_ready(f"{app_url}/api/health", processes[-1])
+
+        driver = LoadDriver(app_url, timeout=args.timeout)
+        modes = [m for m in args.modes.split(",") if m]
+        levels = [int(c) for c in args.concurrency.split(",") if c]
+
+        print(f"app={app_url} mock={mock_url} workers={args.workers} turns={args.turns}")
+        if args.warmup:
+            await driver.run("rest", 1, args.warmup)
+
+        results = []
+        for mode in modes:
+            for concurrency in levels:
+                result = await run_scenario(driver, mode, concurrency, args.turns, mock_url)
+                _print_result(result)
+                results.append(result)
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+    if args.out:
+        out = Path(args.out)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        meta = {
+            "commit": _git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "args": {k: v for k, v in vars(args).items() if k != "compare"},
+        }
+        out.write_text(json.dumps({"meta": meta, "results": results}, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"결과 저장: {out}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="AI Core load test")
+    parser.add_argument("--modes", default="rest,stream,ws", help=f"쉼표 구분 ({', '.join(MODES)})")
+    parser.add_argument("--concurrency", default="1,8,32", help="쉼표 구분 동시 사용자 수")
+    parser.add_argument("--turns", type=int, default=200, help="시나리오당 턴 수")
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--workers", type=int, default=1, help="워커 프로세스 수 (src.server)")
+    parser.add_argument("--env", action="append", default=[], help="서버 환경변수 KEY=VALUE (반복 가능)")
+    parser.add_argument("--app-url", default=None, help="이미 실행 중인 AI Core (지정 시 서버를 띄우지 않음)")
+    parser.add_argument("--mock-url", default=None, help="이미 실행 중인 Mock OpenRouter")
+    parser.add_argument("--out", default=None, help="결과 JSON 경로")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CANDIDATE"), help="결과 파일 비교만 수행")
+    # Mock OpenRouter
+    parser.add_argument("--latency-ms", type=float, default=300.0)
+    parser.add_argument("--jitter-ms", type=float, default=50.0)
+    parser.add_argument("--distribution", choices=DISTRIBUTIONS, default="normal")
+    parser.add_argument("--sigma", type=float, default=0.5)
+    parser.add_argument("--tail-rate", type=float, default=0.0)
+    parser.add_argument("--tail-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--tool-call-rate", type=float, default=0.0)
+    parser.add_argument("--token-delay-ms", type=float, default=20.0)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+    else:
+        asyncio.run(main(args))
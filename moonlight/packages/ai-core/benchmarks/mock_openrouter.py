@@ -0,0 +1,260 @@
+"""
+Mock OpenRouter Server
+
+OpenRouter `/chat/completions` 를 흉내내는 로컬 서버
+- 지연시간 분포 (fixed / normal / lognormal / exponential + 드문 지연 꼬리)
+- 오류율(429/5xx + Retry-After), 모델별 설정
+- stream: true → SSE delta 응답
+- tools 가 있는 요청은 --tool-call-rate 비율로 tool_calls 응답
+
+실행:
+    python -m benchmarks.mock_openrouter --port 9000 --latency-ms 300 --error-rate 0.1
+    python -m benchmarks.mock_openrouter --distribution lognormal --sigma 0.6 --tail-rate 0.01 --tail-ms 5000
+
+AI Core 연결:
+    OPENROUTER_BASE_URL=http://localhost:9000/api/v1
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+
+DISTRIBUTIONS = ("fixed", "normal", "lognormal", "exponential")
+
+
+@dataclass
+class ModelBehavior:
+    """모델별 응답 특성"""
+    latency_ms: float = 300.0  # normal: 평균, lognormal: 중앙값, exponential: 평균
+    jitter_ms: float = 50.0  # normal 표준편차
+    distribution: str = "normal"  # fixed | normal | lognormal | exponential
+    sigma: float = 0.5  # lognormal 형태 (클수록 꼬리가 김)
+    tail_rate: float = 0.0  # 드물게 tail_ms 만큼 더 지연되는 비율 (업스트림 정체)
+    tail_ms: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 429
+    retry_after: Optional[float] = None
+    tool_call_rate: float = 0.0  # tools 요청에 tool_calls로 답하는 비율
+
+    def sample_delay_ms(self, rng: random.Random) -> float:
+        """첫 바이트까지 지연시간 샘플 (ms)"""
+        if self.distribution == "fixed":
+            delay = self.latency_ms
+        elif self.distribution == "lognormal":
+            delay = rng.lognormvariate(math.log(max(self.latency_ms, 1e-3)), self.sigma)
+        elif self.distribution == "exponential":
+            delay = rng.expovariate(1 / self.latency_ms) if self.latency_ms > 0 else 0.0
+        else:
+            delay = rng.gauss(self.latency_ms, self.jitter_ms)
+        if self.tail_rate and rng.random() < self.tail_rate:
+            delay += self.tail_ms
+        return max(delay, 0.0)
+
+
+@dataclass
+class MockConfig:
+    """Mock 서버 설정"""
+    default: ModelBehavior = field(default_factory=ModelBehavior)
+    models: dict[str, ModelBehavior] = field(default_factory=dict)
+    reply: str = "주인님, 여기 있어요. 천천히 말씀해주세요."
+    token_delay_ms: float = 20.0  # 스트리밍 토큰 간격
+    seed: Optional[int] = None  # 재현 가능한 지연/오류 샘플링
+
+    def behavior(self, model: str) -> ModelBehavior:
+        return self.models.get(model, self.default)
+
+
+@dataclass
+class MockStats:
+    """요청 통계"""
+    requests: int = 0
+    errors: int = 0
+    streams: int = 0
+    tool_calls: int = 0
+    by_model: dict[str, int] = field(default_factory=dict)
+    by_status: dict[int, int] = field(default_factory=dict)
+
+    def as_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "streams": self.streams,
+            "tool_calls": self.tool_calls,
+            "by_model": dict(self.by_model),
+            "by_status": {str(status): count for status, count in self.by_status.items()},
+        }
+
+
+def create_mock_app(config: Optional[MockConfig] = None) -> FastAPI:
+    """Mock OpenRouter 앱 생성 (app.state.config 로 실행 중 변경 가능)"""
+    app = FastAPI(title="Mock OpenRouter")
+    app.state.config = config or MockConfig()
+    app.state.stats = MockStats()
+    app.state.rng = random.Random(app.state.config.seed)
+
+    async def completions(request: Request):
+        cfg: MockConfig = app.state.config
+        stats: MockStats = app.state.stats
+        rng: random.Random = app.state.rng
+        body = await request.json()
+        model = body.get("model", "unknown")
+        behavior = cfg.behavior(model)
+
+        stats.requests += 1
+        stats.by_model[model] = stats.by_model.get(model, 0) + 1
+
+        await asyncio.sleep(behavior.sample_delay_ms(rng) / 1000)
+
+        if rng.random() < behavior.error_rate:
+            stats.errors += 1
+            stats.by_status[behavior.error_status] = stats.by_status.get(behavior.error_status, 0) + 1
+            headers = {}
+            if behavior.retry_after is not None:
+                headers["Retry-After"] = str(int(behavior.retry_after))
+            return JSONResponse(
+                {"error": {"message": "mock upstream error", "code": behavior.error_status}},
+                status_code=behavior.error_status,
+                headers=headers,
+            )
+
+        stats.by_status[200] = stats.by_status.get(200, 0) + 1
+        prompt_tokens = sum(len(str(m.get("content", ""))) for m in body.get("messages", [])) // 4
+        tool_call = _tool_call(body, rng, behavior.tool_call_rate)
+        tokens = [] if tool_call else cfg.reply.split(" ")
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": len(tokens) or 8,
+            "total_tokens": prompt_tokens + (len(tokens) or 8),
+        }
+        if tool_call:
+            stats.tool_calls += 1
+
+        if body.get("stream"):
+            stats.streams += 1
+            return StreamingResponse(
+                _stream(model, tokens, usage, cfg.token_delay_ms, tool_call),
+                media_type="text/event-stream",
+            )
+
+        message = {"role": "assistant", "content": None if tool_call else cfg.reply}
+        if tool_call:
+            message["tool_calls"] = [tool_call]
+        return {
+            "id": f"mock-{time.time_ns()}",
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": message,
+                "finish_reason": "tool_calls" if tool_call else "stop",
+            }],
+            "usage": usage,
+        }
+
+    app.add_api_route("/api/v1/chat/completions", completions, methods=["POST"])
+    app.add_api_route("/chat/completions", completions, methods=["POST"])
+
+    @app.get("/stats")
+    async def get_stats() -> dict:
+        return app.state.stats.as_dict()
+
+    @app.post("/stats/reset")
+    async def reset_stats() -> dict:
+        app.state.stats = MockStats()
+        return app.state.stats.as_dict()
+
+    return app
+
+
+def _tool_call(body: dict, rng: random.Random, rate: float) -> Optional[dict]:
+    """tools 요청이면 rate 비율로 첫 Tool 호출 (마지막 사용자 메시지를 query로)"""
+    tools = body.get("tools")
+    if not tools or rng.random() >= rate:
+        return None
+    messages = body.get("messages") or [{}]
+    arguments = {"query": str(messages[-1].get("content", ""))}
+    return {
+        "id": f"call_{rng.getrandbits(32):08x}",
+        "type": "function",
+        "function": {
+            "name": tools[0]["function"]["name"],
+            "arguments": json.dumps(arguments, ensure_ascii=False),
+        },
+    }
+
+
+async def _stream(
+    model: str,
+    tokens: list[str],
+    usage: dict,
+    token_delay_ms: float,
+    tool_call: Optional[dict] = None,
+) -> AsyncIterator[str]:
+    """OpenRouter 스타일 SSE"""
+    yield ": OPENROUTER PROCESSING\n\n"
+    for i, token in enumerate(tokens):
+        content = token if i == 0 else " " + token
+        chunk = {"model": model, "choices": [{"index": 0, "delta": {"content": content}}]}
+        yield f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+        await asyncio.sleep(token_delay_ms / 1000)
+
+    if tool_call is not None:
+        part = {"index": 0, **tool_call}
+        chunk = {"model": model, "choices": [{"index": 0, "delta": {"tool_calls": [part]}}]}
+        yield f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+
+    finish = "tool_calls" if tool_call is not None else "stop"
+    final = {"model": model, "choices": [{"index": 0, "delta": {}, "finish_reason": finish}], "usage": usage}
+    yield f"data: {json.dumps(final)}\n\n"
+    yield "data: [DONE]\n\n"
+
+
+def main() -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Mock OpenRouter server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--latency-ms", type=float, default=300.0)
+    parser.add_argument("--jitter-ms", type=float, default=50.0)
+    parser.add_argument("--distribution", choices=DISTRIBUTIONS, default="normal")
+    parser.add_argument("--sigma", type=float, default=0.5, help="lognormal 형태")
+    parser.add_argument("--tail-rate", type=float, default=0.0)
+    parser.add_argument("--tail-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=429)
+    parser.add_argument("--retry-after", type=float, default=None)
+    parser.add_argument("--tool-call-rate", type=float, default=0.0)
+    parser.add_argument("--token-delay-ms", type=float, default=20.0)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    config = MockConfig(
+        default=ModelBehavior(
+            latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            distribution=args.distribution,
+            sigma=args.sigma,
+            tail_rate=args.tail_rate,
+            tail_ms=args.tail_ms,
+            error_rate=args.error_rate,
+            error_status=args.error_status,
+            retry_after=args.retry_after,
+            tool_call_rate=args.tool_call_rate,
+        ),
+        token_delay_ms=args.token_delay_ms,
+        seed=args.seed,
+    )
+    uvicorn.run(create_mock_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""
+Admission Control
+
+채팅 요청 수락 제어 (업스트림 쿼터 / 다른 사용자 지연 보호)
+- buckets: 토큰 버킷 저장소 (메모리 / Redis Lua)
+- controller: 사용자별·전체 한도 + 우선순위 대기열, 토큰 예산 사후 차감
+"""
+
+from .buckets import BucketSpec, InMemoryBucketStore, RedisBucketStore, TokenBucketStore
+from .controller import (
+    AdmissionController,
+    AdmissionRejected,
+    close_admission,
+    get_admission_controller,
+    init_admission,
+)
+
+__all__ = [
+    "BucketSpec",
+    "InMemoryBucketStore",
+    "RedisBucketStore",
+    "TokenBucketStore",
+    "AdmissionController",
+    "AdmissionRejected",
+    "close_admission",
+    "get_admission_controller",
+    "init_admission",
+]
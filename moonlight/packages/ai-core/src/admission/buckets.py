@@ -0,0 +1,194 @@
+"""
+Token Buckets
+
+요청 수 / LLM 토큰 예산용 토큰 버킷 저장소
+- 메모리 저장소: 프로세스 단위 (단일 워커 / 테스트)
+- Redis 저장소: Lua 스크립트 하나로 보충 + 차감을 원자적으로 (워커 간 공유, 시각은 Redis TIME)
+
+take(): 토큰이 충분하면 차감하고 0.0, 부족하면 차감 없이 다시 시도할 때까지의 초
+charge(): 사후 차감 (실제 사용 토큰), 잔량은 -capacity 까지 음수 허용 → 부채를 갚을 때까지 take 거절
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class BucketSpec:
+    """버킷 한도"""
+    rate: float  # 초당 보충량
+    capacity: float  # 최대 잔량 (버스트)
+
+    @classmethod
+    def per_minute(cls, amount: float) -> "BucketSpec":
+        """분당 예산 (버스트 = 1분치)"""
+        return cls(rate=amount / 60.0, capacity=float(amount))
+
+    def retry_after(self, tokens: float, cost: float) -> float:
+        """잔량 tokens 에서 cost 를 쓸 수 있을 때까지의 초"""
+        if self.rate <= 0:
+            return float("inf")
+        return max(cost - tokens, 0.0) / self.rate
+
+    @property
+    def refill_seconds(self) -> float:
+        """빈 버킷이 가득 찰 때까지의 초 (이후 상태는 버킷이 없는 것과 같음)"""
+        return self.capacity / self.rate if self.rate > 0 else float("inf")
+
+
+class TokenBucketStore:
+    """토큰 버킷 저장소 인터페이스"""
+
+    async def take(self, key: str, spec: BucketSpec, cost: float = 1.0) -> float:
+        """
+        차감 시도
+
+        Returns:
+            0.0 (차감됨) 또는 다시 시도할 때까지의 초 (차감 안 됨)
+        """
+        raise NotImplementedError
+
+    async def charge(self, key: str, spec: BucketSpec, cost: float) -> None:
+        """사후 차감 (음수 잔량 허용)"""
+        raise NotImplementedError
+
+    async def level(self, key: str, spec: BucketSpec) -> float:
+        """현재 잔량 (보충 반영)"""
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """정리"""
+
+
+class InMemoryBucketStore(TokenBucketStore):
+    """
+    프로세스 내 저장소
+
+    키마다 [잔량, 갱신 시각, 가득 차는 데 걸리는 초] 하나. 가득 찬 버킷은 없는 것과 같으므로
+    키가 max_keys 를 넘으면 가득 찬 버킷부터 지웁니다.
+    """
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._buckets: dict[str, list[float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def _refill(self, key: str, spec: BucketSpec, now: float) -> list[float]:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self.max_keys:
+                self._evict(now)
+            bucket = self._buckets[key] = [spec.capacity, now, spec.refill_seconds]
+            return bucket
+        bucket[0] = min(spec.capacity, bucket[0] + (now - bucket[1]) * spec.rate)
+        bucket[1] = now
+        return bucket
+
+    def _evict(self, now: float) -> None:
+        """가득 찼을 버킷 제거 (그래도 넘치면 오래된 키부터)"""
+        full = [key for key, (_, updated, refill) in self._buckets.items() if now - updated >= refill]
+        for key in full:
+            del self._buckets[key]
+        overflow = len(self._buckets) - self.max_keys + 1
+        for key in list(self._buckets)[:max(overflow, 0)]:
+            del self._buckets[key]
+
+    def take_now(self, key: str, spec: BucketSpec, cost: float = 1.0, now: Optional[float] = None) -> float:
+        """take 의 동기 버전 (I/O 없음)"""
+        bucket = self._refill(key, spec, now if now is not None else time.monotonic())
+        if bucket[0] >= cost:
+            bucket[0] -= cost
+            return 0.0
+        return spec.retry_after(bucket[0], cost)
+
+    async def take(self, key: str, spec: BucketSpec, cost: float = 1.0) -> float:
+        return self.take_now(key, spec, cost)
+
+    async def charge(self, key: str, spec: BucketSpec, cost: float) -> None:
+        bucket = self._refill(key, spec, time.monotonic())
+        bucket[0] = max(bucket[0] - cost, -spec.capacity)
+
+    async def level(self, key: str, spec: BucketSpec) -> float:
+        return self._refill(key, spec, time.monotonic())[0]
+
+
+# KEYS[1]: 버킷 / ARGV: rate, capacity, cost, mode (take | charge), ttl_ms
+# → {차감 여부, 잔량 문자열} (Lua 숫자는 정수로 잘리므로 문자열)
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local now_parts = redis.call("TIME")
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+
+local state = redis.call("HMGET", KEYS[1], "tokens", "ts")
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(now - ts, 0) * rate)
+
+local taken = 1
+if ARGV[4] == "charge" then
+    tokens = math.max(tokens - cost, -capacity)
+elseif tokens >= cost then
+    tokens = tokens - cost
+else
+    taken = 0
+end
+
+redis.call("HSET", KEYS[1], "tokens", tostring(tokens), "ts", tostring(now))
+redis.call("PEXPIRE", KEYS[1], ARGV[5])
+return {taken, tostring(tokens)}
+"""
+
+
+class RedisBucketStore(TokenBucketStore):
+    """
+    Redis 저장소 (워커 간 공유)
+
+    Redis 오류 시에는 허용합니다 (fail-open, 한도보다 가용성 우선).
+    """
+
+    KEY_PREFIX = "moonlight:bucket:"
+
+    def __init__(self, redis_url: Optional[str] = None, client=None):
+        """
+        Args:
+            client: redis.asyncio 호환 클라이언트 (테스트에서는 fakeredis)
+        """
+        if client is None:
+            import redis.asyncio as redis
+
+            client = redis.from_url(redis_url, decode_responses=True)
+        self.redis = client
+        self._script = client.register_script(TOKEN_BUCKET_SCRIPT)
+
+    async def _run(self, key: str, spec: BucketSpec, cost: float, mode: str) -> Optional[tuple[bool, float]]:
+        ttl_ms = int(min(spec.refill_seconds, 86400) * 1000) + 1000
+        try:
+            taken, tokens = await self._script(
+                keys=[self.KEY_PREFIX + key],
+                args=[spec.rate, spec.capacity, cost, mode, ttl_ms],
+            )
+        except Exception as e:
+            print(f"토큰 버킷 오류 (허용): {e}")
+            return None
+        return bool(int(taken)), float(tokens)
+
+    async def take(self, key: str, spec: BucketSpec, cost: float = 1.0) -> float:
+        result = await self._run(key, spec, cost, "take")
+        if result is None or result[0]:
+            return 0.0
+        return spec.retry_after(result[1], cost)
+
+    async def charge(self, key: str, spec: BucketSpec, cost: float) -> None:
+        await self._run(key, spec, cost, "charge")
+
+    async def level(self, key: str, spec: BucketSpec) -> float:
+        result = await self._run(key, spec, 0.0, "take")
+        return spec.capacity if result is None else result[1]
+
+    async def close(self) -> None:
+        await self.redis.aclose()
@@ -0,0 +1,314 @@
+"""
+Admission Control
+
+채팅 요청 수락 여부 결정 (OpenRouter로 보내기 전)
+1. 사용자별 토큰 예산: 이전 턴들의 실제 LLM 토큰을 사후 차감, 부채가 남아 있으면 거절
+2. 전체 토큰 예산: 업스트림 쿼터 보호
+3. 사용자별 요청 버킷: 초과분은 즉시 거절 (시끄러운 클라이언트 하나가 대기열을 차지하지 않도록)
+4. 전체 요청 버킷: 초과분은 크기 제한 우선순위 대기열에서 대기, 기한을 넘기면 버림
+   - 우선순위: 토큰 예산을 덜 쓴 사용자 먼저
+   - 대기열에서 거절 / 취소되면 3번에서 쓴 사용자 요청 토큰을 되돌림
+
+거절은 AdmissionRejected (reason, retry_after) → API에서 429 + Retry-After
+"""
+
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional
+
+from .buckets import BucketSpec, InMemoryBucketStore, RedisBucketStore, TokenBucketStore
+from ..config import Settings, get_settings
+from ..llm.usage import TokenUsage, track_usage
+from ..metrics.tracing import current_span
+
+GLOBAL_KEY = "global"
+
+
+class AdmissionRejected(Exception):
+    """요청 거절 (429)"""
+
+    def __init__(self, reason: str, retry_after: float):
+        super().__init__(f"admission rejected: {reason}")
+        self.reason = reason
+        self.retry_after = retry_after
+
+    @property
+    def retry_after_header(self) -> str:
+        """Retry-After 헤더 값 (정수 초, 최소 1)"""
+        if not math.isfinite(self.retry_after):
+            return "60"
+        return str(max(1, math.ceil(self.retry_after)))
+
+
+@dataclass
+class AdmissionStats:
+    """수락 통계"""
+    requests: int = 0
+    admitted: int = 0
+    queued: int = 0
+    queue_depth: int = 0
+    rejected_user_rate: int = 0
+    rejected_user_tokens: int = 0
+    rejected_global_tokens: int = 0
+    rejected_queue_full: int = 0
+    shed_deadline: int = 0
+    refunded_user_requests: int = 0
+    tokens_charged: int = 0
+
+    def as_dict(self) -> dict:
+        return dict(self.__dict__)
+
+
+class AdmissionController:
+    """
+    토큰 버킷 + 우선순위 대기열 기반 수락 제어
+
+    대기열은 (우선순위, 기한, 순번, Future) 힙 하나와 디스패처 Task 하나로 처리합니다.
+    디스패처는 전체 버킷에서 토큰을 얻을 때마다 맨 앞 요청을 깨우고,
+    토큰이 없으면 다음 토큰 또는 가장 이른 기한까지 잠듭니다.
+    """
+
+    def __init__(
+        self,
+        store: TokenBucketStore,
+        user_requests: Optional[BucketSpec] = None,
+        global_requests: Optional[BucketSpec] = None,
+        user_tokens: Optional[BucketSpec] = None,
+        global_tokens: Optional[BucketSpec] = None,
+        queue_size: int = 100,
+        queue_timeout: float = 5.0,
+    ):
+        """
+        Args:
+            store: 버킷 저장소 (메모리 / Redis)
+            *_requests: 요청 수 버킷 (None이면 제한 없음)
+            *_tokens: LLM 토큰 예산 버킷 (None이면 제한 없음)
+            queue_size: 전체 한도 초과 시 대기 가능한 요청 수
+            queue_timeout: 대기 최대 시간 (초)
+        """
+        self.store = store
+        self.user_requests = user_requests
+        self.global_requests = global_requests
+        self.user_tokens = user_tokens
+        self.global_tokens = global_tokens
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.stats = AdmissionStats()
+
+        self._queue: list[tuple[float, float, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._dispatcher: Optional[asyncio.Task] = None
+
+    @classmethod
+    def from_settings(cls, settings: Settings, store: Optional[TokenBucketStore] = None) -> "AdmissionController":
+        if store is None:
+            store = (
+                RedisBucketStore(settings.redis_url)
+                if settings.admission_backend == "redis"
+                else InMemoryBucketStore()
+            )
+        return cls(
+            store,
+            user_requests=_rate_spec(settings.admission_user_rps, settings.admission_user_burst),
+            global_requests=_rate_spec(settings.admission_global_rps, settings.admission_global_burst),
+            user_tokens=_budget_spec(settings.admission_user_tokens_per_minute),
+            global_tokens=_budget_spec(settings.admission_global_tokens_per_minute),
+            queue_size=settings.admission_queue_size,
+            queue_timeout=settings.admission_queue_timeout,
+        )
+
+    async def admit(self, user_id: str) -> None:
+        """
+        요청 수락 (전체 한도 초과 시 대기열에서 대기)
+
+        Raises:
+            AdmissionRejected: 한도 초과 / 대기열 가득 참 / 대기 기한 초과
+        """
+        self.stats.requests += 1
+
+        # 토큰 예산은 차감 없는 확인(cost 0)이므로 요청 토큰보다 먼저
+        if self.user_tokens is not None:
+            wait = await self.store.take(f"tokens:{user_id}", self.user_tokens, 0.0)
+            if wait:
+                self._reject("user_tokens", wait)
+        if self.global_tokens is not None:
+            wait = await self.store.take(f"tokens:{GLOBAL_KEY}", self.global_tokens, 0.0)
+            if wait:
+                self._reject("global_tokens", wait)
+        if self.user_requests is not None:
+            wait = await self.store.take(f"requests:{user_id}", self.user_requests)
+            if wait:
+                self._reject("user_rate", wait)
+
+        # 대기 중인 요청이 있으면 새 요청도 줄을 섬 (먼저 온 요청 추월 방지)
+        if self.global_requests is not None:
+            try:
+                if self._queue or await self.store.take(f"requests:{GLOBAL_KEY}", self.global_requests):
+                    await self._wait_in_queue(await self._priority(user_id))
+            except (AdmissionRejected, asyncio.CancelledError):
+                await asyncio.shield(self._refund_user_request(user_id))
+                raise
+        self.stats.admitted += 1
+
+    async def charge(self, user_id: str, tokens: int) -> None:
+        """턴에서 실제 사용한 LLM 토큰을 예산에서 차감"""
+        if tokens <= 0:
+            return
+        self.stats.tokens_charged += tokens
+        if self.user_tokens is not None:
+            await self.store.charge(f"tokens:{user_id}", self.user_tokens, tokens)
+        if self.global_tokens is not None:
+            await self.store.charge(f"tokens:{GLOBAL_KEY}", self.global_tokens, tokens)
+
+    @asynccontextmanager
+    async def metered(self, user_id: str) -> AsyncIterator[TokenUsage]:
+        """블록 안의 LLM 토큰 사용량을 추적해 끝날 때 차감 (admit 이후)"""
+        with track_usage() as usage:
+            try:
+                yield usage
+            finally:
+                await self.charge(user_id, usage.total_tokens)
+
+    async def _refund_user_request(self, user_id: str) -> None:
+        """수락되지 않은 요청의 사용자 요청 토큰 반환 (다음 보충 때 capacity 로 잘림)"""
+        if self.user_requests is not None:
+            self.stats.refunded_user_requests += 1
+            await self.store.charge(f"requests:{user_id}", self.user_requests, -1.0)
+
+    async def _priority(self, user_id: str) -> float:
+        """대기열 우선순위 (작을수록 먼저): 토큰 예산 사용 비율"""
+        if self.user_tokens is None:
+            return 0.0
+        level = await self.store.level(f"tokens:{user_id}", self.user_tokens)
+        return 1.0 - level / self.user_tokens.capacity
+
+    async def _wait_in_queue(self, priority: float) -> None:
+        if len(self._queue) >= self.queue_size:
+            self._reject("queue_full", self._drain_estimate())
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._queue, (priority, time.monotonic() + self.queue_timeout, next(self._seq), future))
+        self.stats.queued += 1
+        self.stats.queue_depth = len(self._queue)
+        self._ensure_dispatcher()
+        self._wakeup.set()
+
+        span = current_span()
+        started = time.perf_counter()
+        try:
+            await future
+        finally:
+            if not future.done():
+                future.cancel()  # 클라이언트 연결 종료 → 디스패처가 건너뜀
+            if span is not None:
+                span.set("admission.queue_ms", round((time.perf_counter() - started) * 1000, 1))
+
+    def _drain_estimate(self) -> float:
+        """대기열이 비기까지의 예상 초"""
+        rate = self.global_requests.rate if self.global_requests is not None else 0.0
+        return len(self._queue) / rate if rate > 0 else self.queue_timeout
+
+    def _reject(self, reason: str, retry_after: float) -> None:
+        field = "shed_deadline" if reason == "deadline" else f"rejected_{reason}"
+        setattr(self.stats, field, getattr(self.stats, field) + 1)
+        raise AdmissionRejected(reason, retry_after)
+
+    def _ensure_dispatcher(self) -> None:
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+
+    def _shed(self, now: float) -> None:
+        """기한이 지난 요청은 429로, 취소된 요청은 조용히 제거"""
+        kept = []
+        for entry in self._queue:
+            future = entry[3]
+            if future.done():
+                continue
+            if entry[1] <= now:
+                self.stats.shed_deadline += 1
+                future.set_exception(AdmissionRejected("deadline", self._drain_estimate()))
+                continue
+            kept.append(entry)
+        if len(kept) != len(self._queue):
+            heapq.heapify(kept)
+            self._queue = kept
+        self.stats.queue_depth = len(self._queue)
+
+    async def _dispatch(self) -> None:
+        while True:
+            self._shed(time.monotonic())
+            if not self._queue:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            wait = await self.store.take(f"requests:{GLOBAL_KEY}", self.global_requests)
+            if not wait:
+                while self._queue:
+                    future = heapq.heappop(self._queue)[3]
+                    if not future.done():
+                        future.set_result(None)
+                        break
+                self.stats.queue_depth = len(self._queue)
+                continue
+
+            earliest = min(entry[1] for entry in self._queue)
+            await asyncio.sleep(max(min(wait, earliest - time.monotonic()), 0.001))
+
+    async def close(self) -> None:
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            try:
+                await self._dispatcher
+            except asyncio.CancelledError:
+                pass
+            self._dispatcher = None
+        for entry in self._queue:
+            if not entry[3].done():
+                entry[3].set_exception(AdmissionRejected("shutdown", self.queue_timeout))
+        self._queue = []
+        await self.store.close()
+
+
+def _rate_spec(rps: float, burst: int) -> Optional[BucketSpec]:
+    return BucketSpec(rate=rps, capacity=float(max(burst, 1))) if rps > 0 else None
+
+
+def _budget_spec(tokens_per_minute: int) -> Optional[BucketSpec]:
+    return BucketSpec.per_minute(tokens_per_minute) if tokens_per_minute > 0 else None
+
+
+_controller: Optional[AdmissionController] = None
+
+
+def create_admission_controller(settings: Settings) -> Optional[AdmissionController]:
+    """설정에 따른 수락 제어기 생성 (비활성화면 None)"""
+    if not settings.admission_enabled:
+        return None
+    return AdmissionController.from_settings(settings)
+
+
+def init_admission(settings: Optional[Settings] = None) -> Optional[AdmissionController]:
+    """앱 단위 수락 제어기 (lifespan 시작 시)"""
+    global _controller
+    if _controller is None:
+        _controller = create_admission_controller(settings or get_settings())
+    return _controller
+
+
+def get_admission_controller() -> Optional[AdmissionController]:
+    """앱 단위 수락 제어기 (lifespan 밖에서는 지연 생성, 비활성화면 None)"""
+    return init_admission()
+
+
+async def close_admission() -> None:
+    global _controller
+    if _controller is not None:
+        await _controller.close()
+        _controller = None
@@ -5,16 +5,19 @@ Multi-Agent System
 - Stage 1: Intent Parser (75%)
 - Stage 2+3: Validation + Verification (99%)
 - 고위험 작업만 Stage 3 분리 (100%)
+- 명확화 질문 답변은 Slot Filler가 누락 필드만 추출
 """
 
 from .orchestrator import AgentOrchestrator
 from .intent_parser import IntentParserAgent
+from .slot_filler import SlotFillerAgent
 from .validator import ParameterValidatorAgent
 
 __all__ = [
     "AgentOrchestrator",
     "IntentParserAgent",
     "ParameterValidatorAgent",
+    "SlotFillerAgent",
 ]
 
 
@@ -0,0 +1,61 @@
+"""
+Confirmation Reply
+
+고위험 작업 확인 질문에 대한 사용자 답변 분류 (LLM 없이)
+- 긍정: 첫 단어가 "네", "응", "좋아요", "해줘" 등
+- 부정: "아니", "취소", "하지 마" 등이 포함된 짧은 답변
+- 그 외: None (새 요청으로 처리)
+명확화 질문 답변의 취소 여부는 첫 단어만 봄 ("안 해요"가 들어간 본문 등을 취소로 오인하지 않도록)
+"""
+
+import re
+from typing import Optional
+
+AFFIRMATIVE = frozenset({
+    "네", "넵", "넹", "예", "응", "웅", "그래", "그럼", "좋아", "좋습니다", "해줘", "해주세요",
+    "진행", "진행해", "진행해줘", "확인", "맞아", "부탁해", "ㅇㅇ", "ㅇㅋ", "오케이",
+    "yes", "y", "ok", "okay", "sure",
+})
+NEGATIVE_WORDS = frozenset({"노", "no", "n", "nope", "ㄴㄴ", "cancel", "stop"})
+NEGATIVE_PHRASES = ("아니", "아뇨", "취소", "하지마", "하지 마", "싫어", "그만", "됐어", "안 해", "안해")
+
+# 확인 답변으로 볼 최대 길이 (긴 문장은 새 요청)
+MAX_REPLY_LENGTH = 30
+
+_SPLIT = re.compile(r"[\s,.!?~…]+")
+
+
+def parse_confirmation(message: str) -> Optional[bool]:
+    """
+    확인 답변 분류
+
+    Returns:
+        True (진행) / False (취소) / None (확인 답변 아님)
+    """
+    text = message.strip().lower()
+    if not text or len(text) > MAX_REPLY_LENGTH:
+        return None
+
+    words = _words(text)
+    if not words:
+        return None
+    if any(phrase in text for phrase in NEGATIVE_PHRASES) or words[0] in NEGATIVE_WORDS:
+        return False
+
+    first = words[0]
+    if first in AFFIRMATIVE or first.removesuffix("요") in AFFIRMATIVE:
+        return True
+    return None
+
+
+def is_cancellation(message: str) -> bool:
+    """명확화 질문에 대한 취소 답변 ("취소", "아니 됐어" 등, 첫 단어 기준)"""
+    text = message.strip().lower()
+    if len(text) > MAX_REPLY_LENGTH:
+        return False
+    words = _words(text)
+    return bool(words) and (words[0] in NEGATIVE_WORDS or words[0].startswith(NEGATIVE_PHRASES))
+
+
+def _words(text: str) -> list[str]:
+    return [word for word in _SPLIT.split(text) if word]
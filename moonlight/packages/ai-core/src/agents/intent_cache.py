@@ -0,0 +1,174 @@
+"""
+Semantic Intent Cache
+
+LLM 의도 파악 결과를 임베딩 유사도로 재사용
+- NumPy 인프로세스 인덱스 (Redis 불필요)
+- 유사도 임계값 이상이면 LLM 호출 생략
+- LRU + TTL 제거, 적중률 통계
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Optional, Protocol
+
+import numpy as np
+
+from .intent_parser import IntentResult
+
+
+class Embedder(Protocol):
+    """임베딩 인터페이스 (EmbeddingModel 등)"""
+
+    async def embed(self, text: str) -> np.ndarray: ...
+
+
+@dataclass
+class IntentCacheStats:
+    """캐시 통계"""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+@dataclass
+class _Entry:
+    """캐시 항목 (행렬 슬롯과 1:1)"""
+    text: str
+    result: IntentResult
+    created_at: float
+
+
+class SemanticIntentCache:
+    """
+    의미 기반 Intent 캐시
+
+    정규화 벡터를 고정 크기 행렬에 저장하고 내적 한 번으로 최근접 항목을 찾습니다.
+
+    파라미터가 추출된 Tool 결과는 메시지마다 값이 다르므로
+    (예: 받는 사람 이메일) 같은 문장일 때만 재사용합니다.
+    """
+
+    def __init__(
+        self,
+        embedder: Embedder,
+        threshold: float = 0.92,
+        max_entries: int = 2048,
+        ttl_seconds: float = 3600.0,
+    ):
+        self.embedder = embedder
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.stats = IntentCacheStats()
+
+        self._vectors: Optional[np.ndarray] = None  # 첫 저장 시 차원 결정
+        self._valid = np.zeros(max_entries, dtype=bool)
+        self._entries: OrderedDict[int, _Entry] = OrderedDict()  # slot → entry (LRU 순서)
+        self._free = list(range(max_entries - 1, -1, -1))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def embed(self, message: str) -> np.ndarray:
+        """메시지 임베딩"""
+        return await self.embedder.embed(self._normalize(message))
+
+    def lookup(self, vector: np.ndarray, message: str) -> Optional[IntentResult]:
+        """
+        유사한 과거 메시지의 의도 결과 조회
+
+        Args:
+            vector: embed()로 얻은 메시지 벡터
+            message: 원본 메시지
+
+        Returns:
+            IntentResult | None: 재사용 가능한 결과 (복사본)
+        """
+        slot = self._nearest(vector)
+        if slot is None:
+            self.stats.misses += 1
+            return None
+
+        entry = self._entries[slot]
+        result = entry.result
+
+        if result.parameters and entry.text != self._normalize(message):
+            # 파라미터는 메시지 고유값 → 다른 문장에는 재사용 불가
+            self.stats.misses += 1
+            return None
+
+        self._entries.move_to_end(slot)
+        self.stats.hits += 1
+        return replace(result, parameters=dict(result.parameters))
+
+    def store(self, vector: np.ndarray, message: str, result: IntentResult) -> None:
+        """의도 결과 저장 (가득 차면 LRU 제거)"""
+        if self._vectors is None:
+            self._vectors = np.zeros((self.max_entries, vector.shape[0]), dtype=np.float32)
+
+        if not self._free:
+            oldest, _ = self._entries.popitem(last=False)
+            self._release(oldest)
+            self.stats.evictions += 1
+
+        slot = self._free.pop()
+        self._vectors[slot] = vector
+        self._valid[slot] = True
+        self._entries[slot] = _Entry(
+            text=self._normalize(message),
+            result=replace(result, parameters=dict(result.parameters)),
+            created_at=time.monotonic(),
+        )
+
+    def clear(self) -> None:
+        """전체 비우기"""
+        for slot in list(self._entries):
+            self._release(slot)
+        self._entries.clear()
+
+    def _nearest(self, vector: np.ndarray) -> Optional[int]:
+        """임계값 이상인 최근접 슬롯 (만료 항목은 정리)"""
+        if self._vectors is None or not self._entries:
+            return None
+
+        scores = self._vectors @ vector
+        scores[~self._valid] = -1.0
+
+        while True:
+            slot = int(np.argmax(scores))
+            if scores[slot] < self.threshold:
+                return None
+
+            entry = self._entries[slot]
+            if time.monotonic() - entry.created_at <= self.ttl_seconds:
+                return slot
+
+            # TTL 만료 → 제거 후 다음 후보
+            del self._entries[slot]
+            self._release(slot)
+            self.stats.expirations += 1
+            scores[slot] = -1.0
+
+    def _release(self, slot: int) -> None:
+        self._valid[slot] = False
+        self._free.append(slot)
+
+    @staticmethod
+    def _normalize(message: str) -> str:
+        return " ".join(message.lower().split())
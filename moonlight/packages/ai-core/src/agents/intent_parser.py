@@ -4,11 +4,17 @@ Intent Parser Agent
 Stage 1: 사용자 의도 파악 및 Tool 선택
 """
 
-import json
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
+from .keyword_matcher import KeywordMatcher
+from ..llm.json_extract import extract_json
 from ..llm.provider import LLMProvider
+from ..metrics.tracing import current_span
+from ..tools.registry import ToolRegistry, get_tool_registry
+
+if TYPE_CHECKING:
+    from .intent_cache import SemanticIntentCache
 
 
 @dataclass
@@ -30,35 +36,45 @@ class IntentParserAgent:
     3. 파라미터 추출
     """
     
-    AVAILABLE_TOOLS = {
-        "google_search": {
-            "description": "웹 검색",
-            "keywords": ["검색", "찾아", "알려", "뭐야", "어디"],
-        },
-        "send_email": {
-            "description": "이메일 전송",
-            "keywords": ["이메일", "메일", "보내", "전송"],
-        },
-        "get_calendar": {
-            "description": "캘린더 조회",
-            "keywords": ["일정", "캘린더", "스케줄", "약속"],
-        },
-        "create_event": {
-            "description": "일정 생성",
-            "keywords": ["일정 추가", "일정 만들", "약속 잡"],
-        },
-        "github_issues": {
-            "description": "GitHub 이슈 관리",
-            "keywords": ["깃허브", "github", "이슈", "issue"],
-        },
-        "notion_page": {
-            "description": "Notion 페이지 관리",
-            "keywords": ["노션", "notion", "문서"],
-        },
-    }
+    AVAILABLE_TOOLS: dict = {}  # {name: {"description", "keywords"}} (기본값: Tool 레지스트리)
     
-    def __init__(self, llm: LLMProvider):
+    def __init__(
+        self,
+        llm: LLMProvider,
+        tools: Optional[dict] = None,
+        cache: Optional["SemanticIntentCache"] = None,
+        registry: Optional[ToolRegistry] = None,
+    ):
+        """
+        Args:
+            tools: 고정 Tool 목록 (None이면 레지스트리를 따라감 - 등록/비활성화/리로드 시 다시 빌드)
+            registry: Tool 레지스트리 (기본값: 앱 단위 레지스트리)
+        """
         self.llm = llm
+        self.cache = cache
+        self.registry = None if tools is not None else (registry or get_tool_registry())
+        self._tools_version = -1
+        if tools is not None:
+            self.update_tools(tools)
+        else:
+            self._sync_tools()
+    
+    def update_tools(self, tools: dict) -> None:
+        """
+        Tool 목록 교체
+        
+        키워드 오토마톤을 다시 빌드하고 Tool 목록이 달랐던 의미 캐시 결과를 버립니다.
+        """
+        self.AVAILABLE_TOOLS = tools
+        self._matcher = KeywordMatcher.from_tools(tools)
+        if self.cache is not None:
+            self.cache.clear()
+    
+    def _sync_tools(self) -> None:
+        """레지스트리 버전이 바뀌었으면 Tool 목록 / 키워드 오토마톤 다시 빌드"""
+        if self.registry is not None and self._tools_version != self.registry.version:
+            self._tools_version = self.registry.version
+            self.update_tools(self.registry.intent_tools())
     
     async def parse(self, message: str, context: dict) -> IntentResult:
         """
@@ -71,38 +87,80 @@ class IntentParserAgent:
         Returns:
             IntentResult: 의도 파악 결과
         """
+        self._sync_tools()
+        
         # 1. 빠른 키워드 매칭 (속도 최적화)
         quick_match = self._quick_keyword_match(message)
         if quick_match:
+            _mark_source("keyword")
             return quick_match
         
-        # 2. LLM을 통한 정밀 분석
-        return await self._llm_parse(message, context)
+        # 2. LLM을 통한 정밀 분석 (의미 캐시 우선)
+        return await self._cached_llm_parse(message, context)
+    
+    def keyword_match(self, message: str) -> Optional[IntentResult]:
+        """키워드 fast path 결과 (LLM 없이, 일치 없으면 None)"""
+        self._sync_tools()
+        return self._quick_keyword_match(message)
+    
+    def needs_llm(self, message: str) -> bool:
+        """키워드 fast path로 해결되지 않아 LLM 분석이 필요한지"""
+        self._sync_tools()
+        return self._quick_keyword_match(message) is None
     
     def _quick_keyword_match(self, message: str) -> Optional[IntentResult]:
         """
         빠른 키워드 매칭
         
         간단한 요청은 LLM 없이 처리 (지연시간 최소화)
+        Aho–Corasick 단일 순회, 가장 구체적인 키워드가 우선
+        """
+        match = self._matcher.best_match(message)
+        if match is None:
+            return None
+        
+        return IntentResult(
+            tool_needed=True,
+            tool_name=match.tool_name,
+            parameters={"query": message},  # 기본 파라미터
+            confidence=match.confidence,
+        )
+    
+    async def _cached_llm_parse(self, message: str, context: dict) -> IntentResult:
+        """
+        의미 캐시를 거친 LLM 의도 파악
+        
+        유사한 문장이 이미 분류되었다면 LLM 호출 생략
         """
-        message_lower = message.lower()
-        
-        for tool_name, info in self.AVAILABLE_TOOLS.items():
-            for keyword in info["keywords"]:
-                if keyword in message_lower:
-                    return IntentResult(
-                        tool_needed=True,
-                        tool_name=tool_name,
-                        parameters={"query": message},  # 기본 파라미터
-                        confidence=0.7,
-                    )
-        
-        return None
+        if self.cache is None:
+            return await self._llm_parse(message, context)
+        
+        try:
+            vector = await self.cache.embed(message)
+        except Exception as e:
+            # 임베딩 불가 (모델 미설치 등) → 캐시 비활성화 후 진행
+            print(f"Intent 캐시 비활성화 (임베딩 오류): {e}")
+            self.cache = None
+            return await self._llm_parse(message, context)
+        
+        cached = self.cache.lookup(vector, message)
+        if cached is not None:
+            _mark_source("cache")
+            return cached
+        
+        result = await self._llm_parse(message, context)
+        
+        # 파싱 실패(confidence 0) 결과는 캐시하지 않음
+        if result.confidence > 0:
+            self.cache.store(vector, message, result)
+        
+        return result
     
     async def _llm_parse(self, message: str, context: dict) -> IntentResult:
         """
         LLM을 통한 정밀 의도 파악
         """
+        _mark_source("llm")
         tools_desc = "\n".join([
             f"- {name}: {info['description']}"
             for name, info in self.AVAILABLE_TOOLS.items()
@@ -124,24 +182,27 @@ class IntentParserAgent:
 }}
 """
         
-        try:
-            response = await self.llm.chat(
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.1,  # 일관성 높게
-            )
-            
-            # JSON 파싱
-            result = json.loads(response)
-            
-            return IntentResult(
-                tool_needed=result.get("tool_needed", False),
-                tool_name=result.get("tool_name"),
-                parameters=result.get("parameters", {}),
-                confidence=result.get("confidence", 0.5),
-            )
-            
-        except (json.JSONDecodeError, KeyError):
+        response = await self.llm.chat(
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.1,  # 일관성 높게
+        )
+        
+        # JSON 추출 (코드 펜스 / 앞뒤 설명 허용)
+        result = extract_json(response)
+        if not isinstance(result, dict):
             # 파싱 실패 → Tool 불필요로 처리
             return IntentResult(tool_needed=False)
+        
+        return IntentResult(
+            tool_needed=bool(result.get("tool_needed", False)),
+            tool_name=result.get("tool_name"),
+            parameters=result.get("parameters") or {},
+            confidence=result.get("confidence", 0.5),
+        )
 
 
+def _mark_source(source: str) -> None:
+    """현재 span에 의도 판단 경로 기록 (keyword / cache / llm)"""
+    span = current_span()
+    if span is not None:
+        span.set("intent.source", source)
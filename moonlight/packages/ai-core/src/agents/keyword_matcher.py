@@ -0,0 +1,184 @@
+"""
+Keyword Matcher
+
+Aho–Corasick 오토마톤 기반 다중 키워드 매칭
+- 키워드 전체를 한 번만 컴파일
+- 메시지를 한 번 순회하여 모든 매칭 위치 반환 (키워드 수와 무관)
+- 가장 구체적인(긴) 키워드가 우선
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+
+@dataclass(frozen=True)
+class KeywordMatch:
+    """키워드 매칭 결과"""
+    tool_name: str
+    keyword: str
+    start: int
+    end: int
+
+
+@dataclass
+class ScoredMatch:
+    """Tool 단위로 점수화된 매칭"""
+    tool_name: str
+    keyword: str
+    confidence: float
+    matches: list[KeywordMatch]
+
+
+class KeywordMatcher:
+    """
+    다중 패턴 키워드 매처
+
+    Tool → 키워드 목록으로부터 오토마톤을 만들고,
+    메시지 길이에 비례하는 비용으로 모든 키워드를 찾습니다.
+    """
+
+    BASE_CONFIDENCE = 0.7
+    PHRASE_BONUS = 0.1  # "일정 추가" 처럼 여러 단어로 된 키워드
+    EXTRA_HIT_BONUS = 0.05  # 같은 Tool의 추가 키워드
+    MAX_CONFIDENCE = 0.95
+
+    def __init__(self, keywords: dict[str, Iterable[str]]):
+        """
+        Args:
+            keywords: {tool_name: [keyword, ...]}
+        """
+        # 상태별 전이 / 실패 링크 / 출력 (패턴 id 목록)
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[int, ...]] = [()]
+        self._patterns: list[tuple[str, str]] = []  # (tool_name, keyword)
+
+        for tool_name, words in keywords.items():
+            for word in words:
+                word = word.lower()
+                if word:
+                    self._add(word, len(self._patterns))
+                    self._patterns.append((tool_name, word))
+
+        self._build()
+
+    @classmethod
+    def from_tools(cls, tools: dict[str, dict]) -> "KeywordMatcher":
+        """AVAILABLE_TOOLS 형식({name: {"keywords": [...]}})에서 생성"""
+        return cls({
+            name: info.get("keywords", [])
+            for name, info in tools.items()
+        })
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def _add(self, word: str, pattern_id: int) -> None:
+        """트라이에 키워드 추가"""
+        state = 0
+        for ch in word:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = nxt
+        self._out[state] = self._out[state] + (pattern_id,)
+
+    def _build(self) -> None:
+        """BFS로 실패 링크 계산 및 출력 병합"""
+        queue: deque[int] = deque(self._goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+
+                # 실패 링크의 출력도 현재 상태의 출력
+                if self._out[self._fail[nxt]]:
+                    self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find_all(self, text: str) -> list[KeywordMatch]:
+        """
+        모든 키워드 매칭 찾기 (단일 순회)
+
+        Args:
+            text: 검색 대상 (대소문자 무시)
+
+        Returns:
+            list[KeywordMatch]: 끝 위치 순서의 매칭 목록
+        """
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        patterns = self._patterns
+
+        matches: list[KeywordMatch] = []
+        state = 0
+
+        for i, ch in enumerate(text.lower()):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+
+            for pattern_id in out[state]:
+                tool_name, keyword = patterns[pattern_id]
+                matches.append(KeywordMatch(
+                    tool_name=tool_name,
+                    keyword=keyword,
+                    start=i - len(keyword) + 1,
+                    end=i + 1,
+                ))
+
+        return matches
+
+    def best_match(self, text: str) -> Optional[ScoredMatch]:
+        """
+        가장 구체적인 Tool 매칭
+
+        우선순위:
+        1. 가장 긴 키워드 ("일정 추가" > "일정")
+        2. 매칭된 서로 다른 키워드 수
+        3. 먼저 등장한 위치
+        """
+        matches = self.find_all(text)
+        if not matches:
+            return None
+
+        by_tool: dict[str, list[KeywordMatch]] = {}
+        for match in matches:
+            by_tool.setdefault(match.tool_name, []).append(match)
+
+        def rank(item: tuple[str, list[KeywordMatch]]) -> tuple:
+            _, tool_matches = item
+            longest = max(len(m.keyword) for m in tool_matches)
+            distinct = len({m.keyword for m in tool_matches})
+            first = min(m.start for m in tool_matches)
+            return (-longest, -distinct, first)
+
+        tool_name, tool_matches = min(by_tool.items(), key=rank)
+        top = max(tool_matches, key=lambda m: (len(m.keyword), -m.start))
+
+        return ScoredMatch(
+            tool_name=tool_name,
+            keyword=top.keyword,
+            confidence=self._score(top.keyword, tool_matches),
+            matches=tool_matches,
+        )
+
+    def _score(self, keyword: str, matches: list[KeywordMatch]) -> float:
+        """매칭 신뢰도 계산"""
+        confidence = self.BASE_CONFIDENCE
+        if " " in keyword:
+            confidence += self.PHRASE_BONUS
+        extra = len({m.keyword for m in matches}) - 1
+        confidence += self.EXTRA_HIT_BONUS * extra
+        return round(min(confidence, self.MAX_CONFIDENCE), 2)
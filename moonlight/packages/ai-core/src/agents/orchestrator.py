@@ -5,12 +5,35 @@ Multi-agent 시스템의 핵심 조율자
 3단계 검증으로 Function Calling 정확도 100% 달성
 """
 
+import asyncio
+import json
+import uuid
+from contextlib import aclosing
 from dataclasses import dataclass
-from typing import Optional
+from typing import AsyncIterator, Optional
 
+from pydantic import ValidationError
+
+from .confirmation import is_cancellation, parse_confirmation
+from .intent_cache import SemanticIntentCache
 from .intent_parser import IntentParserAgent, IntentResult
+from .slot_filler import SlotFillerAgent
+from .speculation import SpeculationStats, SpeculativeTask
 from .validator import ParameterValidatorAgent, ValidationResult
+from ..config import get_settings
+from ..constitution.loader import ConstitutionLoader, get_constitution
+from ..db.sinks import ConversationRecord, ToolLogRecord
+from ..db.writer import WriteBehindWriter, get_writer
+from ..llm.json_extract import StreamingJSONExtractor, extract_json
 from ..llm.provider import LLMProvider
+from ..memory.context import ContextAssembler
+from ..memory.embedding_service import get_embedding_service
+from ..memory.pending import PendingAction, PendingActionStore, get_pending_store
+from ..memory.retrieval import HybridRetriever, RetrievedMemory, create_retriever
+from ..memory.session import SessionMemory, get_session_memory
+from ..metrics.tracing import Span, current_span, span, tracer
+from ..tools.executor import ToolCall, ToolExecutor, ToolResult, get_tool_executor
+from ..tools.registry import ToolRegistry, get_tool_registry
 
 
 @dataclass
@@ -19,6 +42,29 @@ class ProcessResult:
     message: str
     tool_used: Optional[str] = None
     success: bool = True
+    awaiting_confirmation: bool = False  # 고위험 작업 확인 질문 (다음 턴 답변으로 재개)
+
+
+@dataclass
+class StreamEvent:
+    """스트리밍 이벤트"""
+    type: str  # "delta" | "done"
+    content: str = ""
+    tool_used: Optional[str] = None
+    success: bool = True
+    awaiting_confirmation: bool = False
+    
+    def to_dict(self) -> dict:
+        """전송용 dict 변환"""
+        if self.type == "delta":
+            return {"type": "delta", "content": self.content}
+        return {
+            "type": "done",
+            "message": self.content,
+            "tool_used": self.tool_used,
+            "success": self.success,
+            "awaiting_confirmation": self.awaiting_confirmation,
+        }
 
 
 class AgentOrchestrator:
@@ -31,21 +77,79 @@ class AgentOrchestrator:
     - 고위험 작업: Stage 3 분리 (100% 정확도)
     """
     
-    # 고위험 Tool (사용자 확인 필요)
-    HIGH_RISK_TOOLS = {
-        "send_email",
-        "delete_file",
-        "create_event",
-        "update_event",
-        "delete_event",
-        "github_create_issue",
-        "github_close_issue",
-    }
-    
-    def __init__(self):
-        self.llm = LLMProvider()
-        self.intent_parser = IntentParserAgent(self.llm)
-        self.validator = ParameterValidatorAgent(self.llm)
+    def __init__(
+        self,
+        llm: Optional[LLMProvider] = None,
+        writer: Optional[WriteBehindWriter] = None,
+        sessions: Optional[SessionMemory] = None,
+        retriever: Optional[HybridRetriever] = None,
+        constitution: Optional[ConstitutionLoader] = None,
+        registry: Optional[ToolRegistry] = None,
+        executor: Optional[ToolExecutor] = None,
+        pending: Optional[PendingActionStore] = None,
+    ):
+        self.llm = llm or LLMProvider()
+        
+        # Tool 메타데이터 (고위험 여부 / 확인 문구 / 파라미터 모델)
+        self.registry = registry or get_tool_registry()
+        self.intent_parser = IntentParserAgent(
+            self.llm,
+            cache=self._build_intent_cache(),
+            registry=self.registry,  # 레지스트리 버전이 바뀌면 키워드 오토마톤 다시 빌드
+        )
+        self.validator = ParameterValidatorAgent(self.llm, registry=self.registry)
+        self.executor = executor or get_tool_executor()
+        
+        # 고위험 작업 확인 대기 (세션 키 → 검증된 실행 계획)
+        self.pending = pending if pending is not None else get_pending_store()
+        
+        # Constitution (컴파일된 원칙, 핫 리로드)
+        self.constitution = constitution or get_constitution()
+        
+        # 대화/Tool 로그 write-behind 저장 (비활성화면 None)
+        self.writer = writer if writer is not None else get_writer()
+        
+        # 세션 단기 기억 (최근 대화)
+        self.sessions = sessions or get_session_memory()
+        
+        # 중기 기억 검색 (opt-in) + 토큰 예산 기반 프롬프트 구성
+        settings = get_settings()
+        if retriever is None and settings.retrieval_enabled:
+            retriever = create_retriever(settings)
+        self.retriever = retriever
+        if retriever is not None and self.writer is not None:
+            # 저장된 대화 → 다음 검색에서 로컬 인덱스 증분 갱신
+            self.writer.add_listener(lambda records: retriever.mark_stale({r.user_id for r in records}))
+        self.retrieval_top_k = settings.retrieval_top_k
+        self.context_assembler = ContextAssembler.from_settings(settings)
+        
+        # 명확화 질문 답변 → 누락 파라미터만 추출 (비활성화면 None, 답변은 새 요청으로 처리)
+        self.slot_filler = (
+            SlotFillerAgent(self.llm, registry=self.registry, llm_fallback=settings.slot_filling_llm_fallback)
+            if settings.slot_filling_enabled else None
+        )
+        
+        # Tool 선택 방식 (native | json | legacy)
+        self.tool_calling = settings.tool_calling_mode
+        self.tool_calling_temperature = settings.tool_calling_temperature
+        self._json_tool_prompt: Optional[tuple[int, str]] = None  # (레지스트리 버전, 프롬프트)
+        
+        # 투기적 실행 (opt-in, legacy 경로에서만 Intent 파싱과 응답 생성이 나뉨)
+        self.speculative = settings.speculative_generation and self.tool_calling == "legacy"
+        self.speculation_stats = SpeculationStats()
+    
+    def _build_intent_cache(self) -> Optional[SemanticIntentCache]:
+        """설정에 따라 의미 기반 Intent 캐시 생성 (legacy 모드에서만 Intent Parser LLM 호출이 있음)"""
+        settings = get_settings()
+        if not settings.intent_cache_enabled or settings.tool_calling_mode != "legacy":
+            return None
+        
+        return SemanticIntentCache(
+            embedder=get_embedding_service(),
+            threshold=settings.intent_cache_threshold,
+            max_entries=settings.intent_cache_max_entries,
+            ttl_seconds=settings.intent_cache_ttl_seconds,
+        )
     
     async def process(
         self,
@@ -66,10 +170,30 @@ class AgentOrchestrator:
         Returns:
             ProcessResult: 처리 결과
         """
-        context = {
-            "user_id": user_id,
-            "session_id": session_id,
-        }
+        with span("process"):
+            context = await self._build_context(user_id, session_id, message)
+            
+            result = await self._process(message, context, enable_tools)
+            self._review_response(result.message)
+            await self._persist_turn(message, context, result)
+            return result
+    
+    async def _process(
+        self,
+        message: str,
+        context: dict,
+        enable_tools: bool,
+    ) -> ProcessResult:
+        """단계별 처리 (저장 제외)"""
+        resumed = await self._resume_pending(message, context)
+        if resumed is not None:
+            return resumed
+        
+        if enable_tools and self.tool_calling != "legacy":
+            return await self._process_tool_calling(message, context)
+        
+        if self._should_speculate(message, enable_tools):
+            return await self._process_speculative(message, context)
         
         # Stage 1: Intent Parsing
         intent = await self._parse_intent(message, context, enable_tools)
@@ -79,31 +203,623 @@ class AgentOrchestrator:
             response = await self._generate_response(message, context)
             return ProcessResult(message=response)
         
+        return await self._run_tool(intent, context)
+    
+    async def process_stream(
+        self,
+        user_id: str,
+        message: str,
+        session_id: Optional[str] = None,
+        enable_tools: bool = True,
+    ) -> AsyncIterator[StreamEvent]:
+        """
+        사용자 메시지 처리 (스트리밍)
+        
+        일반 대화는 LLM 토큰을 도착 즉시 delta로 전달하고,
+        Tool 경로는 결과 메시지를 하나의 delta로 전달합니다.
+        마지막 이벤트는 항상 전체 메시지를 담은 "done" 입니다.
+        
+        Yields:
+            StreamEvent: delta 이벤트들 + 최종 done 이벤트
+        """
+        # yield를 건너므로 컨텍스트에 설정하지 않는 span (단계 span은 같은 Trace로 묶임)
+        process = tracer.start_span("process")
+        try:
+            context = await self._build_context(user_id, session_id, message)
+            
+            async for event in self._process_stream(message, context, enable_tools):
+                if event.type == "done":
+                    self._review_response(event.content, process)
+                    await self._persist_turn(
+                        message,
+                        context,
+                        ProcessResult(
+                            message=event.content,
+                            tool_used=event.tool_used,
+                            success=event.success,
+                        ),
+                    )
+                yield event
+        except BaseException as e:
+            tracer.end(process, None if isinstance(e, GeneratorExit) else e)
+            raise
+        tracer.end(process)
+    
+    async def _process_stream(
+        self,
+        message: str,
+        context: dict,
+        enable_tools: bool,
+    ) -> AsyncIterator[StreamEvent]:
+        """단계별 스트리밍 처리 (저장 제외)"""
+        resumed = await self._resume_pending(message, context)
+        if resumed is not None:
+            for event in self._result_events(resumed):
+                yield event
+            return
+        
+        if enable_tools and self.tool_calling != "legacy":
+            async for event in self._stream_tool_calling(message, context):
+                yield event
+            return
+        
+        if self._should_speculate(message, enable_tools):
+            async for event in self._process_stream_speculative(message, context):
+                yield event
+            return
+        
+        # Stage 1: Intent Parsing
+        intent = await self._parse_intent(message, context, enable_tools)
+        
+        if not intent.tool_needed:
+            # Tool 불필요 → 일반 대화 (토큰 스트리밍)
+            parts: list[str] = []
+            async for delta in self._generate_response_stream(message, context):
+                parts.append(delta)
+                yield StreamEvent(type="delta", content=delta)
+            
+            yield StreamEvent(type="done", content="".join(parts))
+            return
+        
+        async for event in self._stream_tool(intent, context):
+            yield event
+    
+    async def _process_tool_calling(self, message: str, context: dict) -> ProcessResult:
+        """
+        한 번의 LLM 호출로 직접 답변 또는 Tool 호출 (native / json)
+        
+        키워드 fast path로 파라미터까지 충족되는 요청은 LLM 없이 실행합니다.
+        """
+        intent = self._keyword_intent(message)
+        if intent is not None:
+            return await self._run_tool(intent, context)
+        
+        # 직접 답변도 이 호출에서 나오므로 일반 대화처럼 응답 캐시 / 병합 없이
+        messages = self._build_messages(message, context)
+        with span("llm", mode=self.tool_calling):
+            if self.tool_calling == "json":
+                text = await self.llm.chat(
+                    self._with_json_tool_prompt(messages),
+                    temperature=self.tool_calling_temperature,
+                    use_cache=False,
+                )
+                intents = self._intents_from_json(extract_json(text))
+            else:
+                response = await self.llm.chat_with_tools(
+                    messages,
+                    self.registry.function_schemas(),
+                    use_cache=False,
+                    temperature=self.tool_calling_temperature,
+                )
+                text = response.get("content") or ""
+                intents = self._intents_from_tool_calls(response.get("tool_calls"))
+        
+        if intents:
+            return await self._run_tools(intents, context)
+        return ProcessResult(message=text or "죄송합니다, 응답을 생성하는 데 실패했습니다.")
+    
+    async def _stream_tool_calling(self, message: str, context: dict) -> AsyncIterator[StreamEvent]:
+        """한 번의 스트리밍 호출: 텍스트는 도착 즉시 delta, Tool 호출은 모은 뒤 실행"""
+        intent = self._keyword_intent(message)
+        if intent is not None:
+            async for event in self._stream_tool(intent, context):
+                yield event
+            return
+        
+        messages = self._build_messages(message, context)
+        parts: list[str] = []
+        intents: list[IntentResult] = []
+        
+        if self.tool_calling == "json":
+            stream = self._stream_json_tool_calls(messages, intents)
+        else:
+            stream = self._stream_native_tool_calls(messages, intents)
+        async with aclosing(stream):
+            async for delta in stream:
+                parts.append(delta)
+                yield StreamEvent(type="delta", content=delta)
+        
+        if not intents:
+            yield StreamEvent(type="done", content="".join(parts))
+            return
+        
+        result = await self._run_tools(intents, context)
+        yield StreamEvent(type="delta", content=result.message)
+        yield StreamEvent(
+            type="done",
+            content="".join(parts) + result.message,
+            tool_used=result.tool_used,
+            success=result.success,
+            awaiting_confirmation=result.awaiting_confirmation,
+        )
+    
+    async def _stream_native_tool_calls(
+        self,
+        messages: list[dict],
+        intents: list[IntentResult],
+    ) -> AsyncIterator[str]:
+        """native: 텍스트 delta 전달, Tool 호출은 intents에 채움"""
+        stream = self.llm.chat_stream_with_tools(
+            messages,
+            self.registry.function_schemas(),
+            temperature=self.tool_calling_temperature,
+        )
+        async with aclosing(stream):
+            async for event in stream:
+                if event["type"] == "delta":
+                    yield event["content"]
+                else:
+                    intents.extend(self._intents_from_tool_calls(event["tool_calls"]))
+    
+    async def _stream_json_tool_calls(
+        self,
+        messages: list[dict],
+        intents: list[IntentResult],
+    ) -> AsyncIterator[str]:
+        """json: JSON 밖 텍스트만 전달, 첫 Tool 호출 JSON이 완성되면 스트림 중단"""
+        extractor = StreamingJSONExtractor()
+        stream = self.llm.chat_stream(self._with_json_tool_prompt(messages), temperature=self.tool_calling_temperature)
+        async with aclosing(stream):
+            async for delta in stream:
+                while True:
+                    text = extractor.feed(delta)
+                    if text:
+                        yield text
+                    if not extractor.done:
+                        break
+                    
+                    found = self._intents_from_json(extractor.value)
+                    if found:
+                        intents.extend(found)
+                        return
+                    # Tool 호출이 아닌 JSON → 일반 텍스트로 전달 후 같은 조각의 나머지부터 계속
+                    yield extractor.raw
+                    delta = extractor.tail
+                    extractor = StreamingJSONExtractor()
+        
+        rest = extractor.close()
+        if rest:
+            yield rest
+    
+    def _keyword_intent(self, message: str) -> Optional[IntentResult]:
+        """키워드 fast path (기본 파라미터로 검증을 통과하는 Tool만)"""
+        intent = self.intent_parser.keyword_match(message)
+        if intent is None:
+            return None
+        
+        model = self.registry.param_model(intent.tool_name)
+        if model is not None:
+            try:
+                model(**intent.parameters)
+            except ValidationError:
+                return None
+        return intent
+    
+    def _intents_from_tool_calls(self, tool_calls: Optional[list[dict]]) -> list[IntentResult]:
+        """OpenAI 호환 tool_calls → IntentResult (알 수 없는 Tool 제외)"""
+        intents = []
+        for call in tool_calls or ():
+            function = call.get("function") or {}
+            name = function.get("name")
+            arguments = function.get("arguments") or {}
+            if isinstance(arguments, str):
+                arguments = extract_json(arguments) if arguments.strip() else {}
+            intent = self._tool_intent(name, arguments)
+            if intent is not None:
+                intents.append(intent)
+        return intents
+    
+    def _intents_from_json(self, value) -> list[IntentResult]:
+        """
+        json 모드 출력 → IntentResult
+        
+        {"tool": ..., "parameters": {...}} 또는 {"tool_calls": [...]} 또는 그 목록
+        """
+        if isinstance(value, dict) and isinstance(value.get("tool_calls"), list):
+            value = value["tool_calls"]
+        items = value if isinstance(value, list) else [value]
+        
+        intents = []
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            intent = self._tool_intent(item.get("tool") or item.get("tool_name"), item.get("parameters"))
+            if intent is not None:
+                intents.append(intent)
+        return intents
+    
+    def _tool_intent(self, name: Optional[str], parameters) -> Optional[IntentResult]:
+        spec = self.registry.get(name)
+        if spec is None or not spec.enabled:
+            return None
+        return IntentResult(
+            tool_needed=True,
+            tool_name=name,
+            parameters=parameters if isinstance(parameters, dict) else {},
+            confidence=1.0,
+        )
+    
+    def _with_json_tool_prompt(self, messages: list[dict]) -> list[dict]:
+        """json 모드: 마지막 사용자 메시지 앞에 Tool 안내 추가 (레지스트리 버전별 캐시)"""
+        if self._json_tool_prompt is None or self._json_tool_prompt[0] != self.registry.version:
+            tools = "\n".join(
+                f"- {spec.name}: {spec.description} "
+                f"{json.dumps(self.registry.json_schema(spec.name).get('properties', {}), ensure_ascii=False)}"
+                for spec in self.registry.enabled()
+            )
+            prompt = (
+                "사용 가능한 Tools:\n"
+                f"{tools}\n\n"
+                "Tool이 필요하면 다른 말 없이 JSON만 출력하세요: "
+                '{"tool": "<이름>", "parameters": {...}} '
+                '(여러 개면 {"tool_calls": [...]}).\n'
+                "Tool이 필요 없으면 평소처럼 바로 답하세요."
+            )
+            self._json_tool_prompt = (self.registry.version, prompt)
+        
+        return [*messages[:-1], {"role": "system", "content": self._json_tool_prompt[1]}, messages[-1]]
+    
+    def _should_speculate(self, message: str, enable_tools: bool) -> bool:
+        """
+        투기적 실행 여부
+        
+        키워드 fast path로 의도가 즉시 정해지는 메시지는 제외 (LLM 파싱이 필요할 때만)
+        """
+        return self.speculative and enable_tools and self.intent_parser.needs_llm(message)
+    
+    async def _process_speculative(self, message: str, context: dict) -> ProcessResult:
+        """Stage 1과 일반 응답 생성을 동시에 실행, 의도 확정 후 불필요한 쪽 취소"""
+        speculation = SpeculativeTask(
+            self._generate_response(message, context),
+            self.speculation_stats,
+        )
+        
+        try:
+            intent = await self._parse_intent(message, context, enable_tools=True)
+        except BaseException:
+            speculation.discard()
+            raise
+        
+        if not intent.tool_needed:
+            response = await speculation.accept()
+            return ProcessResult(message=response)
+        
+        speculation.discard()
+        return await self._run_tool(intent, context)
+    
+    async def _process_stream_speculative(
+        self,
+        message: str,
+        context: dict,
+    ) -> AsyncIterator[StreamEvent]:
+        """스트리밍 투기적 실행: 생성된 delta는 의도 확정 전까지 큐에 보관"""
+        queue: asyncio.Queue[Optional[str]] = asyncio.Queue()
+        speculation = SpeculativeTask(
+            self._pump_response_stream(message, context, queue),
+            self.speculation_stats,
+        )
+        
+        try:
+            intent = await self._parse_intent(message, context, enable_tools=True)
+        except BaseException:
+            speculation.discard()
+            raise
+        
+        if intent.tool_needed:
+            speculation.discard()
+            async for event in self._stream_tool(intent, context):
+                yield event
+            return
+        
+        task = speculation.accept()
+        parts: list[str] = []
+        try:
+            while (delta := await queue.get()) is not None:
+                parts.append(delta)
+                yield StreamEvent(type="delta", content=delta)
+        finally:
+            # 클라이언트 연결 종료 등으로 중단되면 생성도 취소
+            if not task.done():
+                task.cancel()
+        
+        yield StreamEvent(type="done", content="".join(parts))
+    
+    async def _pump_response_stream(
+        self,
+        message: str,
+        context: dict,
+        queue: asyncio.Queue,
+    ) -> None:
+        """일반 응답 delta를 큐로 전달 (None = 종료)"""
+        try:
+            async for delta in self._generate_response_stream(message, context):
+                queue.put_nowait(delta)
+        finally:
+            queue.put_nowait(None)
+    
+    async def _stream_tool(
+        self,
+        intent: IntentResult,
+        context: dict,
+    ) -> AsyncIterator[StreamEvent]:
+        """Tool 경로 결과를 delta + done 이벤트로 전달"""
+        result = await self._run_tool(intent, context)
+        for event in self._result_events(result):
+            yield event
+    
+    @staticmethod
+    def _result_events(result: ProcessResult) -> list[StreamEvent]:
+        """완성된 결과 → delta + done 이벤트"""
+        return [
+            StreamEvent(type="delta", content=result.message),
+            StreamEvent(
+                type="done",
+                content=result.message,
+                tool_used=result.tool_used,
+                success=result.success,
+                awaiting_confirmation=result.awaiting_confirmation,
+            ),
+        ]
+    
+    async def _run_tool(self, intent: IntentResult, context: dict) -> ProcessResult:
+        """Stage 2+3 검증 후 Tool 실행"""
+        return await self._run_tools([intent], context)
+    
+    async def _run_tools(self, intents: list[IntentResult], context: dict) -> ProcessResult:
+        """Stage 2+3 검증 후 Tool 실행 (독립 호출 여러 개는 병렬)"""
         # Stage 2+3: Validation + Verification (병합)
-        validated = await self._validate_and_verify(intent, context)
+        validated = self._validate_and_verify(intents, context)
         
-        if not validated.is_valid:
+        invalid = next((item for item in validated if not item.is_valid), None)
+        if invalid is not None:
             # 검증 실패 → 명확화 요청
-            return ProcessResult(
-                message=validated.clarification_message or "주인님, 다시 한번 말씀해주시겠어요?",
-                success=False,
-            )
+            message = invalid.clarification_message or "주인님, 다시 한번 말씀해주시겠어요?"
+            await self._await_slots(validated, message, context)
+            return ProcessResult(message=message, success=False)
         
-        # 고위험 작업 확인 (Stage 3 분리)
-        if intent.tool_name in self.HIGH_RISK_TOOLS:
-            confirmation_msg = await self._request_confirmation(intent, validated)
-            # TODO: 실제로는 사용자 응답 대기 필요
-            # 지금은 바로 실행 (MVP)
+        # Tool 실행 계획 (고위험 Tool은 계획마다 새 멱등 키 → 확인 대기 재개가 재시도돼도 한 번만 실행,
+        # 사용자가 같은 요청을 다시 보내면 새 계획이므로 다시 실행)
+        calls = [
+            ToolCall(item.tool_name, item.parameters or {}, self._idempotency_key(item, context))
+            for item in validated
+        ]
         
-        # Tool 실행
-        result = await self._execute_tool(validated)
+        # 고위험 작업 확인 (Stage 3 분리): 실행 계획을 저장하고 질문만 반환 → 다음 턴에 재개
+        risky = [
+            (intent, item) for intent, item in zip(intents, validated)
+            if self.registry.is_high_risk(intent.tool_name)
+        ]
+        if risky:
+            prompt = " ".join([await self._request_confirmation(intent, item) for intent, item in risky])
+            action = self.pending.create(
+                [(call.tool_name, call.parameters, call.idempotency_key) for call in calls],
+                prompt,
+            )
+            await self.pending.put(context["session_key"], action)
+            return ProcessResult(message=prompt, awaiting_confirmation=True)
+        
+        return await self._execute_calls(calls, context)
+    
+    async def _execute_calls(self, calls: list[ToolCall], context: dict) -> ProcessResult:
+        """검증된 Tool 호출 실행 (제한 시간 + 벌크헤드, 읽기 전용 Tool은 결과 캐시)"""
+        results = await self.executor.execute_many(calls, scope=context["user_id"])
+        messages = [self._format_tool_result(result) for result in results]
+        await asyncio.gather(*(
+            self._persist_tool_log(context, call, result, message)
+            for call, result, message in zip(calls, results, messages)
+        ))
         
         return ProcessResult(
-            message=result,
-            tool_used=intent.tool_name,
-            success=True,
+            message="\n".join(messages),
+            tool_used=",".join(call.tool_name for call in calls),
+            success=all(result.success for result in results),
         )
     
+    async def _resume_pending(self, message: str, context: dict) -> Optional[ProcessResult]:
+        """
+        확인 대기 중인 작업 재개 (세션 키 조회 한 번)
+        
+        긍정 답변이면 저장된 실행 계획을 검증 없이 바로 실행하고, 부정이면 취소합니다.
+        확인 답변이 아니면 대기 작업을 버리고 새 요청으로 처리합니다 (None 반환).
+        """
+        action: Optional[PendingAction] = await self.pending.pop(context["session_key"])
+        if action is None:
+            return None
+        if action.awaiting_slots:
+            return await self._fill_slots(action, message, context)
+        
+        decision = parse_confirmation(message)
+        if decision is None:
+            return None
+        if not decision:
+            return ProcessResult(message="알겠어요, 주인님. 진행하지 않을게요.", success=False)
+        
+        calls = [ToolCall(name, parameters, key) for name, parameters, key in action.calls]
+        with span("tool.resume", tools=",".join(action.tool_names)):
+            return await self._execute_calls(calls, context)
+    
+    async def _await_slots(
+        self,
+        validated: list[ValidationResult],
+        question: str,
+        context: dict,
+    ) -> None:
+        """
+        누락 필드만 있는 검증 실패 → 부분 파라미터를 세션에 저장 (slot filling)
+        
+        형식 오류가 섞여 있으면 저장하지 않습니다 (다음 답변은 새 요청).
+        """
+        if self.slot_filler is None:
+            return
+        if not all(item.is_valid or item.missing_fields for item in validated):
+            return
+        
+        action = self.pending.create(
+            [(item.tool_name, item.parameters or {}, None) for item in validated],
+            question,
+            missing=[list(item.missing_fields) for item in validated],
+        )
+        await self.pending.put(context["session_key"], action)
+    
+    async def _fill_slots(
+        self,
+        action: PendingAction,
+        message: str,
+        context: dict,
+    ) -> Optional[ProcessResult]:
+        """
+        명확화 질문 답변으로 누락 파라미터를 채워 이어서 실행 (Intent 재파싱 없이)
+        
+        취소 답변이면 취소하고, 다른 Tool 요청이거나 채운 필드가 없으면 새 요청으로 처리합니다 (None 반환).
+        아직 누락이 남으면 _run_tools가 다시 질문하고 상태를 저장합니다.
+        """
+        if self.slot_filler is None:
+            return None
+        if is_cancellation(message):
+            return ProcessResult(message="알겠어요, 주인님. 진행하지 않을게요.", success=False)
+        
+        keyword = self.intent_parser.keyword_match(message)
+        if keyword is not None and keyword.tool_name not in action.tool_names:
+            return None
+        
+        with span("slots", tools=",".join(action.tool_names)) as current:
+            values = await self.slot_filler.fill(
+                [(name, fields) for (name, _, _), fields in zip(action.calls, action.missing)],
+                message,
+                action.prompt,
+            )
+            if current is not None:
+                current.set("filled", len(values))
+        if not values:
+            return None
+        
+        intents = [
+            IntentResult(
+                tool_needed=True,
+                tool_name=name,
+                parameters={**parameters, **{field: values[field] for field in fields if field in values}},
+                confidence=1.0,
+            )
+            for (name, parameters, _), fields in zip(action.calls, action.missing)
+        ]
+        return await self._run_tools(intents, context)
+    
+    def _idempotency_key(self, validated: ValidationResult, context: dict) -> Optional[str]:
+        """고위험 Tool 호출마다 새 키 (PendingAction 에 저장되어 재개 시 그대로 사용)"""
+        if not self.registry.is_high_risk(validated.tool_name):
+            return None
+        return uuid.uuid4().hex
+    
+    async def _build_context(
+        self,
+        user_id: str,
+        session_id: Optional[str],
+        message: str,
+    ) -> dict:
+        """처리 컨텍스트 (최근 대화 + 관련 기억)"""
+        session_key = SessionMemory.key(user_id, session_id)
+        with span("context") as current:
+            history, memories = await asyncio.gather(
+                self.sessions.recent(session_key),
+                self._retrieve_memories(user_id, message),
+            )
+            if current is not None:
+                current.set("memories", len(memories))
+        return {
+            "user_id": user_id,
+            "session_id": session_id,
+            "session_key": session_key,
+            "history": history,
+            "memories": memories,
+        }
+    
+    async def _retrieve_memories(self, user_id: str, message: str) -> list[RetrievedMemory]:
+        """관련 과거 대화 검색 (실패 시 기억 없이 진행)"""
+        if self.retriever is None:
+            return []
+        
+        try:
+            query = await get_embedding_service().embed(message)
+            return await self.retriever.search(user_id, query, self.retrieval_top_k)
+        except Exception as e:
+            print(f"기억 검색 오류: {e}")
+            return []
+    
+    def _review_response(self, response: str, turn_span: Optional[Span] = None) -> None:
+        """응답 사후 검사 (Constitution negative 문구, 통계 + 턴 span에 기록)"""
+        violations = self.constitution.check(response)
+        if violations:
+            current = turn_span or current_span()
+            if current is not None:
+                current.set("constitution.violations", len(violations))
+                current.set("constitution.principles", ",".join(sorted({v.principle_id for v in violations})))
+            phrases = ", ".join(f"{v.principle_id} '{v.phrase}'" for v in violations)
+            print(f"Constitution 위반 문구 감지: {phrases}")
+    
+    async def _persist_turn(
+        self,
+        message: str,
+        context: dict,
+        result: ProcessResult,
+    ) -> None:
+        """대화 턴 기록 (세션 기억 + write-behind 저장)"""
+        with span("persist"):
+            try:
+                await self.sessions.append_turn(context["session_key"], message, result.message)
+            except Exception as e:
+                print(f"세션 기록 오류: {e}")
+            
+            if self.writer is None:
+                return
+            
+            await self.writer.submit(ConversationRecord(
+                user_id=context["user_id"],
+                session_id=context["session_id"],
+                user_message=message,
+                assistant_message=result.message,
+                tools_used=[result.tool_used] if result.tool_used else [],
+            ))
+    
+    async def _persist_tool_log(
+        self,
+        context: dict,
+        call: ToolCall,
+        result: ToolResult,
+        message: str,
+    ) -> None:
+        """Tool 실행 로그 저장 요청"""
+        if self.writer is None:
+            return
+        
+        await self.writer.submit(ToolLogRecord(
+            user_id=context["user_id"],
+            tool_name=call.tool_name,
+            parameters=call.parameters or {},
+            result={"message": message, **result.as_log()},
+            success=result.success,
+            execution_time_ms=result.execution_time_ms,
+        ))
+    
     async def _parse_intent(
         self,
         message: str,
@@ -114,19 +830,19 @@ class AgentOrchestrator:
         if not enable_tools:
             return IntentResult(tool_needed=False)
         
-        return await self.intent_parser.parse(message, context)
+        with span("intent"):
+            return await self.intent_parser.parse(message, context)
     
-    async def _validate_and_verify(
+    def _validate_and_verify(
         self,
-        intent: IntentResult,
+        intents: list[IntentResult],
         context: dict,
-    ) -> ValidationResult:
-        """Stage 2+3: 검증 및 확인 (병합)"""
-        return await self.validator.validate(
-            tool_name=intent.tool_name,
-            parameters=intent.parameters,
-            context=context,
-        )
+    ) -> list[ValidationResult]:
+        """Stage 2+3: 검증 및 확인 (병합, 미리 컴파일된 검증기로 일괄 처리)"""
+        with span("validate", tools=len(intents)):
+            return self.validator.validate_many(
+                (intent.tool_name, intent.parameters) for intent in intents
+            )
     
     async def _request_confirmation(
         self,
@@ -134,45 +850,52 @@ class AgentOrchestrator:
         validated: ValidationResult,
     ) -> str:
         """Stage 3: 고위험 작업 확인 요청"""
-        tool_desc = {
-            "send_email": "이메일을 전송",
-            "delete_file": "파일을 삭제",
-            "create_event": "일정을 생성",
-        }.get(intent.tool_name, intent.tool_name)
+        spec = self.registry.get(intent.tool_name)
+        tool_desc = (spec and spec.confirmation) or intent.tool_name
         
         return f"주인님, {tool_desc}하시겠어요?"
     
-    async def _execute_tool(self, validated: ValidationResult) -> str:
-        """Tool 실행"""
-        # TODO: 실제 Tool 실행 로직
-        # 지금은 Mock
-        return f"주인님, {validated.tool_name} 작업이 완료되었습니다."
+    def _format_tool_result(self, result: ToolResult) -> str:
+        """Tool 실행 결과 → 사용자 메시지"""
+        if result.success:
+            return f"주인님, {result.tool_name} 작업이 완료되었습니다."
+        if result.timed_out:
+            return f"주인님, {result.tool_name} 작업이 제시간에 끝나지 않았어요. 잠시 후 다시 시도해볼게요."
+        print(f"Tool 실행 오류 ({result.tool_name}): {result.error}")
+        return f"주인님, {result.tool_name} 작업 중 문제가 생겼어요."
     
     async def _generate_response(self, message: str, context: dict) -> str:
         """일반 대화 응답 생성"""
-        response = await self.llm.chat(
-            messages=[
-                {"role": "system", "content": self._get_system_prompt()},
-                {"role": "user", "content": message},
-            ]
-        )
+        with span("llm", mode="chat"):
+            response = await self.llm.chat(
+                messages=self._build_messages(message, context)
+            )
         return response
     
+    async def _generate_response_stream(
+        self,
+        message: str,
+        context: dict,
+    ) -> AsyncIterator[str]:
+        """일반 대화 응답 생성 (스트리밍)"""
+        async for delta in self.llm.chat_stream(
+            messages=self._build_messages(message, context)
+        ):
+            yield delta
+    
+    def _build_messages(self, message: str, context: dict) -> list[dict]:
+        """시스템 프롬프트 + 최근 대화 + 관련 기억 + 원칙 강조 + 현재 메시지 (토큰 예산 내)"""
+        assembled = self.context_assembler.assemble(
+            context.get("session_key", ""),
+            self._get_system_prompt(),
+            message,
+            history=context.get("history", ()),
+            memories=context.get("memories", ()),
+            model=self.llm.default_model,
+            focus=self.constitution.current.focus_for(message),
+        )
+        return assembled.messages
+    
     def _get_system_prompt(self) -> str:
-        """시스템 프롬프트 (Constitutional AI)"""
-        return """당신은 '달빛 비서'입니다.
-
-핵심 원칙:
-1. 판단하지 않는다 - 있는 그대로 수용
-2. 기대하지 않는다 - 변화를 강요하지 않음
-3. 존재로서 지지한다 - 함께 있어줌
-
-응답 스타일:
-- 호칭: "주인님"
-- 톤: 따뜻하지만 압도적이지 않게
-- 길이: 간결하되 의미있게
-
-"압도적이지 않지만 달빛처럼"
-"""
-
-
+        """시스템 프롬프트 (Constitutional AI, 메시지와 무관하게 고정)"""
+        return self.constitution.current.system_prompt
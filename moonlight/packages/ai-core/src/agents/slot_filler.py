@@ -0,0 +1,190 @@
+"""
+Slot Filler Agent
+
+명확화 질문 답변에서 누락된 파라미터만 추출 (Intent 재파싱 없이)
+- 형식이 정해진 필드 (이메일 / 날짜·시간 / 저장소): 정규식
+- 자유 텍스트 필드 하나만 남았고 답변에서 다른 값을 찾지 못했으면 답변 전체를 값으로 사용
+- 그래도 남은 필드만 LLM으로 추출 (fallback, 추출한 부분을 빼고 남은 글자가 없으면 생략)
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, get_args
+
+from pydantic import EmailStr
+
+from ..llm.json_extract import extract_json
+from ..llm.provider import LLMProvider
+from ..tools.registry import ToolRegistry, get_tool_registry
+from ..tools.validation import FIELD_LABELS, is_blank
+
+EMAIL = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+
+_DAY = (
+    r"(?:\d{4}-\d{1,2}-\d{1,2}|\d{1,2}월\s*\d{1,2}일|\d{1,2}/\d{1,2}"
+    r"|오늘|내일|모레|글피|(?:이번|다음)\s*주\s*[월화수목금토일]요일|[월화수목금토일]요일)"
+)
+_TIME = r"(?:(?:오전|오후|아침|낮|저녁|밤)\s*)?\d{1,2}(?::\d{2}|시(?:\s*(?:\d{1,2}분|반))?)"
+DATETIME = re.compile(rf"{_DAY}(?:\s*{_TIME})?|{_TIME}")
+
+REPO_URL = re.compile(r"(?:https?://)?(?:www\.)?github\.com/([\w.-]+/[\w.-]+?)(?:\.git)?(?=[/?#\s]|$)")
+# owner/name 형식만 (단어 하나는 "use" 같은 일반 단어와 구분할 수 없으므로 LLM fallback)
+REPO = re.compile(r"(?<![A-Za-z0-9_./-])[A-Za-z][A-Za-z0-9-]*/[A-Za-z0-9_.-]*[A-Za-z0-9_-]")
+
+_WORD = re.compile(r"\w")
+
+
+def _search_repo(text: str) -> Optional[re.Match]:
+    return REPO_URL.search(text) or REPO.search(text)
+
+
+# 필드 종류 → 정규식 검색 ("text"는 추출기 없음, 그룹이 있으면 첫 그룹이 값)
+EXTRACTORS: dict[str, Callable[[str], Optional[re.Match]]] = {
+    "email": EMAIL.search,
+    "datetime": DATETIME.search,
+    "repo": _search_repo,
+}
+
+
+def match_value(match: re.Match) -> str:
+    return (match.group(1) if match.re.groups else match.group(0)).strip()
+
+
+def field_kind(name: str, annotation: Any) -> str:
+    """파라미터 필드 → 추출기 종류 (email / datetime / repo / text)"""
+    if annotation is EmailStr or EmailStr in get_args(annotation):
+        return "email"
+    if name in ("date", "time", "when") or name.endswith(("_time", "_date", "_at")):
+        return "datetime"
+    if name in ("repo", "repository"):
+        return "repo"
+    return "text"
+
+
+@dataclass
+class SlotStats:
+    """Slot filling 통계"""
+    turns: int = 0
+    regex_filled: int = 0
+    text_filled: int = 0
+    llm_fallbacks: int = 0
+    llm_filled: int = 0
+    unfilled: int = 0  # 아무 필드도 못 채움 → 새 요청으로 처리
+
+    def as_dict(self) -> dict:
+        return dict(self.__dict__)
+
+
+class SlotFillerAgent:
+    """
+    누락 파라미터 추출 에이전트
+
+    Validator가 명확화 질문을 보낸 뒤의 답변만 다룹니다.
+    답변은 보통 값 하나라서 대부분 정규식 / 자유 텍스트 규칙으로 끝나고 LLM은 남은 필드에만 씁니다.
+    """
+
+    def __init__(
+        self,
+        llm: LLMProvider,
+        registry: Optional[ToolRegistry] = None,
+        llm_fallback: bool = True,
+    ):
+        self.llm = llm
+        self.registry = registry or get_tool_registry()
+        self.llm_fallback = llm_fallback
+        self.stats = SlotStats()
+        self._kinds: dict[str, dict[str, str]] = {}
+        self._kinds_version = self.registry.version
+
+    def field_kinds(self, tool_name: str) -> dict[str, str]:
+        """Tool 파라미터 필드별 추출기 종류 (레지스트리 버전별 캐시)"""
+        if self._kinds_version != self.registry.version:
+            self._kinds.clear()
+            self._kinds_version = self.registry.version
+
+        kinds = self._kinds.get(tool_name)
+        if kinds is None:
+            model = self.registry.param_model(tool_name)
+            kinds = {} if model is None else {
+                name: field_kind(name, field.annotation) for name, field in model.model_fields.items()
+            }
+            self._kinds[tool_name] = kinds
+        return kinds
+
+    async def fill(
+        self,
+        missing: list[tuple[str, list[str]]],
+        message: str,
+        question: str = "",
+    ) -> dict[str, Any]:
+        """
+        답변에서 누락 필드 값 추출
+
+        Args:
+            missing: (tool_name, 누락 필드) 목록
+            message: 사용자 답변
+            question: 직전에 보낸 명확화 질문 (LLM fallback 프롬프트용)
+
+        Returns:
+            {필드: 값} (찾은 필드만, 같은 이름의 필드는 모든 호출에 같은 값)
+        """
+        self.stats.turns += 1
+        kinds: dict[str, str] = {}
+        for tool_name, fields in missing:
+            tool_kinds = self.field_kinds(tool_name)
+            for name in fields:
+                kinds.setdefault(name, tool_kinds.get(name, "text"))
+
+        text = message.strip()
+        leftover = text
+        values: dict[str, Any] = {}
+        for name, kind in kinds.items():
+            search = EXTRACTORS.get(kind)
+            match = search(text) if search is not None else None
+            if match is not None:
+                values[name] = match_value(match)
+                leftover = leftover.replace(match.group(0), " ")
+        self.stats.regex_filled += len(values)
+
+        rest = [name for name in kinds if name not in values]
+        if len(rest) == 1 and kinds[rest[0]] == "text" and not values and text:
+            values[rest[0]] = text
+            self.stats.text_filled += 1
+            rest = []
+
+        if rest and self.llm_fallback and _WORD.search(leftover):
+            found = await self._llm_extract(rest, text, question)
+            values.update(found)
+            self.stats.llm_filled += len(found)
+
+        if not values:
+            self.stats.unfilled += 1
+        return values
+
+    async def _llm_extract(self, fields: list[str], message: str, question: str) -> dict[str, Any]:
+        """남은 필드만 LLM으로 추출 (실패 시 빈 dict)"""
+        self.stats.llm_fallbacks += 1
+        fields_desc = "\n".join(f"- {name}: {FIELD_LABELS.get(name, name)}" for name in fields)
+        prompt = f"""질문에 대한 사용자 답변에서 다음 필드의 값을 추출하세요.
+
+질문: {question}
+답변: {message}
+
+필드:
+{fields_desc}
+
+JSON 객체로만 답하세요 (답변에 없는 필드는 null).
+"""
+        try:
+            response = await self.llm.chat(
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.1,
+            )
+        except Exception as e:
+            print(f"Slot 추출 오류: {e}")
+            return {}
+
+        result = extract_json(response)
+        if not isinstance(result, dict):
+            return {}
+        return {name: result[name] for name in fields if name in result and not is_blank(result[name])}
@@ -0,0 +1,86 @@
+"""
+Speculative Execution
+
+의도 파악(Stage 1)과 일반 응답 생성을 동시에 시작하고,
+의도가 확정되면 필요 없는 쪽을 취소합니다.
+- 취소는 asyncio Task → httpx 요청까지 전파
+- 낭비된 토큰 vs 절약된 지연시간 통계
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Coroutine, Optional
+
+from ..llm.usage import TokenUsage, track_usage
+
+
+@dataclass
+class SpeculationStats:
+    """투기적 실행 통계"""
+    launched: int = 0
+    used: int = 0  # 일반 대화 → 응답 채택
+    cancelled: int = 0  # Tool 필요 → 생성 도중 취소
+    discarded: int = 0  # Tool 필요 → 이미 완료된 응답 폐기
+    wasted_tokens: int = 0  # 폐기된 응답의 토큰 (취소된 요청은 집계 불가)
+    saved_ms: float = 0.0  # 순차 실행 대비 절약된 시간 합계
+
+    def as_dict(self) -> dict:
+        return {
+            "launched": self.launched,
+            "used": self.used,
+            "cancelled": self.cancelled,
+            "discarded": self.discarded,
+            "wasted_tokens": self.wasted_tokens,
+            "saved_ms_total": round(self.saved_ms, 1),
+            "saved_ms_avg": round(self.saved_ms / self.used, 1) if self.used else 0.0,
+        }
+
+
+class SpeculativeTask:
+    """
+    투기적으로 실행 중인 응답 생성 작업
+
+    accept() 또는 discard() 중 하나를 정확히 한 번 호출합니다.
+    """
+
+    def __init__(self, coro: Coroutine[Any, Any, Any], stats: SpeculationStats):
+        self.stats = stats
+        self.usage = TokenUsage()
+        self.started = time.perf_counter()
+        self.finished: Optional[float] = None
+        self.task = asyncio.create_task(self._run(coro))
+        stats.launched += 1
+
+    async def _run(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        # Task 고유 컨텍스트에서 토큰 추적
+        with track_usage(self.usage):
+            try:
+                return await coro
+            finally:
+                self.finished = time.perf_counter()
+
+    def accept(self) -> asyncio.Task:
+        """
+        응답 채택
+
+        순차 실행이었다면 의도 파악 후에야 시작했을 생성 작업 중
+        이미 진행된 부분(겹친 시간)을 절약 시간으로 기록합니다.
+        """
+        now = time.perf_counter()
+        overlap_end = self.finished if self.finished is not None else now
+        self.stats.used += 1
+        self.stats.saved_ms += (overlap_end - self.started) * 1000
+        return self.task
+
+    def discard(self) -> None:
+        """응답 폐기 (진행 중이면 취소)"""
+        if self.task.done():
+            self.stats.discarded += 1
+            self.stats.wasted_tokens += self.usage.total_tokens
+            # 결과/예외 소비 (미확인 예외 경고 방지)
+            if not self.task.cancelled():
+                self.task.exception()
+        else:
+            self.task.cancel()
+            self.stats.cancelled += 1
@@ -2,11 +2,17 @@
 Chat API Endpoints
 """
 
-from typing import Optional
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+import json
+from contextlib import nullcontext
+from typing import AsyncIterator, Optional
+from fastapi import APIRouter, Request, Response, WebSocket, WebSocketDisconnect
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 
+from ..admission import AdmissionRejected, get_admission_controller
 from ..agents.orchestrator import AgentOrchestrator
+from ..metrics.tracing import span, start_trace
+from .drain import turns
 
 router = APIRouter()
 
@@ -24,41 +30,127 @@ class ChatResponse(BaseModel):
     message: str
     tool_used: Optional[str] = None
     success: bool = True
+    awaiting_confirmation: bool = False  # 고위험 작업 확인 질문 (다음 메시지로 답변)
 
 
-# 글로벌 Orchestrator (나중에 DI로 변경)
+# 워커(프로세스)당 Orchestrator (lifespan 시작 시 생성, 나중에 DI로 변경)
 orchestrator: Optional[AgentOrchestrator] = None
 
+# drain 중 WebSocket 종료 코드 (Service Restart → 클라이언트는 재연결)
+WS_CLOSE_SERVICE_RESTART = 1012
 
-def get_orchestrator() -> AgentOrchestrator:
-    """Orchestrator 싱글톤"""
+
+def init_orchestrator() -> AgentOrchestrator:
+    """Orchestrator 생성 (lifespan 시작 시, 이미 있으면 그대로)"""
     global orchestrator
     if orchestrator is None:
         orchestrator = AgentOrchestrator()
     return orchestrator
 
 
+def get_orchestrator() -> AgentOrchestrator:
+    """Orchestrator 싱글톤 (lifespan 밖에서는 지연 생성)"""
+    return init_orchestrator()
+
+
+async def close_orchestrator() -> None:
+    global orchestrator
+    if orchestrator is not None:
+        await orchestrator.llm.close()
+        if orchestrator.retriever is not None:
+            await orchestrator.retriever.close()  # 로컬 인덱스 디스크 저장
+        orchestrator = None
+
+
+async def _admit(user_id: str) -> None:
+    """수락 제어 (거절 시 AdmissionRejected → 429)"""
+    admission = get_admission_controller()
+    if admission is not None:
+        with span("admission"):
+            await admission.admit(user_id)
+
+
+def _metered(user_id: str):
+    """턴의 LLM 토큰 사용량을 사용자 예산에서 차감 (수락 제어 비활성화면 아무것도 안 함)"""
+    admission = get_admission_controller()
+    return admission.metered(user_id) if admission is not None else nullcontext()
+
+
+async def admission_rejected_handler(request: Request, exc: AdmissionRejected) -> JSONResponse:
+    """수락 제어 거절 → 429 + Retry-After"""
+    return JSONResponse(
+        status_code=429,
+        content={"detail": "요청이 너무 많아요. 잠시 후 다시 시도해주세요.", "reason": exc.reason},
+        headers={"Retry-After": exc.retry_after_header},
+    )
+
+
 @router.post("", response_model=ChatResponse)
-async def chat(request: ChatRequest) -> ChatResponse:
+async def chat(request: ChatRequest, response: Response) -> ChatResponse:
     """
     대화 처리 (REST)
     
     - Multi-agent 시스템으로 처리
     - Tool Calling 자동 처리
+    - 단계별 소요 시간을 Server-Timing 헤더로 반환
+    - 한도 초과 시 429 + Retry-After
     """
     orch = get_orchestrator()
     
-    result = await orch.process(
-        user_id=request.user_id,
-        message=request.message,
-        session_id=request.session_id,
-        enable_tools=request.enable_tools,
-    )
+    with turns.turn(), start_trace() as trace:
+        await _admit(request.user_id)
+        async with _metered(request.user_id):
+            result = await orch.process(
+                user_id=request.user_id,
+                message=request.message,
+                session_id=request.session_id,
+                enable_tools=request.enable_tools,
+            )
+    response.headers["Server-Timing"] = trace.server_timing()
     
     return ChatResponse(
         message=result.message,
         tool_used=result.tool_used,
         success=result.success,
+        awaiting_confirmation=result.awaiting_confirmation,
+    )
+
+
+@router.post("/stream")
+async def chat_stream(request: ChatRequest) -> StreamingResponse:
+    """
+    대화 처리 (SSE 스트리밍)
+    
+    - event: delta → {"content": "..."} (토큰 조각)
+    - event: done  → {"message", "tool_used", "success"} (최종)
+    - 한도 초과 시 스트림 시작 전에 429 + Retry-After
+    """
+    orch = get_orchestrator()
+    # 수락 제어와 스트림이 같은 Trace (응답 시작 후에는 헤더를 못 바꾸므로 Server-Timing 없음)
+    with start_trace() as trace:
+        await _admit(request.user_id)
+    
+    async def event_source() -> AsyncIterator[str]:
+        with turns.turn(), start_trace(trace):
+            async with _metered(request.user_id):
+                async for event in orch.process_stream(
+                    user_id=request.user_id,
+                    message=request.message,
+                    session_id=request.session_id,
+                    enable_tools=request.enable_tools,
+                ):
+                    payload = event.to_dict()
+                    event_type = payload.pop("type")
+                    data = json.dumps(payload, ensure_ascii=False)
+                    yield f"event: {event_type}\ndata: {data}\n\n"
+    
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # 프록시 버퍼링 방지
+        },
     )
 
 
@@ -69,6 +161,8 @@ async def chat_websocket(websocket: WebSocket):
     
     - 스트리밍 응답 지원
     - 실시간 통신
+    - 한도 초과 메시지는 error 프레임 ({"type": "error", "status": 429, "retry_after": 초}) 후 다음 메시지 대기
+    - 워커 종료(drain) 중에는 처리 중인 턴을 끝까지 보낸 뒤 close 1012, 새 메시지는 error 프레임(503) 후 close 1012
     """
     await websocket.accept()
     
@@ -78,22 +172,42 @@ async def chat_websocket(websocket: WebSocket):
         while True:
             # 메시지 수신
             data = await websocket.receive_json()
+            user_id = data.get("user_id", "dev_user")
             
-            # 처리
-            result = await orch.process(
-                user_id=data.get("user_id", "dev_user"),
-                message=data["message"],
-                session_id=data.get("session_id"),
-                enable_tools=data.get("enable_tools", True),
-            )
+            if turns.draining:
+                turns.reject()
+                await websocket.send_json({"type": "error", "status": 503, "reason": "draining", "retry_after": 1})
+                await websocket.close(code=WS_CLOSE_SERVICE_RESTART)
+                return
             
-            # 응답 전송
-            await websocket.send_json({
-                "message": result.message,
-                "tool_used": result.tool_used,
-                "success": result.success,
-            })
+            # 메시지(턴)마다 Trace 하나 (수락 제어 + 처리)
+            with start_trace():
+                try:
+                    await _admit(user_id)
+                except AdmissionRejected as e:
+                    await websocket.send_json({
+                        "type": "error",
+                        "status": 429,
+                        "reason": e.reason,
+                        "retry_after": int(e.retry_after_header),
+                    })
+                    continue
+                
+                # 처리 + 응답 전송 (delta 프레임들 → 최종 done 프레임)
+                with turns.turn():
+                    async with _metered(user_id):
+                        async for event in orch.process_stream(
+                            user_id=user_id,
+                            message=data["message"],
+                            session_id=data.get("session_id"),
+                            enable_tools=data.get("enable_tools", True),
+                        ):
+                            await websocket.send_json(event.to_dict())
             
+            if turns.draining:
+                await websocket.close(code=WS_CLOSE_SERVICE_RESTART)
+                return
+                
     except WebSocketDisconnect:
         print("WebSocket 연결 종료")
 
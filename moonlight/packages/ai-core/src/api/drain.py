@@ -0,0 +1,87 @@
+"""
+Graceful Drain
+
+워커 종료 시 처리 중인 대화 턴을 끝까지 보내고 내려가기 위한 턴 추적
+- 각 턴(REST / SSE / WebSocket 메시지 하나)은 turns.turn() 안에서 처리
+- 종료 신호 → 서버가 새 연결을 막고 turns.drain() 으로 남은 턴을 기다린 뒤 연결을 닫음 (src/server.py)
+- drain 중 WebSocket 새 메시지는 error 프레임(503) + close 1012 (클라이언트는 다른 워커로 재연결)
+"""
+
+import asyncio
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator
+
+
+@dataclass
+class DrainStats:
+    """턴 / drain 통계 (프로세스 단위)"""
+    active_turns: int = 0
+    turns: int = 0
+    draining: bool = False
+    drained_turns: int = 0  # drain 시작 시 처리 중이던 턴 수
+    abandoned_turns: int = 0  # 제한 시간 안에 끝나지 않은 턴 수
+    rejected_while_draining: int = 0
+
+    def as_dict(self) -> dict:
+        return dict(self.__dict__)
+
+
+class TurnTracker:
+    """처리 중인 대화 턴 수 (asyncio 단일 스레드 전용)"""
+
+    def __init__(self):
+        self.stats = DrainStats()
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    @property
+    def active(self) -> int:
+        return self.stats.active_turns
+
+    @property
+    def draining(self) -> bool:
+        return self.stats.draining
+
+    @contextmanager
+    def turn(self) -> Iterator[None]:
+        self.stats.active_turns += 1
+        self.stats.turns += 1
+        self._idle.clear()
+        try:
+            yield
+        finally:
+            self.stats.active_turns -= 1
+            if self.stats.active_turns == 0:
+                self._idle.set()
+
+    def reject(self) -> None:
+        """drain 중 들어온 요청 (통계만)"""
+        self.stats.rejected_while_draining += 1
+
+    async def drain(self, timeout: float) -> bool:
+        """
+        새 턴을 거절하고 처리 중인 턴이 끝날 때까지 대기
+
+        Returns:
+            제한 시간 안에 모두 끝났는지
+        """
+        self.stats.draining = True
+        active = self.stats.active_turns
+        if not active:
+            return True
+
+        self.stats.drained_turns += active
+        print(f"🌙 [{os.getpid()}] 처리 중인 턴 {active}개 대기 (최대 {timeout:g}초)")
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+        except asyncio.TimeoutError:
+            self.stats.abandoned_turns += self.stats.active_turns
+            print(f"⚠️ [{os.getpid()}] drain 제한 시간 초과, 턴 {self.stats.active_turns}개 중단")
+            return False
+        return True
+
+
+# 프로세스(워커)당 하나
+turns = TurnTracker()
@@ -0,0 +1,99 @@
+"""
+Metrics Endpoints
+
+- /metrics: Prometheus 텍스트 형식 (span 지연시간 히스토그램 + 컴포넌트 통계)
+- /metrics/traces: 최근 요청의 span (OTLP JSON, 디버깅용)
+"""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from . import chat as chat_api
+from .drain import turns
+from ..admission import get_admission_controller
+from ..db.writer import get_writer
+from ..llm.http import pool_stats
+from ..llm.usage import total_usage
+from ..memory.embedding_service import get_embedding_service
+from ..metrics.prometheus import CONTENT_TYPE, Exposition, metric_name
+from ..metrics.tracing import tracer
+
+router = APIRouter()
+
+PREFIX = "moonlight"
+
+
+def _collect() -> Exposition:
+    """현재 프로세스의 메트릭 수집 (생성되지 않은 컴포넌트는 건너뜀)"""
+    out = Exposition()
+
+    span_name = metric_name(PREFIX, "span_duration_ms")
+    for name, histogram in sorted(tracer.histograms.items()):
+        out.histogram(span_name, histogram, {"span": name})
+
+    out.stats(metric_name(PREFIX, "http_pool"), pool_stats.as_dict())
+    out.stats(metric_name(PREFIX, "llm_tokens"), total_usage.as_dict())
+    out.stats(metric_name(PREFIX, "turns"), turns.stats.as_dict())
+
+    orch = chat_api.orchestrator
+    if orch is not None:
+        llm = orch.llm
+        if llm.cache is not None:
+            out.stats(metric_name(PREFIX, "llm_cache"), llm.cache.stats.as_dict())
+        if llm.inflight is not None:
+            out.stats(metric_name(PREFIX, "llm_inflight"), llm.inflight.stats.as_dict())
+        out.stats(metric_name(PREFIX, "llm_resilience"), llm.resilience.stats.as_dict())
+        out.stats(metric_name(PREFIX, "speculation"), orch.speculation_stats.as_dict())
+        if orch.intent_parser.cache is not None:
+            out.stats(metric_name(PREFIX, "intent_cache"), orch.intent_parser.cache.stats.as_dict())
+        if orch.retriever is not None:
+            out.stats(metric_name(PREFIX, "retrieval"), orch.retriever.stats.as_dict())
+        out.stats(metric_name(PREFIX, "context"), orch.context_assembler.stats.as_dict())
+        out.histogram(metric_name(PREFIX, orch.context_assembler.assembly_time.name), orch.context_assembler.assembly_time)
+        out.stats(metric_name(PREFIX, "session"), orch.sessions.stats.as_dict())
+        out.stats(metric_name(PREFIX, "pending"), orch.pending.stats.as_dict())
+        if orch.slot_filler is not None:
+            out.stats(metric_name(PREFIX, "slot_filling"), orch.slot_filler.stats.as_dict())
+        out.stats(metric_name(PREFIX, "constitution"), orch.constitution.stats.as_dict())
+        out.stats(metric_name(PREFIX, "tool_registry"), orch.registry.stats.as_dict())
+
+        executor = orch.executor
+        out.stats(metric_name(PREFIX, "tool_executor"), executor.stats.as_dict())
+        out.histogram(metric_name(PREFIX, executor.latency.name), executor.latency)
+        if executor.cache is not None:
+            out.stats(metric_name(PREFIX, "tool_cache"), executor.cache.stats.as_dict())
+
+    admission = get_admission_controller()
+    if admission is not None:
+        out.stats(metric_name(PREFIX, "admission"), admission.stats.as_dict())
+
+    writer = get_writer()
+    if writer is not None:
+        out.stats(metric_name(PREFIX, "persistence"), writer.stats.as_dict())
+        out.histogram(metric_name(PREFIX, writer.flush_latency.name), writer.flush_latency)
+
+    embedding = get_embedding_service()
+    out.histogram(metric_name(PREFIX, embedding.batch_sizes.name), embedding.batch_sizes)
+    out.histogram(metric_name(PREFIX, embedding.queue_latency.name), embedding.queue_latency)
+    return out
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """Prometheus 스크레이프 엔드포인트"""
+    return PlainTextResponse(_collect().render(), media_type=CONTENT_TYPE)
+
+
+@router.get("/metrics/traces")
+async def recent_traces(limit: int = 20) -> dict:
+    """최근 요청의 span (OTLP JSON resourceSpans 형식)"""
+    traces = list(tracer.recent)[-limit:] if limit > 0 else []
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": "moonlight-ai-core"}}]},
+            "scopeSpans": [{
+                "scope": {"name": "moonlight.tracing"},
+                "spans": [span for trace in traces for span in trace.as_otel()],
+            }],
+        }],
+    }
@@ -2,9 +2,13 @@
 Tools API Endpoints
 """
 
+import json
 from typing import Optional
-from fastapi import APIRouter
-from pydantic import BaseModel
+from fastapi import APIRouter, Header, HTTPException
+from pydantic import BaseModel, ValidationError
+
+from ..tools.executor import get_tool_executor
+from ..tools.registry import ToolSpec, get_tool_registry
 
 router = APIRouter()
 
@@ -15,6 +19,17 @@ class ToolInfo(BaseModel):
     description: str
     category: str
     enabled: bool
+    high_risk: bool = False
+    
+    @classmethod
+    def from_spec(cls, spec: ToolSpec) -> "ToolInfo":
+        return cls(
+            name=spec.name,
+            description=spec.description,
+            category=spec.category,
+            enabled=spec.enabled,
+            high_risk=spec.high_risk,
+        )
 
 
 class ToolExecuteRequest(BaseModel):
@@ -22,6 +37,7 @@ class ToolExecuteRequest(BaseModel):
     tool_name: str
     parameters: dict
     user_id: str = "dev_user"
+    idempotency_key: Optional[str] = None  # 같은 사용자가 같은 키 + 파라미터로 재시도하면 다시 실행하지 않음 (파라미터가 다르면 오류)
 
 
 class ToolExecuteResponse(BaseModel):
@@ -30,6 +46,7 @@ class ToolExecuteResponse(BaseModel):
     result: Optional[str] = None
     error: Optional[str] = None
     execution_time_ms: int = 0
+    cached: bool = False
 
 
 @router.get("")
@@ -37,53 +54,42 @@ async def list_tools() -> list[ToolInfo]:
     """
     사용 가능한 Tool 목록
     """
-    # TODO: Tool Registry에서 동적 로드
-    return [
-        ToolInfo(
-            name="google_search",
-            description="Google 검색을 수행합니다",
-            category="search",
-            enabled=True,
-        ),
-        ToolInfo(
-            name="send_email",
-            description="이메일을 전송합니다",
-            category="communication",
-            enabled=True,
-        ),
-        ToolInfo(
-            name="get_calendar",
-            description="캘린더 일정을 조회합니다",
-            category="productivity",
-            enabled=True,
-        ),
-        ToolInfo(
-            name="github_issues",
-            description="GitHub 이슈를 관리합니다",
-            category="development",
-            enabled=True,
-        ),
-    ]
+    return [ToolInfo.from_spec(spec) for spec in get_tool_registry()]
 
 
 @router.post("/execute", response_model=ToolExecuteResponse)
-async def execute_tool(request: ToolExecuteRequest) -> ToolExecuteResponse:
-    """
-    Tool 직접 실행
+async def execute_tool(
+    request: ToolExecuteRequest,
+    idempotency_key: Optional[str] = Header(default=None),
+) -> ToolExecuteResponse:
     """
-    import time
+    Tool 직접 실행 (파라미터 검증 후 실행 엔진으로)
     
-    start = time.time()
+    멱등 키는 요청 본문 또는 Idempotency-Key 헤더로 전달합니다.
+    """
+    _get_spec(request.tool_name)
     
-    # TODO: 실제 Tool 실행 로직
-    # 지금은 Mock 응답
+    model = get_tool_registry().param_model(request.tool_name)
+    parameters = request.parameters
+    if model is not None:
+        try:
+            parameters = model(**parameters).model_dump()
+        except ValidationError as e:
+            return ToolExecuteResponse(success=False, error=str(e))
     
-    execution_time = int((time.time() - start) * 1000)
+    result = await get_tool_executor().execute(
+        request.tool_name,
+        parameters,
+        scope=request.user_id,
+        idempotency_key=request.idempotency_key or idempotency_key,
+    )
     
     return ToolExecuteResponse(
-        success=True,
-        result=f"Tool '{request.tool_name}' 실행 완료 (Mock)",
-        execution_time_ms=execution_time,
+        success=result.success,
+        result=_to_text(result.output) if result.success else None,
+        error=result.error,
+        execution_time_ms=result.execution_time_ms,
+        cached=result.cached,
     )
 
 
@@ -92,12 +98,26 @@ async def get_tool_info(tool_name: str) -> ToolInfo:
     """
     특정 Tool 정보 조회
     """
-    # TODO: Tool Registry에서 조회
-    return ToolInfo(
-        name=tool_name,
-        description=f"{tool_name} Tool입니다",
-        category="general",
-        enabled=True,
-    )
+    return ToolInfo.from_spec(_get_spec(tool_name))
+
+
+@router.get("/{tool_name}/schema")
+async def get_tool_schema(tool_name: str) -> dict:
+    """
+    Tool 파라미터 JSON 스키마 (캐시됨)
+    """
+    _get_spec(tool_name)
+    return get_tool_registry().json_schema(tool_name)
+
+
+def _get_spec(tool_name: str) -> ToolSpec:
+    spec = get_tool_registry().get(tool_name)
+    if spec is None:
+        raise HTTPException(status_code=404, detail=f"Tool을 찾을 수 없습니다: {tool_name}")
+    return spec
 
 
+def _to_text(output) -> str:
+    if isinstance(output, str):
+        return output
+    return json.dumps(output, ensure_ascii=False, default=str)
@@ -2,9 +2,15 @@
 Configuration settings for Moonlight AI Core
 """
 
+import os
 from functools import lru_cache
+from typing import Optional
+from pydantic import model_validator
 from pydantic_settings import BaseSettings
 
+# shared_backend 가 기본값을 정하는 워커 간 공유 상태 백엔드 (명시한 값이 우선)
+SHARED_STATE_BACKENDS = ("session_backend", "pending_backend", "llm_cache_backend", "admission_backend")
+
 
 class Settings(BaseSettings):
     """애플리케이션 설정"""
@@ -17,6 +23,12 @@ class Settings(BaseSettings):
     # Server
     host: str = "0.0.0.0"
     port: int = 8000
+    workers: int = 1  # python -m src.server 워커 프로세스 수 (0이면 CPU 수)
+    shutdown_drain_timeout: float = 30.0  # 종료 시 처리 중인 대화 턴을 기다리는 최대 시간 (초)
+
+    # 워커 간 공유 상태 (세션 / 확인 대기 / LLM 캐시 / 수락 제어 한도)
+    # memory: 프로세스 단위 (단일 워커), redis: 모든 워커가 공유. 개별 *_backend 를 지정하면 그 값이 우선
+    shared_backend: str = "memory"  # memory | redis
 
     # Database
     postgres_host: str = "localhost"
@@ -39,6 +51,15 @@ class Settings(BaseSettings):
             f"@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
         )
 
+    # Persistence (write-behind 대화/Tool 로그 저장)
+    persistence_enabled: bool = False
+    persistence_backend: str = "postgres"  # postgres | sqlite | memory
+    persistence_sqlite_path: str = "moonlight.db"
+    persistence_queue_size: int = 10_000
+    persistence_batch_size: int = 100
+    persistence_flush_interval: float = 1.0  # 초
+    persistence_embed: bool = True  # 저장 시 임베딩 계산
+
     # Redis
     redis_host: str = "localhost"
     redis_port: int = 6379
@@ -48,20 +69,157 @@ class Settings(BaseSettings):
     def redis_url(self) -> str:
         return f"redis://{self.redis_host}:{self.redis_port}/{self.redis_db}"
 
+    # Session Memory (단기 기억: 프로세스 핫 캐시 + Redis)
+    session_backend: str = "memory"  # memory | redis
+    session_hot_capacity: int = 1024  # 프로세스당 핫 세션 수
+    session_max_turns: int = 50  # 세션당 보관 턴 수 (링 버퍼)
+    session_ttl_seconds: int = 86400
+
+    # Pending confirmations (고위험 Tool 확인 대기, 다음 턴에 재개)
+    pending_backend: str = "memory"  # memory | redis (멀티 워커는 redis)
+    pending_ttl_seconds: float = 300.0  # 답변이 없으면 취소
+    pending_sweep_interval: float = 1.0  # 타이머 휠 한 칸 (초)
+
+    # Slot filling (명확화 질문 답변은 누락 필드만 추출해 이어서 실행, 대기 상태는 pending 저장소 사용)
+    slot_filling_enabled: bool = True
+    slot_filling_llm_fallback: bool = True  # 정규식 / 자유 텍스트로 못 채운 필드만 LLM으로 추출
+
+    # Context Assembly (프롬프트 토큰 예산)
+    context_max_prompt_tokens: int = 6000  # 모델 컨텍스트 길이와 별개의 비용/지연 상한
+    context_max_sessions: int = 1024  # 세그먼트 캐시를 유지하는 세션 수
+
     # LLM - OpenRouter
     openrouter_api_key: str = ""
     openrouter_base_url: str = "https://openrouter.ai/api/v1"
     default_model: str = "google/gemini-2.0-flash-exp:free"  # 무료 모델
 
+    # LLM HTTP Client (커넥션 풀)
+    llm_http2: bool = True
+    llm_max_connections: int = 100
+    llm_max_keepalive_connections: int = 20
+    llm_keepalive_expiry: float = 30.0  # 초
+    llm_connect_timeout: float = 5.0
+    llm_read_timeout: float = 60.0  # 스트리밍 토큰 간격 포함
+    llm_write_timeout: float = 10.0
+    llm_pool_timeout: float = 5.0  # 풀에서 연결을 기다리는 최대 시간
+
+    # LLM Resilience
+    llm_fallback_models: list[str] = []  # 순서대로 시도, 예: '["meta-llama/llama-3.3-70b-instruct:free"]'
+    llm_max_retries: int = 2  # 모델당 재시도 횟수
+    llm_retry_base_delay: float = 0.5
+    llm_retry_max_delay: float = 8.0  # Retry-After가 이보다 길면 다음 모델로
+    llm_circuit_failure_threshold: int = 5
+    llm_circuit_reset_seconds: float = 30.0
+    llm_hedge_enabled: bool = False  # p95 초과 시 폴백 모델에 헤지 요청
+    llm_hedge_min_delay: float = 1.0
+
+    # LLM Response Cache
+    llm_cache_backend: str = "memory"  # memory | redis | none
+    llm_cache_ttl_seconds: int = 3600
+    llm_cache_max_entries: int = 1024
+    llm_cache_max_value_bytes: int = 64_000
+    llm_cache_max_temperature: float = 0.3  # 이 값 이하의 결정적 호출만 캐시
+    llm_singleflight_enabled: bool = True  # 동시 동일 요청 병합
+
+    # Orchestrator
+    # Tool 선택 방식
+    # - native: 한 번의 LLM 호출로 직접 답변 또는 Tool 호출 (OpenAI 호환 tools)
+    # - json: native 미지원 모델용, 같은 한 번의 호출에서 JSON Tool 호출을 텍스트로 출력
+    # - legacy: Intent Parser(프롬프트 JSON) → 일반 응답 생성 (최대 2회 호출)
+    tool_calling_mode: str = "native"
+    # (native / json) 직접 답변이 같은 호출에서 나오므로 일반 대화 temperature 유지, 응답 캐시에 넣지 않음
+    tool_calling_temperature: float = 0.7
+    # (legacy 전용) 의도 파악과 일반 응답 생성을 동시에 시작 (Tool 필요 시 응답 취소)
+    speculative_generation: bool = False
+
+    # Admission Control (/api/chat, /api/chat/ws: 토큰 버킷 + 우선순위 대기열, 초과 시 429 + Retry-After)
+    admission_enabled: bool = True
+    admission_backend: str = "memory"  # memory | redis (멀티 워커가 한도를 공유하려면 redis)
+    admission_user_rps: float = 2.0  # 사용자별 요청 보충 속도 (초당, 0이면 제한 없음)
+    admission_user_burst: int = 20
+    admission_global_rps: float = 100.0  # 프로세스(redis면 전체) 요청 보충 속도, 초과분은 대기열
+    admission_global_burst: int = 200
+    admission_user_tokens_per_minute: int = 60_000  # 사용자별 LLM 토큰 예산 (사후 차감, 0이면 제한 없음)
+    admission_global_tokens_per_minute: int = 0  # 업스트림 쿼터에 맞춘 전체 토큰 예산
+    admission_queue_size: int = 100  # 전역 한도 초과 시 대기 가능한 요청 수
+    admission_queue_timeout: float = 5.0  # 대기열 최대 대기 (초, 넘으면 429)
+
+    # Tracing (단계별 span → /api/metrics 히스토그램, /api/chat Server-Timing)
+    tracing_enabled: bool = True
+    tracing_keep_traces: int = 100  # /api/metrics/traces 로 보관할 최근 요청 수
+
     # gRPC - Voice Service
     voice_service_host: str = "localhost"
     voice_service_port: int = 50051
 
     # Embedding
     embedding_model: str = "all-MiniLM-L6-v2"
+    embedding_batch_size: int = 32  # 마이크로 배치 최대 크기
+    embedding_batch_wait_ms: float = 10.0  # 배치를 모으는 최대 대기 시간
+    embedding_workers: int = 1  # 동시에 인코딩하는 배치 수 (풀 크기)
+    embedding_use_processes: bool = False  # True: 프로세스 풀 (GIL 회피)
+
+    # Retrieval (중기 기억 벡터 검색)
+    retrieval_enabled: bool = False  # 응답 생성 시 관련 과거 대화 주입
+    retrieval_backend: str = "auto"  # auto | local | pgvector
+    retrieval_top_k: int = 5
+    retrieval_ivfflat_probes: int = 10  # IVFFlat 탐색 리스트 수 (lists=100 중)
+    retrieval_local_max_corpus: int = 5000  # 이하면 로컬 인덱스 사용
+    retrieval_local_dtype: str = "int8"  # float32 | float16 | int8 (benchmarks/bench_retrieval.py)
+    retrieval_local_max_users: int = 256  # 메모리에 유지하는 사용자 인덱스 수
+    retrieval_index_dir: str = ".moonlight/index"
+    retrieval_sync_ttl_seconds: float = 60.0  # 로컬 인덱스를 pgvector 와 다시 맞추는 주기 (다른 워커가 저장한 대화)
+
+    # Intent Cache (의미 기반, 인프로세스, legacy 전용 - native / json 은 Intent Parser LLM 호출이 없음)
+    intent_cache_enabled: bool = True
+    intent_cache_threshold: float = 0.92  # 코사인 유사도
+    intent_cache_max_entries: int = 2048
+    intent_cache_ttl_seconds: float = 3600.0
+
+    # Tool Registry
+    tools_entry_point_group: str = "moonlight.tools"  # 빈 문자열이면 entry point 탐색 안 함
+    tools_manifest_dir: Optional[str] = None  # *.yaml Tool 매니페스트 디렉터리
+    tools_disabled: list[str] = []
+    tools_discovery_budget_ms: float = 200.0  # 초과 시 경고
+    tools_precompile_validators: bool = True  # 시작 시 파라미터 검증기 컴파일 (첫 요청 지연 제거)
+
+    # Tool Executor
+    tools_default_timeout: float = 10.0  # 초 (ToolSpec.timeout 없을 때)
+    tools_default_concurrency: int = 8  # Tool별 동시 실행 수 (ToolSpec.max_concurrency 없을 때)
+    tools_thread_workers: int = 8  # 동기(blocking I/O) 핸들러 스레드 풀
+    tools_process_workers: int = 0  # CPU 작업 프로세스 풀 (0이면 CPU 수, 첫 사용 시 생성)
+
+    # Tool Result Cache (ToolSpec.cache_ttl 이 있는 읽기 전용 Tool만)
+    tools_cache_enabled: bool = True
+    tools_cache_max_entries: int = 2048
+    tools_cache_max_bytes: int = 8_000_000
+    tools_idempotency_ttl_seconds: float = 600.0  # 같은 멱등 키 재시도를 막는 시간
 
     # Constitution
-    constitution_path: str = "../../docs/constitution.yaml"
+    constitution_path: str = "../../docs/constitution.yaml"  # 상대 경로는 ai-core 기준
+    constitution_reload_interval: float = 2.0  # 파일 변경 확인 주기 (초, 0이면 리로드 안 함)
+
+    @model_validator(mode="after")
+    def _apply_shared_backend(self) -> "Settings":
+        if self.shared_backend != "memory":
+            for name in SHARED_STATE_BACKENDS:
+                if name not in self.model_fields_set:
+                    setattr(self, name, self.shared_backend)
+        return self
+
+    @property
+    def worker_count(self) -> int:
+        return self.workers if self.workers > 0 else (os.cpu_count() or 1)
+
+    @property
+    def process_local_state(self) -> list[str]:
+        """워커마다 따로 갖는 상태 (멀티 워커 시작 경고용)"""
+        local = [name for name in SHARED_STATE_BACKENDS if getattr(self, name) == "memory"]
+        if self.intent_cache_enabled and self.tool_calling_mode == "legacy":
+            local.append("intent_cache")
+        if self.tools_cache_enabled:
+            local.append("tools_cache")
+        return local
 
     class Config:
         env_file = ".env"
@@ -7,8 +7,20 @@ Constitutional AI
 - 존재로서 지지한다
 """
 
-# TODO: Constitution YAML 로더
-# TODO: 원칙 검증 데코레이터
-# TODO: 응답 스타일 적용
+from .loader import (
+    CompiledConstitution,
+    ConstitutionLoader,
+    Principle,
+    Violation,
+    get_constitution,
+)
 
+__all__ = [
+    "CompiledConstitution",
+    "ConstitutionLoader",
+    "Principle",
+    "Violation",
+    "get_constitution",
+]
 
+# TODO: 원칙 검증 데코레이터
@@ -0,0 +1,396 @@
+"""
+Constitution Loader
+
+docs/constitution.yaml 을 한 번 파싱해 불변 구조로 컴파일
+- 시스템 프롬프트 / 원칙별 프롬프트 조각 미리 렌더링
+- triggers (예: principle_4 "지쳤어") → 컴파일된 문구 매처
+- negative 예시 문구 → 응답 사후 검사 매처 (응답 한 번 순회)
+  문구 수가 적어 순수 Python 오토마톤보다 C로 도는 정규식 alternation이 빠름
+  (benchmarks/bench_constitution.py)
+- 파일 변경 시 백그라운드 스레드에서 다시 컴파일 후 참조만 교체 (요청 비차단)
+"""
+
+import asyncio
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import MappingProxyType
+from typing import Iterable, Mapping, Optional
+
+import yaml
+
+from ..config import Settings, get_settings
+
+# ai-core 패키지 루트 (상대 경로 기준)
+PACKAGE_ROOT = Path(__file__).resolve().parents[2]
+
+TONE_LABELS = {"warm_but_not_overwhelming": "따뜻하지만 압도적이지 않게"}
+LENGTH_LABELS = {"concise_but_meaningful": "간결하되 의미있게"}
+
+# 발화로 볼 수 있는 negative 예시의 끝맺음 ("힘내세요", "그건 잘못됐어요" 등)
+# "과도한 반응" 같은 행동 묘사나 "(과도하게)" 처럼 조건이 붙은 예시는 문구 검사에서 제외
+UTTERANCE_ENDINGS = ("요", "다", "죠", "까", "어", "지", "네")
+TRAILING_PUNCTUATION = " .?!~…"
+
+# 파일이 없을 때 쓰는 기본 시스템 프롬프트
+FALLBACK_SYSTEM_PROMPT = """당신은 '달빛 비서'입니다.
+
+핵심 원칙:
+1. 판단하지 않는다 - 있는 그대로 수용
+2. 기대하지 않는다 - 변화를 강요하지 않음
+3. 존재로서 지지한다 - 함께 있어줌
+
+응답 스타일:
+- 호칭: "주인님"
+- 톤: 따뜻하지만 압도적이지 않게
+- 길이: 간결하되 의미있게
+
+"압도적이지 않지만 달빛처럼"
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class Principle:
+    """원칙 하나"""
+    id: str
+    name: str
+    description: str
+    weight: float
+    positive: tuple[str, ...] = ()
+    negative: tuple[str, ...] = ()
+    triggers: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class Violation:
+    """응답에서 발견된 negative 문구"""
+    principle_id: str
+    phrase: str
+    start: int
+    end: int
+    weight: float
+
+
+@dataclass(frozen=True, slots=True)
+class PhraseMatch:
+    """문구 매칭 결과"""
+    principle_id: str
+    phrase: str
+    start: int
+    end: int
+
+
+class PhraseMatcher:
+    """
+    문구 → 원칙 매처 (정규식 alternation 하나로 컴파일)
+
+    긴 문구를 먼저 두어 같은 위치에서는 가장 구체적인 문구가 매칭됩니다.
+    """
+
+    __slots__ = ("_pattern", "_owners")
+
+    def __init__(self, phrases: dict[str, Iterable[str]]):
+        """
+        Args:
+            phrases: {principle_id: [phrase, ...]}
+        """
+        owners: dict[str, list[str]] = {}
+        for principle_id, items in phrases.items():
+            for phrase in items:
+                if phrase:
+                    owners.setdefault(phrase.lower(), []).append(principle_id)
+
+        self._owners = {phrase: tuple(ids) for phrase, ids in owners.items()}
+        alternatives = sorted(self._owners, key=len, reverse=True)
+        self._pattern = re.compile("|".join(map(re.escape, alternatives)), re.IGNORECASE) if alternatives else None
+
+    def __len__(self) -> int:
+        return len(self._owners)
+
+    def find_all(self, text: str) -> list[PhraseMatch]:
+        if self._pattern is None:
+            return []
+        return [
+            PhraseMatch(principle_id, m.group().lower(), m.start(), m.end())
+            for m in self._pattern.finditer(text)
+            for principle_id in self._owners[m.group().lower()]
+        ]
+
+
+@dataclass(frozen=True)
+class CompiledConstitution:
+    """
+    컴파일된 Constitution (불변, 요청 간 공유)
+
+    리로드 시에는 새 인스턴스를 만들어 참조만 교체합니다.
+    """
+    version: str
+    principles: tuple[Principle, ...]
+    system_prompt: str
+    fragments: Mapping[str, str]  # principle id → 프롬프트 조각
+    source: Optional[Path] = None
+    mtime_ns: int = 0
+    _by_id: Mapping[str, Principle] = field(default_factory=dict, repr=False)
+    _triggers: Optional[PhraseMatcher] = field(default=None, repr=False)
+    _negatives: Optional[PhraseMatcher] = field(default=None, repr=False)
+
+    def triggered(self, message: str) -> list[Principle]:
+        """메시지가 건드린 원칙 (triggers 매칭, 가중치 순)"""
+        if self._triggers is None:
+            return []
+        ids = {match.principle_id for match in self._triggers.find_all(message)}
+        return sorted((self._by_id[i] for i in ids), key=lambda p: -p.weight)
+
+    def focus_for(self, message: Optional[str] = None) -> Optional[str]:
+        """
+        메시지가 트리거한 원칙 강조 (없으면 None)
+
+        system_prompt 에 덧붙이지 않고 현재 메시지 바로 앞의 별도 system 메시지로 보냅니다.
+        system_prompt 는 바이트 단위로 고정되어 upstream 프롬프트 캐시 접두사가 유지됩니다.
+        """
+        if not message:
+            return None
+        principles = self.triggered(message)
+        if not principles:
+            return None
+        focus = "\n".join(self.fragments[p.id] for p in principles)
+        return f"지금 특히 지켜야 할 원칙:\n{focus}"
+
+    def check(self, response: str) -> list[Violation]:
+        """응답 사후 검사 (negative 문구, 단일 순회)"""
+        if self._negatives is None:
+            return []
+        return [
+            Violation(
+                principle_id=match.principle_id,
+                phrase=match.phrase,
+                start=match.start,
+                end=match.end,
+                weight=self._by_id[match.principle_id].weight,
+            )
+            for match in self._negatives.find_all(response)
+        ]
+
+
+def _phrase(text: str) -> str:
+    return text.strip().rstrip(TRAILING_PUNCTUATION)
+
+
+def _is_utterance(example: str) -> bool:
+    phrase = _phrase(example)
+    return bool(phrase) and "(" not in phrase and phrase.endswith(UTTERANCE_ENDINGS)
+
+
+def _render_fragment(index: int, principle: Principle) -> str:
+    lines = [f"{index}. {principle.name} - {principle.description}"]
+    if principle.positive:
+        lines.append(f"   예: {' / '.join(repr(p) for p in principle.positive[:2])}")
+    avoid = [n for n in principle.negative if _is_utterance(n)]
+    if avoid:
+        lines.append(f"   피할 말: {' / '.join(repr(n) for n in avoid[:2])}")
+    return "\n".join(lines)
+
+
+def _render_system_prompt(data: dict, fragments: list[str]) -> str:
+    identity = data.get("identity", {})
+    style = data.get("response_style", {})
+
+    tone = style.get("tone", "")
+    length = style.get("length", "")
+    lines = [
+        f"당신은 '달빛 {identity.get('name', '비서')}'입니다 - {identity.get('role', '')}.".replace(" - .", "."),
+        "",
+        "핵심 원칙:",
+        *fragments,
+        "",
+        "응답 스타일:",
+        f"- 호칭: \"{style.get('prefix', '주인님')}\"",
+        f"- 톤: {TONE_LABELS.get(tone, tone)}",
+        f"- 길이: {LENGTH_LABELS.get(length, length)}",
+    ]
+    if identity.get("philosophy"):
+        lines += ["", f"\"{identity['philosophy']}\""]
+    return "\n".join(lines) + "\n"
+
+
+def compile_constitution(data: dict, source: Optional[Path] = None, mtime_ns: int = 0) -> CompiledConstitution:
+    """파싱된 YAML → 컴파일된 Constitution"""
+    principles = tuple(
+        Principle(
+            id=item["id"],
+            name=item.get("name", item["id"]),
+            description=item.get("description", ""),
+            weight=float(item.get("weight", 1.0)),
+            positive=tuple(item.get("examples", {}).get("positive", []) or ()),
+            negative=tuple(item.get("examples", {}).get("negative", []) or ()),
+            triggers=tuple(item.get("triggers", []) or ()),
+        )
+        for item in data.get("principles", [])
+    )
+
+    fragments = {p.id: _render_fragment(i, p) for i, p in enumerate(principles, 1)}
+    triggers = {p.id: [_phrase(t) for t in p.triggers] for p in principles if p.triggers}
+    negatives = {
+        p.id: [_phrase(n) for n in p.negative if _is_utterance(n)]
+        for p in principles
+    }
+    negatives = {k: v for k, v in negatives.items() if v}
+
+    return CompiledConstitution(
+        version=str(data.get("version", "")),
+        principles=principles,
+        system_prompt=_render_system_prompt(data, list(fragments.values())),
+        fragments=MappingProxyType(fragments),
+        source=source,
+        mtime_ns=mtime_ns,
+        _by_id=MappingProxyType({p.id: p for p in principles}),
+        _triggers=PhraseMatcher(triggers) if triggers else None,
+        _negatives=PhraseMatcher(negatives) if negatives else None,
+    )
+
+
+def load_constitution(path: Path) -> CompiledConstitution:
+    """YAML 파일 로딩 + 컴파일 (블로킹, 스레드에서 실행)"""
+    mtime_ns = path.stat().st_mtime_ns
+    with open(path, encoding="utf-8") as f:
+        data = yaml.safe_load(f) or {}
+    return compile_constitution(data, source=path, mtime_ns=mtime_ns)
+
+
+FALLBACK_CONSTITUTION = CompiledConstitution(
+    version="fallback",
+    principles=(),
+    system_prompt=FALLBACK_SYSTEM_PROMPT,
+    fragments=MappingProxyType({}),
+)
+
+
+@dataclass
+class ConstitutionStats:
+    """Constitution 통계"""
+    reloads: int = 0
+    reload_errors: int = 0
+    checks: int = 0
+    violations: int = 0
+    responses_with_violations: int = 0
+    violations_by_principle: dict[str, int] = field(default_factory=dict)
+
+    def as_dict(self) -> dict:
+        return dict(self.__dict__)
+
+
+class ConstitutionLoader:
+    """
+    Constitution 홀더 (핫 리로드)
+
+    current 는 원자적 참조 읽기라 요청 경로에서 락이 필요 없습니다.
+    """
+
+    def __init__(self, path: str, reload_interval: float = 2.0):
+        """
+        Args:
+            path: constitution.yaml 경로 (상대 경로는 ai-core 기준)
+            reload_interval: 변경 확인 주기 (초, 0이면 리로드 안 함)
+        """
+        resolved = Path(path)
+        if not resolved.is_absolute():
+            resolved = (PACKAGE_ROOT / resolved).resolve()
+        self.path = resolved
+        self.reload_interval = reload_interval
+        self.stats = ConstitutionStats()
+
+        self._current = self._load_initial()
+        self._seen_mtime_ns = self._current.mtime_ns  # 실패한 버전도 다시 시도하지 않도록
+        self._watcher: Optional[asyncio.Task] = None
+
+    @property
+    def current(self) -> CompiledConstitution:
+        return self._current
+
+    def check(self, response: str) -> list[Violation]:
+        """응답 검사 + 통계"""
+        violations = self._current.check(response)
+        self.stats.checks += 1
+        if violations:
+            self.stats.violations += len(violations)
+            self.stats.responses_with_violations += 1
+            by_principle = self.stats.violations_by_principle
+            for violation in violations:
+                by_principle[violation.principle_id] = by_principle.get(violation.principle_id, 0) + 1
+        return violations
+
+    async def start(self) -> None:
+        if self._watcher is None and self.reload_interval > 0:
+            self._watcher = asyncio.create_task(self._watch())
+
+    async def stop(self) -> None:
+        if self._watcher is not None:
+            self._watcher.cancel()
+            try:
+                await self._watcher
+            except asyncio.CancelledError:
+                pass
+            self._watcher = None
+
+    async def reload(self) -> bool:
+        """다시 컴파일 후 교체 (실패 시 기존 유지)"""
+        try:
+            compiled = await asyncio.to_thread(load_constitution, self.path)
+        except Exception as e:
+            self.stats.reload_errors += 1
+            print(f"Constitution 리로드 오류: {e}")
+            return False
+
+        self._current = compiled
+        self.stats.reloads += 1
+        print(f"🌙 Constitution 리로드 (v{compiled.version})")
+        return True
+
+    async def _watch(self) -> None:
+        """mtime 폴링"""
+        while True:
+            await asyncio.sleep(self.reload_interval)
+            try:
+                mtime_ns = os.stat(self.path).st_mtime_ns
+            except OSError:
+                continue
+            if mtime_ns != self._seen_mtime_ns:
+                self._seen_mtime_ns = mtime_ns
+                await self.reload()
+
+    def _load_initial(self) -> CompiledConstitution:
+        try:
+            return load_constitution(self.path)
+        except FileNotFoundError:
+            print(f"Constitution 파일 없음, 기본 프롬프트 사용: {self.path}")
+        except (OSError, yaml.YAMLError, KeyError, TypeError, ValueError) as e:
+            print(f"Constitution 로딩 오류, 기본 프롬프트 사용: {e}")
+        return FALLBACK_CONSTITUTION
+
+
+_loader: Optional[ConstitutionLoader] = None
+
+
+def get_constitution(settings: Optional[Settings] = None) -> ConstitutionLoader:
+    """앱 단위 Constitution (첫 호출 시 로딩)"""
+    global _loader
+    if _loader is None:
+        settings = settings or get_settings()
+        _loader = ConstitutionLoader(
+            settings.constitution_path,
+            reload_interval=settings.constitution_reload_interval,
+        )
+    return _loader
+
+
+async def init_constitution(settings: Optional[Settings] = None) -> ConstitutionLoader:
+    """Constitution 로딩 + 변경 감시 시작 (lifespan 시작 시)"""
+    loader = get_constitution(settings)
+    await loader.start()
+    return loader
+
+
+async def close_constitution() -> None:
+    if _loader is not None:
+        await _loader.stop()
@@ -1,3 +1,22 @@
 from .base import Base
+from .sinks import (
+    ConversationRecord,
+    InMemorySink,
+    PersistenceSink,
+    PostgresSink,
+    SQLiteSink,
+    ToolLogRecord,
+)
+from .writer import WriteBehindWriter, get_writer
 
-__all__ = ["Base"]
+__all__ = [
+    "Base",
+    "ConversationRecord",
+    "ToolLogRecord",
+    "PersistenceSink",
+    "InMemorySink",
+    "SQLiteSink",
+    "PostgresSink",
+    "WriteBehindWriter",
+    "get_writer",
+]
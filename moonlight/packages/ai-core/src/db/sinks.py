@@ -0,0 +1,266 @@
+"""
+Persistence Sinks
+
+Write-behind 파이프라인의 저장소 구현
+- PostgresSink: asyncpg COPY (conversations, tool_logs)
+- SQLiteSink: 로컬/테스트용 (표준 라이브러리 sqlite3)
+- InMemorySink: 테스트용
+"""
+
+import asyncio
+import json
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+
+
+@dataclass
+class ConversationRecord:
+    """conversations 테이블 한 행 (대화 한 턴)"""
+    user_id: str
+    session_id: Optional[str]
+    user_message: str
+    assistant_message: str
+    tools_used: list[str] = field(default_factory=list)
+    importance_score: Optional[float] = None
+    user_embedding: Optional[np.ndarray] = None  # 쓰기 직전에 배치로 계산
+    assistant_embedding: Optional[np.ndarray] = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+
+
+@dataclass
+class ToolLogRecord:
+    """tool_logs 테이블 한 행"""
+    user_id: str
+    tool_name: str
+    parameters: dict
+    result: Optional[dict]
+    success: bool
+    execution_time_ms: int
+    created_at: datetime = field(default_factory=datetime.utcnow)
+
+
+class PersistenceSink:
+    """저장소 인터페이스 (배치 단위 쓰기)"""
+
+    async def open(self) -> None:
+        """연결 준비"""
+
+    async def write(
+        self,
+        conversations: list[ConversationRecord],
+        tool_logs: list[ToolLogRecord],
+    ) -> None:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """연결 정리"""
+
+
+class InMemorySink(PersistenceSink):
+    """메모리 저장 (테스트용)"""
+
+    def __init__(self):
+        self.conversations: list[ConversationRecord] = []
+        self.tool_logs: list[ToolLogRecord] = []
+        self.batches = 0
+
+    async def write(self, conversations, tool_logs) -> None:
+        self.conversations.extend(conversations)
+        self.tool_logs.extend(tool_logs)
+        self.batches += 1
+
+
+class SQLiteSink(PersistenceSink):
+    """
+    SQLite 저장 (Postgres 없이 로컬 실행/테스트)
+
+    사용자 ID는 문자열 그대로, 벡터는 JSON 배열로 저장합니다.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS conversations (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id TEXT NOT NULL,
+        session_id TEXT,
+        user_message TEXT NOT NULL,
+        assistant_message TEXT NOT NULL,
+        user_embedding TEXT,
+        assistant_embedding TEXT,
+        importance_score REAL,
+        tools_used TEXT,
+        created_at TEXT
+    );
+    CREATE TABLE IF NOT EXISTS tool_logs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id TEXT,
+        tool_name TEXT NOT NULL,
+        parameters TEXT,
+        result TEXT,
+        success INTEGER,
+        execution_time_ms INTEGER,
+        created_at TEXT
+    );
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+
+    async def open(self) -> None:
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.executescript(self.SCHEMA)
+
+    async def write(self, conversations, tool_logs) -> None:
+        await asyncio.to_thread(self._write, conversations, tool_logs)
+
+    def _write(self, conversations, tool_logs) -> None:
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO conversations (user_id, session_id, user_message, assistant_message, "
+                "user_embedding, assistant_embedding, importance_score, tools_used, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        r.user_id,
+                        r.session_id,
+                        r.user_message,
+                        r.assistant_message,
+                        _vector_json(r.user_embedding),
+                        _vector_json(r.assistant_embedding),
+                        r.importance_score,
+                        json.dumps(r.tools_used),
+                        r.created_at.isoformat(),
+                    )
+                    for r in conversations
+                ],
+            )
+            self._conn.executemany(
+                "INSERT INTO tool_logs (user_id, tool_name, parameters, result, success, "
+                "execution_time_ms, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        r.user_id,
+                        r.tool_name,
+                        json.dumps(r.parameters, ensure_ascii=False),
+                        json.dumps(r.result, ensure_ascii=False),
+                        int(r.success),
+                        r.execution_time_ms,
+                        r.created_at.isoformat(),
+                    )
+                    for r in tool_logs
+                ],
+            )
+
+    async def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class PostgresSink(PersistenceSink):
+    """
+    PostgreSQL + pgvector 저장
+
+    - 배치의 사용자 문자열 ID → users.id 매핑 (없으면 생성)
+    - COPY (copy_records_to_table)로 다중 행 삽입
+    """
+
+    CONVERSATION_COLUMNS = [
+        "user_id", "session_id", "user_message", "assistant_message",
+        "user_embedding", "assistant_embedding", "importance_score",
+        "tools_used", "created_at",
+    ]
+    TOOL_LOG_COLUMNS = [
+        "user_id", "tool_name", "parameters", "result", "success",
+        "execution_time_ms", "created_at",
+    ]
+
+    def __init__(self, dsn: str, min_size: int = 1, max_size: int = 4):
+        self.dsn = dsn
+        self.min_size = min_size
+        self.max_size = max_size
+        self._pool = None
+
+    async def open(self) -> None:
+        import asyncpg
+        from pgvector.asyncpg import register_vector
+
+        self._pool = await asyncpg.create_pool(
+            self.dsn,
+            min_size=self.min_size,
+            max_size=self.max_size,
+            init=register_vector,
+        )
+
+    async def write(self, conversations, tool_logs) -> None:
+        async with self._pool.acquire() as conn:
+            async with conn.transaction():
+                user_ids = await self._resolve_users(
+                    conn,
+                    {r.user_id for r in conversations} | {r.user_id for r in tool_logs},
+                )
+
+                if conversations:
+                    await conn.copy_records_to_table(
+                        "conversations",
+                        columns=self.CONVERSATION_COLUMNS,
+                        records=[
+                            (
+                                user_ids[r.user_id],
+                                r.session_id,
+                                r.user_message,
+                                r.assistant_message,
+                                r.user_embedding,
+                                r.assistant_embedding,
+                                r.importance_score,
+                                json.dumps(r.tools_used),
+                                r.created_at,
+                            )
+                            for r in conversations
+                        ],
+                    )
+
+                if tool_logs:
+                    await conn.copy_records_to_table(
+                        "tool_logs",
+                        columns=self.TOOL_LOG_COLUMNS,
+                        records=[
+                            (
+                                user_ids[r.user_id],
+                                r.tool_name,
+                                json.dumps(r.parameters, ensure_ascii=False),
+                                json.dumps(r.result, ensure_ascii=False),
+                                r.success,
+                                r.execution_time_ms,
+                                r.created_at,
+                            )
+                            for r in tool_logs
+                        ],
+                    )
+
+    async def _resolve_users(self, conn, external_ids: set[str]) -> dict[str, int]:
+        """users.user_id(문자열) → users.id 매핑"""
+        if not external_ids:
+            return {}
+        ids = list(external_ids)
+        await conn.execute(
+            "INSERT INTO users (user_id) SELECT unnest($1::text[]) ON CONFLICT (user_id) DO NOTHING",
+            ids,
+        )
+        rows = await conn.fetch("SELECT id, user_id FROM users WHERE user_id = ANY($1::text[])", ids)
+        return {row["user_id"]: row["id"] for row in rows}
+
+    async def close(self) -> None:
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
+
+def _vector_json(vector: Optional[np.ndarray]) -> Optional[str]:
+    if vector is None:
+        return None
+    return json.dumps([round(float(v), 6) for v in vector])
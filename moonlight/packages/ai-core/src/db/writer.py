@@ -0,0 +1,262 @@
+"""
+Write-Behind Writer
+
+대화/Tool 로그를 요청 경로 밖에서 비동기 일괄 저장
+- 제한된 크기의 인메모리 큐 (가득 차면 짧게 대기 → 초과 시 버림)
+- 크기/시간 임계값으로 배치 플러시 (다중 행 COPY)
+- 임베딩은 플러시 시점에 배치로 계산 (핫 패스 밖)
+- 종료 시 남은 항목 모두 플러시
+- 저장된 대화 배치를 리스너에 알림 (검색 인덱스 갱신)
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional, Union
+
+from .sinks import (
+    ConversationRecord,
+    InMemorySink,
+    PersistenceSink,
+    PostgresSink,
+    SQLiteSink,
+    ToolLogRecord,
+)
+from ..config import Settings, get_settings
+from ..metrics import Histogram
+
+Record = Union[ConversationRecord, ToolLogRecord]
+
+
+@dataclass
+class WriterStats:
+    """Write-behind 통계"""
+    enqueued: int = 0
+    written: int = 0
+    dropped: int = 0  # 큐 포화로 버린 항목
+    failed: int = 0  # 저장 실패로 잃은 항목
+    flushes: int = 0
+
+    def as_dict(self) -> dict:
+        return dict(self.__dict__)
+
+
+class WriteBehindWriter:
+    """
+    Write-behind 저장 파이프라인
+
+    Usage:
+        writer = WriteBehindWriter(SQLiteSink())
+        await writer.start()
+        await writer.submit(ConversationRecord(...))
+        await writer.stop()  # 남은 항목 플러시
+    """
+
+    def __init__(
+        self,
+        sink: PersistenceSink,
+        embedder=None,
+        max_queue: int = 10_000,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        submit_timeout: float = 0.05,
+    ):
+        """
+        Args:
+            sink: 저장소
+            embedder: embed_many(texts) 를 제공하는 임베딩 서비스 (None이면 생략)
+            max_queue: 큐 최대 크기
+            batch_size: 플러시 배치 크기
+            flush_interval: 최대 플러시 간격 (초)
+            submit_timeout: 큐가 가득 찼을 때 submit이 기다리는 최대 시간 (초)
+        """
+        self.sink = sink
+        self.embedder = embedder
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.submit_timeout = submit_timeout
+
+        self.stats = WriterStats()
+        self.flush_latency = Histogram("persistence_flush_ms", "배치 저장 시간 (ms)")
+
+        self._queue: asyncio.Queue[Optional[Record]] = asyncio.Queue(maxsize=max_queue)
+        self._worker: Optional[asyncio.Task] = None
+        self._closed = False  # stop() 이후 submit 거절 (플러시할 워커가 없으므로)
+        self._listeners: list[Callable[[list[ConversationRecord]], None]] = []
+
+    def add_listener(self, listener: Callable[[list[ConversationRecord]], None]) -> None:
+        """대화 배치 저장 성공 시 호출 (writer 태스크 안에서, 가볍게 유지)"""
+        self._listeners.append(listener)
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._closed = False
+        await self.sink.open()
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """남은 항목 플러시 후 종료"""
+        if not self.running:
+            return
+        self._closed = True
+        await self._queue.put(None)  # 종료 신호 (가득 찼으면 자리가 날 때까지 대기)
+        await self._worker
+        self._worker = None
+        await self.sink.close()
+
+    async def submit(self, record: Record) -> bool:
+        """
+        저장 요청 (백프레셔)
+
+        큐가 가득 차면 submit_timeout 동안 기다리고, 그래도 가득하면 버립니다.
+        stop() 이후에는 바로 버립니다.
+
+        Returns:
+            bool: 큐에 들어갔는지
+        """
+        if self._closed:
+            self.stats.dropped += 1
+            return False
+        try:
+            self._queue.put_nowait(record)
+        except asyncio.QueueFull:
+            try:
+                await asyncio.wait_for(self._queue.put(record), timeout=self.submit_timeout)
+            except asyncio.TimeoutError:
+                self.stats.dropped += 1
+                return False
+
+        self.stats.enqueued += 1
+        return True
+
+    async def _run(self) -> None:
+        """배치 수집 → 플러시 루프"""
+        stopping = False
+
+        while not stopping:
+            batch: list[Record] = []
+            deadline = time.monotonic() + self.flush_interval
+
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            if stopping:
+                # 종료 신호 뒤에 남은 항목까지 모두 수집
+                while not self._queue.empty():
+                    item = self._queue.get_nowait()
+                    if item is not None:
+                        batch.append(item)
+
+            if batch:
+                await self._flush(batch)
+
+    async def _flush(self, batch: list[Record]) -> None:
+        """임베딩 계산 후 배치 저장 (한 번 재시도)"""
+        conversations = [r for r in batch if isinstance(r, ConversationRecord)]
+        tool_logs = [r for r in batch if isinstance(r, ToolLogRecord)]
+
+        started = time.perf_counter()
+        await self._embed(conversations)
+
+        for attempt in range(2):
+            try:
+                await self.sink.write(conversations, tool_logs)
+                self.stats.written += len(batch)
+                self._notify(conversations)
+                break
+            except Exception as e:
+                print(f"대화 저장 오류 (시도 {attempt + 1}): {e}")
+                if attempt == 1:
+                    self.stats.failed += len(batch)
+                else:
+                    await asyncio.sleep(0.5)
+
+        self.stats.flushes += 1
+        self.flush_latency.observe((time.perf_counter() - started) * 1000)
+
+    def _notify(self, conversations: list[ConversationRecord]) -> None:
+        if not conversations:
+            return
+        for listener in self._listeners:
+            try:
+                listener(conversations)
+            except Exception as e:
+                print(f"저장 알림 오류: {e}")
+
+    async def _embed(self, conversations: list[ConversationRecord]) -> None:
+        """사용자/비서 메시지 임베딩 (배치 한 번)"""
+        pending = [r for r in conversations if r.user_embedding is None]
+        if self.embedder is None or not pending:
+            return
+
+        texts = [r.user_message for r in pending] + [r.assistant_message for r in pending]
+        try:
+            vectors = await self.embedder.embed_many(texts)
+        except Exception as e:
+            # 임베딩 없이 저장 (나중에 백필 가능)
+            print(f"대화 임베딩 오류: {e}")
+            return
+
+        n = len(pending)
+        for i, record in enumerate(pending):
+            record.user_embedding = vectors[i]
+            record.assistant_embedding = vectors[n + i]
+
+
+def create_sink(settings: Settings) -> PersistenceSink:
+    """설정(persistence_backend)에 따른 저장소 생성"""
+    backend = settings.persistence_backend
+    if backend == "postgres":
+        return PostgresSink(settings.postgres_sync_url)
+    if backend == "sqlite":
+        return SQLiteSink(settings.persistence_sqlite_path)
+    return InMemorySink()
+
+
+_writer: Optional[WriteBehindWriter] = None
+
+
+async def init_writer(settings: Optional[Settings] = None, embedder=None) -> Optional[WriteBehindWriter]:
+    """앱 단위 writer 시작 (lifespan 시작 시, 비활성화면 None)"""
+    global _writer
+    settings = settings or get_settings()
+    if not settings.persistence_enabled:
+        return None
+
+    if _writer is None:
+        _writer = WriteBehindWriter(
+            create_sink(settings),
+            embedder=embedder,
+            max_queue=settings.persistence_queue_size,
+            batch_size=settings.persistence_batch_size,
+            flush_interval=settings.persistence_flush_interval,
+        )
+        await _writer.start()
+    return _writer
+
+
+def get_writer() -> Optional[WriteBehindWriter]:
+    return _writer
+
+
+async def close_writer() -> None:
+    """남은 항목 플러시 후 종료 (lifespan 종료 시)"""
+    global _writer
+    if _writer is not None:
+        await _writer.stop()
+        _writer = None
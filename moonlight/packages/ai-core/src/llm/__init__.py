@@ -4,8 +4,14 @@ LLM Provider Module
 OpenRouter API를 통한 LLM 호출
 """
 
+from .cache import InMemoryResponseCache, RedisResponseCache, ResponseCache
 from .provider import LLMProvider
 
-__all__ = ["LLMProvider"]
+__all__ = [
+    "LLMProvider",
+    "ResponseCache",
+    "InMemoryResponseCache",
+    "RedisResponseCache",
+]
 
 
@@ -0,0 +1,193 @@
+"""
+LLM Response Cache
+
+동일 요청(모델, 메시지, temperature, max_tokens, tools)의 응답 재사용
+- 요청 지문: 정규화된 JSON의 SHA-256
+- 백엔드: 인메모리 LRU / Redis
+- TTL, 크기 제한, 적중/미스 통계
+"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from ..config import Settings
+
+# 지문에 포함되는 요청 필드 (응답에 영향을 주는 값만)
+FINGERPRINT_FIELDS = (
+    "model",
+    "messages",
+    "temperature",
+    "max_tokens",
+    "tools",
+    "tool_choice",
+)
+
+
+def request_fingerprint(payload: dict) -> str:
+    """
+    요청 지문 생성
+
+    키 순서/공백과 무관한 정규 JSON을 해시하므로
+    같은 요청은 항상 같은 지문을 가집니다.
+    """
+    canonical = json.dumps(
+        {field: payload.get(field) for field in FINGERPRINT_FIELDS},
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """캐시 통계"""
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    errors: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "errors": self.errors,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+class ResponseCache:
+    """응답 캐시 인터페이스 (값은 JSON 문자열)"""
+
+    def __init__(self, ttl_seconds: int, max_value_bytes: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_value_bytes = max_value_bytes
+        self.stats = CacheStats()
+
+    async def get(self, key: str) -> Optional[str]:
+        raise NotImplementedError
+
+    async def set(self, key: str, value: str, ttl_seconds: Optional[int] = None) -> None:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """백엔드 연결 정리"""
+
+
+class InMemoryResponseCache(ResponseCache):
+    """프로세스 내 LRU 캐시"""
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: int = 3600, max_value_bytes: int = 64_000):
+        super().__init__(ttl_seconds, max_value_bytes)
+        self.max_entries = max_entries
+        self._data: OrderedDict[str, tuple[float, str]] = OrderedDict()  # key → (만료 시각, 값)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    async def get(self, key: str) -> Optional[str]:
+        item = self._data.get(key)
+        if item is None:
+            self.stats.misses += 1
+            return None
+
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._data[key]
+            self.stats.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    async def set(self, key: str, value: str, ttl_seconds: Optional[int] = None) -> None:
+        if len(value.encode("utf-8")) > self.max_value_bytes:
+            return
+
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        self.stats.stores += 1
+
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+            self.stats.evictions += 1
+
+
+class RedisResponseCache(ResponseCache):
+    """
+    Redis 캐시 (워커 간 공유)
+
+    크기 제한은 Redis maxmemory 정책에 맡기고 항목 크기만 제한합니다.
+    Redis 오류는 미스로 처리합니다 (캐시는 최적화일 뿐).
+    """
+
+    KEY_PREFIX = "moonlight:llm:"
+
+    def __init__(self, redis_url: str, ttl_seconds: int = 3600, max_value_bytes: int = 64_000):
+        super().__init__(ttl_seconds, max_value_bytes)
+        import redis.asyncio as redis
+
+        self.redis = redis.from_url(redis_url, decode_responses=True)
+
+    async def get(self, key: str) -> Optional[str]:
+        try:
+            value = await self.redis.get(self.KEY_PREFIX + key)
+        except Exception as e:
+            print(f"LLM 캐시(Redis) 조회 오류: {e}")
+            self.stats.errors += 1
+            self.stats.misses += 1
+            return None
+
+        if value is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return value
+
+    async def set(self, key: str, value: str, ttl_seconds: Optional[int] = None) -> None:
+        if len(value.encode("utf-8")) > self.max_value_bytes:
+            return
+
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        try:
+            await self.redis.set(self.KEY_PREFIX + key, value, ex=ttl)
+            self.stats.stores += 1
+        except Exception as e:
+            print(f"LLM 캐시(Redis) 저장 오류: {e}")
+            self.stats.errors += 1
+
+    async def close(self) -> None:
+        await self.redis.aclose()
+
+
+def create_response_cache(settings: Settings) -> Optional[ResponseCache]:
+    """설정(llm_cache_backend)에 따른 캐시 생성"""
+    backend = settings.llm_cache_backend
+
+    if backend == "memory":
+        return InMemoryResponseCache(
+            max_entries=settings.llm_cache_max_entries,
+            ttl_seconds=settings.llm_cache_ttl_seconds,
+            max_value_bytes=settings.llm_cache_max_value_bytes,
+        )
+    if backend == "redis":
+        return RedisResponseCache(
+            redis_url=settings.redis_url,
+            ttl_seconds=settings.llm_cache_ttl_seconds,
+            max_value_bytes=settings.llm_cache_max_value_bytes,
+        )
+    return None
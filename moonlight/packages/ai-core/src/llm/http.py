@@ -0,0 +1,145 @@
+"""
+HTTP Client
+
+OpenRouter 호출용 앱 단위 공유 httpx 클라이언트
+- main.lifespan 에서 생성/종료 (프로세스당 하나의 커넥션 풀)
+- 풀 크기 / keep-alive / HTTP/2 / connect·read 타임아웃 분리 (Settings)
+- 커넥션 풀 대기 시간 / TTFB 계측
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import httpx
+
+from ..config import Settings, get_settings
+from ..metrics.tracing import current_span, tracer
+
+
+@dataclass
+class PoolStats:
+    """커넥션 풀 통계"""
+    requests: int = 0
+    new_connections: int = 0  # TCP 연결 수립 (TLS 핸드셰이크 포함)
+    pool_wait_ms_total: float = 0.0
+    pool_wait_ms_max: float = 0.0
+
+    def record_wait(self, wait_ms: float) -> None:
+        self.requests += 1
+        self.pool_wait_ms_total += wait_ms
+        self.pool_wait_ms_max = max(self.pool_wait_ms_max, wait_ms)
+
+    def as_dict(self) -> dict:
+        avg = self.pool_wait_ms_total / self.requests if self.requests else 0.0
+        return {
+            "requests": self.requests,
+            "new_connections": self.new_connections,
+            "connection_reuse_rate": round(1 - self.new_connections / self.requests, 4) if self.requests else 0.0,
+            "pool_wait_ms_avg": round(avg, 3),
+            "pool_wait_ms_max": round(self.pool_wait_ms_max, 3),
+        }
+
+
+class _PoolTracer:
+    """
+    httpcore trace 콜백
+
+    요청 시작부터 첫 연결 이벤트(새 연결 수립 또는 재사용 연결에 헤더 전송)까지를
+    풀 대기 시간으로, 응답 헤더 수신까지를 TTFB로 기록합니다 (요청을 보낸 span에 속성 추가).
+    """
+
+    __slots__ = ("stats", "started", "recorded", "span")
+
+    def __init__(self, stats: PoolStats):
+        self.stats = stats
+        self.started = time.perf_counter()
+        self.recorded = False
+        self.span = current_span()
+
+    async def __call__(self, event_name: str, info: dict) -> None:
+        if not self.recorded:
+            self.recorded = True
+            wait_ms = (time.perf_counter() - self.started) * 1000
+            self.stats.record_wait(wait_ms)
+            tracer.observe("llm.http.queue_wait", wait_ms)
+            if self.span is not None:
+                self.span.set("http.queue_wait_ms", round(wait_ms, 3))
+
+        if event_name == "connection.connect_tcp.complete":
+            self.stats.new_connections += 1
+        elif event_name.endswith("receive_response_headers.complete"):
+            ttfb_ms = (time.perf_counter() - self.started) * 1000
+            tracer.observe("llm.http.ttfb", ttfb_ms)
+            if self.span is not None:
+                self.span.set("http.ttfb_ms", round(ttfb_ms, 3))
+
+
+pool_stats = PoolStats()
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def create_http_client(settings: Settings, stats: Optional[PoolStats] = None) -> httpx.AsyncClient:
+    """설정 기반 httpx 클라이언트 생성"""
+    stats = stats if stats is not None else pool_stats
+
+    http2 = settings.llm_http2
+    if http2 and not _http2_available():
+        print("HTTP/2 비활성화: h2 패키지 없음 (pip install 'httpx[http2]')")
+        http2 = False
+
+    async def attach_tracer(request: httpx.Request) -> None:
+        request.extensions["trace"] = _PoolTracer(stats)
+
+    return httpx.AsyncClient(
+        base_url=settings.openrouter_base_url,
+        headers={
+            "Authorization": f"Bearer {settings.openrouter_api_key}",
+            "Content-Type": "application/json",
+            "HTTP-Referer": "https://moonlight.local",  # OpenRouter 요구
+            "X-Title": "Moonlight AI",
+        },
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=settings.llm_max_connections,
+            max_keepalive_connections=settings.llm_max_keepalive_connections,
+            keepalive_expiry=settings.llm_keepalive_expiry,
+        ),
+        timeout=httpx.Timeout(
+            connect=settings.llm_connect_timeout,
+            read=settings.llm_read_timeout,
+            write=settings.llm_write_timeout,
+            pool=settings.llm_pool_timeout,
+        ),
+        event_hooks={"request": [attach_tracer]},
+    )
+
+
+def init_http_client(settings: Optional[Settings] = None) -> httpx.AsyncClient:
+    """앱 단위 클라이언트 생성 (lifespan 시작 시)"""
+    global _client
+    if _client is None:
+        _client = create_http_client(settings or get_settings())
+    return _client
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """앱 단위 클라이언트 (lifespan 밖에서는 지연 생성)"""
+    return _client if _client is not None else init_http_client()
+
+
+async def close_http_client() -> None:
+    """앱 단위 클라이언트 종료 (lifespan 종료 시)"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -0,0 +1,185 @@
+"""
+JSON Extraction
+
+LLM 자유 텍스트 응답에서 JSON 추출 (네이티브 Tool Calling 미지원 모델용)
+- 마크다운 코드 펜스(```json), 앞뒤 설명 문장 허용
+- 흔한 오류 보정: 후행 쉼표, Python 리터럴 (True/False/None)
+- 스트리밍: JSON 밖의 텍스트는 도착 즉시 통과, 첫 JSON 객체는 보류 후 파싱
+"""
+
+import json
+import re
+from typing import Any, Optional
+
+_FENCE = re.compile(r"```[a-zA-Z]*\s*")
+_TRAILING_COMMA = re.compile(r",\s*([}\]])")
+_PY_LITERALS = re.compile(r"\b(True|False|None)\b")
+_PY_TO_JSON = {"True": "true", "False": "false", "None": "null"}
+
+
+def _loads(text: str) -> Optional[Any]:
+    """json.loads + 보정 후 재시도"""
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        pass
+
+    repaired = _TRAILING_COMMA.sub(r"\1", text)
+    repaired = _PY_LITERALS.sub(lambda m: _PY_TO_JSON[m.group(1)], repaired)
+    try:
+        return json.loads(repaired)
+    except json.JSONDecodeError:
+        return None
+
+
+def _object_end(text: str, start: int) -> int:
+    """text[start] 의 '{' / '[' 에 대응하는 닫는 괄호 다음 위치 (없으면 -1)"""
+    depth = 0
+    in_string = escape = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch in "{[":
+            depth += 1
+        elif ch in "}]":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+    return -1
+
+
+def extract_json(text: Optional[str]) -> Optional[Any]:
+    """
+    텍스트에서 첫 번째 JSON 객체 추출
+
+    Returns:
+        dict | list | None: 파싱 결과 (찾지 못하면 None)
+    """
+    if not text:
+        return None
+
+    stripped = text.strip()
+    if stripped[:1] in "{[":
+        value = _loads(stripped)
+        if value is not None:
+            return value
+
+    start = text.find("{")
+    while start != -1:
+        end = _object_end(text, start)
+        if end == -1:
+            return None
+        value = _loads(text[start:end])
+        if value is not None:
+            return value
+        start = text.find("{", start + 1)
+    return None
+
+
+class StreamingJSONExtractor:
+    """
+    스트리밍 응답에서 첫 JSON 객체 분리
+
+    Usage:
+        extractor = StreamingJSONExtractor()
+        async for delta in stream:
+            text = extractor.feed(delta)   # JSON 밖 텍스트 (바로 전달 가능)
+            if extractor.done:
+                break                      # extractor.value = 파싱된 객체, extractor.tail = 조각의 나머지
+        text += extractor.close()
+    """
+
+    def __init__(self):
+        self.value: Optional[Any] = None
+        self.done = False
+        self.raw = ""  # 보류된 JSON 원문
+        self.tail = ""  # JSON이 닫힌 조각에서 아직 읽지 않은 나머지
+        self._pending = ""  # 코드 펜스일 수 있는 텍스트 (``` / ```json)
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    @property
+    def capturing(self) -> bool:
+        return self._depth > 0
+
+    def feed(self, chunk: str) -> str:
+        """
+        조각 입력
+
+        Returns:
+            str: 전달해도 되는 텍스트 (JSON / 펜스 제외)
+        """
+        if self.done:
+            return ""
+
+        out: list[str] = []
+        for i, ch in enumerate(chunk):
+            if self._depth:
+                self._capture(ch)
+                if self.done:
+                    self.tail = chunk[i + 1:]
+                    break
+                continue
+
+            if ch == "{":
+                if self._pending and not _FENCE.fullmatch(self._pending):
+                    out.append(self._pending)
+                self._pending = ""
+                self._capture(ch)
+                continue
+
+            if self._pending or ch == "`":
+                self._pending += ch
+                if not _could_be_fence(self._pending):
+                    out.append(self._pending)
+                    self._pending = ""
+                continue
+
+            out.append(ch)
+        return "".join(out)
+
+    def close(self) -> str:
+        """스트림 종료: 완성되지 않은 JSON / 보류 텍스트를 일반 텍스트로 반환"""
+        if self.done:
+            return ""
+        rest = self._pending + self.raw
+        self._pending = self.raw = ""
+        self._depth = 0
+        return rest
+
+    def _capture(self, ch: str) -> None:
+        self.raw += ch
+        if self._in_string:
+            if self._escape:
+                self._escape = False
+            elif ch == "\\":
+                self._escape = True
+            elif ch == '"':
+                self._in_string = False
+            return
+
+        if ch == '"':
+            self._in_string = True
+        elif ch in "{[":
+            self._depth += 1
+        elif ch in "}]":
+            self._depth -= 1
+            if self._depth == 0:
+                self.value = _loads(self.raw)
+                self.done = True
+
+
+def _could_be_fence(text: str) -> bool:
+    """``` / ```json + 공백으로 시작될 수 있는 접두어인지"""
+    if len(text) <= 3:
+        return text == "`" * len(text)
+    return bool(_FENCE.fullmatch(text))
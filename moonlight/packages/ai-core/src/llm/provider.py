@@ -5,10 +5,19 @@ OpenRouter API를 통한 다양한 LLM 모델 호출
 Tool Calling 지원
 """
 
-from typing import Optional
+import json
+import time
+from typing import AsyncIterator, Optional
+
 import httpx
 
+from .cache import ResponseCache, create_response_cache, request_fingerprint
+from .http import get_http_client
+from .resilience import LLMUnavailableError, ResilientCaller, is_retryable
+from .singleflight import SingleFlight
+from .usage import record_usage
 from ..config import get_settings
+from ..metrics.tracing import tracer
 
 
 class LLMProvider:
@@ -22,23 +31,28 @@ class LLMProvider:
     - Llama
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        cache: Optional[ResponseCache] = None,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
         settings = get_settings()
         self.api_key = settings.openrouter_api_key
         self.base_url = settings.openrouter_base_url
         self.default_model = settings.default_model
         
-        # HTTP 클라이언트
-        self.client = httpx.AsyncClient(
-            base_url=self.base_url,
-            headers={
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-                "HTTP-Referer": "https://moonlight.local",  # OpenRouter 요구
-                "X-Title": "Moonlight AI",
-            },
-            timeout=30.0,
-        )
+        # HTTP 클라이언트 (앱 단위 공유 커넥션 풀, lifespan에서 종료)
+        self.client = client or get_http_client()
+        
+        # 응답 캐시 (결정적인 저온 호출만)
+        self.cache = cache if cache is not None else create_response_cache(settings)
+        self.cache_max_temperature = settings.llm_cache_max_temperature
+        
+        # 동시 중복 요청 병합
+        self.inflight = SingleFlight() if settings.llm_singleflight_enabled else None
+        
+        # 재시도 / 서킷 브레이커 / 폴백 모델 / 헤지 요청
+        self.resilience = ResilientCaller.from_settings(settings)
     
     async def chat(
         self,
@@ -47,6 +61,7 @@ class LLMProvider:
         temperature: float = 0.7,
         max_tokens: int = 1000,
         tools: Optional[list[dict]] = None,
+        use_cache: bool = True,
     ) -> str:
         """
         채팅 완성
@@ -57,6 +72,7 @@ class LLMProvider:
             temperature: 창의성 (0.0-1.0)
             max_tokens: 최대 토큰 수
             tools: Tool 정의 리스트
+            use_cache: 응답 캐시 사용 여부 (호출 단위 opt-out)
         
         Returns:
             str: 생성된 응답
@@ -74,24 +90,17 @@ class LLMProvider:
             payload["tool_choice"] = "auto"
         
         try:
-            response = await self.client.post(
-                "/chat/completions",
-                json=payload,
-            )
-            response.raise_for_status()
-            
-            data = response.json()
-            choice = data["choices"][0]
+            message = await self._complete(payload, use_cache)
             
             # Tool Call 처리
-            if choice.get("message", {}).get("tool_calls"):
-                return self._format_tool_calls(choice["message"]["tool_calls"])
+            if message.get("tool_calls"):
+                return self._format_tool_calls(message["tool_calls"])
             
             # 일반 응답
-            return choice["message"]["content"]
+            return message["content"]
             
-        except httpx.HTTPStatusError as e:
-            print(f"LLM API 오류: {e.response.status_code}")
+        except (httpx.HTTPStatusError, LLMUnavailableError) as e:
+            print(f"LLM API 오류: {e}")
             return "죄송합니다, 일시적인 오류가 발생했습니다."
         except Exception as e:
             print(f"LLM 호출 오류: {e}")
@@ -102,6 +111,9 @@ class LLMProvider:
         messages: list[dict],
         tools: list[dict],
         model: Optional[str] = None,
+        use_cache: bool = True,
+        temperature: float = 0.3,
+        max_tokens: int = 1000,
     ) -> dict:
         """
         Tool Calling을 포함한 채팅
@@ -117,18 +129,12 @@ class LLMProvider:
             "messages": messages,
             "tools": tools,
             "tool_choice": "auto",
-            "temperature": 0.3,  # Tool 호출은 낮은 temperature
+            "temperature": temperature,  # Tool 호출은 낮은 temperature
+            "max_tokens": max_tokens,
         }
         
         try:
-            response = await self.client.post(
-                "/chat/completions",
-                json=payload,
-            )
-            response.raise_for_status()
-            
-            data = response.json()
-            message = data["choices"][0]["message"]
+            message = await self._complete(payload, use_cache)
             
             return {
                 "content": message.get("content"),
@@ -139,6 +145,262 @@ class LLMProvider:
             print(f"Tool Calling 오류: {e}")
             return {"content": None, "tool_calls": None}
     
+    async def _complete(self, payload: dict, use_cache: bool = True) -> dict:
+        """
+        /chat/completions 호출 → choices[0].message
+        
+        - 결정적인 요청(temperature ≤ llm_cache_max_temperature)은
+          요청 지문으로 캐시하여 네트워크를 두 번 타지 않습니다.
+        - 같은 지문의 동시 요청은 하나의 업스트림 요청을 공유합니다.
+        - use_cache=False 이면 캐시와 병합 모두 생략합니다.
+        """
+        with tracer.span("llm.complete", model=payload.get("model")) as span:
+            cache_key = None
+            if use_cache and self._is_cacheable(payload):
+                cache_key = request_fingerprint(payload)
+                cached = await self.cache.get(cache_key)
+                if cached is not None:
+                    if span is not None:
+                        span.set("llm.cache", "hit")
+                    return json.loads(cached)
+            
+            if span is not None:
+                span.set("llm.cache", "miss" if cache_key else "bypass")
+            
+            if not use_cache or self.inflight is None:
+                return await self._fetch(payload, cache_key)
+            
+            key = cache_key or request_fingerprint(payload)
+            return await self.inflight.do(key, lambda: self._fetch(payload, cache_key))
+    
+    async def _fetch(self, payload: dict, cache_key: Optional[str] = None) -> dict:
+        """업스트림 요청 (재시도/폴백 적용, 성공 응답만 캐시)"""
+        data = await self.resilience.call(payload, self._send)
+        message = data["choices"][0]["message"]
+        record_usage(data.get("usage"))
+        
+        if cache_key is not None:
+            await self.cache.set(cache_key, json.dumps(message, ensure_ascii=False))
+        
+        return message
+    
+    async def _send(self, model: str, payload: dict) -> dict:
+        """단일 /chat/completions 요청 (시도마다 span 하나, 풀 대기/TTFB는 http 훅이 기록)"""
+        with tracer.span("llm.http", model=model) as span:
+            response = await self.client.post(
+                "/chat/completions",
+                json={**payload, "model": model},
+            )
+            if span is not None:
+                span.set("http.status_code", response.status_code)
+            response.raise_for_status()
+            return response.json()
+    
+    def _is_cacheable(self, payload: dict) -> bool:
+        """캐시 대상 요청인지 (캐시 존재 + 저온)"""
+        if self.cache is None:
+            return False
+        return payload.get("temperature", 1.0) <= self.cache_max_temperature
+    
+    async def chat_stream(
+        self,
+        messages: list[dict],
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+    ) -> AsyncIterator[str]:
+        """
+        스트리밍 채팅 완성
+        
+        `stream: true` 요청의 SSE 응답을 파싱하여 토큰 델타를 도착 즉시 반환
+        
+        Args:
+            messages: 대화 메시지 리스트
+            model: 사용할 모델 (기본: default_model)
+            temperature: 창의성 (0.0-1.0)
+            max_tokens: 최대 토큰 수
+        
+        Yields:
+            str: 생성된 응답 조각 (delta)
+        """
+        payload = {
+            "model": model or self.default_model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "stream": True,
+        }
+        
+        async for event in self._stream_events(payload):
+            if event["type"] == "delta":
+                yield event["content"]
+    
+    async def chat_stream_with_tools(
+        self,
+        messages: list[dict],
+        tools: list[dict],
+        model: Optional[str] = None,
+        temperature: float = 0.3,
+        max_tokens: int = 1000,
+    ) -> AsyncIterator[dict]:
+        """
+        Tool Calling을 포함한 스트리밍 채팅
+        
+        텍스트는 도착 즉시, Tool 호출은 인자 조각을 모두 모은 뒤 한 번에 반환
+        
+        Yields:
+            dict: {"type": "delta", "content": str}
+                | {"type": "tool_calls", "tool_calls": list[dict]}
+        """
+        payload = {
+            "model": model or self.default_model,
+            "messages": messages,
+            "tools": tools,
+            "tool_choice": "auto",
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "stream": True,
+        }
+        
+        async for event in self._stream_events(payload):
+            yield event
+    
+    async def _stream_events(self, payload: dict) -> AsyncIterator[dict]:
+        """스트리밍 요청 (첫 이벤트 전 일시적 오류 → 폴백 모델로 재연결)"""
+        received = False
+        try:
+            models = self.resilience.candidate_models(payload["model"])
+            for index, candidate in enumerate(models):
+                breaker = self.resilience.breaker(candidate)
+                try:
+                    async for event in self._stream_once({**payload, "model": candidate}):
+                        received = True
+                        yield event
+                except Exception as e:
+                    if is_retryable(e):
+                        breaker.record_failure()
+                    if received or not is_retryable(e) or index + 1 == len(models):
+                        raise
+                    print(f"LLM 스트리밍 폴백: {candidate} → {models[index + 1]}")
+                    continue
+                
+                breaker.record_success()
+                return
+            
+            raise RuntimeError("사용 가능한 LLM 모델 없음 (서킷 열림)")
+            
+        except httpx.HTTPStatusError as e:
+            print(f"LLM 스트리밍 오류: {e.response.status_code}")
+            if not received:
+                yield {"type": "delta", "content": "죄송합니다, 일시적인 오류가 발생했습니다."}
+        except Exception as e:
+            print(f"LLM 스트리밍 호출 오류: {e}")
+            if not received:
+                yield {"type": "delta", "content": "죄송합니다, 응답을 생성하는 데 실패했습니다."}
+    
+    async def _stream_once(self, payload: dict) -> AsyncIterator[dict]:
+        """
+        단일 스트리밍 요청의 이벤트 반환 (Tool 호출 조각은 index별로 누적)
+        
+        yield를 건너므로 컨텍스트에 설정하지 않는 span을 쓰고, 첫 SSE 데이터까지를 TTFB로 기록합니다.
+        """
+        tool_calls: dict[int, dict] = {}
+        span = tracer.start_span("llm.stream", model=payload.get("model"))
+        started = time.perf_counter()
+        first = True
+        
+        try:
+            async with self.client.stream(
+                "POST",
+                "/chat/completions",
+                json=payload,
+            ) as response:
+                if span is not None:
+                    span.set("http.status_code", response.status_code)
+                response.raise_for_status()
+                
+                async for data in self._iter_sse_data(response):
+                    if first:
+                        first = False
+                        ttfb_ms = (time.perf_counter() - started) * 1000
+                        tracer.observe("llm.stream.ttfb", ttfb_ms)
+                        if span is not None:
+                            span.set("llm.ttfb_ms", round(ttfb_ms, 3))
+                    
+                    if data == "[DONE]":
+                        break
+                    
+                    chunk = json.loads(data)
+                    if "error" in chunk:
+                        raise RuntimeError(chunk["error"].get("message", "stream error"))
+                    
+                    # 마지막 청크에 usage 포함
+                    usage = chunk.get("usage")
+                    record_usage(usage)
+                    if usage and span is not None:
+                        span.set("llm.prompt_tokens", usage.get("prompt_tokens") or 0)
+                        span.set("llm.completion_tokens", usage.get("completion_tokens") or 0)
+                    
+                    choices = chunk.get("choices") or []
+                    if not choices:
+                        continue
+                    
+                    delta = choices[0].get("delta", {})
+                    for part in delta.get("tool_calls") or ():
+                        self._merge_tool_call(tool_calls, part)
+                    
+                    if delta.get("content"):
+                        yield {"type": "delta", "content": delta["content"]}
+        except BaseException as e:
+            tracer.end(span, None if isinstance(e, GeneratorExit) else e)
+            raise
+        tracer.end(span)
+        
+        if tool_calls:
+            yield {"type": "tool_calls", "tool_calls": [tool_calls[i] for i in sorted(tool_calls)]}
+    
+    @staticmethod
+    def _merge_tool_call(tool_calls: dict[int, dict], part: dict) -> None:
+        """스트리밍 tool_calls 조각 병합 (id/name은 첫 조각, arguments는 이어붙임)"""
+        call = tool_calls.setdefault(part.get("index", len(tool_calls)), {
+            "id": None,
+            "type": "function",
+            "function": {"name": "", "arguments": ""},
+        })
+        if part.get("id"):
+            call["id"] = part["id"]
+        function = part.get("function") or {}
+        if function.get("name"):
+            call["function"]["name"] += function["name"]
+        if function.get("arguments"):
+            call["function"]["arguments"] += function["arguments"]
+    
+    async def _iter_sse_data(self, response: httpx.Response) -> AsyncIterator[str]:
+        """
+        SSE 이벤트의 data 필드 추출
+        
+        - 여러 줄의 data는 개행으로 연결
+        - ':'로 시작하는 주석(keep-alive)은 무시
+        """
+        data_lines: list[str] = []
+        
+        async for line in response.aiter_lines():
+            if not line:
+                # 빈 줄 = 이벤트 경계
+                if data_lines:
+                    yield "\n".join(data_lines)
+                    data_lines = []
+                continue
+            
+            if line.startswith(":"):
+                continue
+            
+            if line.startswith("data:"):
+                data_lines.append(line[5:].lstrip())
+        
+        if data_lines:
+            yield "\n".join(data_lines)
+    
     def _format_tool_calls(self, tool_calls: list[dict]) -> str:
         """Tool Call 응답 포맷팅"""
         if not tool_calls:
@@ -149,7 +411,12 @@ class LLMProvider:
         return f"[Tool: {func.get('name')}] {func.get('arguments')}"
     
     async def close(self):
-        """클라이언트 정리"""
-        await self.client.aclose()
+        """
+        리소스 정리
+        
+        공유 HTTP 클라이언트는 close_http_client()가 종료합니다.
+        """
+        if self.cache is not None:
+            await self.cache.close()
 
 
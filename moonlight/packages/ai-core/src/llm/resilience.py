@@ -0,0 +1,312 @@
+"""
+LLM Resilience
+
+업스트림(OpenRouter) 장애/지연 대응
+- 지터 지수 백오프 재시도 (Retry-After 준수)
+- 모델별 서킷 브레이커
+- 순서가 있는 폴백 모델 목록
+- 헤지 요청: p95 시간 안에 응답이 없으면 폴백 모델에 두 번째 요청, 먼저 온 응답 채택
+"""
+
+import asyncio
+import email.utils
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Optional
+
+import httpx
+
+from ..config import Settings
+
+# 재시도로 회복 가능한 HTTP 상태
+RETRYABLE_STATUS = {408, 409, 425, 429, 500, 502, 503, 504}
+
+
+class LLMUnavailableError(Exception):
+    """모든 모델/재시도가 실패"""
+
+    def __init__(self, message: str, last_error: Optional[BaseException] = None):
+        super().__init__(message)
+        self.last_error = last_error
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더 (초 또는 HTTP 날짜) → 초"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        parsed = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(parsed.timestamp() - time.time(), 0.0)
+
+
+def is_retryable(error: BaseException) -> bool:
+    """일시적인 오류인지 (네트워크, 타임아웃, 429/5xx)"""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in RETRYABLE_STATUS
+    return isinstance(error, httpx.TransportError)
+
+
+@dataclass
+class RetryPolicy:
+    """재시도 정책 (full jitter 지수 백오프)"""
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> Optional[float]:
+        """
+        다음 시도까지 대기 시간
+
+        Returns:
+            float | None: None 이면 이 모델로는 더 기다리지 않음 (Retry-After가 너무 김)
+        """
+        if retry_after is not None:
+            if retry_after > self.max_delay:
+                return None
+            return retry_after
+        cap = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return random.uniform(0, cap)
+
+
+class CircuitBreaker:
+    """
+    모델별 서킷 브레이커
+
+    closed → (연속 실패 threshold회) → open → (reset_timeout 경과) → half_open
+    half_open 에서 한 번 성공하면 closed, 실패하면 다시 open
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        return self.state != "open"
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.state == "half_open" or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+
+
+class LatencyTracker:
+    """모델별 최근 응답 시간 (헤지 기준 p95)"""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.min_samples = min_samples
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def p95(self) -> Optional[float]:
+        if len(self._samples) < self.min_samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[int(len(ordered) * 0.95) - 1]
+
+
+@dataclass
+class ResilienceStats:
+    """복원력 통계"""
+    retries: int = 0
+    fallbacks: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+    circuit_skips: int = 0
+    failures: int = 0
+
+    def as_dict(self) -> dict:
+        return dict(self.__dict__)
+
+
+@dataclass
+class ResilientCaller:
+    """
+    재시도 + 서킷 브레이커 + 폴백 + 헤지를 적용한 업스트림 호출기
+
+    send(model, payload) 는 응답 JSON을 반환하거나 예외를 던지는 실제 요청입니다.
+    """
+    fallback_models: list[str] = field(default_factory=list)
+    policy: RetryPolicy = field(default_factory=RetryPolicy)
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+    hedge_enabled: bool = False
+    hedge_min_delay: float = 1.0
+    stats: ResilienceStats = field(default_factory=ResilienceStats)
+
+    def __post_init__(self):
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._latency: dict[str, LatencyTracker] = {}
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "ResilientCaller":
+        return cls(
+            fallback_models=list(settings.llm_fallback_models),
+            policy=RetryPolicy(
+                max_attempts=settings.llm_max_retries + 1,
+                base_delay=settings.llm_retry_base_delay,
+                max_delay=settings.llm_retry_max_delay,
+            ),
+            failure_threshold=settings.llm_circuit_failure_threshold,
+            reset_timeout=settings.llm_circuit_reset_seconds,
+            hedge_enabled=settings.llm_hedge_enabled,
+            hedge_min_delay=settings.llm_hedge_min_delay,
+        )
+
+    def breaker(self, model: str) -> CircuitBreaker:
+        if model not in self._breakers:
+            self._breakers[model] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+        return self._breakers[model]
+
+    def latency(self, model: str) -> LatencyTracker:
+        if model not in self._latency:
+            self._latency[model] = LatencyTracker()
+        return self._latency[model]
+
+    def candidate_models(self, model: str) -> list[str]:
+        """요청 모델 + 폴백 모델 중 서킷이 열리지 않은 것 (순서 유지)"""
+        ordered = [model] + [m for m in self.fallback_models if m != model]
+        allowed = []
+        for candidate in ordered:
+            if self.breaker(candidate).allow():
+                allowed.append(candidate)
+            else:
+                self.stats.circuit_skips += 1
+        return allowed
+
+    async def call(
+        self,
+        payload: dict,
+        send: Callable[[str, dict], Awaitable[dict]],
+    ) -> dict:
+        """
+        모델 순서대로 재시도하며 호출
+
+        Raises:
+            LLMUnavailableError: 모든 후보 실패
+            httpx.HTTPStatusError: 재시도해도 소용없는 요청 오류 (400, 401 등)
+        """
+        models = self.candidate_models(payload["model"])
+        last_error: Optional[BaseException] = None
+
+        for index, model in enumerate(models):
+            if index > 0:
+                self.stats.fallbacks += 1
+            hedge_model = models[index + 1] if index + 1 < len(models) else None
+
+            for attempt in range(self.policy.max_attempts):
+                try:
+                    return await self._attempt(model, hedge_model, payload, send)
+                except Exception as e:
+                    last_error = e
+                    if not is_retryable(e):
+                        raise
+
+                retry_after = None
+                if isinstance(last_error, httpx.HTTPStatusError):
+                    retry_after = parse_retry_after(last_error.response.headers.get("Retry-After"))
+
+                if attempt + 1 >= self.policy.max_attempts or not self.breaker(model).allow():
+                    break
+                delay = self.policy.delay(attempt, retry_after)
+                if delay is None:
+                    break  # Retry-After가 너무 김 → 다음 모델
+
+                self.stats.retries += 1
+                await asyncio.sleep(delay)
+
+        self.stats.failures += 1
+        raise LLMUnavailableError("모든 LLM 모델 호출 실패", last_error)
+
+    async def _attempt(
+        self,
+        model: str,
+        hedge_model: Optional[str],
+        payload: dict,
+        send: Callable[[str, dict], Awaitable[dict]],
+    ) -> dict:
+        """한 번의 시도 (헤지 조건이면 폴백 모델과 경쟁)"""
+        hedge_delay = self._hedge_delay(model) if hedge_model else None
+        if hedge_delay is None:
+            return await self._send(model, payload, send)
+
+        primary = asyncio.ensure_future(self._send(model, payload, send))
+        pending = {primary}
+        error: Optional[BaseException] = None
+
+        # 호출자가 취소되면 (헤지 대기 중 포함) 남은 업스트림 요청을 모두 취소
+        try:
+            done, pending = await asyncio.wait(pending, timeout=hedge_delay)
+            if done:
+                return primary.result()
+
+            # p95 초과 → 폴백 모델로 헤지 요청
+            self.stats.hedges += 1
+            hedge = asyncio.ensure_future(self._send(hedge_model, payload, send))
+            pending.add(hedge)
+
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.stats.hedge_wins += 1
+                        return task.result()
+                    error = task.exception()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        raise error
+
+    async def _send(
+        self,
+        model: str,
+        payload: dict,
+        send: Callable[[str, dict], Awaitable[dict]],
+    ) -> dict:
+        """단일 요청 + 서킷/지연시간 기록"""
+        breaker = self.breaker(model)
+        started = time.monotonic()
+        try:
+            data = await send(model, payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if is_retryable(e):
+                breaker.record_failure()
+            raise
+
+        breaker.record_success()
+        self.latency(model).record(time.monotonic() - started)
+        return data
+
+    def _hedge_delay(self, model: str) -> Optional[float]:
+        if not self.hedge_enabled:
+            return None
+        p95 = self.latency(model).p95()
+        if p95 is None:
+            return None  # 샘플 부족 → 헤지 기준 없음
+        return max(p95, self.hedge_min_delay)
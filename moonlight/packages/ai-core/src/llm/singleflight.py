@@ -0,0 +1,82 @@
+"""
+Single-Flight
+
+같은 요청 지문을 가진 동시 호출을 하나의 업스트림 요청으로 병합
+- 첫 호출자(leader)만 실제 요청 실행, 나머지는 같은 결과 공유
+- 대기자 한 명의 취소는 다른 대기자에게 영향 없음
+- 모든 대기자가 취소되면 업스트림 요청도 취소
+- 예외는 모든 대기자에게 전달
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlightStats:
+    """병합 통계"""
+    leaders: int = 0  # 실제 업스트림 요청 수
+    coalesced: int = 0  # 진행 중인 요청에 합류한 호출 수
+
+    def as_dict(self) -> dict:
+        return {"leaders": self.leaders, "coalesced": self.coalesced}
+
+
+class _Call(Generic[T]):
+    """진행 중인 호출"""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Task[T]"):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """동시 중복 호출 병합기"""
+
+    def __init__(self):
+        self._calls: dict[str, _Call] = {}
+        self.stats = SingleFlightStats()
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        key에 대해 fn을 최대 한 번만 동시 실행
+
+        Args:
+            key: 요청 지문
+            fn: 업스트림 호출 (leader일 때만 실행)
+
+        Returns:
+            T: 공유된 결과
+        """
+        call = self._calls.get(key)
+
+        if call is None:
+            call = _Call(asyncio.ensure_future(fn()))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda _: self._forget(key, call))
+            self.stats.leaders += 1
+        else:
+            self.stats.coalesced += 1
+
+        call.waiters += 1
+        try:
+            # shield: 이 대기자의 취소가 공유 Task를 취소하지 않도록
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                # 결과를 기다리는 호출자가 없음 → 업스트림 요청 취소
+                call.task.cancel()
+                self._forget(key, call)
+
+    def _forget(self, key: str, call: _Call) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
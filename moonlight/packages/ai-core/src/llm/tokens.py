@@ -0,0 +1,41 @@
+"""
+Token Estimation
+
+프롬프트 예산 계산용 토큰 수 추정
+- 모델별 토크나이저 없이 UTF-8 바이트 기반 근사 (한글 1자 ≈ 0.75 토큰, 영문 4자 ≈ 1 토큰)
+- 메시지 단위 오버헤드 포함
+"""
+
+# 메시지 하나당 role/구분자 오버헤드
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """텍스트 토큰 수 근사"""
+    if not text:
+        return 0
+    return max(1, len(text.encode("utf-8")) // 4)
+
+
+def estimate_message_tokens(message: dict) -> int:
+    """chat 메시지({"role", "content"}) 토큰 수 근사"""
+    return estimate_tokens(message.get("content") or "") + MESSAGE_OVERHEAD_TOKENS
+
+
+# 모델별 컨텍스트 길이 (토큰, 모델 ID 접두사 매칭)
+MODEL_CONTEXT_WINDOWS = {
+    "google/gemini-2.0-flash": 1_048_576,
+    "google/gemini": 1_000_000,
+    "meta-llama/llama-3.3-70b-instruct": 131_072,
+    "openai/gpt-4o": 128_000,
+    "anthropic/claude": 200_000,
+}
+DEFAULT_CONTEXT_WINDOW = 8192
+
+
+def context_window(model: str) -> int:
+    """모델 컨텍스트 길이 (모르는 모델은 보수적 기본값)"""
+    for prefix, window in MODEL_CONTEXT_WINDOWS.items():
+        if model.startswith(prefix):
+            return window
+    return DEFAULT_CONTEXT_WINDOW
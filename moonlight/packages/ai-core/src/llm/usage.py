@@ -0,0 +1,79 @@
+"""
+Token Usage Tracking
+
+OpenRouter 응답의 usage(prompt/completion 토큰)를 호출 컨텍스트별로 집계
+- contextvars 기반: asyncio Task마다 독립적으로 추적
+- 중첩 추적 시 바깥 추적기에도 함께 기록
+- 프로세스 누적량(total_usage)과 현재 span 속성에도 기록 (/api/metrics)
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from ..metrics.tracing import current_span
+
+
+@dataclass
+class TokenUsage:
+    """토큰 사용량"""
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    requests: int = 0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    def add(self, usage: dict) -> None:
+        """OpenRouter usage 객체 누적"""
+        self.prompt_tokens += usage.get("prompt_tokens") or 0
+        self.completion_tokens += usage.get("completion_tokens") or 0
+        self.requests += 1
+
+    def as_dict(self) -> dict:
+        return {
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "requests": self.requests,
+        }
+
+
+# 프로세스 누적 사용량
+total_usage = TokenUsage()
+
+
+_trackers: ContextVar[tuple[TokenUsage, ...]] = ContextVar("llm_usage_trackers", default=())
+
+
+@contextmanager
+def track_usage(usage: Optional[TokenUsage] = None) -> Iterator[TokenUsage]:
+    """
+    현재 컨텍스트의 LLM 토큰 사용량 추적
+
+    Usage:
+        with track_usage() as usage:
+            await llm.chat(...)
+        print(usage.total_tokens)
+    """
+    usage = usage if usage is not None else TokenUsage()
+    token = _trackers.set(_trackers.get() + (usage,))
+    try:
+        yield usage
+    finally:
+        _trackers.reset(token)
+
+
+def record_usage(usage: Optional[dict]) -> None:
+    """활성 추적기 모두에 사용량 기록 (LLMProvider가 호출)"""
+    if not usage:
+        return
+    total_usage.add(usage)
+    for tracker in _trackers.get():
+        tracker.add(usage)
+
+    span = current_span()
+    if span is not None:
+        span.set("llm.prompt_tokens", usage.get("prompt_tokens") or 0)
+        span.set("llm.completion_tokens", usage.get("completion_tokens") or 0)
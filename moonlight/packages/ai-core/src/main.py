@@ -1,15 +1,29 @@
 """
 Moonlight AI Core - Main Application
+
+실행: python -m src.server (멀티 워커 / graceful drain), 개발 중 리로드는 python -m src.main
 """
 
+import os
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from .admission import AdmissionRejected, close_admission, init_admission
 from .config import get_settings
+from .constitution.loader import close_constitution, init_constitution
 from .api import router as api_router
+from .api import chat as chat_api
+from .db.writer import close_writer, init_writer
+from .llm.http import close_http_client, init_http_client
+from .memory.embedding_service import get_embedding_service
+from .memory.pending import close_pending_store, init_pending_store
+from .memory.session import close_session_memory, init_session_memory
+from .metrics.tracing import init_tracing
+from .tools.executor import close_tool_executor
+from .tools.registry import get_tool_registry
 
 
 @asynccontextmanager
@@ -19,16 +33,60 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     print(f"🌙 {settings.app_name} v{settings.app_version} 시작...")
     print(f"   - Debug: {settings.debug}")
     print(f"   - LLM: {settings.default_model}")
+    print(f"   - Worker: pid {os.getpid()} ({settings.worker_count}개 중 하나)")
+    
+    # 워커마다 따로 갖는 상태 경고 (멀티 워커는 SHARED_BACKEND=redis)
+    local_state = settings.process_local_state
+    if settings.worker_count > 1 and local_state:
+        print(f"⚠️ 워커 간 공유되지 않는 상태: {', '.join(local_state)}")
+    
+    # 단계별 span 추적 (/api/metrics, Server-Timing)
+    init_tracing(settings)
+    
+    # 공유 HTTP 클라이언트 (OpenRouter 커넥션 풀)
+    init_http_client(settings)
+    
+    # 대화/Tool 로그 write-behind 저장
+    await init_writer(
+        settings,
+        embedder=get_embedding_service() if settings.persistence_embed else None,
+    )
+    
+    # Constitution 로딩 + 파일 변경 감시
+    await init_constitution(settings)
+    
+    # 세션 단기 기억 (핫 캐시 + Redis, 워커 간 무효화 구독)
+    await init_session_memory(settings)
+    
+    # 고위험 작업 확인 대기 (타이머 휠 만료 정리)
+    await init_pending_store(settings)
+    
+    # 수락 제어 (사용자별/전체 토큰 버킷 + 우선순위 대기열)
+    init_admission(settings)
+    
+    # Tool 메타데이터 디스커버리 (핸들러는 첫 실행 시 import) + 파라미터 검증기 컴파일
+    registry = get_tool_registry()
+    if settings.tools_precompile_validators:
+        registry.compile_validators()
+    
+    # 워커당 싱글톤은 첫 요청이 아니라 여기서 생성 (Orchestrator → Tool 실행 엔진, LLM, Intent 캐시 등)
+    chat_api.init_orchestrator()
     
     # TODO: 초기화 작업
-    # - Database 연결
-    # - Redis 연결
-    # - Tool Registry 로드
     # - gRPC 클라이언트 (Voice Service)
     
     yield
     
-    # 정리 작업
+    # 정리 작업 (처리 중인 턴은 서버가 먼저 drain, src/server.py)
+    await chat_api.close_orchestrator()
+    await close_writer()  # 남은 대화 플러시 (임베딩 서비스보다 먼저)
+    await close_session_memory()
+    await close_pending_store()
+    await close_admission()
+    await close_constitution()
+    close_tool_executor()
+    await get_embedding_service().stop()
+    await close_http_client()
     print("🌙 Moonlight AI Core 종료...")
 
 
@@ -55,6 +113,9 @@ def create_app() -> FastAPI:
     # 라우터 등록
     app.include_router(api_router, prefix="/api")
     
+    # 수락 제어 거절 → 429 + Retry-After
+    app.add_exception_handler(AdmissionRejected, chat_api.admission_rejected_handler)
+    
     return app
 
 
@@ -64,12 +125,17 @@ app = create_app()
 if __name__ == "__main__":
     import uvicorn
     
+    from .server import serve
+    
     settings = get_settings()
-    uvicorn.run(
-        "src.main:app",
-        host=settings.host,
-        port=settings.port,
-        reload=settings.debug,
-    )
+    if settings.debug and settings.worker_count == 1:
+        uvicorn.run(
+            "src.main:app",
+            host=settings.host,
+            port=settings.port,
+            reload=True,
+        )
+    else:
+        serve(settings)
 
 
@@ -7,8 +7,41 @@ Memory & RAG System
 - Long-term: User Profile (패턴, 선호도)
 """
 
-# TODO: RAG Pipeline 구현
-# TODO: Context Injection 구현
+from .context import AssembledContext, ContextAssembler
+from .embedding import EmbeddingModel, get_embedding_model
+from .embedding_service import EmbeddingService, get_embedding_service
+from .retrieval import (
+    HybridRetriever,
+    LocalVectorIndex,
+    PgVectorRetriever,
+    RetrievedMemory,
+    create_retriever,
+)
+from .session import (
+    InMemorySessionStore,
+    RedisSessionStore,
+    SessionMemory,
+    get_session_memory,
+)
+
+__all__ = [
+    "EmbeddingModel",
+    "get_embedding_model",
+    "EmbeddingService",
+    "get_embedding_service",
+    "SessionMemory",
+    "InMemorySessionStore",
+    "RedisSessionStore",
+    "get_session_memory",
+    "RetrievedMemory",
+    "PgVectorRetriever",
+    "LocalVectorIndex",
+    "HybridRetriever",
+    "create_retriever",
+    "ContextAssembler",
+    "AssembledContext",
+]
+
 # TODO: 중요도 판단 구현
 
 
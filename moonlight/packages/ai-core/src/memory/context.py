@@ -0,0 +1,315 @@
+"""
+Context Assembly
+
+턴마다 프롬프트(시스템 프롬프트 + 최근 대화 + 관련 기억 + 현재 메시지) 구성
+- 세그먼트별 토큰 수는 한 번만 계산 (턴은 저장 시, 기억/시스템 프롬프트는 캐시)
+- 예산 초과 시 중요도가 낮은 세그먼트부터 제거
+- 순서 고정: 시스템 → 대화 기록(append-only) → 관련 기억 → 메시지별 강조(focus) → 현재 메시지
+  → 앞부분이 턴 사이에 유지되어 upstream 프롬프트 캐시가 적중
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Optional, Sequence
+
+from .retrieval import RetrievedMemory
+from .session import Turn
+from ..config import Settings, get_settings
+from ..llm.tokens import MESSAGE_OVERHEAD_TOKENS, context_window, estimate_tokens
+from ..metrics import Histogram
+
+ASSEMBLY_US_BUCKETS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+MEMORY_HEADER = "참고할 과거 대화 (주인님과의 기억):"
+MEMORY_MESSAGE_CHARS = 200  # 기억 한 줄에 넣는 메시지 최대 길이
+
+
+@dataclass(slots=True)
+class Segment:
+    """프롬프트 조각 (토큰 수 캐시)"""
+    order: int  # 출력 순서
+    messages: list[dict]
+    tokens: int
+    importance: float
+    pinned: bool = False
+    kind: str = "history"  # system | history | memory | memory_header | focus | message
+
+
+@dataclass
+class AssembledContext:
+    """구성된 프롬프트"""
+    messages: list[dict]
+    tokens: int
+    budget: int
+    evicted: int = 0
+
+
+@dataclass
+class ContextStats:
+    """컨텍스트 구성 통계"""
+    assemblies: int = 0
+    tokens_counted: int = 0  # 새로 계산한 토큰 수
+    tokens_reused: int = 0  # 캐시된 개수를 재사용한 토큰 수 (재토큰화 절약)
+    tokens_trimmed: int = 0  # 예산 초과로 뺀 토큰 수
+    segments_evicted: int = 0
+
+    def as_dict(self) -> dict:
+        return dict(self.__dict__)
+
+
+class ContextAssembler:
+    """
+    토큰 예산 기반 프롬프트 구성기
+
+    Usage:
+        assembler = ContextAssembler(max_prompt_tokens=6000)
+        ctx = assembler.assemble(session_key, system_prompt, message, history=turns)
+        await llm.chat(ctx.messages)
+    """
+
+    def __init__(
+        self,
+        max_prompt_tokens: int = 6000,
+        max_sessions: int = 1024,
+        counter: Callable[[str], int] = estimate_tokens,
+    ):
+        self.max_prompt_tokens = max_prompt_tokens
+        self.max_sessions = max_sessions
+        self.counter = counter
+
+        self.stats = ContextStats()
+        self.assembly_time = Histogram(
+            "context_assembly_us",
+            "프롬프트 구성 시간 (µs)",
+            buckets=ASSEMBLY_US_BUCKETS,
+        )
+
+        self._static: dict[str, int] = {}  # 시스템 프롬프트 등 공용 텍스트 → 토큰 수
+        self._memories: OrderedDict[str, dict[int, tuple[str, int]]] = OrderedDict()
+
+    @classmethod
+    def from_settings(cls, settings: Optional[Settings] = None) -> "ContextAssembler":
+        settings = settings or get_settings()
+        return cls(
+            max_prompt_tokens=settings.context_max_prompt_tokens,
+            max_sessions=settings.context_max_sessions,
+        )
+
+    def budget(self, model: str, max_tokens: int = 1000) -> int:
+        """모델별 프롬프트 예산 (컨텍스트 길이 - 응답 토큰, 상한 적용)"""
+        return max(0, min(context_window(model) - max_tokens, self.max_prompt_tokens))
+
+    def assemble(
+        self,
+        session_key: str,
+        system_prompt: str,
+        message: str,
+        history: Sequence[Turn] = (),
+        memories: Sequence[RetrievedMemory] = (),
+        model: Optional[str] = None,
+        max_tokens: int = 1000,
+        focus: Optional[str] = None,
+    ) -> AssembledContext:
+        """
+        프롬프트 구성
+
+        Args:
+            session_key: 세션 키 (기억 세그먼트 캐시 단위)
+            system_prompt: 시스템 프롬프트 (고정)
+            message: 현재 사용자 메시지 (고정)
+            history: 최근 대화 턴 (오래된 것부터)
+            memories: 검색된 과거 대화
+            model: 예산 계산용 모델 (None이면 max_prompt_tokens)
+            focus: 이번 메시지에만 붙는 system 지시 (현재 메시지 바로 앞, 고정 접두사 밖)
+        """
+        started = time.perf_counter()
+        budget = self.budget(model, max_tokens) if model else self.max_prompt_tokens
+
+        segments = [
+            Segment(
+                0,
+                [{"role": "system", "content": system_prompt}],
+                self._static_tokens(system_prompt),
+                importance=1.0,
+                pinned=True,
+                kind="system",
+            ),
+            *self._history_segments(history),
+            *self._memory_segments(session_key, memories),
+            *self._focus_segments(focus),
+            Segment(
+                3,
+                [{"role": "user", "content": message}],
+                self._count(message) + MESSAGE_OVERHEAD_TOKENS,
+                importance=1.0,
+                pinned=True,
+                kind="message",
+            ),
+        ]
+
+        total = sum(s.tokens for s in segments)
+        evicted = 0
+        if total > budget:
+            kept, total, evicted = self._evict(segments, total, budget)
+            segments = kept
+
+        result = AssembledContext(self._render(segments), total, budget, evicted)
+
+        self.stats.assemblies += 1
+        self.assembly_time.observe((time.perf_counter() - started) * 1_000_000)
+        return result
+
+    def _history_segments(self, history: Sequence[Turn]) -> list[Segment]:
+        """user/assistant 쌍 단위 세그먼트 (최신일수록 중요)"""
+        pairs: list[list[Turn]] = []
+        for turn in history:
+            if turn.role == "user" or not pairs:
+                pairs.append([turn])
+            else:
+                pairs[-1].append(turn)
+
+        segments = []
+        count = len(pairs)
+        for i, pair in enumerate(pairs):
+            tokens = sum(t.tokens for t in pair)  # 저장 시 계산된 값
+            self.stats.tokens_reused += tokens
+            age = count - 1 - i
+            segments.append(Segment(
+                1,
+                [{"role": t.role, "content": t.content} for t in pair],
+                tokens,
+                importance=max(0.2, 1.0 - 0.05 * age),
+            ))
+        return segments
+
+    def _memory_segments(self, session_key: str, memories: Sequence[RetrievedMemory]) -> list[Segment]:
+        """
+        관련 기억 세그먼트 (한 줄씩, 렌더링 시 system 메시지 하나로 합침)
+
+        conversation_id 순으로 정렬해 검색 점수가 바뀌어도 순서가 흔들리지 않게 합니다.
+        """
+        if not memories:
+            return []
+
+        cache = self._session_cache(session_key)
+        segments = []
+        for memory in sorted(memories, key=lambda m: m.conversation_id):
+            cached = cache.get(memory.conversation_id)
+            if cached is None:
+                if len(cache) >= 256:
+                    cache.clear()
+                line = self._render_memory(memory)
+                cached = (line, self._count(line) + 1)  # 줄바꿈
+                cache[memory.conversation_id] = cached
+            else:
+                self.stats.tokens_reused += cached[1]
+
+            importance_score = memory.importance_score if memory.importance_score is not None else 0.5
+            segments.append(Segment(
+                2,
+                [{"role": "system", "content": cached[0]}],
+                cached[1],
+                importance=0.4 + 0.3 * memory.score + 0.3 * importance_score,
+                kind="memory",
+            ))
+
+        # 헤더 (기억이 하나라도 남을 때만 렌더링, 고정)
+        segments.append(Segment(
+            2,
+            [],
+            self._static_tokens(MEMORY_HEADER),
+            importance=1.0,
+            pinned=True,
+            kind="memory_header",
+        ))
+        return segments
+
+    def _focus_segments(self, focus: Optional[str]) -> list[Segment]:
+        if not focus:
+            return []
+        return [Segment(
+            3,
+            [{"role": "system", "content": focus}],
+            self._static_tokens(focus),  # 트리거 조합 수만큼만 생김
+            importance=1.0,
+            pinned=True,
+            kind="focus",
+        )]
+
+    def _evict(self, segments: list[Segment], total: int, budget: int) -> tuple[list[Segment], int, int]:
+        """중요도 낮은 순(같으면 오래된 순)으로 제거"""
+        candidates = sorted(
+            (i for i, s in enumerate(segments) if not s.pinned),
+            key=lambda i: (segments[i].importance, i),
+        )
+
+        removed: set[int] = set()
+        for i in candidates:
+            if total <= budget:
+                break
+            removed.add(i)
+            total -= segments[i].tokens
+            self.stats.tokens_trimmed += segments[i].tokens
+            self.stats.segments_evicted += 1
+
+        kept = [s for i, s in enumerate(segments) if i not in removed]
+        if not any(s.kind == "memory" for s in kept):
+            # 기억이 모두 빠지면 헤더도 제거
+            total -= sum(s.tokens for s in kept if s.kind == "memory_header")
+            kept = [s for s in kept if s.kind != "memory_header"]
+        return kept, total, len(removed)
+
+    def _render(self, segments: list[Segment]) -> list[dict]:
+        messages: list[dict] = []
+        memory_lines: list[str] = []
+        for segment in sorted(segments, key=lambda s: s.order):  # 안정 정렬
+            if segment.kind == "memory":
+                memory_lines.append(segment.messages[0]["content"])
+            elif segment.kind == "memory_header":
+                continue
+            else:
+                if memory_lines and segment.order > 2:
+                    messages.append(self._memory_message(memory_lines))
+                    memory_lines = []
+                messages.extend(segment.messages)
+        return messages
+
+    @staticmethod
+    def _memory_message(lines: list[str]) -> dict:
+        return {"role": "system", "content": "\n".join([MEMORY_HEADER, *lines])}
+
+    @staticmethod
+    def _render_memory(memory: RetrievedMemory) -> str:
+        date = f"[{memory.created_at[:10]}] " if memory.created_at else ""
+        return (
+            f"- {date}주인님: {memory.user_message[:MEMORY_MESSAGE_CHARS]}"
+            f" / 달빛: {memory.assistant_message[:MEMORY_MESSAGE_CHARS]}"
+        )
+
+    def _static_tokens(self, text: str) -> int:
+        tokens = self._static.get(text)
+        if tokens is None:
+            tokens = self._count(text) + MESSAGE_OVERHEAD_TOKENS
+            if len(self._static) > 64:  # 시스템 프롬프트 버전이 바뀌는 경우 대비
+                self._static.clear()
+            self._static[text] = tokens
+        else:
+            self.stats.tokens_reused += tokens
+        return tokens
+
+    def _session_cache(self, session_key: str) -> dict[int, tuple[str, int]]:
+        cache = self._memories.get(session_key)
+        if cache is None:
+            cache = {}
+            self._memories[session_key] = cache
+            while len(self._memories) > self.max_sessions:
+                self._memories.popitem(last=False)
+        else:
+            self._memories.move_to_end(session_key)
+        return cache
+
+    def _count(self, text: str) -> int:
+        tokens = self.counter(text)
+        self.stats.tokens_counted += tokens
+        return tokens
@@ -0,0 +1,69 @@
+"""
+Embedding Model
+
+sentence-transformers 임베딩 (all-MiniLM-L6-v2, 384차원)
+- 무거운 모델은 첫 사용 시 로딩
+- 정규화된 float32 벡터 반환 (내적 = 코사인 유사도)
+"""
+
+import asyncio
+import threading
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+
+from ..config import get_settings
+
+
+class EmbeddingModel:
+    """
+    임베딩 모델 래퍼
+
+    encode()는 블로킹(CPU) 호출이므로 이벤트 루프에서는 embed()를 사용합니다.
+    """
+
+    def __init__(self, model_name: Optional[str] = None):
+        self.model_name = model_name or get_settings().embedding_model
+        self._model = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        """모델 지연 로딩 (스레드 안전)"""
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    from sentence_transformers import SentenceTransformer
+
+                    self._model = SentenceTransformer(self.model_name)
+        return self._model
+
+    @property
+    def dimension(self) -> int:
+        """임베딩 차원"""
+        return self._load().get_sentence_embedding_dimension()
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        """
+        텍스트 배치 임베딩 (블로킹)
+
+        Returns:
+            np.ndarray: (len(texts), dim) 정규화된 float32 행렬
+        """
+        vectors = self._load().encode(
+            texts,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+        )
+        return vectors.astype(np.float32, copy=False)
+
+    async def embed(self, text: str) -> np.ndarray:
+        """단일 텍스트 임베딩 (스레드에서 실행)"""
+        vectors = await asyncio.to_thread(self.encode, [text])
+        return vectors[0]
+
+
+@lru_cache
+def get_embedding_model() -> EmbeddingModel:
+    """임베딩 모델 싱글톤"""
+    return EmbeddingModel()
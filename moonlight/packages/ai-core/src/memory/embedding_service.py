@@ -0,0 +1,229 @@
+"""
+Embedding Service
+
+비동기 임베딩 마이크로 배칭
+- 모든 코루틴의 요청을 하나의 큐로 모음
+- 배치 크기(예: 32) 또는 대기 시간(예: 10ms) 도달 시 한 번에 인코딩
+- 인코딩은 스레드/프로세스 풀에서 실행 (이벤트 루프 비차단)
+- 배치 크기 / 큐 대기 시간 히스토그램
+"""
+
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+
+from .embedding import EmbeddingModel
+from ..config import get_settings
+from ..metrics import Histogram
+
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128)
+
+# 프로세스 풀 워커의 모델 (워커 프로세스마다 한 번 로딩)
+_worker_model: Optional[EmbeddingModel] = None
+
+
+def _init_worker(model_name: str) -> None:
+    global _worker_model
+    _worker_model = EmbeddingModel(model_name)
+
+
+def _encode_in_worker(texts: list[str]) -> np.ndarray:
+    return _worker_model.encode(texts)
+
+
+class EmbeddingService:
+    """
+    마이크로 배칭 임베딩 서비스
+
+    embed()는 요청별 Future를 큐에 넣고 배치 결과를 기다립니다.
+    배치 수집 중에도 이전 배치 인코딩이 진행되도록 파이프라인으로 동작합니다.
+    """
+
+    def __init__(
+        self,
+        model: Optional[EmbeddingModel] = None,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 10.0,
+        workers: int = 1,
+        use_processes: bool = False,
+    ):
+        self.model = model or EmbeddingModel()
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.workers = workers
+        self.use_processes = use_processes
+
+        self.batch_sizes = Histogram(
+            "embedding_batch_size",
+            "임베딩 배치 크기",
+            buckets=BATCH_SIZE_BUCKETS,
+        )
+        self.queue_latency = Histogram(
+            "embedding_queue_latency_ms",
+            "요청이 배치에 들어가기까지 대기 시간 (ms)",
+        )
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._executor: Optional[Executor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._inflight: set[asyncio.Task] = set()
+        self._closed = False  # stop() 이후 새 요청 거절 (start() 로 다시 열림)
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    async def start(self) -> None:
+        """배치 워커 시작 (중복 호출 무시)"""
+        if self.running:
+            return
+
+        self._closed = False
+        if self.use_processes:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self.model.model_name,),
+            )
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers,
+                thread_name_prefix="embedding",
+            )
+
+        self._queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self.workers)
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        종료 신호 이전 요청은 처리 후 종료
+
+        신호 이후 큐에 남은 요청은 _run 종료 시 실패 처리되고, 이후 embed()는 거절됩니다.
+        """
+        self._closed = True
+        if not self.running:
+            return
+
+        await self._queue.put(None)  # 종료 신호
+        await self._worker
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+        self._executor.shutdown(wait=True)
+        self._worker = None
+
+    async def embed(self, text: str) -> np.ndarray:
+        """단일 텍스트 임베딩 (배치로 처리)"""
+        if self._closed:
+            raise RuntimeError("임베딩 서비스가 종료되었습니다")
+        if not self.running:
+            await self.start()
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((text, future, time.perf_counter()))
+        return await future
+
+    async def embed_many(self, texts: list[str]) -> np.ndarray:
+        """여러 텍스트 임베딩 (다른 요청과 함께 배치될 수 있음)"""
+        vectors = await asyncio.gather(*(self.embed(text) for text in texts))
+        return np.stack(vectors) if vectors else np.empty((0, 0), dtype=np.float32)
+
+    async def _run(self) -> None:
+        """큐에서 배치를 모아 인코딩 작업으로 전달"""
+        try:
+            await self._collect()
+        finally:
+            self._fail_pending()
+
+    async def _collect(self) -> None:
+        stopping = False
+
+        while not stopping:
+            first = await self._queue.get()
+            if first is None:
+                break
+
+            batch = [first]
+            deadline = time.perf_counter() + self.max_wait
+
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            # 워커 슬롯이 빌 때까지 대기 (그 사이 큐에 다음 배치가 쌓임)
+            await self._slots.acquire()
+            task = asyncio.create_task(self._encode_batch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    def _fail_pending(self) -> None:
+        """종료 신호 이후 큐에 남은 요청 실패 처리"""
+        error = RuntimeError("임베딩 서비스가 종료되었습니다")
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not None and not item[1].done():
+                item[1].set_exception(error)
+
+    async def _encode_batch(self, batch: list[tuple]) -> None:
+        """배치 인코딩 후 요청별 Future 완료"""
+        try:
+            now = time.perf_counter()
+            live = [(text, fut) for text, fut, _ in batch if not fut.done()]
+            for _, _, enqueued_at in batch:
+                self.queue_latency.observe((now - enqueued_at) * 1000)
+            self.batch_sizes.observe(len(batch))
+
+            if not live:
+                return
+
+            texts = [text for text, _ in live]
+            encode = _encode_in_worker if self.use_processes else self.model.encode
+            loop = asyncio.get_running_loop()
+
+            try:
+                vectors = await loop.run_in_executor(self._executor, encode, texts)
+            except Exception as e:
+                for _, fut in live:
+                    if not fut.done():
+                        fut.set_exception(e)
+                return
+
+            for (_, fut), vector in zip(live, vectors):
+                if not fut.done():  # 호출자가 취소한 경우 무시
+                    fut.set_result(vector)
+        finally:
+            self._slots.release()
+
+    def stats(self) -> dict:
+        return {
+            "batch_size": self.batch_sizes.as_dict(),
+            "queue_latency_ms": self.queue_latency.as_dict(),
+        }
+
+
+@lru_cache
+def get_embedding_service() -> EmbeddingService:
+    """임베딩 서비스 싱글톤"""
+    settings = get_settings()
+    return EmbeddingService(
+        model=EmbeddingModel(settings.embedding_model),
+        max_batch_size=settings.embedding_batch_size,
+        max_wait_ms=settings.embedding_batch_wait_ms,
+        workers=settings.embedding_workers,
+        use_processes=settings.embedding_use_processes,
+    )
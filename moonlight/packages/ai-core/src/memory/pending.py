@@ -0,0 +1,306 @@
+"""
+Pending Actions
+
+고위험 Tool의 사용자 확인 대기 상태 (세션 키 → 검증된 실행 계획)
++ 누락 파라미터 답변 대기 (slot filling: 부분 파라미터 + 호출별 누락 필드)
+- 확인을 기다리는 동안 코루틴/Task를 붙잡지 않음: 다음 턴이 pop(key) 한 번으로 O(1) 재개
+- 항목은 압축 JSON 문자열 하나 (수백 바이트)
+- 메모리 저장소: 항목별 타이머 대신 해시 타이밍 휠 하나로 만료 정리
+- Redis 저장소: SET EX + GETDEL (만료는 Redis, 워커 간 한 번만 재개)
+"""
+
+import asyncio
+import json
+import math
+import time
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from ..config import Settings, get_settings
+
+
+class PendingAction:
+    """확인 (또는 누락 파라미터 답변) 대기 중인 Tool 실행 계획"""
+
+    __slots__ = ("calls", "prompt", "expires_at", "missing")
+
+    def __init__(
+        self,
+        calls: list[tuple[str, dict, Optional[str]]],
+        prompt: str,
+        expires_at: float,
+        missing: Optional[list[list[str]]] = None,
+    ):
+        """
+        Args:
+            calls: (tool_name, parameters, idempotency_key) 목록 (확인 대기면 검증 완료, slot filling이면 부분 파라미터)
+            prompt: 사용자에게 보낸 확인 / 명확화 질문
+            expires_at: 만료 시각 (Unix time)
+            missing: 호출별 누락 필드 (slot filling, 확인 대기면 None)
+        """
+        self.calls = calls
+        self.prompt = prompt
+        self.expires_at = expires_at
+        self.missing = missing
+
+    @property
+    def tool_names(self) -> list[str]:
+        return [name for name, _, _ in self.calls]
+
+    @property
+    def awaiting_slots(self) -> bool:
+        """누락 파라미터 답변 대기 (False면 실행 확인 대기)"""
+        return any(self.missing or ())
+
+    def expired(self, now: Optional[float] = None) -> bool:
+        return (now or time.time()) >= self.expires_at
+
+    def encode(self) -> str:
+        """저장용 압축 표현 (JSON 배열, slot filling이면 누락 필드 목록 추가)"""
+        value = [round(self.expires_at, 3), self.prompt, [list(call) for call in self.calls]]
+        if self.missing:
+            value.append(self.missing)
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def decode(cls, raw: str) -> "PendingAction":
+        expires_at, prompt, calls, *rest = json.loads(raw)
+        return cls([tuple(call) for call in calls], prompt, expires_at, rest[0] if rest else None)
+
+
+class TimerWheel:
+    """
+    해시 타이밍 휠 (만료 키 일괄 수집)
+
+    키를 ceil(deadline / tick) 칸에 넣고 advance()가 지난 칸만 훑습니다.
+    등록/취소 O(1), 칸 하나는 키 문자열 참조 목록이라 항목당 수십 바이트입니다.
+    휠 한 바퀴(tick × size)보다 먼 만료는 해당 칸에 남겨 두었다가 다음 바퀴에 확인합니다.
+    """
+
+    __slots__ = ("tick", "size", "_buckets", "_current")
+
+    def __init__(self, tick: float = 1.0, size: int = 512, now: Optional[float] = None):
+        self.tick = tick
+        self.size = size
+        self._buckets: list[list[str]] = [[] for _ in range(size)]
+        self._current = math.floor((now if now is not None else time.time()) / tick)
+
+    def slot(self, deadline: float) -> int:
+        return max(math.ceil(deadline / self.tick), self._current + 1)
+
+    def schedule(self, key: str, deadline: float) -> None:
+        self._buckets[self.slot(deadline) % self.size].append(key)
+
+    def advance(self, now: float) -> Iterable[tuple[int, list[str]]]:
+        """now 까지 지난 칸들의 (칸 번호, 키 목록)을 비우며 반환"""
+        target = math.floor(now / self.tick)
+        steps = min(target - self._current, self.size)
+        start = target - steps
+        self._current = target
+        for tick in range(start + 1, target + 1):
+            index = tick % self.size
+            keys = self._buckets[index]
+            if keys:
+                self._buckets[index] = []
+                yield tick, keys
+
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self._buckets)
+
+
+@dataclass
+class PendingStats:
+    """확인 대기 통계"""
+    created: int = 0
+    resumed: int = 0
+    expired: int = 0
+    pending: int = 0
+
+    def as_dict(self) -> dict:
+        return dict(self.__dict__)
+
+
+class PendingActionStore:
+    """확인 대기 저장소 인터페이스"""
+
+    def __init__(self, ttl_seconds: float = 300.0):
+        self.ttl_seconds = ttl_seconds
+        self.stats = PendingStats()
+
+    def create(
+        self,
+        calls: list[tuple[str, dict, Optional[str]]],
+        prompt: str,
+        missing: Optional[list[list[str]]] = None,
+    ) -> PendingAction:
+        return PendingAction(calls, prompt, time.time() + self.ttl_seconds, missing)
+
+    async def put(self, key: str, action: PendingAction) -> None:
+        raise NotImplementedError
+
+    async def pop(self, key: str) -> Optional[PendingAction]:
+        """대기 항목을 꺼내며 삭제 (없거나 만료면 None)"""
+        raise NotImplementedError
+
+    async def start(self) -> None:
+        """만료 정리 시작"""
+
+    async def close(self) -> None:
+        """정리"""
+
+
+class InMemoryPendingStore(PendingActionStore):
+    """
+    프로세스 내 저장소 (단일 워커 / 테스트)
+
+    만료는 pop 시점에 확인하므로 정확하고, 휠 정리는 메모리 회수 용도입니다.
+    """
+
+    def __init__(self, ttl_seconds: float = 300.0, tick: float = 1.0, wheel_size: int = 512):
+        super().__init__(ttl_seconds)
+        self._data: dict[str, str] = {}  # key → 인코딩된 PendingAction
+        self._deadlines: dict[str, float] = {}
+        self._wheel = TimerWheel(tick, wheel_size)
+        self._sweeper: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    async def put(self, key: str, action: PendingAction) -> None:
+        if key not in self._data:
+            self.stats.pending += 1
+        self._data[key] = action.encode()
+        self._deadlines[key] = action.expires_at
+        self._wheel.schedule(key, action.expires_at)
+        self.stats.created += 1
+
+    async def pop(self, key: str) -> Optional[PendingAction]:
+        raw = self._data.pop(key, None)
+        if raw is None:
+            return None
+        self._deadlines.pop(key, None)
+        self.stats.pending -= 1
+
+        action = PendingAction.decode(raw)
+        if action.expired():
+            self.stats.expired += 1
+            return None
+        self.stats.resumed += 1
+        return action
+
+    def sweep(self, now: Optional[float] = None) -> int:
+        """만료 항목 제거 (제거 수)"""
+        now = now if now is not None else time.time()
+        removed = 0
+        for tick, keys in self._wheel.advance(now):
+            for key in keys:
+                deadline = self._deadlines.get(key)
+                if deadline is None:
+                    continue  # 이미 재개됨
+                if deadline <= now:
+                    del self._data[key]
+                    del self._deadlines[key]
+                    removed += 1
+                elif self._wheel.slot(deadline) % self._wheel.size == tick % self._wheel.size:
+                    self._wheel.schedule(key, deadline)  # 다음 바퀴
+                # 그 외: 같은 키가 다시 등록되어 남은 오래된 참조 → 버림
+        self.stats.expired += removed
+        self.stats.pending -= removed
+        return removed
+
+    async def start(self) -> None:
+        if self._sweeper is None:
+            self._sweeper = asyncio.create_task(self._sweep_loop())
+
+    async def close(self) -> None:
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            try:
+                await self._sweeper
+            except asyncio.CancelledError:
+                pass
+            self._sweeper = None
+
+    async def _sweep_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._wheel.tick)
+            self.sweep()
+
+
+class RedisPendingStore(PendingActionStore):
+    """
+    Redis 저장소 (워커 간 공유)
+
+    SET EX 로 만료를 Redis에 맡기고, GETDEL 로 꺼내므로 같은 확인 응답이
+    여러 워커에 도착해도 한 번만 재개됩니다.
+    """
+
+    KEY_PREFIX = "moonlight:pending:"
+
+    def __init__(self, redis_url: Optional[str] = None, ttl_seconds: float = 300.0, client=None):
+        """
+        Args:
+            client: redis.asyncio 호환 클라이언트 (테스트에서는 fakeredis)
+        """
+        super().__init__(ttl_seconds)
+        if client is None:
+            import redis.asyncio as redis
+
+            client = redis.from_url(redis_url, decode_responses=True)
+        self.redis = client
+
+    async def put(self, key: str, action: PendingAction) -> None:
+        ttl_ms = max(int((action.expires_at - time.time()) * 1000), 1)
+        await self.redis.set(self.KEY_PREFIX + key, action.encode(), px=ttl_ms)
+        self.stats.created += 1
+
+    async def pop(self, key: str) -> Optional[PendingAction]:
+        raw = await self.redis.getdel(self.KEY_PREFIX + key)
+        if raw is None:
+            return None
+        action = PendingAction.decode(raw)
+        if action.expired():
+            self.stats.expired += 1
+            return None
+        self.stats.resumed += 1
+        return action
+
+    async def close(self) -> None:
+        await self.redis.aclose()
+
+
+def create_pending_store(settings: Settings) -> PendingActionStore:
+    """설정(pending_backend)에 따른 확인 대기 저장소 생성"""
+    if settings.pending_backend == "redis":
+        return RedisPendingStore(settings.redis_url, ttl_seconds=settings.pending_ttl_seconds)
+    return InMemoryPendingStore(
+        ttl_seconds=settings.pending_ttl_seconds,
+        tick=settings.pending_sweep_interval,
+    )
+
+
+_pending_store: Optional[PendingActionStore] = None
+
+
+async def init_pending_store(settings: Optional[Settings] = None) -> PendingActionStore:
+    """앱 단위 확인 대기 저장소 시작 (lifespan 시작 시)"""
+    global _pending_store
+    if _pending_store is None:
+        _pending_store = create_pending_store(settings or get_settings())
+    await _pending_store.start()
+    return _pending_store
+
+
+def get_pending_store() -> PendingActionStore:
+    """앱 단위 확인 대기 저장소 (lifespan 밖에서는 지연 생성, 정리 루프 없음)"""
+    global _pending_store
+    if _pending_store is None:
+        _pending_store = create_pending_store(get_settings())
+    return _pending_store
+
+
+async def close_pending_store() -> None:
+    global _pending_store
+    if _pending_store is not None:
+        await _pending_store.close()
+        _pending_store = None
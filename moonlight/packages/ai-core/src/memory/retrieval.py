@@ -0,0 +1,538 @@
+"""
+Retrieval (Mid-term Memory)
+
+과거 대화 벡터 검색 (RAG)
+- PgVectorRetriever: conversations IVFFlat 인덱스 (ivfflat.probes 조정)
+- LocalVectorIndex: 사용자별 인프로세스 brute-force 인덱스
+  (float16/int8 양자화, 디스크에 저장 후 memory-map 로딩)
+- HybridRetriever: 사용자 대화 수에 따라 백엔드 선택
+  (작은 코퍼스는 로컬에서 왕복 없이, 큰 코퍼스는 pgvector)
+  로컬 인덱스는 마지막 id 이후의 새 대화만 가져와 따라잡음
+  (새 대화 저장 알림 / 디스크에서 로딩한 직후 / sync_ttl 경과 시 - 다른 워커가 저장한 대화)
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from ..config import Settings, get_settings
+
+QUANTIZATION_DTYPES = ("float32", "float16", "int8")
+
+# 양자화 행렬을 float32로 올려 BLAS 내적을 쓰는 청크 크기 (행)
+SCORE_CHUNK_ROWS = 8192
+
+
+@dataclass
+class RetrievedMemory:
+    """검색된 과거 대화 한 턴"""
+    conversation_id: int
+    score: float  # 코사인 유사도
+    user_message: str
+    assistant_message: str
+    created_at: Optional[str] = None
+    importance_score: Optional[float] = None
+
+    def to_payload(self) -> dict:
+        return {
+            "user_message": self.user_message,
+            "assistant_message": self.assistant_message,
+            "created_at": self.created_at,
+            "importance_score": self.importance_score,
+        }
+
+
+class Retriever:
+    """검색기 인터페이스 (query는 정규화된 임베딩)"""
+
+    async def search(self, user_id: str, query: np.ndarray, k: int = 5) -> list[RetrievedMemory]:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """연결 정리"""
+
+
+class PgVectorRetriever(Retriever):
+    """
+    pgvector 검색 (conversations.user_embedding, 코사인 거리)
+
+    IVFFlat은 전체 사용자 공용 인덱스이므로 사용자 필터 후 결과가 모자라지 않도록
+    트랜잭션마다 `SET LOCAL ivfflat.probes` 로 탐색 리스트 수를 조정합니다.
+    """
+
+    SEARCH_SQL = """
+        SELECT c.id, c.user_message, c.assistant_message, c.created_at, c.importance_score,
+               1 - (c.user_embedding <=> $2) AS score
+        FROM conversations c
+        JOIN users u ON u.id = c.user_id
+        WHERE u.user_id = $1 AND c.user_embedding IS NOT NULL
+        ORDER BY c.user_embedding <=> $2
+        LIMIT $3
+    """
+    COUNT_SQL = """
+        SELECT count(*)
+        FROM conversations c
+        JOIN users u ON u.id = c.user_id
+        WHERE u.user_id = $1 AND c.user_embedding IS NOT NULL
+    """
+    FETCH_ALL_SQL = """
+        SELECT c.id, c.user_message, c.assistant_message, c.created_at, c.importance_score,
+               c.user_embedding
+        FROM conversations c
+        JOIN users u ON u.id = c.user_id
+        WHERE u.user_id = $1 AND c.user_embedding IS NOT NULL
+        ORDER BY c.id
+    """
+    FETCH_SINCE_SQL = """
+        SELECT c.id, c.user_message, c.assistant_message, c.created_at, c.importance_score,
+               c.user_embedding
+        FROM conversations c
+        JOIN users u ON u.id = c.user_id
+        WHERE u.user_id = $1 AND c.user_embedding IS NOT NULL AND c.id > $2
+        ORDER BY c.id
+    """
+
+    def __init__(self, dsn: str, probes: int = 10, min_size: int = 1, max_size: int = 4):
+        self.dsn = dsn
+        self.probes = probes
+        self.min_size = min_size
+        self.max_size = max_size
+        self._pool = None
+        self._pool_lock = asyncio.Lock()
+
+    async def _get_pool(self):
+        if self._pool is None:
+            async with self._pool_lock:
+                if self._pool is None:
+                    import asyncpg
+                    from pgvector.asyncpg import register_vector
+
+                    self._pool = await asyncpg.create_pool(
+                        self.dsn,
+                        min_size=self.min_size,
+                        max_size=self.max_size,
+                        init=register_vector,
+                    )
+        return self._pool
+
+    async def search(
+        self,
+        user_id: str,
+        query: np.ndarray,
+        k: int = 5,
+        probes: Optional[int] = None,
+    ) -> list[RetrievedMemory]:
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                # SET은 파라미터 바인딩 불가 → 정수로 강제 변환
+                await conn.execute(f"SET LOCAL ivfflat.probes = {int(probes or self.probes)}")
+                rows = await conn.fetch(self.SEARCH_SQL, user_id, query, k)
+
+        return [
+            RetrievedMemory(
+                conversation_id=row["id"],
+                score=float(row["score"]),
+                user_message=row["user_message"],
+                assistant_message=row["assistant_message"],
+                created_at=row["created_at"].isoformat() if row["created_at"] else None,
+                importance_score=row["importance_score"],
+            )
+            for row in rows
+        ]
+
+    async def count(self, user_id: str) -> int:
+        """사용자 대화(임베딩 있는) 수"""
+        pool = await self._get_pool()
+        return await pool.fetchval(self.COUNT_SQL, user_id)
+
+    async def fetch_all(self, user_id: str) -> tuple[list[int], np.ndarray, list[dict]]:
+        """로컬 인덱스 구축용 전체 벡터 (ids, (n, dim) 행렬, payloads)"""
+        pool = await self._get_pool()
+        return self._rows_to_vectors(await pool.fetch(self.FETCH_ALL_SQL, user_id))
+
+    async def fetch_since(self, user_id: str, after_id: int) -> tuple[list[int], np.ndarray, list[dict]]:
+        """after_id 이후에 저장된 대화 벡터 (로컬 인덱스 갱신용)"""
+        pool = await self._get_pool()
+        return self._rows_to_vectors(await pool.fetch(self.FETCH_SINCE_SQL, user_id, after_id))
+
+    @staticmethod
+    def _rows_to_vectors(rows) -> tuple[list[int], np.ndarray, list[dict]]:
+        if not rows:
+            return [], np.empty((0, 0), dtype=np.float32), []
+
+        ids = [row["id"] for row in rows]
+        vectors = np.stack([np.asarray(row["user_embedding"], dtype=np.float32) for row in rows])
+        payloads = [
+            {
+                "user_message": row["user_message"],
+                "assistant_message": row["assistant_message"],
+                "created_at": row["created_at"].isoformat() if row["created_at"] else None,
+                "importance_score": row["importance_score"],
+            }
+            for row in rows
+        ]
+        return ids, vectors, payloads
+
+    async def close(self) -> None:
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
+
+class LocalVectorIndex:
+    """
+    인프로세스 brute-force 벡터 인덱스 (정확 검색, 양자화 저장)
+
+    - float16: 메모리 1/2, recall 손실 거의 없음 (단, NumPy float16→float32 변환이 느림)
+    - int8: 메모리 1/4, 벡터별 스케일 (대칭 양자화), recall@10 ≈ 0.98
+    - 용량은 2배씩 늘려 append를 분할 상환 O(1)로 유지
+    """
+
+    def __init__(self, dim: int, dtype: str = "int8", capacity: int = 256):
+        if dtype not in QUANTIZATION_DTYPES:
+            raise ValueError(f"지원하지 않는 dtype: {dtype}")
+        self.dim = dim
+        self.dtype = dtype
+        self.size = 0
+
+        self._vectors = np.empty((capacity, dim), dtype=np.dtype(dtype))
+        self._scales = np.ones(capacity, dtype=np.float32)
+        self._ids = np.empty(capacity, dtype=np.int64)
+        self.payloads: list[dict] = []
+
+    @property
+    def last_id(self) -> int:
+        """가장 큰 대화 id (없으면 0, pgvector 증분 조회 기준)"""
+        return int(self._ids[: self.size].max()) if self.size else 0
+
+    @property
+    def nbytes(self) -> int:
+        """벡터 저장에 쓰는 바이트 수"""
+        return int(self._vectors[: self.size].nbytes + self._scales[: self.size].nbytes)
+
+    def add(self, ids: list[int], vectors: np.ndarray, payloads: Optional[list[dict]] = None) -> None:
+        """벡터 추가 (vectors: (n, dim), 정규화 가정)"""
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dim)
+        n = len(vectors)
+        if n == 0:
+            return
+        self._reserve(self.size + n)
+
+        quantized, scales = self._quantize(vectors)
+        end = self.size + n
+        self._vectors[self.size:end] = quantized
+        self._scales[self.size:end] = scales
+        self._ids[self.size:end] = ids
+        self.payloads.extend(payloads or [{} for _ in range(n)])
+        self.size = end
+
+    def search(self, query: np.ndarray, k: int = 5) -> tuple[np.ndarray, np.ndarray]:
+        """
+        내적 상위 k (정확 검색)
+
+        Returns:
+            (positions, scores): 점수 내림차순
+        """
+        if self.size == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        query = np.asarray(query, dtype=np.float32)
+        if self.dtype == "float32":
+            scores = self._vectors[: self.size] @ query
+        else:
+            # float16/int8 행렬곱은 BLAS를 타지 않으므로 청크 단위로 float32 변환
+            scores = np.empty(self.size, dtype=np.float32)
+            for start in range(0, self.size, SCORE_CHUNK_ROWS):
+                end = min(start + SCORE_CHUNK_ROWS, self.size)
+                scores[start:end] = self._vectors[start:end].astype(np.float32) @ query
+            if self.dtype == "int8":
+                scores *= self._scales[: self.size]
+
+        k = min(k, self.size)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return top, scores[top]
+
+    def results(self, query: np.ndarray, k: int = 5) -> list[RetrievedMemory]:
+        positions, scores = self.search(query, k)
+        return [
+            RetrievedMemory(
+                conversation_id=int(self._ids[pos]),
+                score=float(score),
+                user_message=self.payloads[pos].get("user_message", ""),
+                assistant_message=self.payloads[pos].get("assistant_message", ""),
+                created_at=self.payloads[pos].get("created_at"),
+                importance_score=self.payloads[pos].get("importance_score"),
+            )
+            for pos, score in zip(positions, scores)
+        ]
+
+    def save(self, directory: Path) -> None:
+        """디스크 저장 (vectors.npy 는 로딩 시 memory-map)"""
+        directory.mkdir(parents=True, exist_ok=True)
+        np.save(directory / "vectors.npy", self._vectors[: self.size])
+        np.save(directory / "scales.npy", self._scales[: self.size])
+        np.save(directory / "ids.npy", self._ids[: self.size])
+        (directory / "payloads.json").write_text(
+            json.dumps({"dtype": self.dtype, "payloads": self.payloads}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+
+    @classmethod
+    def load(cls, directory: Path) -> "LocalVectorIndex":
+        """디스크에서 로딩 (벡터는 memory-map, 추가 시에만 메모리로 복사)"""
+        meta = json.loads((directory / "payloads.json").read_text(encoding="utf-8"))
+        vectors = np.load(directory / "vectors.npy", mmap_mode="r")
+
+        index = cls.__new__(cls)
+        index.dim = vectors.shape[1]
+        index.dtype = meta["dtype"]
+        index.size = len(vectors)
+        index._vectors = vectors
+        index._scales = np.load(directory / "scales.npy")
+        index._ids = np.load(directory / "ids.npy")
+        index.payloads = meta["payloads"]
+        return index
+
+    def _reserve(self, needed: int) -> None:
+        capacity = len(self._ids)
+        if needed <= capacity and self._vectors.flags.writeable:
+            return
+
+        new_capacity = max(needed, capacity * 2, 16)
+        vectors = np.empty((new_capacity, self.dim), dtype=np.dtype(self.dtype))
+        scales = np.ones(new_capacity, dtype=np.float32)
+        ids = np.empty(new_capacity, dtype=np.int64)
+        vectors[: self.size] = self._vectors[: self.size]
+        scales[: self.size] = self._scales[: self.size]
+        ids[: self.size] = self._ids[: self.size]
+        self._vectors, self._scales, self._ids = vectors, scales, ids
+
+    def _quantize(self, vectors: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        if self.dtype != "int8":
+            return vectors.astype(self.dtype), np.ones(len(vectors), dtype=np.float32)
+
+        max_abs = np.abs(vectors).max(axis=1)
+        scales = np.where(max_abs > 0, max_abs / 127.0, 1.0).astype(np.float32)
+        quantized = np.clip(np.rint(vectors / scales[:, None]), -127, 127).astype(np.int8)
+        return quantized, scales
+
+
+class LocalIndexStore:
+    """
+    사용자별 로컬 인덱스 (LRU, 디스크 캐시)
+
+    처음 조회 시 디스크 → 없으면 pgvector 에서 구축 후 저장합니다.
+    """
+
+    def __init__(self, directory: str, dtype: str = "int8", max_users: int = 256, dim: int = 384):
+        self.directory = Path(directory)
+        self.dtype = dtype
+        self.dim = dim  # 대화가 없는 사용자의 빈 인덱스 차원
+        self.max_users = max_users
+        self._indexes: OrderedDict[str, LocalVectorIndex] = OrderedDict()
+        # 사용자별 구축/갱신 락 (인덱스가 LRU에서 빠질 때 같이 제거, 대기자가 있는 동안 교체되지 않도록)
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    def path(self, user_id: str) -> Path:
+        digest = hashlib.sha1(user_id.encode("utf-8")).hexdigest()[:16]
+        return self.directory / digest
+
+    def get(self, user_id: str) -> Optional[LocalVectorIndex]:
+        index = self._indexes.get(user_id)
+        if index is not None:
+            self._indexes.move_to_end(user_id)
+            return index
+
+        path = self.path(user_id)
+        if (path / "vectors.npy").exists():
+            index = LocalVectorIndex.load(path)
+            self._remember(user_id, index)
+        return index
+
+    async def get_or_build(self, user_id: str, source: PgVectorRetriever) -> LocalVectorIndex:
+        """인덱스 조회 (없으면 source.fetch_all 로 구축, 사용자별 한 번만)"""
+        index = self.get(user_id)
+        if index is not None:
+            return index
+
+        async with self._lock(user_id):
+            index = self.get(user_id)
+            if index is None:
+                ids, vectors, payloads = await source.fetch_all(user_id)
+                dim = vectors.shape[1] if len(ids) else self.dim
+                index = LocalVectorIndex(dim, self.dtype, capacity=max(len(ids), 16))
+                index.add(ids, vectors, payloads)
+                await asyncio.to_thread(index.save, self.path(user_id))
+                self._remember(user_id, index)
+        return index
+
+    async def refresh(self, user_id: str, source: PgVectorRetriever) -> int:
+        """
+        인덱스 이후에 저장된 대화만 source.fetch_since 로 가져와 추가 (디스크에도 저장)
+
+        Returns:
+            추가된 대화 수
+        """
+        if self.get(user_id) is None:
+            return 0
+
+        async with self._lock(user_id):
+            # 락을 기다리는 동안 앞선 갱신이 추가한 행은 last_id 로 걸러짐
+            index = self.get(user_id)
+            if index is None:
+                return 0
+            ids, vectors, payloads = await source.fetch_since(user_id, index.last_id)
+            if ids:
+                index.add(ids, vectors, payloads)
+                await asyncio.to_thread(index.save, self.path(user_id))
+        return len(ids)
+
+    def save_all(self) -> None:
+        for user_id, index in self._indexes.items():
+            index.save(self.path(user_id))
+
+    def _lock(self, user_id: str) -> asyncio.Lock:
+        lock = self._locks.get(user_id)
+        if lock is None:
+            lock = self._locks[user_id] = asyncio.Lock()
+        return lock
+
+    def _remember(self, user_id: str, index: LocalVectorIndex) -> None:
+        self._indexes[user_id] = index
+        self._indexes.move_to_end(user_id)
+        while len(self._indexes) > self.max_users:
+            evicted, _ = self._indexes.popitem(last=False)
+            lock = self._locks.get(evicted)
+            if lock is not None and not lock.locked():
+                del self._locks[evicted]
+
+
+@dataclass
+class RetrievalStats:
+    """검색 통계"""
+    local_searches: int = 0
+    pgvector_searches: int = 0
+    index_builds: int = 0
+    index_refreshes: int = 0  # 증분 갱신 조회 수
+    refreshed_rows: int = 0  # 증분 갱신으로 추가된 대화 수
+    total_ms: float = 0.0
+
+    def as_dict(self) -> dict:
+        searches = self.local_searches + self.pgvector_searches
+        return {
+            **self.__dict__,
+            "avg_ms": round(self.total_ms / searches, 3) if searches else 0.0,
+        }
+
+
+class HybridRetriever(Retriever):
+    """
+    코퍼스 크기 기반 백엔드 선택
+
+    - 대화 수 ≤ local_max_corpus: 로컬 인덱스 (정확 검색, DB 왕복 없음)
+    - 그 이상: pgvector IVFFlat
+    사용자별 대화 수는 count_ttl 동안 캐시합니다.
+
+    로컬 인덱스는 이 프로세스에서 처음 쓸 때(디스크 로딩), 새 대화 저장 알림(mark_stale) 후,
+    sync_ttl 이 지났을 때 pgvector 에서 마지막 id 이후의 행만 가져와 갱신합니다.
+    """
+
+    def __init__(
+        self,
+        pgvector: PgVectorRetriever,
+        local: LocalIndexStore,
+        local_max_corpus: int = 5000,
+        backend: str = "auto",
+        count_ttl: float = 300.0,
+        sync_ttl: float = 60.0,
+    ):
+        self.pgvector = pgvector
+        self.local = local
+        self.local_max_corpus = local_max_corpus
+        self.backend = backend
+        self.count_ttl = count_ttl
+        self.sync_ttl = sync_ttl
+        self.stats = RetrievalStats()
+        self._counts: dict[str, tuple[int, float]] = {}
+        self._synced: dict[str, float] = {}  # 사용자 → 로컬 인덱스를 pgvector 와 맞춘 시각
+        self._stale: set[str] = set()
+
+    async def search(self, user_id: str, query: np.ndarray, k: int = 5) -> list[RetrievedMemory]:
+        started = time.perf_counter()
+        if await self._use_local(user_id):
+            built = self.local.get(user_id) is None
+            index = await self.local.get_or_build(user_id, self.pgvector)
+            now = time.monotonic()
+            if built:
+                self.stats.index_builds += 1
+                self._synced[user_id] = now
+                self._stale.discard(user_id)
+            elif self._needs_sync(user_id, now):
+                self._stale.discard(user_id)
+                self.stats.index_refreshes += 1
+                self.stats.refreshed_rows += await self.local.refresh(user_id, self.pgvector)
+                self._synced[user_id] = now
+                index = self.local.get(user_id) or index
+            self.stats.local_searches += 1
+            results = index.results(query, k)
+        else:
+            self.stats.pgvector_searches += 1
+            results = await self.pgvector.search(user_id, query, k)
+
+        self.stats.total_ms += (time.perf_counter() - started) * 1000
+        return results
+
+    def mark_stale(self, user_ids) -> None:
+        """새 대화가 저장된 사용자 (다음 검색에서 로컬 인덱스 증분 갱신, 대화 수 다시 조회)"""
+        for user_id in user_ids:
+            self._stale.add(user_id)
+            self._counts.pop(user_id, None)
+
+    def _needs_sync(self, user_id: str, now: float) -> bool:
+        if user_id in self._stale:
+            return True
+        synced = self._synced.get(user_id)
+        return synced is None or now - synced > self.sync_ttl
+
+    async def _use_local(self, user_id: str) -> bool:
+        if self.backend != "auto":
+            return self.backend == "local"
+        index = self.local.get(user_id)
+        if index is not None:
+            return index.size <= self.local_max_corpus
+
+        cached = self._counts.get(user_id)
+        now = time.monotonic()
+        if cached is None or now - cached[1] > self.count_ttl:
+            cached = (await self.pgvector.count(user_id), now)
+            self._counts[user_id] = cached
+        return cached[0] <= self.local_max_corpus
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self.local.save_all)
+        await self.pgvector.close()
+
+
+def create_retriever(settings: Optional[Settings] = None) -> HybridRetriever:
+    """설정(retrieval_*)에 따른 검색기 생성"""
+    settings = settings or get_settings()
+    return HybridRetriever(
+        PgVectorRetriever(settings.postgres_sync_url, probes=settings.retrieval_ivfflat_probes),
+        LocalIndexStore(
+            settings.retrieval_index_dir,
+            dtype=settings.retrieval_local_dtype,
+            max_users=settings.retrieval_local_max_users,
+        ),
+        local_max_corpus=settings.retrieval_local_max_corpus,
+        backend=settings.retrieval_backend,
+        sync_ttl=settings.retrieval_sync_ttl_seconds,
+    )
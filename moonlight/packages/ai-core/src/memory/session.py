@@ -0,0 +1,338 @@
+"""
+Session Memory (Short-term)
+
+세션 대화 기록 - 프로세스 내 핫 캐시 + Redis
+- 핫 세션은 프로세스 LRU에서 바로 컨텍스트 구성 (sub-ms)
+- 턴은 append-only 링 버퍼 (최근 N턴), 토큰 예산 내에서 최신부터 잘라냄
+- Redis 읽기/쓰기는 파이프라인 한 번
+- 워커 간 무효화: Redis pub/sub
+"""
+
+import asyncio
+import json
+import time
+import uuid
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from ..config import Settings, get_settings
+from ..llm.tokens import MESSAGE_OVERHEAD_TOKENS, estimate_tokens
+
+
+@dataclass(slots=True)
+class Turn:
+    """대화 한 턴 (user 또는 assistant 메시지)"""
+    role: str
+    content: str
+    tokens: int
+    created_at: float
+
+    @classmethod
+    def create(cls, role: str, content: str) -> "Turn":
+        return cls(role, content, estimate_tokens(content) + MESSAGE_OVERHEAD_TOKENS, time.time())
+
+    def encode(self) -> str:
+        """저장용 압축 표현 (JSON 배열)"""
+        return json.dumps([self.role, self.content, self.tokens, round(self.created_at, 3)], ensure_ascii=False)
+
+    @classmethod
+    def decode(cls, raw: str) -> "Turn":
+        role, content, tokens, created_at = json.loads(raw)
+        return cls(role, content, tokens, created_at)
+
+
+class SessionBuffer:
+    """세션 턴 링 버퍼 (최근 max_turns 턴 유지)"""
+
+    __slots__ = ("turns",)
+
+    def __init__(self, max_turns: int, turns: Iterable[Turn] = ()):
+        self.turns: deque[Turn] = deque(turns, maxlen=max_turns)
+
+    def extend(self, turns: Iterable[Turn]) -> None:
+        self.turns.extend(turns)
+
+    def window(self, token_budget: int) -> list[dict]:
+        """
+        토큰 예산 내 최근 대화 (오래된 것부터 정렬된 chat 메시지)
+
+        최신 턴부터 거꾸로 누적하다 예산을 넘으면 멈춥니다.
+        앞부분이 짝 잃은 assistant 메시지면 제외합니다.
+        """
+        selected: list[Turn] = []
+        used = 0
+        for turn in reversed(self.turns):
+            if used + turn.tokens > token_budget:
+                break
+            used += turn.tokens
+            selected.append(turn)
+
+        while selected and selected[-1].role == "assistant":
+            selected.pop()
+
+        return [{"role": t.role, "content": t.content} for t in reversed(selected)]
+
+
+class SessionStore:
+    """세션 저장소 인터페이스"""
+
+    async def load(self, key: str) -> list[Turn]:
+        raise NotImplementedError
+
+    async def append(self, key: str, turns: list[Turn]) -> None:
+        raise NotImplementedError
+
+    async def clear(self, key: str) -> None:
+        raise NotImplementedError
+
+    async def publish_invalidation(self, key: str, origin: str) -> None:
+        """다른 워커에 무효화 알림 (단일 프로세스 저장소는 불필요)"""
+
+    async def listen_invalidations(self, callback) -> None:
+        """무효화 구독 (callback(key, origin)), 취소될 때까지 실행"""
+
+    async def close(self) -> None:
+        """연결 정리"""
+
+
+class InMemorySessionStore(SessionStore):
+    """프로세스 내 저장소 (단일 워커 / 테스트)"""
+
+    def __init__(self, max_turns: int = 50):
+        self.max_turns = max_turns
+        self._data: dict[str, deque[str]] = {}
+
+    async def load(self, key: str) -> list[Turn]:
+        return [Turn.decode(raw) for raw in self._data.get(key, ())]
+
+    async def append(self, key: str, turns: list[Turn]) -> None:
+        buffer = self._data.setdefault(key, deque(maxlen=self.max_turns))
+        buffer.extend(turn.encode() for turn in turns)
+
+    async def clear(self, key: str) -> None:
+        self._data.pop(key, None)
+
+
+class RedisSessionStore(SessionStore):
+    """
+    Redis 저장소 (워커 간 공유)
+
+    세션마다 LIST 하나: RPUSH + LTRIM + EXPIRE 를 한 파이프라인으로 실행
+    """
+
+    KEY_PREFIX = "moonlight:session:"
+    CHANNEL = "moonlight:session:invalidate"
+
+    def __init__(self, redis_url: Optional[str] = None, max_turns: int = 50, ttl_seconds: int = 86400, client=None):
+        """
+        Args:
+            client: redis.asyncio 호환 클라이언트 (테스트에서는 fakeredis)
+        """
+        if client is None:
+            import redis.asyncio as redis
+
+            client = redis.from_url(redis_url, decode_responses=True)
+        self.redis = client
+        self.max_turns = max_turns
+        self.ttl_seconds = ttl_seconds
+
+    async def load(self, key: str) -> list[Turn]:
+        raw = await self.redis.lrange(self.KEY_PREFIX + key, -self.max_turns, -1)
+        return [Turn.decode(item) for item in raw]
+
+    async def append(self, key: str, turns: list[Turn]) -> None:
+        redis_key = self.KEY_PREFIX + key
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.rpush(redis_key, *(turn.encode() for turn in turns))
+            pipe.ltrim(redis_key, -self.max_turns, -1)
+            pipe.expire(redis_key, self.ttl_seconds)
+            await pipe.execute()
+
+    async def clear(self, key: str) -> None:
+        await self.redis.delete(self.KEY_PREFIX + key)
+
+    async def publish_invalidation(self, key: str, origin: str) -> None:
+        await self.redis.publish(self.CHANNEL, f"{origin}|{key}")
+
+    async def listen_invalidations(self, callback) -> None:
+        pubsub = self.redis.pubsub()
+        await pubsub.subscribe(self.CHANNEL)
+        try:
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                origin, _, key = message["data"].partition("|")
+                callback(key, origin)
+        finally:
+            await pubsub.unsubscribe(self.CHANNEL)
+            await pubsub.aclose()
+
+    async def close(self) -> None:
+        await self.redis.aclose()
+
+
+@dataclass
+class SessionStats:
+    """세션 메모리 통계"""
+    hot_hits: int = 0
+    hot_misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    def as_dict(self) -> dict:
+        total = self.hot_hits + self.hot_misses
+        return {
+            **self.__dict__,
+            "hot_hit_rate": round(self.hot_hits / total, 4) if total else 0.0,
+        }
+
+
+class SessionMemory:
+    """
+    세션 메모리 (핫 LRU → 저장소)
+
+    같은 세션의 연속 요청은 대부분 같은 워커의 핫 캐시에서 처리되고,
+    다른 워커가 세션을 갱신하면 pub/sub 알림으로 핫 항목을 버립니다.
+    """
+
+    def __init__(
+        self,
+        store: SessionStore,
+        hot_capacity: int = 1024,
+        max_turns: int = 50,
+    ):
+        self.store = store
+        self.hot_capacity = hot_capacity
+        self.max_turns = max_turns
+        self.worker_id = uuid.uuid4().hex[:12]
+        self.stats = SessionStats()
+
+        self._hot: OrderedDict[str, SessionBuffer] = OrderedDict()
+        # 세션이 바뀔 때마다 증가 - 로드 중에 바뀌었으면 결과를 핫 캐시에 넣지 않음
+        self._epoch = 0
+        self._listener: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def key(user_id: str, session_id: Optional[str]) -> str:
+        return f"{user_id}:{session_id or 'default'}"
+
+    async def start(self) -> None:
+        """워커 간 무효화 구독 시작"""
+        if self._listener is None:
+            self._listener = asyncio.create_task(
+                self.store.listen_invalidations(self._on_invalidation)
+            )
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._listener = None
+        await self.store.close()
+
+    async def get(self, key: str) -> SessionBuffer:
+        """세션 버퍼 (핫 캐시 우선)"""
+        buffer = self._hot.get(key)
+        if buffer is not None:
+            self._hot.move_to_end(key)
+            self.stats.hot_hits += 1
+            return buffer
+
+        self.stats.hot_misses += 1
+        epoch = self._epoch
+        buffer = SessionBuffer(self.max_turns, await self.store.load(key))
+        if epoch == self._epoch:
+            self._remember(key, buffer)
+        return buffer
+
+    async def recent(self, key: str) -> list[Turn]:
+        """최근 턴 (오래된 것부터, 토큰 수 포함)"""
+        return list((await self.get(key)).turns)
+
+    async def context_window(self, key: str, token_budget: int) -> list[dict]:
+        """토큰 예산 내 최근 대화 메시지"""
+        return (await self.get(key)).window(token_budget)
+
+    async def append_turn(self, key: str, user_message: str, assistant_message: str) -> None:
+        """user/assistant 메시지 한 쌍 추가 (저장소 쓰기 + 다른 워커 무효화)"""
+        turns = [
+            Turn.create("user", user_message),
+            Turn.create("assistant", assistant_message),
+        ]
+
+        buffer = self._hot.get(key)
+        if buffer is not None:
+            buffer.extend(turns)
+        self._epoch += 1
+
+        await self.store.append(key, turns)
+        await self.store.publish_invalidation(key, self.worker_id)
+
+    async def clear(self, key: str) -> None:
+        self._hot.pop(key, None)
+        self._epoch += 1
+        await self.store.clear(key)
+        await self.store.publish_invalidation(key, self.worker_id)
+
+    def _remember(self, key: str, buffer: SessionBuffer) -> None:
+        self._hot[key] = buffer
+        self._hot.move_to_end(key)
+        while len(self._hot) > self.hot_capacity:
+            self._hot.popitem(last=False)
+            self.stats.evictions += 1
+
+    def _on_invalidation(self, key: str, origin: str) -> None:
+        if origin == self.worker_id:
+            return
+        self._epoch += 1
+        if self._hot.pop(key, None) is not None:
+            self.stats.invalidations += 1
+
+
+def create_session_memory(settings: Settings) -> SessionMemory:
+    """설정(session_backend)에 따른 세션 메모리 생성"""
+    if settings.session_backend == "redis":
+        store: SessionStore = RedisSessionStore(
+            settings.redis_url,
+            max_turns=settings.session_max_turns,
+            ttl_seconds=settings.session_ttl_seconds,
+        )
+    else:
+        store = InMemorySessionStore(max_turns=settings.session_max_turns)
+
+    return SessionMemory(
+        store,
+        hot_capacity=settings.session_hot_capacity,
+        max_turns=settings.session_max_turns,
+    )
+
+
+_session_memory: Optional[SessionMemory] = None
+
+
+async def init_session_memory(settings: Optional[Settings] = None) -> SessionMemory:
+    """앱 단위 세션 메모리 시작 (lifespan 시작 시)"""
+    global _session_memory
+    if _session_memory is None:
+        _session_memory = create_session_memory(settings or get_settings())
+    await _session_memory.start()
+    return _session_memory
+
+
+def get_session_memory() -> SessionMemory:
+    """앱 단위 세션 메모리 (lifespan 밖에서는 지연 생성, 구독 없음)"""
+    global _session_memory
+    if _session_memory is None:
+        _session_memory = create_session_memory(get_settings())
+    return _session_memory
+
+
+async def close_session_memory() -> None:
+    global _session_memory
+    if _session_memory is not None:
+        await _session_memory.stop()
+        _session_memory = None
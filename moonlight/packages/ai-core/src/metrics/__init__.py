@@ -0,0 +1,25 @@
+"""
+Metrics
+
+경량 인프로세스 메트릭 (Prometheus 호환 버킷)
+- histogram: 고정 버킷 히스토그램
+- tracing: span 추적 (OpenTelemetry 호환 필드, Server-Timing)
+- prometheus: 텍스트 노출 형식 (/api/metrics)
+"""
+
+from .histogram import Histogram
+from .prometheus import Exposition
+from .tracing import Span, Trace, Tracer, current_span, current_trace, span, start_trace, tracer
+
+__all__ = [
+    "Histogram",
+    "Exposition",
+    "Span",
+    "Trace",
+    "Tracer",
+    "current_span",
+    "current_trace",
+    "span",
+    "start_trace",
+    "tracer",
+]
@@ -0,0 +1,70 @@
+"""
+Histogram
+
+고정 버킷 히스토그램 (Prometheus `le` 버킷과 같은 의미)
+- observe()는 bisect 한 번 (락 없음, 이벤트 루프 단일 스레드 기준)
+- 버킷 경계로 근사한 분위수 제공
+"""
+
+from bisect import bisect_left
+from typing import Optional, Sequence
+
+# 밀리초 단위 지연시간 기본 버킷
+LATENCY_MS_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class Histogram:
+    """누적 버킷 히스토그램"""
+
+    def __init__(
+        self,
+        name: str,
+        description: str = "",
+        buckets: Sequence[float] = LATENCY_MS_BUCKETS,
+    ):
+        self.name = name
+        self.description = description
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # 마지막 = +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        분위수 근사 (해당 버킷의 상한)
+
+        Args:
+            q: 0.0 ~ 1.0
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, n in zip(self.buckets, self.counts):
+            seen += n
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        """(le, 누적 개수) 목록, 마지막은 +Inf"""
+        result = []
+        seen = 0
+        for bound, n in zip(self.buckets + (float("inf"),), self.counts):
+            seen += n
+            result.append((bound, seen))
+        return result
+
+    def as_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "avg": round(self.sum / self.count, 3) if self.count else 0.0,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+        }
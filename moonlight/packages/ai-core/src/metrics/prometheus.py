@@ -0,0 +1,85 @@
+"""
+Prometheus Exposition
+
+히스토그램 / 게이지를 Prometheus 텍스트 형식(0.0.4)으로 변환
+"""
+
+import math
+import re
+from typing import Iterable, Optional
+
+from .histogram import Histogram
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_INVALID = re.compile(r"[^a-zA-Z0-9_:]")
+
+
+def metric_name(*parts: str) -> str:
+    """이름 정규화 (점/하이픈 → 밑줄)"""
+    return _INVALID.sub("_", "_".join(p for p in parts if p))
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: Optional[dict], extra: Optional[tuple[str, str]] = None) -> str:
+    items = list((labels or {}).items())
+    if extra is not None:
+        items.append(extra)
+    if not items:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in items) + "}"
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Exposition:
+    """
+    Prometheus 텍스트 작성기
+
+    같은 이름의 메트릭은 HELP/TYPE을 한 번만 출력합니다 (레이블만 다른 시계열).
+    """
+
+    def __init__(self):
+        self._families: dict[str, tuple[str, str, list[str]]] = {}  # name → (type, help, lines)
+
+    def _family(self, name: str, kind: str, description: str) -> list[str]:
+        family = self._families.get(name)
+        if family is None:
+            family = (kind, description, [])
+            self._families[name] = family
+        return family[2]
+
+    def histogram(self, name: str, histogram: Histogram, labels: Optional[dict] = None) -> None:
+        lines = self._family(name, "histogram", histogram.description or histogram.name)
+        for bound, count in histogram.cumulative():
+            lines.append(f"{name}_bucket{_labels(labels, ('le', _number(bound)))} {count}")
+        lines.append(f"{name}_sum{_labels(labels)} {_number(histogram.sum)}")
+        lines.append(f"{name}_count{_labels(labels)} {histogram.count}")
+
+    def gauge(self, name: str, value: float, labels: Optional[dict] = None, description: str = "") -> None:
+        self._family(name, "gauge", description or name).append(f"{name}{_labels(labels)} {_number(value)}")
+
+    def stats(self, prefix: str, values: dict, labels: Optional[dict] = None) -> None:
+        """as_dict() 결과의 숫자 값들을 게이지로 (중첩 dict는 이름을 이어붙임)"""
+        for key, value in values.items():
+            if isinstance(value, bool):
+                value = int(value)
+            if isinstance(value, dict):
+                self.stats(metric_name(prefix, key), value, labels)
+            elif isinstance(value, (int, float)):
+                self.gauge(metric_name(prefix, key), value, labels)
+
+    def render(self) -> str:
+        out: list[str] = []
+        for name, (kind, description, lines) in self._families.items():
+            out.append(f"# HELP {name} {description}")
+            out.append(f"# TYPE {name} {kind}")
+            out.extend(lines)
+        return "\n".join(out) + "\n"
@@ -0,0 +1,286 @@
+"""
+Tracing
+
+경량 span 추적 (OpenTelemetry 호환 필드, 수집기 불필요)
+- contextvars 기반 부모/자식 연결 (asyncio Task마다 독립)
+- span 종료 시 이름별 지연시간 히스토그램에 기록 → /api/metrics (Prometheus)
+- 요청 단위 Trace: 이름별 합계를 Server-Timing 헤더로
+- 최근 Trace는 OTLP JSON 형태로 보관 (개수 제한, 디버깅용)
+
+span 하나의 비용은 수 µs 이내가 목표입니다 (benchmarks/bench_tracing.py).
+ID는 64/128비트 정수로 두고 내보낼 때만 16진수로 변환합니다.
+"""
+
+import random
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Optional
+
+from .histogram import Histogram
+
+if TYPE_CHECKING:
+    from ..config import Settings
+
+# 밀리초 단위 span 버킷 (서브밀리초 단계 포함)
+SPAN_MS_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+_getrandbits = random.getrandbits
+_now_ns = time.perf_counter_ns
+_wall_ns = time.time_ns
+
+
+class Span:
+    """추적 구간"""
+
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "start_ns", "end_ns", "attributes", "status")
+
+    def __init__(self, name: str, trace_id: int, parent_id: Optional[int], attributes: Optional[dict]):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = _getrandbits(64)
+        self.parent_id = parent_id
+        self.start_ns = _now_ns()
+        self.end_ns = 0
+        self.attributes = attributes
+        self.status = "ok"
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_ns or _now_ns()
+        return (end - self.start_ns) / 1e6
+
+    def set(self, key: str, value: Any) -> None:
+        if self.attributes is None:
+            self.attributes = {}
+        self.attributes[key] = value
+
+    def record_error(self, error: BaseException) -> None:
+        self.status = "error"
+        self.set("error.type", type(error).__name__)
+        self.set("error.message", str(error))
+
+    def as_otel(self, offset_ns: int = 0) -> dict:
+        """
+        OTLP JSON span
+
+        Args:
+            offset_ns: perf_counter_ns → Unix epoch ns 변환값
+        """
+        return {
+            "traceId": f"{self.trace_id:032x}",
+            "spanId": f"{self.span_id:016x}",
+            "parentSpanId": f"{self.parent_id:016x}" if self.parent_id else "",
+            "name": self.name,
+            "startTimeUnixNano": self.start_ns + offset_ns,
+            "endTimeUnixNano": (self.end_ns or self.start_ns) + offset_ns,
+            "status": {"code": 2 if self.status == "error" else 1},
+            "attributes": [
+                {"key": key, "value": {"stringValue": str(value)}}
+                for key, value in (self.attributes or {}).items()
+            ],
+        }
+
+
+class Trace:
+    """요청 하나의 span 모음"""
+
+    __slots__ = ("trace_id", "spans", "recorded", "_offset_ns")
+
+    def __init__(self):
+        self.trace_id = _getrandbits(128)
+        self.spans: list[Span] = []
+        self.recorded = False  # tracer.recent 에 들어갔는지 (이어서 쓰는 경우 한 번만)
+        self._offset_ns = _wall_ns() - _now_ns()
+
+    def totals(self) -> dict[str, float]:
+        """span 이름별 소요 시간 합계 (ms, 처음 등장한 순서)"""
+        totals: dict[str, float] = {}
+        for span in self.spans:
+            totals[span.name] = totals.get(span.name, 0.0) + span.duration_ms
+        return totals
+
+    def server_timing(self) -> str:
+        """Server-Timing 헤더 값 (예: "intent;dur=12.3, llm;dur=410.2")"""
+        return ", ".join(f"{name};dur={ms:.1f}" for name, ms in self.totals().items())
+
+    def as_otel(self) -> list[dict]:
+        return [span.as_otel(self._offset_ns) for span in self.spans]
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("moonlight_span", default=None)
+_current_trace: ContextVar[Optional[Trace]] = ContextVar("moonlight_trace", default=None)
+
+
+class _SpanScope:
+    """span 컨텍스트 매니저 (제너레이터 기반보다 가벼운 구현)"""
+
+    __slots__ = ("tracer", "span", "token")
+
+    def __init__(self, tracer: "Tracer", name: str, attributes: Optional[dict]):
+        parent = _current_span.get()
+        trace = _current_trace.get()
+        if parent is not None:
+            trace_id = parent.trace_id
+        elif trace is not None:
+            trace_id = trace.trace_id
+        else:
+            trace_id = _getrandbits(128)
+        self.tracer = tracer
+        self.span = Span(name, trace_id, parent.span_id if parent is not None else None, attributes)
+        self.token = None
+
+    def __enter__(self) -> Span:
+        self.token = _current_span.set(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        span = self.span
+        span.end_ns = _now_ns()
+        _current_span.reset(self.token)
+        if exc is not None:
+            span.record_error(exc)
+        self.tracer._finish(span)
+
+
+class _NoopScope:
+    """추적 비활성화 시"""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+_NOOP = _NoopScope()
+
+
+class _TraceScope:
+    __slots__ = ("tracer", "trace", "token")
+
+    def __init__(self, tracer: "Tracer", trace: Optional[Trace] = None):
+        self.tracer = tracer
+        self.trace = trace if trace is not None else Trace()
+        self.token = None
+
+    def __enter__(self) -> Trace:
+        self.token = _current_trace.set(self.trace)
+        return self.trace
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            _current_trace.reset(self.token)
+        except ValueError:
+            pass  # 스트리밍 제너레이터가 다른 컨텍스트에서 정리된 경우 (GC 시 aclose)
+        trace = self.trace
+        if trace.spans and not trace.recorded:
+            trace.recorded = True
+            self.tracer.recent.append(trace)
+
+
+class Tracer:
+    """
+    Span 추적기
+
+    Usage:
+        with tracer.start_trace() as trace:
+            with tracer.span("intent", mode="native"):
+                ...
+        response.headers["Server-Timing"] = trace.server_timing()
+    """
+
+    def __init__(self, keep_traces: int = 100, enabled: bool = True):
+        self.enabled = enabled
+        self.histograms: dict[str, Histogram] = {}
+        self.recent: deque[Trace] = deque(maxlen=keep_traces)
+
+    def span(self, name: str, **attributes: Any):
+        """span 시작 (with 문)"""
+        if not self.enabled:
+            return _NOOP
+        return _SpanScope(self, name, attributes or None)
+
+    def start_span(self, name: str, **attributes: Any) -> Optional[Span]:
+        """
+        컨텍스트에 설정하지 않는 span (end()로 종료)
+
+        yield를 건너는 구간(스트리밍 제너레이터)용입니다. ContextVar를 제너레이터 안에서
+        설정하면 소비자 쪽 컨텍스트로 새어 나가므로 부모만 읽고 현재 span은 바꾸지 않습니다.
+        """
+        if not self.enabled:
+            return None
+        parent = _current_span.get()
+        trace = _current_trace.get()
+        if parent is not None:
+            trace_id = parent.trace_id
+        elif trace is not None:
+            trace_id = trace.trace_id
+        else:
+            trace_id = _getrandbits(128)
+        return Span(name, trace_id, parent.span_id if parent is not None else None, attributes or None)
+
+    def end(self, span: Optional[Span], error: Optional[BaseException] = None) -> None:
+        """start_span()으로 시작한 span 종료"""
+        if span is None or span.end_ns:
+            return
+        span.end_ns = _now_ns()
+        if error is not None:
+            span.record_error(error)
+        self._finish(span)
+
+    def start_trace(self, trace: Optional[Trace] = None) -> _TraceScope:
+        """
+        요청 단위 Trace 시작 (with 문)
+
+        trace 를 넘기면 그 Trace 에 이어서 기록합니다 (SSE: 라우트의 수락 제어 → 응답 스트림 제너레이터).
+        """
+        return _TraceScope(self, trace)
+
+    def observe(self, name: str, value_ms: float) -> None:
+        """외부에서 측정한 구간 기록 (예: TTFB)"""
+        if self.enabled:
+            self.histogram(name).observe(value_ms)
+
+    def histogram(self, name: str) -> Histogram:
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = Histogram(name, f"{name} (ms)", buckets=SPAN_MS_BUCKETS)
+            self.histograms[name] = histogram
+        return histogram
+
+    def _finish(self, span: Span) -> None:
+        self.histogram(span.name).observe((span.end_ns - span.start_ns) / 1e6)
+        trace = _current_trace.get()
+        if trace is not None:
+            trace.spans.append(span)
+
+
+tracer = Tracer()
+
+
+def init_tracing(settings: "Settings") -> Tracer:
+    """설정 적용 (main.lifespan 에서 호출, 기존 히스토그램은 유지)"""
+    tracer.enabled = settings.tracing_enabled
+    if tracer.recent.maxlen != settings.tracing_keep_traces:
+        tracer.recent = deque(tracer.recent, maxlen=settings.tracing_keep_traces)
+    return tracer
+
+
+def span(name: str, **attributes: Any):
+    """기본 추적기의 span (with 문)"""
+    return tracer.span(name, **attributes)
+
+
+def start_trace(trace: Optional[Trace] = None) -> _TraceScope:
+    return tracer.start_trace(trace)
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def current_trace() -> Optional[Trace]:
+    return _current_trace.get()
@@ -0,0 +1,159 @@
+"""
+Server (멀티 워커 + graceful drain)
+
+uvicorn 워커 N개를 띄우는 내장 프로세스 감독자
+- 부모가 소켓을 한 번 bind 하고 워커(spawn)들이 같은 소켓에서 accept (커널이 분배)
+- 워커가 비정상 종료하면 다시 띄움 (시작 자체가 실패하면 전체 종료)
+- SIGTERM / SIGINT → 모든 워커에 SIGTERM → 각 워커는
+  1. 새 연결 수락 중단
+  2. 처리 중인 대화 턴이 끝날 때까지 대기 (shutdown_drain_timeout, src/api/drain.py)
+  3. 남은 연결 종료 (WebSocket 1012) → lifespan 정리
+
+uvicorn 기본 종료 순서는 연결부터 닫기 때문에(WebSocket 1012) 2번을 Server.shutdown 앞에 끼워 넣습니다.
+워커 간 공유 상태는 SHARED_BACKEND=redis (세션 / 확인 대기 / LLM 캐시 / 수락 제어).
+
+실행: python -m src.server [--workers 4] [--port 8000]
+"""
+
+import argparse
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+import time
+from typing import Optional
+
+import uvicorn
+from uvicorn.server import STARTUP_FAILURE
+
+from .config import Settings, get_settings
+
+APP = "src.main:app"
+
+
+class DrainingServer(uvicorn.Server):
+    """종료 시 연결을 닫기 전에 처리 중인 턴을 기다리는 uvicorn 서버"""
+
+    def __init__(self, config: uvicorn.Config, drain_timeout: float = 30.0):
+        super().__init__(config)
+        self.drain_timeout = drain_timeout
+
+    async def shutdown(self, sockets: Optional[list[socket.socket]] = None) -> None:
+        from .api.drain import turns
+
+        # 새 연결 수락 중단 (소켓 자체는 다른 워커와 공유하므로 닫지 않음)
+        for server in self.servers:
+            server.close()
+        await turns.drain(self.drain_timeout)
+        await super().shutdown(sockets)
+
+
+def create_config(settings: Settings, **overrides) -> uvicorn.Config:
+    options = {
+        "host": settings.host,
+        "port": settings.port,
+        "workers": settings.worker_count,
+        # drain 이후 남은 연결 / 백그라운드 작업 대기
+        "timeout_graceful_shutdown": 5,
+        **overrides,
+    }
+    return uvicorn.Config(APP, **options)
+
+
+def _run_worker(config: uvicorn.Config, drain_timeout: float, sock: socket.socket) -> None:
+    """워커 프로세스 진입점"""
+    DrainingServer(config, drain_timeout).run(sockets=[sock])
+
+
+class WorkerSupervisor:
+    """워커 프로세스 감독 (uvicorn Multiprocess 와 같은 구조, 워커는 DrainingServer)"""
+
+    def __init__(self, config: uvicorn.Config, workers: int, drain_timeout: float):
+        self.config = config
+        self.workers = workers
+        self.drain_timeout = drain_timeout
+        self.processes: list[multiprocessing.Process] = []
+        self.restarts = 0
+        self._context = multiprocessing.get_context("spawn")
+        self._should_exit = threading.Event()
+
+    def _spawn(self, sock: socket.socket) -> multiprocessing.Process:
+        process = self._context.Process(target=_run_worker, args=(self.config, self.drain_timeout, sock))
+        process.start()
+        return process
+
+    def _handle_exit(self, sig: int, frame) -> None:
+        self._should_exit.set()
+
+    def run(self) -> None:
+        sock = self.config.bind_socket()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, self._handle_exit)
+
+        print(f"🌙 감독 프로세스 [{os.getpid()}] 워커 {self.workers}개 시작 ({self.config.host}:{self.config.port})")
+        self.processes = [self._spawn(sock) for _ in range(self.workers)]
+        try:
+            while not self._should_exit.wait(0.5):
+                self._keep_alive(sock)
+        finally:
+            self._stop_all()
+            sock.close()
+        print(f"🌙 감독 프로세스 [{os.getpid()}] 종료 (워커 재시작 {self.restarts}회)")
+
+    def _keep_alive(self, sock: socket.socket) -> None:
+        for index, process in enumerate(self.processes):
+            if process.is_alive():
+                continue
+            process.join()
+            if process.exitcode == STARTUP_FAILURE:
+                print(f"❌ 워커 [{process.pid}] 시작 실패, 전체 종료")
+                self._should_exit.set()
+                return
+            print(f"⚠️ 워커 [{process.pid}] 종료 (exit {process.exitcode}), 다시 시작")
+            self.restarts += 1
+            self.processes[index] = self._spawn(sock)
+
+    def _stop_all(self) -> None:
+        """모든 워커에 SIGTERM → drain + 정리 시간만큼 기다린 뒤 남은 워커는 강제 종료"""
+        for process in self.processes:
+            if process.is_alive():
+                # Windows 에는 SIGTERM 이 없으므로 Ctrl+Break (uvicorn 이 SIGBREAK 로 처리)
+                os.kill(process.pid, signal.CTRL_BREAK_EVENT if os.name == "nt" else signal.SIGTERM)
+
+        deadline = time.monotonic() + self.drain_timeout + (self.config.timeout_graceful_shutdown or 0) + 10
+        for process in self.processes:
+            process.join(max(deadline - time.monotonic(), 0))
+            if process.is_alive():
+                print(f"⚠️ 워커 [{process.pid}] 응답 없음, 강제 종료")
+                process.kill()
+                process.join()
+
+
+def serve(settings: Optional[Settings] = None, **overrides) -> None:
+    """설정된 워커 수로 서버 실행 (1이면 감독 프로세스 없이 현재 프로세스에서)"""
+    settings = settings or get_settings()
+    config = create_config(settings, **overrides)
+    if config.workers <= 1:
+        DrainingServer(config, settings.shutdown_drain_timeout).run()
+        return
+    WorkerSupervisor(config, config.workers, settings.shutdown_drain_timeout).run()
+
+
+def main() -> None:
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="Moonlight AI Core server")
+    parser.add_argument("--host", default=settings.host)
+    parser.add_argument("--port", type=int, default=settings.port)
+    parser.add_argument("--workers", type=int, default=settings.workers, help="0이면 CPU 수")
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args()
+
+    # 워커 프로세스는 설정을 새로 읽으므로 환경변수로 전달
+    os.environ["WORKERS"] = str(args.workers)
+    settings.workers = args.workers
+    serve(settings, host=args.host, port=args.port, log_level=args.log_level)
+
+
+if __name__ == "__main__":
+    main()
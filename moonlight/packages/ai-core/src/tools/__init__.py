@@ -2,13 +2,27 @@
 Tool System
 
 Plugin 구조로 Tool 관리
-- 자동 디스커버리
-- 동적 로딩
+- 자동 디스커버리 (entry points / 매니페스트, 메타데이터만)
+- 동적 로딩 (파라미터 모델 / 핸들러는 첫 사용 시 import)
+- 실행 엔진 (제한 시간 / 벌크헤드 / 병렬 실행)
+- 결과 캐시 (읽기 전용 Tool TTL, 멱등 키)
 - RAG 컨텍스트 주입
 """
 
-# TODO: Tool Registry 구현
-# TODO: Tool Loader 구현
-# TODO: 기본 Tools 구현 (Gmail, Calendar, Search 등)
+from .cache import ToolResultCache, tool_cache_key
+from .executor import ToolCall, ToolExecutor, ToolResult, get_tool_executor
+from .registry import ToolRegistry, ToolSpec, get_tool_registry
 
+__all__ = [
+    "ToolResultCache",
+    "tool_cache_key",
+    "ToolCall",
+    "ToolExecutor",
+    "ToolResult",
+    "get_tool_executor",
+    "ToolRegistry",
+    "ToolSpec",
+    "get_tool_registry",
+]
 
+# TODO: 기본 Tools 구현 (Gmail, Calendar, Search 등)
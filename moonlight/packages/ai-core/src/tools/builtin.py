@@ -0,0 +1,111 @@
+"""
+Builtin Tools
+
+기본 Tool 메타데이터 (실행 핸들러는 아직 Mock)
+"""
+
+from .registry import ToolSpec
+
+PARAMS = f"{__package__}.params"
+MOCK_HANDLER = f"{__package__}.mock:echo"
+
+BUILTIN_TOOLS = (
+    ToolSpec(
+        name="google_search",
+        description="웹 검색",
+        category="search",
+        keywords=("검색", "찾아", "알려", "뭐야", "어디"),
+        params=f"{PARAMS}:GoogleSearchParams",
+        handler=MOCK_HANDLER,
+        timeout=5.0,
+        cache_ttl=300.0,
+    ),
+    ToolSpec(
+        name="send_email",
+        description="이메일 전송",
+        category="communication",
+        keywords=("이메일", "메일", "보내", "전송"),
+        high_risk=True,
+        confirmation="이메일을 전송",
+        params=f"{PARAMS}:SendEmailParams",
+        handler=MOCK_HANDLER,
+    ),
+    ToolSpec(
+        name="get_calendar",
+        description="캘린더 조회",
+        category="productivity",
+        keywords=("일정", "캘린더", "스케줄", "약속"),
+        handler=MOCK_HANDLER,
+        cache_ttl=60.0,
+    ),
+    ToolSpec(
+        name="create_event",
+        description="일정 생성",
+        category="productivity",
+        keywords=("일정 추가", "일정 만들", "약속 잡"),
+        high_risk=True,
+        confirmation="일정을 생성",
+        params=f"{PARAMS}:CalendarEventParams",
+        handler=MOCK_HANDLER,
+    ),
+    ToolSpec(
+        name="update_event",
+        description="일정 수정",
+        category="productivity",
+        high_risk=True,
+        confirmation="일정을 수정",
+        params=f"{PARAMS}:CalendarEventParams",
+        handler=MOCK_HANDLER,
+    ),
+    ToolSpec(
+        name="delete_event",
+        description="일정 삭제",
+        category="productivity",
+        high_risk=True,
+        confirmation="일정을 삭제",
+        handler=MOCK_HANDLER,
+    ),
+    ToolSpec(
+        name="delete_file",
+        description="파일 삭제",
+        category="productivity",
+        high_risk=True,
+        confirmation="파일을 삭제",
+        handler=MOCK_HANDLER,
+    ),
+    ToolSpec(
+        name="github_issues",
+        description="GitHub 이슈 관리",
+        category="development",
+        keywords=("깃허브", "github", "이슈", "issue"),
+        params=f"{PARAMS}:GitHubIssueParams",
+        handler=MOCK_HANDLER,
+        max_concurrency=4,  # GitHub API 속도 제한 (repo/title/body 를 받아 생성일 수 있으므로 캐시 안 함)
+    ),
+    ToolSpec(
+        name="github_create_issue",
+        description="GitHub 이슈 생성",
+        category="development",
+        high_risk=True,
+        confirmation="GitHub 이슈를 생성",
+        params=f"{PARAMS}:GitHubIssueParams",
+        handler=MOCK_HANDLER,
+        max_concurrency=4,  # GitHub API 속도 제한
+    ),
+    ToolSpec(
+        name="github_close_issue",
+        description="GitHub 이슈 닫기",
+        category="development",
+        high_risk=True,
+        confirmation="GitHub 이슈를 종료",
+        handler=MOCK_HANDLER,
+        max_concurrency=4,  # GitHub API 속도 제한
+    ),
+    ToolSpec(
+        name="notion_page",
+        description="Notion 페이지 관리",
+        category="productivity",
+        keywords=("노션", "notion", "문서"),
+        handler=MOCK_HANDLER,
+    ),
+)
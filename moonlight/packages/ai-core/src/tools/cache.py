@@ -0,0 +1,232 @@
+"""
+Tool Result Cache
+
+읽기 전용 Tool 결과 재사용 + 멱등 키
+- 키: Tool 이름 + 범위(사용자) + 검증된 파라미터 정규 JSON의 SHA-256
+- Tool별 TTL은 ToolSpec.cache_ttl (없으면 캐시 안 함), 고위험 Tool은 항상 제외
+- 멱등 키: 같은 범위 + 같은 키 + 같은 파라미터의 재시도는 실행하지 않고 첫 결과 반환 (동시 재시도는 single-flight로 병합)
+  같은 키를 다른 파라미터로 재사용하면 실행하지 않고 오류 (다른 요청의 결과를 돌려주지 않도록)
+- 항목 수 + 바이트 기준 LRU 제거, 적중률 통계
+"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Awaitable, Callable, Optional
+
+from .executor import ToolResult
+from .registry import ToolSpec
+from ..config import Settings
+from ..llm.singleflight import SingleFlight
+
+
+def tool_cache_key(tool_name: str, parameters: Optional[dict], scope: Optional[str] = None) -> str:
+    """
+    Tool 호출 지문
+
+    parameters 는 ParameterValidatorAgent.validate 의 model_dump() 결과 (키 순서 무관)
+    """
+    canonical = json.dumps(
+        [scope, parameters or {}],
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=str,
+    )
+    return f"{tool_name}:{hashlib.sha256(canonical.encode('utf-8')).hexdigest()}"
+
+
+@dataclass
+class ToolCacheStats:
+    """Tool 캐시 통계"""
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    bypassed: int = 0  # 캐시 대상이 아닌 호출 (TTL 없음 / 고위험)
+    idempotent_replays: int = 0  # 멱등 키로 실행을 건너뛴 호출
+    idempotency_conflicts: int = 0  # 같은 멱등 키, 다른 파라미터 (거절)
+    entries: int = 0
+    bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def as_dict(self) -> dict:
+        return {**self.__dict__, "hit_rate": round(self.hit_rate, 4)}
+
+
+class _LRU:
+    """TTL + 항목 수 / 바이트 제한 LRU (값: ToolResult)"""
+
+    def __init__(self, max_entries: int, max_bytes: int, stats: ToolCacheStats):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = stats
+        self.bytes = 0
+        # key → (만료 시각, 크기, 결과, 파라미터 지문)
+        self._data: OrderedDict[str, tuple[float, int, ToolResult, Optional[str]]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def lookup(self, key: str) -> Optional[tuple[ToolResult, Optional[str]]]:
+        """(결과, 파라미터 지문)"""
+        item = self._data.get(key)
+        if item is None:
+            return None
+        if item[0] < time.monotonic():
+            self._remove(key)
+            return None
+        self._data.move_to_end(key)
+        return item[2], item[3]
+
+    def get(self, key: str) -> Optional[ToolResult]:
+        item = self.lookup(key)
+        return item[0] if item is not None else None
+
+    def put(self, key: str, result: ToolResult, ttl: float, fingerprint: Optional[str] = None) -> bool:
+        size = len(json.dumps(result.as_log(), ensure_ascii=False, default=str).encode("utf-8"))
+        if size > self.max_bytes:
+            return False
+
+        self._remove(key)
+        self._data[key] = (time.monotonic() + ttl, size, result, fingerprint)
+        self.bytes += size
+        while len(self._data) > self.max_entries or self.bytes > self.max_bytes:
+            self._remove(next(iter(self._data)))
+            self.stats.evictions += 1
+        return True
+
+    def invalidate(self, prefix: str) -> int:
+        keys = [key for key in self._data if key.startswith(prefix)]
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def _remove(self, key: str) -> None:
+        item = self._data.pop(key, None)
+        if item is not None:
+            self.bytes -= item[1]
+
+
+class ToolResultCache:
+    """
+    Tool 결과 캐시 (프로세스 내)
+
+    Usage:
+        result = await cache.run(spec, params, scope=user_id, execute=lambda: executor.execute(...))
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 2048,
+        max_bytes: int = 8_000_000,
+        idempotency_ttl: float = 600.0,
+    ):
+        self.idempotency_ttl = idempotency_ttl
+        self.stats = ToolCacheStats()
+        self._results = _LRU(max_entries, max_bytes, self.stats)
+        self._idempotent = _LRU(max_entries, max_bytes, self.stats)
+        self._inflight = SingleFlight()
+        self._idempotent_inflight: dict[str, str] = {}  # 멱등 키 → 실행 중인 파라미터 지문
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "ToolResultCache":
+        return cls(
+            max_entries=settings.tools_cache_max_entries,
+            max_bytes=settings.tools_cache_max_bytes,
+            idempotency_ttl=settings.tools_idempotency_ttl_seconds,
+        )
+
+    @staticmethod
+    def cacheable(spec: ToolSpec) -> bool:
+        return bool(spec.cache_ttl) and not spec.high_risk
+
+    async def run(
+        self,
+        spec: ToolSpec,
+        parameters: dict,
+        execute: Callable[[], Awaitable[ToolResult]],
+        scope: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> ToolResult:
+        """
+        캐시 / 멱등 키를 거쳐 Tool 실행
+
+        Args:
+            spec: Tool 메타데이터
+            parameters: 검증된 파라미터
+            execute: 실제 실행 (미스일 때만 호출)
+            scope: 캐시 범위 (사용자 ID - 사용자별 데이터가 섞이지 않도록)
+            idempotency_key: 같은 범위 + 키 + 파라미터의 재시도는 실행하지 않음
+        """
+        if idempotency_key:
+            return await self._run_idempotent(spec, parameters, idempotency_key, execute, scope)
+
+        if not self.cacheable(spec):
+            self.stats.bypassed += 1
+            return await execute()
+
+        key = tool_cache_key(spec.name, parameters, scope)
+        cached = self._results.get(key)
+        if cached is not None:
+            self.stats.hits += 1
+            return replace(cached, cached=True, execution_time_ms=0)
+
+        self.stats.misses += 1
+        result = await self._inflight.do(key, execute)
+        if result.success and self._results.put(key, result, spec.cache_ttl):
+            self.stats.stores += 1
+        self._sync_size()
+        return result
+
+    async def _run_idempotent(
+        self,
+        spec: ToolSpec,
+        parameters: dict,
+        idempotency_key: str,
+        execute: Callable[[], Awaitable[ToolResult]],
+        scope: Optional[str],
+    ) -> ToolResult:
+        # 범위(사용자)별 키 공간: 다른 사용자가 같은 키를 보내도 서로의 결과를 받지 않음
+        key = tool_cache_key(spec.name, {"idem": idempotency_key}, scope)
+        fingerprint = tool_cache_key(spec.name, parameters)
+
+        previous = self._idempotent.lookup(key)
+        if previous is not None:
+            if previous[1] != fingerprint:
+                return self._conflict(spec)
+            self.stats.idempotent_replays += 1
+            return replace(previous[0], cached=True, execution_time_ms=0)
+
+        running = self._idempotent_inflight.setdefault(key, fingerprint)
+        if running != fingerprint:
+            return self._conflict(spec)
+        try:
+            result = await self._inflight.do(key, execute)
+        finally:
+            self._idempotent_inflight.pop(key, None)
+        # 시간 초과도 기록: 백그라운드에서 완료됐을 수 있으므로 재실행하지 않음
+        if result.success or result.timed_out:
+            self._idempotent.put(key, result, self.idempotency_ttl, fingerprint)
+        self._sync_size()
+        return result
+
+    def _conflict(self, spec: ToolSpec) -> ToolResult:
+        self.stats.idempotency_conflicts += 1
+        return ToolResult(spec.name, False, error="같은 멱등 키가 다른 파라미터로 사용되었습니다")
+
+    def invalidate(self, tool_name: Optional[str] = None) -> int:
+        """Tool 결과 캐시 비우기 (tool_name 없으면 전체)"""
+        removed = self._results.invalidate(f"{tool_name}:" if tool_name else "")
+        self._sync_size()
+        return removed
+
+    def _sync_size(self) -> None:
+        self.stats.entries = len(self._results) + len(self._idempotent)
+        self.stats.bytes = self._results.bytes + self._idempotent.bytes
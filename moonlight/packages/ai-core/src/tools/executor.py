@@ -0,0 +1,270 @@
+"""
+Tool Executor
+
+Tool 실행 엔진
+- async 핸들러는 이벤트 루프에서, 동기 핸들러는 제한된 스레드/프로세스 풀에서 실행
+- Tool별 제한 시간 (ToolSpec.timeout, 벌크헤드 대기 시간 포함)
+- Tool별 벌크헤드 (ToolSpec.max_concurrency) - 느린 GitHub 호출이 검색을 막지 않도록
+- 한 응답의 독립적인 Tool 호출 여러 개를 병렬 실행 (execute_many)
+- 결과 캐시 / 멱등 키 (ToolResultCache, 선택)
+
+동기 핸들러는 시간 초과 후에도 스레드가 끝날 때까지 벌크헤드 슬롯을 점유합니다
+(멈춘 호출이 풀을 잠식하지 않도록).
+"""
+
+import asyncio
+import concurrent.futures
+import functools
+import os
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional
+
+from .registry import ToolRegistry, ToolSpec, get_tool_registry
+from ..config import Settings, get_settings
+from ..metrics.histogram import Histogram
+from ..metrics.tracing import tracer
+
+if TYPE_CHECKING:
+    from .cache import ToolResultCache
+
+_JSON_TYPES = (dict, list, str, int, float, bool, type(None))
+
+
+@dataclass
+class ToolCall:
+    """실행할 Tool 호출"""
+    tool_name: str
+    parameters: dict = field(default_factory=dict)
+    idempotency_key: Optional[str] = None
+
+
+@dataclass
+class ToolResult:
+    """Tool 실행 결과"""
+    tool_name: str
+    success: bool
+    output: Any = None
+    error: Optional[str] = None
+    timed_out: bool = False
+    execution_time_ms: int = 0
+    cached: bool = False  # 캐시 / 멱등 키로 재사용된 결과
+
+    def as_log(self) -> dict:
+        """tool_logs.result 용 JSON"""
+        output = self.output if isinstance(self.output, _JSON_TYPES) else repr(self.output)
+        return {"output": output, "error": self.error, "timed_out": self.timed_out, "cached": self.cached}
+
+
+@dataclass
+class ExecutorStats:
+    """실행 통계"""
+    calls: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    timed_out: int = 0
+    in_flight: int = 0
+    max_in_flight: int = 0
+
+    def as_dict(self) -> dict:
+        return dict(self.__dict__)
+
+
+class ToolExecutor:
+    """
+    Tool 실행 엔진
+
+    Usage:
+        executor = ToolExecutor(registry)
+        result = await executor.execute("google_search", {"query": "날씨"})
+        results = await executor.execute_many([ToolCall(...), ToolCall(...)])
+    """
+
+    def __init__(
+        self,
+        registry: Optional[ToolRegistry] = None,
+        default_timeout: float = 10.0,
+        default_concurrency: int = 8,
+        thread_workers: int = 8,
+        process_workers: int = 0,
+        cache: Optional["ToolResultCache"] = None,
+    ):
+        self.registry = registry or get_tool_registry()
+        self.cache = cache
+        self.default_timeout = default_timeout
+        self.default_concurrency = default_concurrency
+        self.thread_workers = thread_workers
+        self.process_workers = process_workers or (os.cpu_count() or 1)
+
+        self._threads: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._processes: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        self._bulkheads: dict[str, asyncio.Semaphore] = {}
+
+        self.stats = ExecutorStats()
+        self.latency = Histogram("tool_execution_ms", "Tool 실행 시간 (ms)")
+
+    @classmethod
+    def from_settings(cls, settings: Settings, registry: Optional[ToolRegistry] = None) -> "ToolExecutor":
+        from .cache import ToolResultCache
+
+        return cls(
+            registry=registry,
+            default_timeout=settings.tools_default_timeout,
+            default_concurrency=settings.tools_default_concurrency,
+            thread_workers=settings.tools_thread_workers,
+            process_workers=settings.tools_process_workers,
+            cache=ToolResultCache.from_settings(settings) if settings.tools_cache_enabled else None,
+        )
+
+    async def execute(
+        self,
+        tool_name: str,
+        parameters: Optional[dict] = None,
+        scope: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> ToolResult:
+        """
+        Tool 하나 실행 (예외를 던지지 않고 ToolResult로 반환)
+
+        Args:
+            tool_name: Tool 이름
+            parameters: 검증된 파라미터 (핸들러 키워드 인자)
+            scope: 결과 캐시 범위 (사용자 ID)
+            idempotency_key: 같은 키로 이미 실행했으면 실행하지 않고 이전 결과 반환
+        """
+        parameters = parameters or {}
+        spec = self.registry.get(tool_name)
+        if spec is None or not spec.enabled:
+            return self._finish(ToolResult(tool_name, False, error=f"사용할 수 없는 Tool: {tool_name}"), 0.0)
+
+        with tracer.span("tool", tool=tool_name) as span:
+            if self.cache is None:
+                result = await self._execute(spec, parameters)
+            else:
+                result = await self.cache.run(
+                    spec,
+                    parameters,
+                    lambda: self._execute(spec, parameters),
+                    scope=scope,
+                    idempotency_key=idempotency_key,
+                )
+            if span is not None:
+                span.set("tool.cached", result.cached)
+                span.set("tool.success", result.success)
+            return result
+
+    async def execute_many(self, calls: Iterable[ToolCall], scope: Optional[str] = None) -> list[ToolResult]:
+        """독립적인 Tool 호출 병렬 실행 (입력 순서대로 결과 반환)"""
+        return list(await asyncio.gather(*(
+            self.execute(call.tool_name, call.parameters, scope, call.idempotency_key)
+            for call in calls
+        )))
+
+    async def _execute(self, spec: ToolSpec, parameters: dict) -> ToolResult:
+        tool_name = spec.name
+        try:
+            handler = self.registry.handler(tool_name)
+        except Exception as e:
+            return self._finish(ToolResult(tool_name, False, error=f"핸들러 로딩 실패: {e}"), 0.0)
+        if handler is None:
+            return self._finish(ToolResult(tool_name, False, error=f"핸들러가 없는 Tool: {tool_name}"), 0.0)
+
+        timeout = spec.timeout or self.default_timeout
+        self.stats.in_flight += 1
+        self.stats.max_in_flight = max(self.stats.max_in_flight, self.stats.in_flight)
+        started = time.perf_counter()
+        try:
+            output = await asyncio.wait_for(self._run(spec, handler, parameters), timeout)
+            result = ToolResult(tool_name, True, output=output)
+        except asyncio.TimeoutError:
+            result = ToolResult(tool_name, False, error=f"{timeout:g}초 안에 완료되지 않았습니다", timed_out=True)
+        except Exception as e:
+            result = ToolResult(tool_name, False, error=f"{type(e).__name__}: {e}")
+        finally:
+            self.stats.in_flight -= 1
+        return self._finish(result, started)
+
+    async def _run(self, spec: ToolSpec, handler: Callable, parameters: dict) -> Any:
+        bulkhead = self._bulkhead(spec)
+        await bulkhead.acquire()
+
+        if asyncio.iscoroutinefunction(handler):
+            try:
+                return await handler(**parameters)
+            finally:
+                bulkhead.release()
+
+        # 동기 핸들러: 풀 작업이 실제로 끝날 때 슬롯 반환 (취소/시간 초과와 무관)
+        loop = asyncio.get_running_loop()
+        try:
+            future = self._pool(spec).submit(functools.partial(handler, **parameters))
+        except BaseException:
+            bulkhead.release()
+            raise
+        future.add_done_callback(lambda _: _release_threadsafe(loop, bulkhead))
+        return await asyncio.wrap_future(future)
+
+    def _bulkhead(self, spec: ToolSpec) -> asyncio.Semaphore:
+        bulkhead = self._bulkheads.get(spec.name)
+        if bulkhead is None:
+            bulkhead = asyncio.Semaphore(spec.max_concurrency or self.default_concurrency)
+            self._bulkheads[spec.name] = bulkhead
+        return bulkhead
+
+    def _pool(self, spec: ToolSpec) -> concurrent.futures.Executor:
+        """실행 풀 (첫 사용 시 생성)"""
+        if spec.blocking == "process":
+            if self._processes is None:
+                self._processes = concurrent.futures.ProcessPoolExecutor(self.process_workers)
+            return self._processes
+        if self._threads is None:
+            self._threads = concurrent.futures.ThreadPoolExecutor(
+                self.thread_workers, thread_name_prefix="moonlight-tool"
+            )
+        return self._threads
+
+    def _finish(self, result: ToolResult, started: float) -> ToolResult:
+        if started:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            result.execution_time_ms = int(elapsed_ms)
+            self.latency.observe(elapsed_ms)
+        self.stats.calls += 1
+        if result.success:
+            self.stats.succeeded += 1
+        else:
+            self.stats.failed += 1
+            if result.timed_out:
+                self.stats.timed_out += 1
+        return result
+
+    def close(self) -> None:
+        """풀 종료 (진행 중인 동기 작업은 기다리지 않음)"""
+        for pool in (self._threads, self._processes):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+        self._threads = self._processes = None
+
+
+def _release_threadsafe(loop: asyncio.AbstractEventLoop, bulkhead: asyncio.Semaphore) -> None:
+    try:
+        loop.call_soon_threadsafe(bulkhead.release)
+    except RuntimeError:
+        pass  # 루프 종료 후 완료된 작업
+
+
+_executor: Optional[ToolExecutor] = None
+
+
+def get_tool_executor() -> ToolExecutor:
+    """앱 단위 Tool 실행 엔진 (첫 호출 시 생성)"""
+    global _executor
+    if _executor is None:
+        _executor = ToolExecutor.from_settings(get_settings())
+    return _executor
+
+
+def close_tool_executor() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.close()
+        _executor = None
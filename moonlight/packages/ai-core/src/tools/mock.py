@@ -0,0 +1,10 @@
+"""
+Mock Tool Handlers
+
+실제 연동 (Gmail, Calendar, GitHub 등) 전까지 기본 Tool이 사용하는 핸들러
+"""
+
+
+async def echo(**parameters) -> dict:
+    """받은 파라미터를 그대로 돌려줌"""
+    return {"mock": True, "parameters": parameters}
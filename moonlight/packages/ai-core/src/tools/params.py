@@ -0,0 +1,37 @@
+"""
+Tool Parameters
+
+기본 Tool 파라미터 Pydantic 모델
+- ToolSpec.params 에 "src.tools.params:SendEmailParams" 형태로 지정 (첫 사용 시 import)
+"""
+
+from typing import Optional
+
+from pydantic import BaseModel, EmailStr
+
+
+class SendEmailParams(BaseModel):
+    """이메일 전송 파라미터"""
+    to: EmailStr
+    subject: str
+    body: str
+
+
+class GoogleSearchParams(BaseModel):
+    """검색 파라미터"""
+    query: str
+
+
+class CalendarEventParams(BaseModel):
+    """캘린더 이벤트 파라미터"""
+    title: str
+    start_time: Optional[str] = None
+    end_time: Optional[str] = None
+    description: Optional[str] = None
+
+
+class GitHubIssueParams(BaseModel):
+    """GitHub 이슈 파라미터"""
+    repo: str
+    title: str
+    body: Optional[str] = None
@@ -0,0 +1,333 @@
+"""
+Tool Registry
+
+Tool 메타데이터의 단일 소스 (Intent Parser / Validator / Orchestrator / API)
+- 시작 시에는 메타데이터(ToolSpec)만 로딩
+  - 기본 Tool (builtin.py)
+  - entry points 그룹 "moonlight.tools" (가벼운 스펙 모듈만 import)
+  - 매니페스트 디렉터리의 *.yaml
+- 파라미터 모델 / 핸들러는 "module:attr" 문자열로 두고 첫 사용 시 import
+- JSON 스키마 / function calling 스키마 / 파라미터 검증기는 한 번 생성 후 캐시
+"""
+
+import importlib
+import time
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from importlib.metadata import entry_points
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+import yaml
+from pydantic import BaseModel
+
+from .validation import CompiledValidator
+from ..config import Settings, get_settings
+
+ENTRY_POINT_GROUP = "moonlight.tools"
+
+# libyaml 바인딩이 있으면 C 로더 사용 (순수 파이썬 대비 ~10배)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@dataclass(frozen=True)
+class ToolSpec:
+    """
+    Tool 메타데이터 (import 비용 없음)
+
+    params / handler 는 "package.module:attr" 문자열입니다.
+    handler 는 async 함수 (이벤트 루프) 또는 동기 함수 (스레드/프로세스 풀) 이며
+    검증된 파라미터를 키워드 인자로 받습니다.
+    """
+    name: str
+    description: str
+    category: str = "general"
+    keywords: tuple[str, ...] = ()
+    high_risk: bool = False  # 실행 전 사용자 확인 필요
+    confirmation: Optional[str] = None  # 확인 문구용 동작 설명 (예: "이메일을 전송")
+    params: Optional[str] = None
+    handler: Optional[str] = None
+    enabled: bool = True
+    timeout: Optional[float] = None  # 실행 제한 시간 (초, None이면 기본값)
+    max_concurrency: Optional[int] = None  # 동시 실행 수 벌크헤드 (None이면 기본값)
+    blocking: str = "thread"  # 동기 핸들러 실행 위치: thread | process
+    cache_ttl: Optional[float] = None  # 결과 캐시 TTL (초, 읽기 전용 Tool만, None이면 캐시 안 함)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ToolSpec":
+        """매니페스트 항목 → ToolSpec"""
+        data = dict(data)
+        data["keywords"] = tuple(data.get("keywords") or ())
+        known = cls.__dataclass_fields__.keys()
+        return cls(**{k: v for k, v in data.items() if k in known})
+
+
+@dataclass
+class RegistryStats:
+    """레지스트리 통계"""
+    discovery_ms: float = 0.0
+    discovered: int = 0
+    discovery_errors: int = 0
+    lazy_imports: int = 0
+    schema_builds: int = 0
+    validator_builds: int = 0
+
+    def as_dict(self) -> dict:
+        return dict(self.__dict__)
+
+
+def import_string(path: str) -> Any:
+    """'package.module:attr' → 객체"""
+    module_name, _, attr = path.partition(":")
+    if not attr:
+        raise ValueError(f"'module:attr' 형식이어야 합니다: {path}")
+    target: Any = importlib.import_module(module_name)
+    for part in attr.split("."):
+        target = getattr(target, part)
+    return target
+
+
+class ToolRegistry:
+    """
+    Tool 레지스트리
+
+    Usage:
+        registry = ToolRegistry(BUILTIN_TOOLS)
+        registry.discover()
+        model = registry.param_model("send_email")  # 첫 호출 시 import
+    """
+
+    def __init__(self, specs: Iterable[ToolSpec] = ()):
+        self._specs: dict[str, ToolSpec] = {}
+        self._param_models: dict[str, Optional[type[BaseModel]]] = {}
+        self._handlers: dict[str, Callable] = {}
+        self._schemas: dict[str, dict] = {}
+        self._validators: dict[str, Optional[CompiledValidator]] = {}
+        self._function_schemas: Optional[list[dict]] = None
+        self.version = 0  # 변경 시 증가 (의존 캐시 무효화용)
+        self.stats = RegistryStats()
+
+        for spec in specs:
+            self.register(spec)
+
+    # ------------------------------------------------------------------
+    # 등록 / 조회
+    # ------------------------------------------------------------------
+
+    def register(self, spec: ToolSpec, override: bool = False) -> None:
+        if spec.name in self._specs and not override:
+            raise ValueError(f"이미 등록된 Tool: {spec.name}")
+        self._specs[spec.name] = spec
+        self._invalidate(spec.name)
+
+    def unregister(self, name: str) -> None:
+        if self._specs.pop(name, None) is not None:
+            self._invalidate(name)
+
+    def get(self, name: Optional[str]) -> Optional[ToolSpec]:
+        return self._specs.get(name) if name else None
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._specs
+
+    def __iter__(self) -> Iterator[ToolSpec]:
+        return iter(self._specs.values())
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+    def enabled(self) -> list[ToolSpec]:
+        return [spec for spec in self._specs.values() if spec.enabled]
+
+    def is_high_risk(self, name: Optional[str]) -> bool:
+        spec = self.get(name)
+        return spec is not None and spec.high_risk
+
+    def intent_tools(self) -> dict[str, dict]:
+        """Intent Parser 형식 {name: {"description", "keywords"}}"""
+        return {
+            spec.name: {"description": spec.description, "keywords": list(spec.keywords)}
+            for spec in self.enabled()
+        }
+
+    # ------------------------------------------------------------------
+    # 지연 로딩 + 캐시
+    # ------------------------------------------------------------------
+
+    def param_model(self, name: str) -> Optional[type[BaseModel]]:
+        """파라미터 검증 모델 (첫 호출 시 import, 없으면 None)"""
+        if name in self._param_models:
+            return self._param_models[name]
+
+        spec = self.get(name)
+        model = None
+        if spec is not None and spec.params:
+            model = import_string(spec.params)
+            self.stats.lazy_imports += 1
+        self._param_models[name] = model
+        return model
+
+    def handler(self, name: str) -> Optional[Callable]:
+        """실행 핸들러 (첫 호출 시 import, 없으면 None)"""
+        cached = self._handlers.get(name)
+        if cached is not None:
+            return cached
+
+        spec = self.get(name)
+        if spec is None or not spec.handler:
+            return None
+        handler = import_string(spec.handler)
+        self.stats.lazy_imports += 1
+        self._handlers[name] = handler
+        return handler
+
+    def validator(self, name: str) -> Optional[CompiledValidator]:
+        """컴파일된 파라미터 검증기 (캐시, 파라미터 모델이 없으면 None)"""
+        if name in self._validators:
+            return self._validators[name]
+
+        model = self.param_model(name)
+        validator = CompiledValidator(name, model) if model is not None else None
+        if validator is not None:
+            self.stats.validator_builds += 1
+        self._validators[name] = validator
+        return validator
+
+    def compile_validators(self) -> int:
+        """활성 Tool의 검증기 미리 컴파일 (lifespan, 파라미터 모델 import 포함)"""
+        compiled = 0
+        for spec in self.enabled():
+            try:
+                compiled += self.validator(spec.name) is not None
+            except Exception as e:
+                print(f"Tool 검증기 컴파일 실패 ({spec.name}): {e}")
+        return compiled
+
+    def json_schema(self, name: str) -> dict:
+        """파라미터 JSON 스키마 (캐시)"""
+        schema = self._schemas.get(name)
+        if schema is None:
+            model = self.param_model(name)
+            schema = model.model_json_schema() if model else {"type": "object", "properties": {}}
+            self._schemas[name] = schema
+            self.stats.schema_builds += 1
+        return schema
+
+    def function_schemas(self) -> list[dict]:
+        """OpenAI 호환 function calling tools 목록 (캐시)"""
+        if self._function_schemas is None:
+            self._function_schemas = [
+                {
+                    "type": "function",
+                    "function": {
+                        "name": spec.name,
+                        "description": spec.description,
+                        "parameters": self.json_schema(spec.name),
+                    },
+                }
+                for spec in self.enabled()
+            ]
+        return self._function_schemas
+
+    def _invalidate(self, name: str) -> None:
+        self._param_models.pop(name, None)
+        self._handlers.pop(name, None)
+        self._schemas.pop(name, None)
+        self._validators.pop(name, None)
+        self._function_schemas = None
+        self.version += 1
+
+    # ------------------------------------------------------------------
+    # 디스커버리 (메타데이터만)
+    # ------------------------------------------------------------------
+
+    def discover(
+        self,
+        group: Optional[str] = ENTRY_POINT_GROUP,
+        manifest_dir: Optional[str] = None,
+        disabled: Iterable[str] = (),
+    ) -> int:
+        """
+        외부 Tool 탐색
+
+        Args:
+            group: entry points 그룹 (값은 ToolSpec, ToolSpec 목록 또는 이를 반환하는 함수)
+            manifest_dir: *.yaml 매니페스트 디렉터리 ({"tools": [ToolSpec 필드...]})
+            disabled: 비활성화할 Tool 이름
+
+        Returns:
+            int: 새로 등록된 Tool 수
+        """
+        started = time.perf_counter()
+        found: list[ToolSpec] = []
+
+        if group:
+            for ep in entry_points(group=group):
+                try:
+                    found.extend(self._as_specs(ep.load()))
+                except Exception as e:
+                    self.stats.discovery_errors += 1
+                    print(f"Tool entry point 로딩 오류 ({ep.name}): {e}")
+
+        if manifest_dir:
+            for path in sorted(Path(manifest_dir).glob("*.yaml")):
+                try:
+                    found.extend(self._read_manifest(path))
+                except Exception as e:
+                    self.stats.discovery_errors += 1
+                    print(f"Tool 매니페스트 오류 ({path.name}): {e}")
+
+        disabled = set(disabled)
+        for spec in found:
+            if spec.name in disabled:
+                spec = replace(spec, enabled=False)
+            self.register(spec, override=True)
+
+        for name in disabled & self._specs.keys():
+            spec = self._specs[name]
+            if spec.enabled:
+                self.register(replace(spec, enabled=False), override=True)
+
+        self.stats.discovered += len(found)
+        self.stats.discovery_ms += (time.perf_counter() - started) * 1000
+        return len(found)
+
+    @staticmethod
+    def _as_specs(value: Any) -> list[ToolSpec]:
+        if callable(value) and not isinstance(value, ToolSpec):
+            value = value()
+        if isinstance(value, ToolSpec):
+            return [value]
+        return [v if isinstance(v, ToolSpec) else ToolSpec.from_dict(v) for v in value]
+
+    @staticmethod
+    def _read_manifest(path: Path) -> list[ToolSpec]:
+        with open(path, encoding="utf-8") as f:
+            data = yaml.load(f, Loader=_YAML_LOADER) or {}
+        return [ToolSpec.from_dict(item) for item in data.get("tools", [])]
+
+
+def create_tool_registry(settings: Optional[Settings] = None) -> ToolRegistry:
+    """기본 Tool + 설정에 따른 디스커버리"""
+    from .builtin import BUILTIN_TOOLS
+
+    settings = settings or get_settings()
+    registry = ToolRegistry(BUILTIN_TOOLS)
+    registry.discover(
+        group=settings.tools_entry_point_group or None,
+        manifest_dir=settings.tools_manifest_dir,
+        disabled=settings.tools_disabled,
+    )
+
+    if registry.stats.discovery_ms > settings.tools_discovery_budget_ms:
+        print(
+            f"Tool 디스커버리가 예산을 초과했습니다: "
+            f"{registry.stats.discovery_ms:.1f}ms > {settings.tools_discovery_budget_ms}ms"
+        )
+    return registry
+
+
+@lru_cache
+def get_tool_registry() -> ToolRegistry:
+    """Tool 레지스트리 싱글톤"""
+    return create_tool_registry()
@@ -0,0 +1,112 @@
+"""
+Tool Parameter Validation
+
+Tool별로 한 번 컴파일하는 파라미터 검증기 (Validator Agent의 fast path)
+- 필수 필드 집합 / 선언 순서를 미리 계산 → 누락은 Pydantic 호출 전에 집합 차로 판단
+- Pydantic 검증은 모델의 pydantic-core 검증기를 직접 호출 (생성자 / errors() 순회 없이)
+- 중첩 모델이 없는 평면 모델은 model_dump 대신 필드 dict 복사
+- 명확화 질문은 누락 조합별로 미리 생성 (필수 필드가 많으면 첫 사용 시 생성 후 캐시)
+"""
+
+from itertools import combinations
+from typing import Any, Optional, get_args
+
+from pydantic import BaseModel, ValidationError
+
+# 명확화 질문에 쓰는 필드 표시 이름
+FIELD_LABELS = {
+    "to": "받는 사람 이메일",
+    "subject": "제목",
+    "body": "내용",
+    "query": "검색어",
+    "title": "제목",
+    "start_time": "시작 시간",
+    "end_time": "종료 시간",
+    "repo": "저장소(owner/name)",
+}
+
+FORMAT_ERROR = "주인님, 입력 형식이 올바르지 않은 것 같아요."
+
+# 이 개수 이하의 필수 필드는 모든 누락 조합의 질문을 미리 만듦 (2^n - 1개)
+PRECOMPUTE_MAX_REQUIRED = 6
+
+
+def clarification_message(labels: list[str]) -> str:
+    return f"주인님, {', '.join(labels)}을(를) 알려주시겠어요?"
+
+
+def is_blank(value: Any) -> bool:
+    """LLM이 모르는 값을 채우는 방식 (null / 빈 문자열) → 누락으로 취급"""
+    return value is None or (isinstance(value, str) and not value.strip())
+
+
+class CompiledValidator:
+    """Tool 하나의 파라미터 검증기"""
+
+    __slots__ = ("tool_name", "model", "required", "order", "_validate", "_flat", "_clarifications")
+
+    def __init__(self, tool_name: str, model: type[BaseModel]):
+        self.tool_name = tool_name
+        self.model = model
+        self._validate = model.__pydantic_validator__.validate_python
+        self._flat = not any(_has_model(field.annotation) for field in model.model_fields.values())
+        self.order = tuple(model.model_fields)
+        self.required = frozenset(name for name, field in model.model_fields.items() if field.is_required())
+
+        self._clarifications: dict[frozenset, str] = {}
+        required = [name for name in self.order if name in self.required]
+        if len(required) <= PRECOMPUTE_MAX_REQUIRED:
+            for size in range(1, len(required) + 1):
+                for subset in combinations(required, size):
+                    self._clarifications[frozenset(subset)] = self._build_clarification(subset)
+
+    def missing(self, parameters: dict) -> frozenset:
+        """누락된 필수 필드 (값이 비어 있어도 누락)"""
+        return self.required.difference(_present(parameters))
+
+    def clarification(self, missing: frozenset) -> str:
+        message = self._clarifications.get(missing)
+        if message is None:
+            message = self._build_clarification([name for name in self.order if name in missing])
+            self._clarifications[missing] = message
+        return message
+
+    def ordered(self, missing: frozenset) -> tuple[str, ...]:
+        """누락 필드 (모델 선언 순서)"""
+        return tuple(name for name in self.order if name in missing)
+
+    def validate(self, parameters: dict) -> tuple[Optional[dict], frozenset, Optional[str]]:
+        """
+        검증
+
+        Returns:
+            (검증된 파라미터 | None, 누락 필드, 명확화 질문 | None)
+        """
+        parameters = _present(parameters)
+        missing = self.required.difference(parameters)
+        if missing:
+            return None, missing, self.clarification(missing)
+        try:
+            validated = self._validate(parameters)
+        except ValidationError:
+            return None, missing, FORMAT_ERROR
+        return (dict(validated.__dict__) if self._flat else validated.model_dump()), missing, None
+
+    @staticmethod
+    def _build_clarification(fields) -> str:
+        return clarification_message([FIELD_LABELS.get(name, name) for name in fields])
+
+
+def _present(parameters: dict) -> dict:
+    """비어 있는 값 제거 (대부분 그대로 반환)"""
+    for value in parameters.values():
+        if is_blank(value):
+            return {key: value for key, value in parameters.items() if not is_blank(value)}
+    return parameters
+
+
+def _has_model(annotation: Any) -> bool:
+    """타입 (Optional / list 등 포함)에 BaseModel이 들어 있는지"""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return True
+    return any(_has_model(arg) for arg in get_args(annotation))
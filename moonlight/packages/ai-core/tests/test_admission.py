@@ -0,0 +1,45 @@
+import pytest
+
+from src.admission.buckets import BucketSpec, InMemoryBucketStore
+from src.admission.controller import AdmissionController, AdmissionRejected
+
+
+async def test_global_rejection_does_not_consume_user_request_token():
+    store = InMemoryBucketStore()
+    controller = AdmissionController(
+        store,
+        user_requests=BucketSpec(rate=0.001, capacity=2),
+        global_requests=BucketSpec(rate=0.001, capacity=1),
+        queue_size=0,
+    )
+    try:
+        await controller.admit("other")  # 전체 버킷 소진
+
+        for _ in range(3):
+            with pytest.raises(AdmissionRejected) as rejected:
+                await controller.admit("u1")
+            assert rejected.value.reason == "queue_full"
+
+        assert await store.level("requests:u1", controller.user_requests) == pytest.approx(2, abs=0.01)
+        assert controller.stats.refunded_user_requests == 3
+        assert controller.stats.rejected_user_rate == 0
+    finally:
+        await controller.close()
+
+
+async def test_global_token_budget_checked_before_user_request_token():
+    store = InMemoryBucketStore()
+    controller = AdmissionController(
+        store,
+        user_requests=BucketSpec(rate=0.001, capacity=1),
+        global_tokens=BucketSpec.per_minute(100),
+    )
+    try:
+        await controller.charge("other", 200)  # 전체 예산 부채
+
+        with pytest.raises(AdmissionRejected) as rejected:
+            await controller.admit("u1")
+        assert rejected.value.reason == "global_tokens"
+        assert await store.level("requests:u1", controller.user_requests) == pytest.approx(1, abs=0.01)
+    finally:
+        await controller.close()
@@ -0,0 +1,19 @@
+from src.constitution.loader import get_constitution
+from src.memory.context import ContextAssembler
+
+
+def test_triggered_principles_do_not_change_system_prefix():
+    constitution = get_constitution().current
+    assembler = ContextAssembler()
+
+    calm = "오늘 날씨 어때?"
+    tired = "오늘 회사에서 너무 지쳤어"
+    assert constitution.focus_for(calm) is None
+    focus = constitution.focus_for(tired)
+    assert focus
+
+    plain = assembler.assemble("s", constitution.system_prompt, calm).messages
+    focused = assembler.assemble("s", constitution.system_prompt, tired, focus=focus).messages
+
+    assert plain[0] == focused[0] == {"role": "system", "content": constitution.system_prompt}
+    assert focused[-2:] == [{"role": "system", "content": focus}, {"role": "user", "content": tired}]
@@ -0,0 +1,55 @@
+import asyncio
+import time
+
+import numpy as np
+import pytest
+
+from src.memory.embedding_service import EmbeddingService
+
+
+class FakeModel:
+    model_name = "fake"
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        time.sleep(0.01)
+        return np.ones((len(texts), 4), dtype=np.float32)
+
+
+async def test_stop_finishes_queued_requests_then_refuses_new_work():
+    service = EmbeddingService(model=FakeModel(), max_batch_size=2, max_wait_ms=1)
+    await service.start()
+
+    queued = [asyncio.create_task(service.embed(str(i))) for i in range(5)]
+    await asyncio.sleep(0)
+    await asyncio.wait_for(service.stop(), 5)
+
+    vectors = await asyncio.wait_for(asyncio.gather(*queued), 1)
+    assert all(v.shape == (4,) for v in vectors)
+    with pytest.raises(RuntimeError):
+        await service.embed("late")
+
+
+async def test_stop_fails_requests_left_behind_the_sentinel():
+    service = EmbeddingService(model=FakeModel())
+    await service.start()
+
+    # 종료 신호 뒤에 남은 요청 (stop 과 경쟁한 경우)
+    service._queue.put_nowait(None)
+    orphan = asyncio.get_running_loop().create_future()
+    service._queue.put_nowait(("late", orphan, time.perf_counter()))
+    await asyncio.wait_for(service.stop(), 5)
+
+    with pytest.raises(RuntimeError):
+        await asyncio.wait_for(orphan, 1)
+
+
+async def test_start_after_stop_accepts_work_again():
+    service = EmbeddingService(model=FakeModel())
+    await service.start()
+    await service.stop()
+
+    await service.start()
+    try:
+        assert (await service.embed("again")).shape == (4,)
+    finally:
+        await service.stop()
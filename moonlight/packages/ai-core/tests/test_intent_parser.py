@@ -0,0 +1,17 @@
+from src.agents.intent_parser import IntentParserAgent
+from src.tools.registry import ToolRegistry, ToolSpec
+
+
+def test_keyword_automaton_follows_registry_changes():
+    registry = ToolRegistry([ToolSpec(name="google_search", description="검색", keywords=("검색",))])
+    parser = IntentParserAgent(llm=None, registry=registry)
+
+    assert parser.keyword_match("날씨 검색해줘").tool_name == "google_search"
+    assert parser.keyword_match("회의 일정 잡아줘") is None
+
+    registry.register(ToolSpec(name="create_event", description="일정 생성", keywords=("일정",)))
+    assert parser.keyword_match("회의 일정 잡아줘").tool_name == "create_event"
+
+    registry.unregister("google_search")
+    assert parser.keyword_match("날씨 검색해줘") is None
+    assert "google_search" not in parser.AVAILABLE_TOOLS
@@ -0,0 +1,91 @@
+import pytest
+
+from src.agents.orchestrator import AgentOrchestrator
+from src.llm.json_extract import StreamingJSONExtractor, extract_json
+from src.memory.pending import InMemoryPendingStore
+from src.memory.session import InMemorySessionStore, SessionMemory
+
+
+def _feed_all(chunks: list[str]) -> tuple[str, StreamingJSONExtractor]:
+    extractor = StreamingJSONExtractor()
+    text = ""
+    for chunk in chunks:
+        text += extractor.feed(chunk)
+        if extractor.done:
+            break
+    return text + extractor.close(), extractor
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ('{"tool": "google_search"}', {"tool": "google_search"}),
+        ('검색할게요.\n```json\n{"tool": "google_search",}\n```', {"tool": "google_search"}),
+        ('{"done": True, "value": None}', {"done": True, "value": None}),
+        ("JSON 없음", None),
+    ],
+)
+def test_extract_json(text, expected):
+    assert extract_json(text) == expected
+
+
+def test_streaming_extractor_holds_back_fenced_json():
+    text, extractor = _feed_all(["잠깐만요. ``", '`json\n{"tool": "go', 'ogle_search", "q": "}"}', "\n```"])
+
+    assert text == "잠깐만요. "
+    assert extractor.value == {"tool": "google_search", "q": "}"}
+
+
+def test_streaming_extractor_keeps_rest_of_closing_chunk():
+    extractor = StreamingJSONExtractor()
+
+    assert extractor.feed('예시는 {"a": 5} 이렇게') == "예시는 "
+    assert extractor.done and extractor.value == {"a": 5}
+    assert extractor.tail == " 이렇게"
+
+
+def test_streaming_extractor_returns_unfinished_json_on_close():
+    text, extractor = _feed_all(['앞 {"tool": "goo'])
+
+    assert text == '앞 {"tool": "goo'
+    assert not extractor.done
+
+
+class ChunkedLLM:
+    """chat_stream 만 흉내내는 가짜 LLM"""
+
+    default_model = "mock"
+
+    def __init__(self, chunks: list[str]):
+        self.chunks = chunks
+
+    async def chat_stream(self, messages, **kwargs):
+        for chunk in self.chunks:
+            yield chunk
+
+
+async def _stream_json(chunks: list[str]) -> tuple[str, list]:
+    orchestrator = AgentOrchestrator(
+        llm=ChunkedLLM(chunks),
+        sessions=SessionMemory(InMemorySessionStore()),
+        pending=InMemoryPendingStore(),
+    )
+    intents: list = []
+    text = ""
+    async for delta in orchestrator._stream_json_tool_calls([{"role": "user", "content": "?"}], intents):
+        text += delta
+    return text, intents
+
+
+async def test_json_stream_keeps_text_after_non_tool_object():
+    text, intents = await _stream_json(['예시는 {"a": 5} 이렇게', " 쓰면 돼요"])
+
+    assert text == '예시는 {"a": 5} 이렇게 쓰면 돼요'
+    assert intents == []
+
+
+async def test_json_stream_finds_tool_call_after_non_tool_object_in_same_chunk():
+    text, intents = await _stream_json(['예시 {"a": 5} 그리고 {"tool": "google_search", "parameters": {"query": "날씨"}}'])
+
+    assert text == '예시 {"a": 5} 그리고 '
+    assert [(i.tool_name, i.parameters) for i in intents] == [("google_search", {"query": "날씨"})]
@@ -0,0 +1,93 @@
+import random
+
+from src.agents.keyword_matcher import KeywordMatcher
+
+TOOLS = {
+    "get_calendar": {"keywords": ["일정", "캘린더", "스케줄"]},
+    "add_calendar_event": {"keywords": ["일정 추가", "일정 등록", "약속 잡아"]},
+    "google_search": {"keywords": ["검색", "찾아"]},
+    "no_keywords": {"description": "키워드 없음"},
+}
+
+
+def _naive(keywords: dict[str, list[str]], text: str) -> set[tuple]:
+    text = text.lower()
+    found = set()
+    for tool_name, words in keywords.items():
+        for word in words:
+            word = word.lower()
+            start = text.find(word)
+            while word and start != -1:
+                found.add((tool_name, word, start, start + len(word)))
+                start = text.find(word, start + 1)
+    return found
+
+
+def test_find_all_reports_overlapping_matches_with_positions():
+    matcher = KeywordMatcher({"a": ["he", "she", "hers"], "b": ["his"]})
+
+    found = {(m.tool_name, m.keyword, m.start, m.end) for m in matcher.find_all("ushers")}
+
+    assert found == {("a", "she", 1, 4), ("a", "he", 2, 4), ("a", "hers", 2, 6)}
+
+
+def test_find_all_matches_naive_search():
+    rng = random.Random(0)
+    keywords = {
+        f"t{i}": ["".join(rng.choice("abc") for _ in range(rng.randint(1, 4))) for _ in range(3)]
+        for i in range(4)
+    }
+    matcher = KeywordMatcher(keywords)
+
+    for _ in range(200):
+        text = "".join(rng.choice("abcd") for _ in range(rng.randint(0, 30)))
+        found = {(m.tool_name, m.keyword, m.start, m.end) for m in matcher.find_all(text)}
+        assert found == _naive(keywords, text), text
+
+
+def test_matching_ignores_case():
+    matcher = KeywordMatcher({"google_search": ["Google"]})
+
+    assert matcher.best_match("GOOGLE에서 찾아줘").tool_name == "google_search"
+
+
+def test_from_tools_skips_tools_without_keywords():
+    matcher = KeywordMatcher.from_tools(TOOLS)
+
+    assert len(matcher) == 8
+    assert matcher.best_match("안녕하세요") is None
+
+
+def test_longest_keyword_wins_over_more_general_tool():
+    matcher = KeywordMatcher.from_tools(TOOLS)
+
+    best = matcher.best_match("내일 일정 추가해줘")
+
+    assert best.tool_name == "add_calendar_event"
+    assert best.keyword == "일정 추가"
+    assert best.confidence == 0.8
+
+
+def test_distinct_keywords_break_length_ties():
+    matcher = KeywordMatcher({"a": ["일정"], "b": ["검색", "찾아"]})
+
+    best = matcher.best_match("일정 검색해서 찾아줘")
+
+    assert best.tool_name == "b"
+    assert best.confidence == 0.75
+    assert [m.keyword for m in best.matches] == ["검색", "찾아"]
+
+
+def test_earliest_position_breaks_remaining_ties():
+    matcher = KeywordMatcher({"a": ["일정"], "b": ["검색"]})
+
+    assert matcher.best_match("검색 말고 일정").tool_name == "b"
+    assert matcher.best_match("일정 말고 검색").tool_name == "a"
+
+
+def test_confidence_is_capped():
+    matcher = KeywordMatcher({"a": ["일정 추가", "일정", "추가", "캘린더", "스케줄", "등록"]})
+
+    best = matcher.best_match("일정 추가 캘린더 스케줄 등록")
+
+    assert best.confidence == KeywordMatcher.MAX_CONFIDENCE
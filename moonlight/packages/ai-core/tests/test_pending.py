@@ -0,0 +1,78 @@
+import time
+
+from src.memory.pending import InMemoryPendingStore, PendingAction, TimerWheel
+
+
+def test_pending_action_roundtrip():
+    action = PendingAction([("github_issues", {"title": "버그"}, None)], "저장소를 알려주시겠어요?", 123.4567, [["repo"]])
+
+    decoded = PendingAction.decode(action.encode())
+
+    assert decoded.calls == [("github_issues", {"title": "버그"}, None)]
+    assert decoded.prompt == action.prompt and decoded.expires_at == 123.457
+    assert decoded.awaiting_slots and decoded.tool_names == ["github_issues"]
+
+
+def test_timer_wheel_returns_only_passed_slots():
+    wheel = TimerWheel(tick=1.0, size=8, now=100.0)
+    wheel.schedule("a", 101.2)  # 102번 칸
+    wheel.schedule("b", 103.0)
+    wheel.schedule("past", 50.0)  # 지난 시각 → 바로 다음 칸
+
+    assert [keys for _, keys in wheel.advance(101.5)] == [["past"]]
+    assert [keys for _, keys in wheel.advance(103.0)] == [["a"], ["b"]]
+    assert len(wheel) == 0
+
+
+def test_timer_wheel_far_deadline_shares_slot_with_next_lap():
+    wheel = TimerWheel(tick=1.0, size=4, now=0.0)
+    wheel.schedule("far", 6.0)  # 한 바퀴(4칸) 넘음 → 2번 칸
+
+    assert [(tick, keys) for tick, keys in wheel.advance(2.0)] == [(2, ["far"])]
+
+
+def _store(size: int = 8) -> tuple[InMemoryPendingStore, float]:
+    store = InMemoryPendingStore(tick=1.0, wheel_size=size)
+    now = time.time()
+    store._wheel = TimerWheel(1.0, size, now=now)
+    return store, now
+
+
+async def test_sweep_removes_only_expired_actions():
+    store, now = _store()
+    await store.put("soon", PendingAction([], "?", now + 2))
+    await store.put("later", PendingAction([], "?", now + 5))
+    await store.put("resumed", PendingAction([], "?", now + 2))
+    await store.pop("resumed")
+
+    assert store.sweep(now + 3) == 1
+    assert len(store) == 1
+    assert store.stats.as_dict() == {"created": 3, "resumed": 1, "expired": 1, "pending": 1}
+
+
+async def test_sweep_keeps_actions_beyond_one_lap():
+    store, now = _store(size=4)
+    await store.put("far", PendingAction([], "?", now + 10))
+
+    for step in range(1, 10):
+        assert store.sweep(now + step) == 0
+    assert store.sweep(now + 11) == 1
+    assert len(store) == 0
+
+
+async def test_replaced_action_uses_its_new_deadline():
+    store, now = _store()
+    await store.put("key", PendingAction([], "첫 질문", now + 2))
+    await store.put("key", PendingAction([], "새 질문", now + 6))
+
+    assert store.sweep(now + 4) == 0
+    assert (await store.pop("key")).prompt == "새 질문"
+    assert store.stats.pending == 0
+
+
+async def test_pop_of_expired_action_returns_none():
+    store, now = _store()
+    await store.put("key", PendingAction([], "?", now - 1))
+
+    assert await store.pop("key") is None
+    assert store.stats.expired == 1 and store.stats.pending == 0
@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+
+from src.llm.resilience import ResilientCaller
+
+
+class SlowUpstream:
+    """모델별 응답 지연 (초)을 두는 가짜 send"""
+
+    def __init__(self, delays: dict[str, float]):
+        self.delays = delays
+        self.started: list[str] = []
+        self.cancelled: list[str] = []
+
+    async def __call__(self, model: str, payload: dict) -> dict:
+        self.started.append(model)
+        try:
+            await asyncio.sleep(self.delays[model])
+        except asyncio.CancelledError:
+            self.cancelled.append(model)
+            raise
+        return {"model": model}
+
+
+def _hedging_caller() -> ResilientCaller:
+    caller = ResilientCaller(fallback_models=["b"], hedge_enabled=True, hedge_min_delay=0.05)
+    for _ in range(caller.latency("a").min_samples):
+        caller.latency("a").record(0.01)
+    return caller
+
+
+async def test_hedge_wins_when_primary_is_slow():
+    caller = _hedging_caller()
+    upstream = SlowUpstream({"a": 10.0, "b": 0.0})
+
+    result = await caller.call({"model": "a"}, upstream)
+
+    assert result == {"model": "b"}
+    assert caller.stats.hedges == 1 and caller.stats.hedge_wins == 1
+    await asyncio.sleep(0)
+    assert upstream.cancelled == ["a"]
+
+
+async def test_caller_cancelled_during_hedge_wait_cancels_primary():
+    caller = _hedging_caller()
+    upstream = SlowUpstream({"a": 10.0, "b": 10.0})
+
+    task = asyncio.create_task(caller.call({"model": "a"}, upstream))
+    await asyncio.sleep(0.01)  # 헤지 대기 중 (0.05초 전)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await asyncio.sleep(0)
+
+    assert upstream.started == ["a"]
+    assert upstream.cancelled == ["a"]
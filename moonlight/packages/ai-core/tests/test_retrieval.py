@@ -0,0 +1,144 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from src.memory.retrieval import HybridRetriever, LocalIndexStore, LocalVectorIndex
+
+DIM = 8
+
+
+def _unit(rng: np.random.Generator, n: int) -> np.ndarray:
+    vectors = rng.standard_normal((n, DIM)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+class FakeSource:
+    """pgvector 대신 메모리 행 (fetch 마다 잠깐 양보해 동시 갱신이 겹치도록)"""
+
+    def __init__(self, vectors: np.ndarray):
+        self.rows = [(i + 1, v, {"user_message": f"m{i + 1}"}) for i, v in enumerate(vectors)]
+        self.fetches = 0
+
+    def append(self, vectors: np.ndarray) -> None:
+        start = len(self.rows)
+        self.rows += [(start + i + 1, v, {"user_message": f"m{start + i + 1}"}) for i, v in enumerate(vectors)]
+
+    async def _rows(self, after_id: int):
+        self.fetches += 1
+        await asyncio.sleep(0.01)
+        rows = [row for row in self.rows if row[0] > after_id]
+        if not rows:
+            return [], np.empty((0, 0), dtype=np.float32), []
+        return [r[0] for r in rows], np.stack([r[1] for r in rows]), [r[2] for r in rows]
+
+    async def fetch_all(self, user_id):
+        return await self._rows(0)
+
+    async def fetch_since(self, user_id, after_id):
+        return await self._rows(after_id)
+
+    async def count(self, user_id):
+        return len(self.rows)
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float16", "int8"])
+def test_quantised_index_keeps_exact_top_results(dtype):
+    rng = np.random.default_rng(0)
+    vectors = _unit(rng, 200)
+    index = LocalVectorIndex(DIM, dtype, capacity=4)  # 추가하면서 용량 증가
+    index.add(list(range(1, 201)), vectors)
+
+    query = vectors[17]
+    positions, scores = index.search(query, k=5)
+
+    assert index.size == 200 and index.last_id == 200
+    assert positions[0] == 17
+    assert scores[0] == pytest.approx(1.0, abs=0.02)
+    exact = np.argsort(-(vectors @ query))[:3]
+    assert set(exact) <= set(index.search(query, k=10)[0])
+
+
+def test_index_roundtrip_and_append_after_load(tmp_path):
+    rng = np.random.default_rng(1)
+    index = LocalVectorIndex(DIM, "int8")
+    index.add([1, 2], _unit(rng, 2), [{"user_message": "a"}, {"user_message": "b"}])
+    index.save(tmp_path)
+
+    loaded = LocalVectorIndex.load(tmp_path)
+    extra = _unit(rng, 1)
+    loaded.add([3], extra, [{"user_message": "c"}])  # memory-map → 메모리 복사 후 추가
+
+    assert loaded.size == 3 and loaded.last_id == 3
+    assert loaded.results(extra[0], k=1)[0].user_message == "c"
+
+
+async def test_concurrent_refresh_adds_each_row_once(tmp_path):
+    rng = np.random.default_rng(2)
+    source = FakeSource(_unit(rng, 5))
+    store = LocalIndexStore(str(tmp_path), dim=DIM)
+    await store.get_or_build("u1", source)
+
+    source.append(_unit(rng, 3))
+    added = await asyncio.gather(*(store.refresh("u1", source) for _ in range(4)))
+
+    index = store.get("u1")
+    assert sorted(added) == [0, 0, 0, 3]
+    assert index.size == 8
+    assert sorted(int(i) for i in index._ids[: index.size]) == list(range(1, 9))
+
+
+async def test_concurrent_builds_fetch_once(tmp_path):
+    source = FakeSource(_unit(np.random.default_rng(3), 4))
+    store = LocalIndexStore(str(tmp_path), dim=DIM)
+
+    indexes = await asyncio.gather(*(store.get_or_build("u1", source) for _ in range(3)))
+
+    assert source.fetches == 1
+    assert all(index is indexes[0] for index in indexes)
+
+
+async def test_refresh_arriving_while_others_wait_does_not_duplicate_rows(tmp_path):
+    rng = np.random.default_rng(5)
+    source = FakeSource(_unit(rng, 2))
+    store = LocalIndexStore(str(tmp_path), dim=DIM)
+    await store.get_or_build("u1", source)
+
+    source.append(_unit(rng, 1))
+    first = asyncio.create_task(store.refresh("u1", source))
+    waiting = asyncio.create_task(store.refresh("u1", source))
+    await first
+    # 앞선 갱신이 끝난 직후 새 행 + 새 호출 (waiting 은 아직 락 대기 / 조회 중)
+    source.append(_unit(rng, 2))
+    late = asyncio.create_task(store.refresh("u1", source))
+    await asyncio.gather(waiting, late)
+
+    index = store.get("u1")
+    ids = [int(i) for i in index._ids[: index.size]]
+    assert sorted(ids) == list(range(1, 6))
+
+
+def test_evicted_index_drops_its_lock(tmp_path):
+    store = LocalIndexStore(str(tmp_path), max_users=1, dim=DIM)
+    store._lock("u1")
+    store._remember("u1", LocalVectorIndex(DIM))
+    store._lock("u2")
+    store._remember("u2", LocalVectorIndex(DIM))
+
+    assert "u1" not in store._locks and "u2" in store._locks
+
+
+async def test_retriever_refreshes_stale_user_before_search(tmp_path):
+    rng = np.random.default_rng(4)
+    source = FakeSource(_unit(rng, 3))
+    retriever = HybridRetriever(source, LocalIndexStore(str(tmp_path), dim=DIM), backend="local", sync_ttl=3600)
+    await retriever.search("u1", source.rows[0][1], k=1)
+
+    new = _unit(rng, 1)
+    source.append(new)
+    assert (await retriever.search("u1", new[0], k=1))[0].conversation_id != 4  # sync_ttl 전, 알림 없음
+    retriever.mark_stale({"u1"})
+    results = await retriever.search("u1", new[0], k=1)
+
+    assert results[0].conversation_id == 4
+    assert retriever.stats.refreshed_rows == 1
@@ -0,0 +1,124 @@
+import asyncio
+
+import fakeredis
+
+from src.memory.session import (
+    InMemorySessionStore,
+    RedisSessionStore,
+    SessionBuffer,
+    SessionMemory,
+    Turn,
+)
+
+
+def _turn(role: str, content: str, tokens: int) -> Turn:
+    return Turn(role, content, tokens, 0.0)
+
+
+async def _until(predicate, timeout: float = 1.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.005)
+
+
+def test_window_keeps_newest_turns_within_budget():
+    buffer = SessionBuffer(10, [
+        _turn("user", "q1", 10), _turn("assistant", "a1", 10),
+        _turn("user", "q2", 10), _turn("assistant", "a2", 10),
+    ])
+
+    assert buffer.window(25) == [
+        {"role": "user", "content": "q2"},
+        {"role": "assistant", "content": "a2"},
+    ]
+
+
+def test_window_drops_leading_orphan_assistant():
+    buffer = SessionBuffer(10, [
+        _turn("user", "q1", 10), _turn("assistant", "a1", 10), _turn("user", "q2", 10),
+    ])
+
+    assert buffer.window(20) == [{"role": "user", "content": "q2"}]
+
+
+async def test_hot_cache_serves_repeat_reads_and_sees_own_appends():
+    memory = SessionMemory(InMemorySessionStore(), hot_capacity=2)
+    key = SessionMemory.key("u1", None)
+
+    await memory.append_turn(key, "안녕", "반가워요")
+    assert [t.content for t in await memory.recent(key)] == ["안녕", "반가워요"]
+    await memory.append_turn(key, "날씨", "맑아요")
+    assert len(await memory.recent(key)) == 4
+    assert memory.stats.hot_misses == 1 and memory.stats.hot_hits == 1
+
+
+async def test_hot_cache_evicts_least_recently_used():
+    memory = SessionMemory(InMemorySessionStore(), hot_capacity=2)
+
+    await memory.get("a")
+    await memory.get("b")
+    await memory.get("a")
+    await memory.get("c")
+
+    assert list(memory._hot) == ["a", "c"]
+    assert memory.stats.evictions == 1
+
+
+async def test_invalidation_from_another_worker_drops_hot_entry():
+    server = fakeredis.FakeServer()
+    worker_a = SessionMemory(RedisSessionStore(client=fakeredis.FakeAsyncRedis(server=server, decode_responses=True)))
+    worker_b = SessionMemory(RedisSessionStore(client=fakeredis.FakeAsyncRedis(server=server, decode_responses=True)))
+    await worker_a.start()
+    await worker_b.start()
+    try:
+        key = SessionMemory.key("u1", "s1")
+        await worker_a.get(key)
+        await asyncio.sleep(0.05)
+
+        await worker_b.append_turn(key, "질문", "답변")
+        await _until(lambda: worker_a.stats.invalidations == 1)
+
+        assert key not in worker_a._hot
+        assert [t.content for t in await worker_a.recent(key)] == ["질문", "답변"]
+        assert worker_b.stats.invalidations == 0
+    finally:
+        await worker_a.stop()
+        await worker_b.stop()
+
+
+async def test_own_invalidation_is_ignored():
+    memory = SessionMemory(InMemorySessionStore())
+    await memory.get("k")
+
+    memory._on_invalidation("k", memory.worker_id)
+    assert "k" in memory._hot
+
+    memory._on_invalidation("k", "other-worker")
+    assert "k" not in memory._hot
+    assert memory.stats.invalidations == 1
+
+
+class SlowLoadStore(InMemorySessionStore):
+    def __init__(self):
+        super().__init__()
+        self.release = asyncio.Event()
+
+    async def load(self, key):
+        turns = await super().load(key)
+        await self.release.wait()
+        return turns
+
+
+async def test_invalidation_during_load_does_not_cache_stale_turns():
+    store = SlowLoadStore()
+    memory = SessionMemory(store)
+
+    loading = asyncio.create_task(memory.recent("k"))
+    await asyncio.sleep(0)
+    await store.append("k", [Turn.create("user", "새 질문")])
+    memory._on_invalidation("k", "other-worker")
+    store.release.set()
+    await loading
+
+    assert [t.content for t in await memory.recent("k")] == ["새 질문"]
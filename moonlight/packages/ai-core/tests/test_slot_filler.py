@@ -0,0 +1,24 @@
+import pytest
+
+from src.agents.slot_filler import EXTRACTORS, match_value
+
+
+def _repo(text: str):
+    match = EXTRACTORS["repo"](text)
+    return match_value(match) if match else None
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("moonlight-app/moonlight 저장소요", "moonlight-app/moonlight"),
+        ("use kim/dotfiles please", "kim/dotfiles"),
+        ("https://github.com/kim/dotfiles.git", "kim/dotfiles"),
+        ("github.com/kim/dotfiles/issues 여기요", "kim/dotfiles"),
+        ("use the main repo", None),
+        ("moonlight 저장소요", None),
+        ("12/25일", None),
+    ],
+)
+def test_repo_extractor_requires_owner_and_name(text, expected):
+    assert _repo(text) == expected
@@ -0,0 +1,58 @@
+from src.tools.cache import ToolResultCache
+from src.tools.executor import ToolResult
+from src.tools.registry import ToolSpec
+
+SEND_EMAIL = ToolSpec(name="send_email", description="이메일 전송", high_risk=True)
+
+
+class Counter:
+    def __init__(self):
+        self.calls = 0
+
+    async def __call__(self) -> ToolResult:
+        self.calls += 1
+        return ToolResult("send_email", True, output=self.calls)
+
+
+async def test_idempotency_key_replays_same_parameters():
+    cache = ToolResultCache()
+    execute = Counter()
+    params = {"to": "kim@example.com", "subject": "회의록"}
+
+    first = await cache.run(SEND_EMAIL, params, execute, scope="u1", idempotency_key="k1")
+    second = await cache.run(SEND_EMAIL, dict(params), execute, scope="u1", idempotency_key="k1")
+
+    assert execute.calls == 1
+    assert second.cached and second.output == first.output
+    assert cache.stats.idempotent_replays == 1
+
+
+async def test_idempotency_key_is_scoped_per_user():
+    cache = ToolResultCache()
+    execute = Counter()
+    params = {"to": "kim@example.com"}
+
+    await cache.run(SEND_EMAIL, params, execute, scope="u1", idempotency_key="k1")
+    other = await cache.run(SEND_EMAIL, params, execute, scope="u2", idempotency_key="k1")
+
+    assert execute.calls == 2
+    assert not other.cached
+
+
+async def test_idempotency_key_reused_with_different_parameters_is_rejected():
+    cache = ToolResultCache()
+    execute = Counter()
+
+    await cache.run(SEND_EMAIL, {"to": "kim@example.com"}, execute, scope="u1", idempotency_key="k1")
+    conflict = await cache.run(SEND_EMAIL, {"to": "lee@example.com"}, execute, scope="u1", idempotency_key="k1")
+
+    assert execute.calls == 1
+    assert not conflict.success
+    assert cache.stats.idempotency_conflicts == 1
+
+
+def test_only_read_only_builtin_tools_are_cached():
+    from src.tools.builtin import BUILTIN_TOOLS
+
+    cached = {spec.name for spec in BUILTIN_TOOLS if ToolResultCache.cacheable(spec)}
+    assert cached == {"google_search", "get_calendar"}
@@ -0,0 +1,77 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.agents.orchestrator import AgentOrchestrator
+from src.api import chat as chat_api
+from src.memory.pending import InMemoryPendingStore
+from src.memory.session import InMemorySessionStore, SessionMemory
+from src.metrics.tracing import span, start_trace, tracer
+
+
+class StreamingLLM:
+    """일반 대화 스트림만 흉내내는 가짜 LLM"""
+
+    default_model = "mock"
+
+    async def chat_stream(self, messages, **kwargs):
+        for chunk in ("주인님, ", "듣고 있어요."):
+            yield chunk
+
+
+@pytest.fixture
+def client():
+    chat_api.orchestrator = AgentOrchestrator(
+        llm=StreamingLLM(),
+        sessions=SessionMemory(InMemorySessionStore()),
+        pending=InMemoryPendingStore(),
+    )
+    app = FastAPI()
+    app.include_router(chat_api.router, prefix="/chat")
+    tracer.recent.clear()
+    try:
+        yield TestClient(app)
+    finally:
+        chat_api.orchestrator = None
+
+
+def _single_turn_trace() -> list:
+    assert len(tracer.recent) == 1
+    spans = tracer.recent[0].spans
+    assert len({s.trace_id for s in spans}) == 1
+    return [s.name for s in spans]
+
+
+def test_sse_turn_is_one_trace(client):
+    with client.stream("POST", "/chat/stream", json={"message": "안녕", "enable_tools": False}) as response:
+        body = "".join(response.iter_text())
+
+    assert "event: done" in body
+    names = _single_turn_trace()
+    assert "process" in names and "context" in names
+
+
+def test_websocket_turns_get_a_trace_each(client):
+    with client.websocket_connect("/chat/ws") as ws:
+        for _ in range(2):
+            ws.send_json({"message": "안녕", "enable_tools": False})
+            while ws.receive_json()["type"] != "done":
+                pass
+
+    assert len(tracer.recent) == 2
+    for trace in tracer.recent:
+        assert {s.trace_id for s in trace.spans} == {trace.trace_id}
+        assert "process" in [s.name for s in trace.spans]
+
+
+def test_resumed_trace_is_recorded_once():
+    tracer.recent.clear()
+    with start_trace() as trace:
+        with span("admission"):
+            pass
+    with start_trace(trace):
+        with span("process"):
+            pass
+
+    assert list(tracer.recent) == [trace]
+    assert [s.name for s in trace.spans] == ["admission", "process"]
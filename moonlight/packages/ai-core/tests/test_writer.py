@@ -0,0 +1,108 @@
+import asyncio
+
+import numpy as np
+
+from src.db.sinks import ConversationRecord, InMemorySink, ToolLogRecord
+from src.db.writer import WriteBehindWriter
+
+
+def _turn(i: int, user_id: str = "u1") -> ConversationRecord:
+    return ConversationRecord(user_id, None, f"질문 {i}", f"답변 {i}")
+
+
+def _log(i: int) -> ToolLogRecord:
+    return ToolLogRecord("u1", "google_search", {"query": str(i)}, None, True, 1)
+
+
+class FlakySink(InMemorySink):
+    def __init__(self, failures: int):
+        super().__init__()
+        self.failures = failures
+
+    async def write(self, conversations, tool_logs) -> None:
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("db down")
+        await super().write(conversations, tool_logs)
+
+
+class FakeEmbedder:
+    async def embed_many(self, texts):
+        return np.stack([np.full(4, len(t), dtype=np.float32) for t in texts])
+
+
+async def test_stop_flushes_everything_queued():
+    sink = InMemorySink()
+    writer = WriteBehindWriter(sink, batch_size=4, flush_interval=60)
+    await writer.start()
+    for i in range(10):
+        await writer.submit(_turn(i))
+    await writer.submit(_log(0))
+    await writer.stop()
+
+    assert [r.user_message for r in sink.conversations] == [f"질문 {i}" for i in range(10)]
+    assert len(sink.tool_logs) == 1
+    assert writer.stats.written == 11 and writer.stats.failed == 0
+
+
+async def test_flushes_on_interval_without_filling_a_batch():
+    sink = InMemorySink()
+    writer = WriteBehindWriter(sink, batch_size=100, flush_interval=0.02)
+    await writer.start()
+    try:
+        await writer.submit(_turn(0))
+        await asyncio.sleep(0.1)
+        assert len(sink.conversations) == 1
+    finally:
+        await writer.stop()
+
+
+async def test_submit_drops_when_queue_stays_full():
+    writer = WriteBehindWriter(InMemorySink(), max_queue=2, submit_timeout=0.01)  # 시작 전: 소비자 없음
+
+    results = [await writer.submit(_turn(i)) for i in range(3)]
+
+    assert results == [True, True, False]
+    assert writer.stats.dropped == 1
+
+
+async def test_submit_after_stop_is_refused():
+    sink = InMemorySink()
+    writer = WriteBehindWriter(sink)
+    await writer.start()
+    await writer.stop()
+
+    assert await writer.submit(_turn(0)) is False
+    assert writer.stats.dropped == 1 and writer.stats.enqueued == 0
+
+
+async def test_failed_write_is_retried_once_then_counted():
+    sink = FlakySink(failures=1)
+    writer = WriteBehindWriter(sink, flush_interval=60)
+    await writer.start()
+    await writer.submit(_turn(0))
+    await writer.stop()
+    assert len(sink.conversations) == 1
+
+    sink = FlakySink(failures=2)
+    writer = WriteBehindWriter(sink, flush_interval=60)
+    await writer.start()
+    await writer.submit(_turn(0))
+    await writer.stop()
+    assert sink.conversations == [] and writer.stats.failed == 1
+
+
+async def test_embeddings_and_listener_on_successful_flush():
+    sink = InMemorySink()
+    seen: list[list[str]] = []
+    writer = WriteBehindWriter(sink, embedder=FakeEmbedder(), flush_interval=60)
+    writer.add_listener(lambda records: seen.append([r.user_id for r in records]))
+    await writer.start()
+    await writer.submit(_turn(0, "u1"))
+    await writer.submit(_turn(1, "u2"))
+    await writer.submit(_log(0))
+    await writer.stop()
+
+    record = sink.conversations[0]
+    assert record.user_embedding[0] == len("질문 0") and record.assistant_embedding[0] == len("답변 0")
+    assert seen == [["u1", "u2"]]